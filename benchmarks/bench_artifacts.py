@@ -0,0 +1,58 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Benchmark of passing the large stage output by value in the context data
+and by reference with the artifact store handle.
+
+Usage:
+
+    $ python benchmarks/bench_artifacts.py --size 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import tempfile
+import time
+from pathlib import Path
+
+from ddeutil.workflow import ArtifactStore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=200, help="Size in MiB")
+    args = parser.parse_args()
+    value = bytearray(args.size * 1024 * 1024)
+
+    start: float = time.perf_counter()
+    copy.deepcopy({"outputs": {"df": value}})
+    print(f"by value     deepcopy {time.perf_counter() - start:8.4f} s")
+
+    store = ArtifactStore()
+    with tempfile.TemporaryDirectory() as tmp:
+        for shared in (False, True):
+            name: str = "shm" if shared else "file"
+            start: float = time.perf_counter()
+            handle = store.put(value, "bench", path=Path(tmp), shared=shared)
+            put_sec: float = time.perf_counter() - start
+
+            start: float = time.perf_counter()
+            copy.deepcopy({"outputs": {"df": handle}})
+            copy_sec: float = time.perf_counter() - start
+
+            start: float = time.perf_counter()
+            store.get(handle)
+            get_sec: float = time.perf_counter() - start
+            print(
+                f"by ref {name:<5} deepcopy {copy_sec:8.4f} s, "
+                f"put {put_sec:8.4f} s, get {get_sec:8.4f} s"
+            )
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Benchmark of the file audit queries with and without the sidecar catalog.
+
+Usage:
+
+    $ python benchmarks/bench_audit_catalog.py --releases 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from ddeutil.workflow.audits import LocalFileAudit
+
+
+def bench(audit: LocalFileAudit, name: str) -> str:
+    start: float = time.perf_counter()
+    list(audit.find_audits(name, offset=0, limit=20))
+    page_sec: float = time.perf_counter() - start
+
+    start: float = time.perf_counter()
+    audit.find_audit_with_release(name)
+    latest_sec: float = time.perf_counter() - start
+    return f"page {page_sec:8.4f} s, latest {latest_sec:8.4f} s"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--releases", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        audit = LocalFileAudit(
+            path=Path(tmp), extras={"enable_write_audit": True}
+        )
+        release: datetime = datetime(2024, 1, 1)
+        start: float = time.perf_counter()
+        for i in range(args.releases):
+            audit.save(
+                {
+                    "name": "wf-bench",
+                    "release": release + timedelta(minutes=i),
+                    "run_id": f"{i:08d}",
+                    "context": {"params": {"i": i}},
+                }
+            )
+        print(
+            f"save {args.releases} releases {time.perf_counter() - start:.2f} s"
+        )
+        print(f"catalog {bench(audit, 'wf-bench')}")
+
+        audit.catalog.unlink()
+        print(f"scan    {bench(audit, 'wf-bench')}")
+
+        start: float = time.perf_counter()
+        audit.rebuild_catalog()
+        print(f"rebuild catalog {time.perf_counter() - start:8.4f} s")
+
+
+if __name__ == "__main__":
+    main()
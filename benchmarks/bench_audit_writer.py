@@ -0,0 +1,93 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Benchmark of the audit write throughput that save each audit record on the
+caller thread and put them to the background audit writer.
+
+Usage:
+
+    $ WORKFLOW_LOG_TRACE_HANDLERS='[]' \\
+        python benchmarks/bench_audit_writer.py --records 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from ddeutil.workflow.audits import (
+    AuditWriter,
+    BaseAudit,
+    LocalFileAudit,
+    LocalSQLiteAudit,
+)
+
+
+def make_records(size: int) -> list[dict]:
+    release: datetime = datetime(2024, 1, 1)
+    return [
+        {
+            "name": "wf-bench",
+            "release": release + timedelta(minutes=i),
+            "run_id": f"{i:08d}",
+            "context": {
+                "params": {"i": i},
+                "jobs": {f"job-{j}": {"status": "SUCCESS"} for j in range(20)},
+            },
+        }
+        for i in range(size)
+    ]
+
+
+def bench(audit: BaseAudit, records: list[dict], writer: bool) -> str:
+    start: float = time.perf_counter()
+    if writer:
+        w = AuditWriter(flush_size=500)
+        for record in records:
+            w.put(audit, record)
+        put_sec: float = time.perf_counter() - start
+        w.close()
+    else:
+        for record in records:
+            audit.save(record)
+        put_sec: float = time.perf_counter() - start
+    total_sec: float = time.perf_counter() - start
+    return (
+        f"caller {put_sec:8.4f} s, total {total_sec:8.4f} s, "
+        f"{len(records) / total_sec:10.1f} records/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=2000)
+    args = parser.parse_args()
+    records: list[dict] = make_records(args.records)
+    extras: dict = {"enable_write_audit": True}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, compress in (("file", None), ("file-gzip", "gzip")):
+            for writer in (False, True):
+                audit = LocalFileAudit(
+                    path=Path(tmp) / f"{name}-{writer}",
+                    compress=compress,
+                    extras=extras,
+                )
+                mode: str = "writer" if writer else "sync"
+                print(f"{name:<10} {mode:<6} {bench(audit, records, writer)}")
+
+        for writer in (False, True):
+            audit = LocalSQLiteAudit(
+                path=Path(tmp) / f"sqlite-{writer}.db", extras=extras
+            )
+            mode: str = "writer" if writer else "sync"
+            print(f"{'sqlite':<10} {mode:<6} {bench(audit, records, writer)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Benchmark of the sequential release loop and the parallel backfill of the
+workflow over an hourly schedule range.
+
+Usage:
+
+    $ python benchmarks/bench_backfill.py --hours 48 --sleep 0.05 --parallel 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from ddeutil.workflow import Result, Workflow
+from ddeutil.workflow.audits import LocalFileAudit
+
+
+def make_workflow(sleep: float) -> Workflow:
+    return Workflow.model_validate(
+        {
+            "name": "wf-bench-backfill",
+            "on": {"schedule": [{"cronjob": "0 * * * *"}]},
+            "jobs": {
+                "first-job": {
+                    "stages": [
+                        {"name": "Echo", "echo": "hello", "sleep": sleep}
+                    ],
+                },
+            },
+        }
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hours", type=int, default=48)
+    parser.add_argument("--sleep", type=float, default=0.05)
+    parser.add_argument("--parallel", type=int, default=8)
+    args = parser.parse_args()
+
+    start: datetime = datetime(2024, 1, 1)
+    end: datetime = start + timedelta(hours=args.hours - 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        workflow: Workflow = make_workflow(args.sleep)
+
+        audit = LocalFileAudit(
+            path=Path(tmp) / "loop", extras={"enable_write_audit": True}
+        )
+        begin: float = time.perf_counter()
+        for dt in workflow.on.generate(start, end):
+            workflow.release(dt, params={}, audit=audit)
+        print(f"release loop {time.perf_counter() - begin:8.2f} s")
+
+        audit = LocalFileAudit(
+            path=Path(tmp) / "backfill", extras={"enable_write_audit": True}
+        )
+        begin: float = time.perf_counter()
+        rs: Result = workflow.backfill(
+            start, end, max_parallel=args.parallel, audit=audit
+        )
+        print(
+            f"backfill     {time.perf_counter() - begin:8.2f} s "
+            f"{rs.context['metrics']}"
+        )
+
+        begin: float = time.perf_counter()
+        rs: Result = workflow.backfill(
+            start, end, max_parallel=args.parallel, audit=audit
+        )
+        print(
+            f"re-backfill  {time.perf_counter() - begin:8.2f} s "
+            f"{rs.context['metrics']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
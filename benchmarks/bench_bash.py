@@ -0,0 +1,45 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Benchmark of the short bash stage execution between the `.sh` file mode,
+that write a new file and spawn a new shell process, and the shell worker pool
+mode.
+
+Usage:
+
+    $ python benchmarks/bench_bash.py --number 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from functools import partial
+
+from ddeutil.workflow.stages import BashStage
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=500)
+    args = parser.parse_args()
+    for name, extras in (
+        ("file", {}),
+        ("pool", {"stage_bash_pool": True}),
+    ):
+        stage = BashStage(
+            name="Bench",
+            bash='echo "Hello $FOO"',
+            env={"FOO": "World"},
+            extras=extras | {"trace_handlers": []},
+        )
+        sec: float = timeit.timeit(
+            partial(stage.execute, {}), number=args.number
+        )
+        print(f"{name:<10} {sec / args.number * 1_000_000:10.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Benchmark of the copy-on-write context layer against the `copy.deepcopy`
+function that nested executions used to prepare their context with a large
+upstream `jobs` outputs.
+
+Usage:
+
+    $ python benchmarks/bench_context.py --number 10000 --size 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import time
+import tracemalloc
+from typing import Callable
+
+from ddeutil.workflow import SUCCESS, ForEachStage
+from ddeutil.workflow.__types import DictData
+from ddeutil.workflow.utils import layer_context
+
+
+def make_params(size: int) -> DictData:
+    return {
+        "params": {"name": "bench"},
+        "jobs": {
+            "extract": {
+                "stages": {
+                    "records": {
+                        "outputs": {
+                            "records": [
+                                {"id": i, "name": f"name-{i}", "tags": ["a"]}
+                                for i in range(size)
+                            ],
+                        },
+                    },
+                },
+            },
+        },
+        "stages": {},
+    }
+
+
+def measure(name: str, number: int, func: Callable[[int], DictData]) -> None:
+    tracemalloc.start()
+    start: float = time.perf_counter()
+    keep: list[DictData] = [func(i) for i in range(number)]
+    sec: float = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:<10} {sec:8.3f} s {peak / 1024 / 1024:10.2f} MiB "
+        f"(contexts: {len(keep)})"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=10_000)
+    parser.add_argument("--size", type=int, default=1_000)
+    args = parser.parse_args()
+    params: DictData = make_params(args.size)
+    print(f"Contexts: {args.number}, upstream records: {args.size}")
+
+    def deep(i: int) -> DictData:
+        context: DictData = copy.deepcopy(params)
+        context.update({"item": i, "loop": i})
+        return context
+
+    measure("deepcopy", args.number, deep)
+    measure(
+        "layer", args.number, lambda i: layer_context(params, item=i, loop=i)
+    )
+
+    stage = ForEachStage(
+        name="Foreach",
+        foreach=list(range(min(args.number, 1_000))),
+        stages=[
+            {
+                "name": "Echo",
+                "id": "echo",
+                "echo": "${{ item }}",
+            },
+        ],
+        extras={"stage_default_id": False},
+    )
+    start: float = time.perf_counter()
+    rs = stage.execute(params)
+    assert rs.status == SUCCESS, rs.context
+    print(f"foreach    {time.perf_counter() - start:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Benchmark of the cron runner that jumps with the compiled bitmask of the
+cronjob and the previous runner that shifts the date by one unit of each mode
+until it matches with the cronjob.
+
+Usage:
+
+    $ python benchmarks/bench_cron.py --releases 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from ddeutil.core.dtutils import next_date, replace_date
+from ddeutil.workflow import UTC
+from ddeutil.workflow.__cron import WEEKDAYS, CronJob
+
+CRONS: tuple[str, ...] = (
+    "*/5 * * * *",
+    "30 2 * * *",
+    "*/15 9-17 * * 1-5",
+    "0 0 1 */3 *",
+    "0 0 13 * 5",
+    "0 0 29 2 *",
+)
+
+
+def legacy_find_date(cron: CronJob, date: datetime) -> datetime:
+    """Return the next matching datetime with the previous shifting step."""
+    switch: dict[str, str] = {
+        "month": "year",
+        "day": "month",
+        "hour": "day",
+        "minute": "hour",
+    }
+
+    def shift(mode: str) -> bool:
+        nonlocal date
+        current_value: int = getattr(date, switch[mode])
+        while not cron.check(date, mode) or (
+            mode == "day"
+            and WEEKDAYS.get(date.strftime("%a")) not in cron.dow.values
+        ):
+            date = next_date(date, mode)
+            date = replace_date(date, mode).replace(second=0, microsecond=0)
+            if current_value != getattr(date, switch[mode]):
+                return mode != "month"
+        return False
+
+    for _ in range(25):
+        if all(not shift(mode) for mode in ("month", "day", "hour", "minute")):
+            return date
+    raise RecursionError("Unable to find execution time for schedule")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--releases", type=int, default=1000)
+    args = parser.parse_args()
+
+    start: datetime = datetime(2024, 1, 1, tzinfo=UTC)
+    for value in CRONS:
+        cron = CronJob(value)
+        releases: int = args.releases if "29 2" not in value else 10
+
+        begin: float = time.perf_counter()
+        runner = cron.schedule(start, tz=UTC)
+        for _ in range(releases):
+            _ = runner.next
+        jump: float = time.perf_counter() - begin
+
+        begin: float = time.perf_counter()
+        date: datetime = start
+        for _ in range(releases):
+            try:
+                date = legacy_find_date(cron, date) + timedelta(minutes=1)
+            except RecursionError:
+                break
+        step: float = time.perf_counter() - begin
+        print(
+            f"{value:<20} {releases:>6} releases "
+            f"jump {jump:8.4f} s step {step:8.4f} s ({step / jump:6.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Benchmark of the foreach stage context size and the downstream deep-copy
+time between the output policies when each item returns a large output.
+
+Usage:
+
+    $ python benchmarks/bench_output_policy.py --size 2000 --rows 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from ddeutil.workflow import SUCCESS
+from ddeutil.workflow.stages import ForEachStage
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=2_000)
+    parser.add_argument("--rows", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for output in ("all", "status", "spill"):
+            stage = ForEachStage.model_validate(
+                {
+                    "name": "Foreach",
+                    "id": "foreach",
+                    "foreach": list(range(args.size)),
+                    "concurrent": 4,
+                    "output": output,
+                    "stages": [
+                        {
+                            "name": "Rows",
+                            "id": "rows",
+                            "run": f"rows = list(range({args.rows}))",
+                        },
+                    ],
+                    "extras": {
+                        "trace_handlers": [],
+                        "stage_spill_path": Path(tmp),
+                    },
+                }
+            )
+            start: float = time.perf_counter()
+            rs = stage.execute({})
+            exec_sec: float = time.perf_counter() - start
+            assert rs.status == SUCCESS
+
+            start: float = time.perf_counter()
+            copy.deepcopy(rs.context)
+            copy_sec: float = time.perf_counter() - start
+            size: int = len(json.dumps(rs.context, default=str))
+            print(
+                f"{output:<7} exec {exec_sec:7.3f} s, "
+                f"deepcopy {copy_sec * 1_000:8.2f} ms, "
+                f"context {size / 1024 / 1024:7.2f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
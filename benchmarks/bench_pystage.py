@@ -0,0 +1,89 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Benchmark of the Python stage statement running between the previous path,
+that merge the whole module globals and exec the source string, and the cached
+code object with the minimal globals.
+
+Usage:
+
+    $ python benchmarks/bench_pystage.py --number 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from inspect import isclass, isfunction, ismodule
+from textwrap import dedent
+
+from ddeutil.workflow import stages
+from ddeutil.workflow.stages import PyStage, compile_py
+
+SOURCE: str = dedent(
+    """
+    import math
+    total: int = 0
+    for i in range(x):
+        total += i
+    value = math.sqrt(total)
+    """
+)
+
+
+def exec_legacy() -> dict:
+    lc: dict = {}
+    gb: dict = vars(stages) | {"x": 32, "result": None}
+    exec(SOURCE, gb, lc)
+    return {
+        k: gb[k]
+        for k in gb
+        if (
+            not k.startswith("__")
+            and k != "annotations"
+            and not ismodule(gb[k])
+            and not isclass(gb[k])
+            and not isfunction(gb[k])
+        )
+    }
+
+
+def exec_cached() -> dict:
+    lc: dict = {}
+    gb: dict = {"__builtins__": __builtins__, "x": 32, "result": None}
+    exec(compile_py(SOURCE), gb, lc)
+    return {
+        k: gb[k]
+        for k in gb
+        if (
+            not k.startswith("__")
+            and not ismodule(gb[k])
+            and not isclass(gb[k])
+            and not isfunction(gb[k])
+        )
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=5_000)
+    args = parser.parse_args()
+    stage = PyStage(
+        name="Bench",
+        vars={"x": "${{ params.x }}"},
+        run=SOURCE,
+        extras={"trace_handlers": []},
+    )
+    for name, func in (
+        ("legacy", exec_legacy),
+        ("cached", exec_cached),
+        ("stage", lambda: stage.execute(params={"params": {"x": 32}})),
+    ):
+        sec: float = timeit.timeit(func, number=args.number)
+        print(f"{name:<10} {sec / args.number * 1_000_000:10.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
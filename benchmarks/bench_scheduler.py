@@ -0,0 +1,101 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Benchmark of the scheduler timer heap and the polling of all workflow
+schedules on every minute over one simulated day. It counts the dispatched
+releases only, so it measures the scheduling overhead without the releases.
+
+Usage:
+
+    $ python benchmarks/bench_scheduler.py --workflows 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from ddeutil.workflow import UTC
+from ddeutil.workflow.scheduler import Scheduler
+
+CRONS: tuple[str, ...] = (
+    "*/5 * * * *",
+    "0 * * * *",
+    "30 2 * * *",
+    "*/15 9-17 * * 1-5",
+)
+
+
+class CountScheduler(Scheduler):
+    """Scheduler that counts the dispatched releases instead of running."""
+
+    dispatched: int = 0
+
+    def _dispatch(self, name: str, dt: datetime) -> None:
+        self.dispatched += 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workflows", type=int, default=100)
+    args = parser.parse_args()
+
+    start: datetime = datetime(2024, 1, 1, tzinfo=UTC)
+    minutes: list[datetime] = [
+        start + timedelta(minutes=i) for i in range(24 * 60)
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp)
+        for i in range(args.workflows):
+            (path / f"wf_{i:05d}.yml").write_text(
+                f"wf-bench-{i:05d}:\n"
+                f"  type: Workflow\n"
+                f"  on:\n"
+                f"    schedule:\n"
+                f"      - cronjob: '{CRONS[i % len(CRONS)]}'\n"
+                f"  jobs:\n"
+                f"    first-job:\n"
+                f"      stages:\n"
+                f"        - name: Echo\n"
+                f"          echo: hello\n"
+            )
+
+        scheduler = CountScheduler(path=path, misfire_grace=60)
+        begin: float = time.perf_counter()
+        scheduler.load(now=start)
+        print(f"load    {time.perf_counter() - begin:8.4f} s")
+
+        begin: float = time.perf_counter()
+        scheduler.load(now=start)
+        print(f"reload  {time.perf_counter() - begin:8.4f} s (no change)")
+
+        begin: float = time.perf_counter()
+        due: datetime = start
+        while due is not None and due < minutes[-1]:
+            due = scheduler.tick(now=due)
+        print(
+            f"heap    {time.perf_counter() - begin:8.4f} s "
+            f"{scheduler.dispatched} releases"
+        )
+
+        begin: float = time.perf_counter()
+        dispatched: int = 0
+        for minute in minutes:
+            for workflow in scheduler.workflows.values():
+                for on in workflow.on.schedule:
+                    if on.cronjob.schedule(minute, tz=UTC).next == minute:
+                        dispatched += 1
+        print(
+            f"polling {time.perf_counter() - begin:8.4f} s "
+            f"{dispatched} releases"
+        )
+        scheduler.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Benchmark of the huge matrix strategy generation between the materialized
+list and the lazy generator, and the fail-fast job execution that stops
+generating the next strategies.
+
+Usage:
+
+    $ python benchmarks/bench_strategy_dispatch.py --size 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+
+from ddeutil.workflow import FAILED, Job
+from ddeutil.workflow.job import make_iter
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=50_000)
+    args = parser.parse_args()
+    matrix = {"x": list(range(args.size // 100)), "y": list(range(100))}
+    exclude = [{"x": i, "y": i} for i in range(100)]
+
+    for name, func in (
+        ("list", lambda: iter(list(make_iter(matrix, [], exclude)))),
+        ("lazy", lambda: make_iter(matrix, [], exclude)),
+    ):
+        tracemalloc.start()
+        start: float = time.perf_counter()
+        next(func())
+        sec: float = time.perf_counter() - start
+        peak: int = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(
+            f"{name:<6} first strategy {sec * 1_000:8.2f} ms, "
+            f"peak {peak / 1024 / 1024:8.2f} MiB"
+        )
+
+    job = Job(
+        strategy={"max-parallel": 4, "fail-fast": True, "matrix": matrix},
+        stages=[
+            {"name": "Raise", "if": "${{ matrix.x }} == 1", "raise": "Stop"},
+            {"name": "Echo", "echo": "Hello"},
+        ],
+        extras={"stage_default_id": False, "trace_handlers": []},
+    )
+    start: float = time.perf_counter()
+    rs = job.execute({})
+    assert rs.status == FAILED
+    print(f"fail-fast job {time.perf_counter() - start:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Benchmark of the strategy executor types with the CPU-bound matrix job. The
+thread executor will serialize all strategies by the GIL, but the process
+executor should scale with the number of CPU cores.
+
+Usage:
+
+    $ python benchmarks/bench_strategy_executor.py --number 8 --size 2000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+from ddeutil.workflow import SUCCESS, Job
+
+
+def make_job(executor: str, workers: int, number: int, size: int) -> Job:
+    return Job(
+        id="cpu-bound",
+        strategy={
+            "max-parallel": workers,
+            "executor": executor,
+            "matrix": {"part": list(range(number))},
+        },
+        stages=[
+            {
+                "name": "Sum of Square",
+                "id": "sum-square",
+                "run": (
+                    f"total = sum(i * i for i in range({size}))"
+                    " + ${{ matrix.part }}"
+                ),
+            },
+        ],
+        extras={"stage_default_id": False},
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=8)
+    parser.add_argument("--size", type=int, default=2_000_000)
+    args = parser.parse_args()
+    cpu: int = os.cpu_count() or 1
+    print(f"CPU cores: {cpu}, strategies: {args.number}")
+
+    base: dict[str, float] = {}
+    for workers in sorted({1, 2, 4, min(cpu, 9)}):
+        for executor in ("thread", "process"):
+            job: Job = make_job(executor, workers, args.number, args.size)
+            start: float = time.perf_counter()
+            rs = job.execute({})
+            sec: float = time.perf_counter() - start
+            assert rs.status == SUCCESS, rs.context
+            base.setdefault(executor, sec)
+            print(
+                f"{executor:<8} workers={workers:<2} {sec:8.3f} s "
+                f"({base[executor] / sec:5.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
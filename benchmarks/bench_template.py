@@ -0,0 +1,122 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Benchmark of the compiled template engine against the legacy templating
+path that searches the caller regex and parses post-filters on every call.
+
+Usage:
+
+    $ python benchmarks/bench_template.py --number 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from datetime import datetime
+from typing import Any, Optional
+
+from ddeutil.core import getdot
+from ddeutil.io import search_env_replace
+from ddeutil.workflow.__types import DictData, Re
+from ddeutil.workflow.reusables import (
+    compile_template,
+    get_args_const,
+    make_filter_registry,
+    param2template,
+)
+
+ARGS: DictData = {
+    "source": "${{ params.source }}",
+    "target": "${{ params.schema }}.${{ params.table | upper }}",
+    "run_date": "${{ params.run_date | fmt('%Y%m%d') }}",
+    "limit": "${{ matrix.limit }}",
+    "options": {
+        "partition": "${{ matrix.partition | str }}",
+        "columns": ["id", "${{ params.key }}", "updated_at"],
+    },
+}
+PARAMS: DictData = {
+    "params": {
+        "source": "s3://bucket/raw",
+        "schema": "warehouse",
+        "table": "orders",
+        "run_date": datetime(2024, 1, 1),
+        "key": "order_id",
+    },
+    "matrix": {"limit": 1000, "partition": 12},
+}
+
+
+def legacy_str2template(value: str, params: DictData, filters: DictData) -> Any:
+    """The legacy templating path before the compiled template engine."""
+    value: str = value.strip()
+    for found in Re.finditer_caller(value):
+        pfilter: list[str] = [
+            i.strip()
+            for i in (found.post_filters.strip().removeprefix("|").split("|"))
+            if i != ""
+        ]
+        getter: Any = getdot(found.caller, params)
+        for ft in pfilter:
+            func_name, _args, _kwargs = get_args_const(ft)
+            getter = filters[func_name](
+                getter,
+                *[a.value for a in _args],
+                **{k: v.value for k, v in _kwargs.items()},
+            )
+        if value.replace(found.full, "", 1) == "":
+            return getter
+        value = value.replace(found.full, str(getter), 1)
+    return search_env_replace(value)
+
+
+def legacy_param2template(
+    value: Any, params: DictData, filters: Optional[DictData] = None
+) -> Any:
+    filters = filters or make_filter_registry()
+    if isinstance(value, dict):
+        return {
+            k: legacy_param2template(value[k], params, filters) for k in value
+        }
+    elif isinstance(value, (list, tuple, set)):
+        return type(value)(
+            legacy_param2template(i, params, filters) for i in value
+        )
+    elif not isinstance(value, str):
+        return value
+    return legacy_str2template(value, params, filters)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=2000)
+    number: int = parser.parse_args().number
+
+    compiled = compile_template(ARGS)
+    filters: DictData = make_filter_registry(["ddeutil.workflow.reusables"])
+    assert legacy_param2template(ARGS, PARAMS, filters) == compiled.render(
+        PARAMS, filters=filters
+    )
+
+    cases: dict[str, Any] = {
+        "legacy": lambda: legacy_param2template(ARGS, PARAMS, filters),
+        "param2template (lru)": lambda: param2template(
+            ARGS, PARAMS, filters=filters
+        ),
+        "compiled": lambda: compiled.render(PARAMS, filters=filters),
+    }
+    base: Optional[float] = None
+    for name, func in cases.items():
+        sec: float = min(timeit.repeat(func, number=number, repeat=3))
+        base = base or sec
+        print(
+            f"{name:<24} {sec / number * 1e6:10.2f} us/call "
+            f"({base / sec:5.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
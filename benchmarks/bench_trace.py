@@ -0,0 +1,60 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Benchmark of the per-emit overhead of the trace metadata and the trace
+object with the file handler, and the cost of the trace factory function.
+
+Usage:
+
+    $ python benchmarks/bench_trace.py --number 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import tempfile
+import timeit
+
+from ddeutil.workflow.traces import Metadata, Trace, get_trace
+
+
+def make_metadata() -> Metadata:
+    return Metadata.make(
+        error_flag=False,
+        message="[STAGE]: Execute Empty-Stage: 'Echo'",
+        level="info",
+        cutting_id="01",
+        run_id="01",
+        parent_run_id="bench",
+        extras={"logs_trace_frame_layer": 1},
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=5_000)
+    args = parser.parse_args()
+    path: str = tempfile.mkdtemp()
+    try:
+        trace = Trace(
+            run_id="01",
+            parent_run_id="bench",
+            handlers=[{"type": "file", "path": path}],
+        )
+        for name, func in (
+            ("metadata", make_metadata),
+            ("dump", make_metadata().model_dump_json),
+            ("emit", lambda: trace.info("Execute Empty-Stage: 'Echo'")),
+            ("get_trace", lambda: get_trace("01", parent_run_id="bench")),
+        ):
+            sec: float = timeit.timeit(func, number=args.number)
+            print(f"{name:<10} {sec / args.number * 1_000_000:10.2f} us/call")
+    finally:
+        shutil.rmtree(path)
+
+
+if __name__ == "__main__":
+    main()
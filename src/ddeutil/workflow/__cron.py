@@ -5,11 +5,11 @@
 # ------------------------------------------------------------------------------
 from __future__ import annotations
 
-import copy
+from calendar import monthrange
 from collections.abc import Iterator
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from functools import partial, total_ordering
+from datetime import date, datetime, timedelta, timezone
+from functools import cached_property, partial, total_ordering
 from typing import ClassVar, Optional, Union
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
@@ -18,7 +18,6 @@ from ddeutil.core import (
     isinstance_check,
     must_split,
 )
-from ddeutil.core.dtutils import DatetimeMode, next_date, replace_date
 
 WEEKDAYS: dict[str, int] = {
     "Sun": 0,
@@ -711,6 +710,15 @@ class CronJob:
         assert mode in ("year", "month", "day", "hour", "minute")
         return getattr(date, mode) in getattr(self, mode).values
 
+    @cached_property
+    def mask(self) -> CronMask:
+        """Return the compiled bitmask of this cronjob that the CronRunner
+        uses to jump to the next or previous matching datetime.
+
+        :rtype: CronMask
+        """
+        return CronMask(self)
+
     def schedule(
         self,
         date: Optional[datetime] = None,
@@ -757,6 +765,204 @@ class CronJobYear(CronJob):
         return self.parts[5]
 
 
+class CronMask:
+    """Compiled bitmask of the cronjob that keeps each part as the integer
+    bitset with the precomputed next-set-bit and previous-set-bit tables, so
+    it can jump to the next or previous matching value of each part directly
+    instead of stepping one unit at a time.
+
+        The day of month and the day of week parts compile together to the
+    bitset of matching days for each weekday of the first day of month. A
+    part that was set with `?` matches all values.
+
+    :param cron: (CronJob | CronJobYear)
+    """
+
+    horizon: ClassVar[int] = 400
+
+    __slots__: tuple[str, ...] = (
+        "minute",
+        "hour",
+        "month",
+        "year",
+        "days",
+        "year_min",
+        "year_max",
+    )
+
+    def __init__(self, cron: Union[CronJob, CronJobYear]) -> None:
+        self.minute: tuple[tuple[int, ...], tuple[int, ...]] = self.tables(
+            cron.minute
+        )
+        self.hour: tuple[tuple[int, ...], tuple[int, ...]] = self.tables(
+            cron.hour
+        )
+        self.month: tuple[tuple[int, ...], tuple[int, ...]] = self.tables(
+            cron.month
+        )
+        self.year: Optional[tuple[tuple[int, ...], tuple[int, ...]]] = None
+        self.year_min: int = 1
+        self.year_max: int = 9999
+        if isinstance(cron, CronJobYear):
+            self.year = self.tables(cron.year)
+            self.year_min = cron.year.unit.min
+            self.year_max = cron.year.unit.max
+
+        # NOTE: Build the bitset of matching days of month, bit 1 to 31, for
+        #   each weekday of the first day of month that start from Sunday.
+        day: int = self.bits(cron.day)
+        dow: int = self.bits(cron.dow)
+        self.days: tuple[int, ...] = tuple(
+            day
+            & sum(
+                1 << d for d in range(1, 32) if dow >> ((first + d - 1) % 7) & 1
+            )
+            for first in range(7)
+        )
+
+    @staticmethod
+    def bits(part: CronPart) -> int:
+        """Return the bitset of the part values that all values set if the
+        part was set with `?`.
+
+        :rtype: int
+        """
+        return sum(1 << v for v in (part.values or part.unit.range()))
+
+    @classmethod
+    def tables(cls, part: CronPart) -> tuple[tuple[int, ...], tuple[int, ...]]:
+        """Return the next-set-bit and previous-set-bit tables of the part
+        that index with the value from 0 to the max value of its unit. The
+        table keeps -1 if it does not have any set bit.
+
+        :rtype: tuple[tuple[int, ...], tuple[int, ...]]
+        """
+        bits: int = cls.bits(part)
+        nexts: list[int] = []
+        prevs: list[int] = []
+        for v in range(part.unit.max + 1):
+            upper: int = bits >> v << v
+            nexts.append((upper & -upper).bit_length() - 1 if upper else -1)
+            prevs.append((bits & ((2 << v) - 1)).bit_length() - 1)
+        return tuple(nexts), tuple(prevs)
+
+    def month_days(self, year: int, month: int) -> int:
+        """Return the bitset of matching days of the month.
+
+        :rtype: int
+        """
+        first: int = (date(year, month, 1).weekday() + 1) % 7
+        return self.days[first] & ((2 << monthrange(year, month)[1]) - 2)
+
+    def next(self, dt: datetime) -> datetime:
+        """Return the first matching datetime that equal or after the naive
+        datetime.
+
+        :param dt: (datetime) A naive datetime without second.
+
+        :rtype: datetime
+        """
+        y, mo, d, h, mi = dt.year, dt.month, dt.day, dt.hour, dt.minute
+        limit: int = min(y + self.horizon, self.year_max)
+        while True:
+            if y > limit:
+                if self.year is not None:
+                    raise YearReachLimit(
+                        f"The year is reach the limit with this crontab "
+                        f"setting: {self.year_max}."
+                    )
+                raise RecursionError(
+                    "Unable to find execution time for schedule"
+                )
+
+            if self.year is not None:
+                ny: int = self.year[0][y] if y <= self.year_max else -1
+                if ny < 0:
+                    y = limit + 1
+                    continue
+                if ny != y:
+                    y, mo, d, h, mi = ny, 1, 1, 0, 0
+
+            if (nmo := self.month[0][mo]) < 0:
+                y, mo, d, h, mi = y + 1, 1, 1, 0, 0
+                continue
+            if nmo != mo:
+                mo, d, h, mi = nmo, 1, 0, 0
+
+            days: int = self.month_days(y, mo) >> d << d
+            if not days:
+                y, mo = (y + 1, 1) if mo == 12 else (y, mo + 1)
+                d, h, mi = 1, 0, 0
+                continue
+            if (nd := (days & -days).bit_length() - 1) != d:
+                d, h, mi = nd, 0, 0
+
+            if (nh := self.hour[0][h]) < 0:
+                d, h, mi = d + 1, 0, 0
+                continue
+            if nh != h:
+                h, mi = nh, 0
+
+            if (nmi := self.minute[0][mi]) < 0:
+                d, h, mi = (d + 1, 0, 0) if h == 23 else (d, h + 1, 0)
+                continue
+            return datetime(y, mo, d, h, nmi)
+
+    def prev(self, dt: datetime) -> datetime:
+        """Return the last matching datetime that equal or before the naive
+        datetime.
+
+        :param dt: (datetime) A naive datetime without second.
+
+        :rtype: datetime
+        """
+        y, mo, d, h, mi = dt.year, dt.month, dt.day, dt.hour, dt.minute
+        limit: int = max(y - self.horizon, self.year_min)
+        while True:
+            if y < limit:
+                if self.year is not None:
+                    raise YearReachLimit(
+                        f"The year is reach the limit with this crontab "
+                        f"setting: {self.year_min}."
+                    )
+                raise RecursionError(
+                    "Unable to find execution time for schedule"
+                )
+
+            if self.year is not None:
+                py: int = self.year[1][min(y, self.year_max)]
+                if py < 0:
+                    y = limit - 1
+                    continue
+                if py != y:
+                    y, mo, d, h, mi = py, 12, 31, 23, 59
+
+            if (pmo := self.month[1][mo]) < 0:
+                y, mo, d, h, mi = y - 1, 12, 31, 23, 59
+                continue
+            if pmo != mo:
+                mo, d, h, mi = pmo, 31, 23, 59
+
+            days: int = self.month_days(y, mo) & ((2 << d) - 1)
+            if not days:
+                y, mo = (y - 1, 12) if mo == 1 else (y, mo - 1)
+                d, h, mi = 31, 23, 59
+                continue
+            if (pd := days.bit_length() - 1) != d:
+                d, h, mi = pd, 23, 59
+
+            if (ph := self.hour[1][h]) < 0:
+                d, h, mi = d - 1, 23, 59
+                continue
+            if ph != h:
+                h, mi = ph, 59
+
+            if (pmi := self.minute[1][mi]) < 0:
+                d, h, mi = (d - 1, 23, 59) if h == 0 else (d, h - 1, 59)
+                continue
+            return datetime(y, mo, d, h, pmi)
+
+
 class CronRunner:
     """Create an instance of Date Runner object for datetime generate with
     cron schedule object value.
@@ -766,8 +972,6 @@ class CronRunner:
     :param tz: (str)
     """
 
-    shift_limit: ClassVar[int] = 25
-
     __slots__: tuple[str, ...] = (
         "__start_date",
         "cron",
@@ -864,81 +1068,57 @@ class CronRunner:
     def find_date(self, reverse: bool = False) -> datetime:
         """Returns the time the schedule would run by `next` or `prev` methods.
 
+            It jumps on the wall-clock time of the current date with the
+        compiled bitmask of the cronjob. The matching time that does not exist
+        in its timezone because of the DST gap moves to the first time after
+        this gap, like the Vixie cron. The matching time that repeats on the
+        DST overlap returns the first time only.
+
         Args:
             reverse: A reverse flag.
 
         Returns:
-            datetime: A next datetime from shifting step.
+            datetime: A next datetime from jumping step.
         """
         # NOTE: Set reset flag to false if start any action.
         self.reset_flag: bool = False
 
-        # NOTE: For loop with 25 times by default.
-        for _ in range(
-            max(self.shift_limit, 100) if self.is_year else self.shift_limit
-        ):
-
-            # NOTE: Shift the date from year to minute.
-            mode: DatetimeMode  # noqa: F842
-            if all(
-                not self.__shift_date(mode, reverse)
-                for mode in ("year", "month", "day", "hour", "minute")
-            ):
-                return copy.deepcopy(self.date)
-
-        raise RecursionError("Unable to find execution time for schedule")
-
-    def __shift_date(self, mode: DatetimeMode, reverse: bool = False) -> bool:
-        """Increments the mode of date value ("month", "day", "hour", "minute")
-        until matches with the schedule.
-
-        :param mode: A mode of date that want to shift.
-        :param reverse: A flag that define shifting next or previous
-        """
-        switch: dict[str, str] = {
-            "year": "year",
-            "month": "year",
-            "day": "month",
-            "hour": "day",
-            "minute": "hour",
-        }
-        current_value: int = getattr(self.date, switch[mode])
-
-        if not self.is_year and mode == "year":
-            return False
-
-        # NOTE: Additional condition for weekdays
-        def addition_cond(dt: datetime) -> bool:
-            return (
-                WEEKDAYS.get(dt.strftime("%a")) not in self.cron.dow.values
-                if mode == "day"
-                else False
-            )
-
-        # NOTE:
-        #   Start while-loop for checking this date include in this cronjob.
-        while not self.cron.check(self.date, mode) or addition_cond(self.date):
-            if mode == "year" and (
-                getattr(self.date, mode)
-                > (max_year := max(self.cron.year.values))
-            ):
-                raise YearReachLimit(
-                    f"The year is reach the limit with this crontab setting: "
-                    f"{max_year}."
-                )
-
-            # NOTE: Shift date with it mode matrix unit.
-            self.date: datetime = next_date(self.date, mode, reverse=reverse)
-
-            # NOTE: Replace date that less than it mode to zero.
-            self.date: datetime = replace_date(self.date, mode, reverse=reverse)
+        mask: CronMask = self.cron.mask
+        start: datetime = self.date.replace(tzinfo=None, fold=0)
+        wall: datetime = start
+        while True:
+            wall: datetime = mask.prev(wall) if reverse else mask.next(wall)
+            if self.tz is None:
+                break
+
+            # NOTE: The previous time that moves after the DST gap should not
+            #   be later than the current date.
+            moved: datetime = self.__after_gap(wall)
+            if not reverse or moved <= start:
+                wall: datetime = moved
+                break
+            wall: datetime = wall - timedelta(minutes=1)
+
+        self.date: datetime = wall.replace(tzinfo=self.tz)
+        return self.date
+
+    def __after_gap(self, wall: datetime) -> datetime:
+        """Move the wall-clock time that does not exist in the timezone of
+        this runner to the first time after the DST gap.
 
-            # NOTE: Replace second and microsecond values that change from
-            #   the replace_date func with reverse flag.
-            self.date: datetime = self.date.replace(second=0, microsecond=0)
-
-            if current_value != getattr(self.date, switch[mode]):
-                return mode != "month"
+        Args:
+            wall: A naive wall-clock datetime.
 
-        # NOTE: Return False if the date that match with condition.
-        return False
+        Returns:
+            datetime: The same wall-clock datetime if it exists, or the first
+                wall-clock datetime after its DST gap.
+        """
+        while (
+            wall.replace(tzinfo=self.tz)
+            .astimezone(timezone.utc)
+            .astimezone(self.tz)
+            .replace(tzinfo=None)
+            != wall
+        ):
+            wall: datetime = wall + timedelta(minutes=1)
+        return wall
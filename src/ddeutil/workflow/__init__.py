@@ -49,6 +49,12 @@ Note:
 """
 from .__cron import CronRunner
 from .__types import DictData, DictStr, Matrix, Re, TupleStr
+from .artifacts import (
+    ArtifactStore,
+    artifact,
+    get_artifact_store,
+    is_artifact,
+)
 from .audits import (
     DRYRUN,
     FORCE,
@@ -123,6 +129,14 @@ from .params import (
     Param,
     StrParam,
 )
+from .pool import (
+    ShellPool,
+    ShellWorker,
+    TaskGroup,
+    WorkerPool,
+    get_pool,
+    get_shell_pool,
+)
 from .result import (
     CANCEL,
     FAILED,
@@ -134,6 +148,10 @@ from .result import (
     get_status_from_error,
 )
 from .reusables import *
+from .scheduler import (
+    CatchUp,
+    Scheduler,
+)
 from .stages import (
     BashStage,
     CallStage,
@@ -141,6 +159,7 @@ from .stages import (
     DockerStage,
     EmptyStage,
     ForEachStage,
+    OutputPolicy,
     ParallelStage,
     PyStage,
     RaiseStage,
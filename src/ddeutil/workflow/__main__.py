@@ -6,6 +6,8 @@
 from __future__ import annotations
 
 import json
+import signal
+from datetime import datetime
 from pathlib import Path
 from platform import python_version
 from textwrap import dedent
@@ -16,10 +18,13 @@ from pydantic import Field, TypeAdapter
 
 from .__about__ import __version__
 from .__types import DictData
+from .audits import LocalFileAudit, ReleaseType, get_audit
 from .conf import config
 from .errors import JobError
 from .job import Job
 from .params import Param
+from .result import FAILED
+from .scheduler import CatchUp, Scheduler
 from .workflow import Workflow
 
 app = typer.Typer(pretty_exceptions_enable=True)
@@ -196,6 +201,53 @@ def api(
     )
 
 
+@app.command()
+def scheduler(
+    path: Annotated[
+        Optional[Path],
+        typer.Option(help="A config path of the workflow templates."),
+    ] = None,
+    tag: Annotated[
+        Optional[list[str]],
+        typer.Option(help="A tag that want to filter the workflow templates."),
+    ] = None,
+    max_workers: Annotated[
+        Optional[int],
+        typer.Option(help="The maximum releases that run in parallel."),
+    ] = None,
+    catchup: Annotated[
+        Optional[CatchUp],
+        typer.Option(help="A catch-up policy of the missed releases."),
+    ] = None,
+    misfire_grace: Annotated[
+        Optional[float],
+        typer.Option(help="The maximum delay second of a due release."),
+    ] = None,
+    reload_interval: Annotated[
+        Optional[float],
+        typer.Option(help="The second between two config reloads."),
+    ] = None,
+) -> None:
+    """Run the scheduler daemon that releases all workflows with their event
+    schedules. It stops on SIGINT or SIGTERM and reloads the config on SIGHUP.
+    """
+    daemon = Scheduler(
+        path=path,
+        tags=tag,
+        max_workers=max_workers,
+        catchup=catchup,
+        misfire_grace=misfire_grace,
+        reload_interval=reload_interval,
+    )
+    signal.signal(signal.SIGINT, lambda *_: daemon.stop())
+    signal.signal(signal.SIGTERM, lambda *_: daemon.stop())
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, lambda *_: daemon.reload())
+
+    typer.echo(f"Start scheduler with config path: {path or config.conf_path}")
+    daemon.run()
+
+
 @app.command()
 def make(
     name: Annotated[Path, typer.Argument()],
@@ -238,6 +290,70 @@ def workflow_execute(
     typer.echo(f"... with params: {params_dict}")
 
 
+@workflow_app.command(name="backfill")
+def workflow_backfill(
+    name: Annotated[
+        str,
+        typer.Option(help="A name of workflow template."),
+    ],
+    start: Annotated[
+        datetime,
+        typer.Option(help="A start release datetime with inclusive bound."),
+    ],
+    end: Annotated[
+        datetime,
+        typer.Option(help="An end release datetime with inclusive bound."),
+    ],
+    params: Annotated[
+        str,
+        typer.Option(help="A workflow release parameters"),
+    ] = "{}",
+    max_parallel: Annotated[
+        int,
+        typer.Option(help="The maximum releases that run in parallel."),
+    ] = 1,
+    release_type: Annotated[
+        ReleaseType,
+        typer.Option(help="A release type of each release."),
+    ] = ReleaseType.NORMAL,
+    timeout: Annotated[
+        int,
+        typer.Option(help="A timeout in second of each release."),
+    ] = 600,
+    ordered: Annotated[
+        bool,
+        typer.Option(help="Report releases in the release datetime order."),
+    ] = True,
+    path: Annotated[
+        Optional[Path],
+        typer.Option(help="A config path of the workflow template."),
+    ] = None,
+) -> None:
+    """Backfill workflow with all release datetimes of its event schedules."""
+    try:
+        params_dict: dict[str, Any] = json.loads(params)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Params does not support format: {params!r}.") from e
+
+    workflow: Workflow = Workflow.from_conf(name=name, path=path)
+    typer.echo(f"Start backfill workflow template: {name}")
+    rs = workflow.backfill(
+        start,
+        end,
+        params=params_dict,
+        max_parallel=max_parallel,
+        release_type=release_type,
+        timeout=timeout,
+        ordered=ordered,
+        callback=lambda dt, r: typer.echo(
+            f"... {dt:%Y-%m-%d %H:%M:%S} : {r.status.name}"
+        ),
+    )
+    typer.echo(f"[BACKFILL]: {rs.status.name} with {rs.context['metrics']}")
+    if rs.status == FAILED:
+        raise typer.Exit(code=1)
+
+
 class WorkflowSchema(Workflow):
     """Override workflow model fields for generate JSON schema file."""
 
@@ -279,5 +395,22 @@ def log_callback():
     """Manage Only Log CLI."""
 
 
+@log_app.command(name="rebuild-catalog")
+def log_rebuild_catalog(
+    path: Annotated[
+        Optional[Path],
+        typer.Option(help="An audit path that want to rebuild its catalog."),
+    ] = None,
+) -> None:
+    """Rebuild the audit catalog from all log files of the file audit."""
+    audit = LocalFileAudit(path=path) if path else get_audit()
+    if not isinstance(audit, LocalFileAudit):
+        typer.echo(f"Audit type: {audit.type!r} does not have catalog.")
+        raise typer.Exit(code=1)
+
+    typer.echo(f"Start rebuild audit catalog: {audit.catalog}")
+    typer.echo(f"... index {audit.rebuild_catalog()} audit logs.")
+
+
 if __name__ == "__main__":
     app()
@@ -27,7 +27,7 @@ router = APIRouter(
     tags=["audit"],
 )
 async def get_audits(
-    offset: int = Query(default=0, gt=0),
+    offset: int = Query(default=0, ge=0),
     limit: int = Query(default=100, gt=0),
 ):
     """Return all audit logs from the current audit log path that config with
@@ -37,7 +37,9 @@ async def get_audits(
         "message": (
             f"Getting audit logs with offset: {offset} and limit: {limit}",
         ),
-        "audits": list(get_audit().find_audits(name="demo")),
+        "audits": list(
+            get_audit().find_audits(name="demo", offset=offset, limit=limit)
+        ),
     }
 
 
@@ -48,15 +50,24 @@ async def get_audits(
     summary="Read all audit logs with specific workflow name.",
     tags=["audit"],
 )
-async def get_audit_with_workflow(workflow: str):
+async def get_audit_with_workflow(
+    workflow: str,
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, gt=0),
+):
     """Return all audit logs with specific workflow name from the current audit
     log path that config with `WORKFLOW_AUDIT_URL` environment variable name.
+    These audit logs order from the newest release.
 
     - **workflow**: A specific workflow name that want to find audit logs.
+    - **offset**: A number of audit logs that want to skip.
+    - **limit**: A maximum number of audit logs.
     """
     return {
         "message": f"Getting audit logs with workflow name {workflow}",
-        "audits": list(get_audit().find_audits(name="demo")),
+        "audits": list(
+            get_audit().find_audits(name=workflow, offset=offset, limit=limit)
+        ),
     }
 
 
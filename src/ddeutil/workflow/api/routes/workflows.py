@@ -10,7 +10,7 @@ from dataclasses import asdict
 from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from fastapi import status as st
 from fastapi.responses import UJSONResponse
 from pydantic import BaseModel
@@ -90,7 +90,12 @@ async def workflow_execute(name: str, payload: ExecutePayload) -> DictData:
 
 
 @router.get(path="/{name}/audits", status_code=st.HTTP_200_OK)
-async def get_workflow_audits(name: str):
+async def get_workflow_audits(
+    name: str,
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, gt=0),
+):
+    """Get Workflow audit logs that order from the newest release."""
     try:
         return {
             "message": f"Getting workflow {name!r} audits",
@@ -100,7 +105,9 @@ async def get_workflow_audits(name: str):
                     exclude_none=False,
                     exclude_unset=True,
                 )
-                for audit in get_audit().find_audits(name=name)
+                for audit in get_audit().find_audits(
+                    name=name, offset=offset, limit=limit
+                )
             ],
         }
     except FileNotFoundError:
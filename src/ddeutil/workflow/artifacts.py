@@ -0,0 +1,488 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Artifact Store Module.
+
+This module provides the local artifact store that passes the large stage
+outputs, like the DataFrame or the NumPy array, between stages by reference
+instead of merging the value itself to the context data.
+
+    The call stage function returns the value that wrap with the `artifact`
+function, and the call stage puts it to the store and keeps only the artifact
+handle, the small mapping of the reference and metadata, in its outputs. So,
+the deep-copy of the context data and the audit only see this handle. The
+template, like `${{ stages.x.outputs.df }}`, loads the value from the store
+lazily when it reaches the handle.
+
+    The store serializes the value with the pickle protocol 5 and keeps its
+out-of-band buffers, like the NumPy array data, after the pickle data. It
+loads these buffers without copying them from the memory-mapped file, or from
+the shared memory segment if the artifact was put with the `shared` flag.
+
+    Each artifact has a reference count that starts from the workflow running
+ID that owns it. The workflow releases its artifacts at the end of the
+execution, or passes them to its parent workflow if it was triggered from the
+trigger stage.
+
+Classes:
+    ArtifactValue: A pending value that want to put to the artifact store
+    ArtifactStore: A local artifact store with the reference counting
+
+Functions:
+    artifact: Wrap a value that want to pass by reference
+    is_artifact: Check a value is the artifact handle
+    get_artifact_store: Get the process-wide artifact store
+
+Example:
+    ```python
+    from ddeutil.workflow import artifact, tag
+
+    @tag("polars", alias="load-frame")
+    def load_frame(path: str) -> dict:
+        return {"df": artifact(pl.read_parquet(path), shared=True)}
+    ```
+"""
+from __future__ import annotations
+
+import atexit
+import mmap
+import os
+import pickle
+import sys
+from multiprocessing import parent_process, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from threading import Lock
+from typing import Any, Final, Optional
+from uuid import uuid4
+
+from .__types import DictData
+from .conf import dynamic
+
+ARTIFACT_KEY: Final[str] = "$artifact"
+
+
+class ArtifactValue:
+    """Pending value that want to put to the artifact store. The call stage
+    replaces this object with the artifact handle after its function returns.
+    """
+
+    __slots__ = ("value", "shared")
+
+    def __init__(self, value: Any, shared: bool = False) -> None:
+        self.value: Any = value
+        self.shared: bool = shared
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(type={type(self.value).__name__}, "
+            f"shared={self.shared})"
+        )
+
+
+def artifact(value: Any, *, shared: bool = False) -> ArtifactValue:
+    """Wrap a value that want to pass to the next stages by reference. It
+    should use on the returned mapping of the call stage function.
+
+    Args:
+        value (Any): A value that can pickle.
+        shared (bool, default False): A flag that put this value to the
+            shared memory segment instead of the file for the zero-copy
+            loading on the same host.
+
+    Returns:
+        ArtifactValue: A pending artifact value.
+    """
+    return ArtifactValue(value, shared=shared)
+
+
+def is_artifact(value: Any) -> bool:
+    """Check a value is the artifact handle.
+
+    Args:
+        value (Any): Any value.
+
+    Returns:
+        bool: True if it is the artifact handle.
+    """
+    return isinstance(value, dict) and ARTIFACT_KEY in value
+
+
+class ArtifactStore:
+    """Local artifact store that keeps the artifact values on the filesystem
+    or the shared memory segments, and tracks their reference counts and owner
+    running IDs.
+
+        The reference counts and owners only track in the current process.
+    The child process of the process executor detaches its artifacts and
+    returns their handles, so the parent process adopts them to its store and
+    removes them when its owner releases. The file artifacts that the parent
+    does not adopt will remove together with the running ID directory.
+
+    Examples:
+        >>> store = ArtifactStore()
+        >>> handle = store.put([1, 2, 3], run_id="01", path=Path("./tmp"))
+        >>> store.get(handle)
+        [1, 2, 3]
+        >>> store.release_run("01")
+    """
+
+    def __init__(self) -> None:
+        self._lock: Lock = Lock()
+        self._refs: dict[str, int] = {}
+        self._handles: dict[str, DictData] = {}
+        self._owners: dict[str, set[str]] = {}
+        self._segments: dict[str, SharedMemory] = {}
+
+    def put(
+        self,
+        value: Any,
+        run_id: str,
+        *,
+        path: Path,
+        shared: bool = False,
+    ) -> DictData:
+        """Put a value to this store and return its artifact handle that own
+        by the running ID.
+
+        Args:
+            value (Any): A value that can pickle.
+            run_id (str): An owner running ID.
+            path (Path): A base path of the file artifacts.
+            shared (bool, default False): A flag that put this value to the
+                shared memory segment.
+
+        Returns:
+            DictData: An artifact handle.
+        """
+        buffers: list[pickle.PickleBuffer] = []
+        data: bytes = pickle.dumps(
+            value, protocol=5, buffer_callback=buffers.append
+        )
+        raws: list[memoryview] = [b.raw() for b in buffers]
+        sizes: list[int] = [len(data)] + [r.nbytes for r in raws]
+        artifact_id: str = uuid4().hex
+        if shared:
+            shm = SharedMemory(
+                name=f"wf-{artifact_id[:24]}", create=True, size=sum(sizes)
+            )
+            pos: int = 0
+            for chunk, size in zip([data, *raws], sizes):
+                shm.buf[pos : pos + size] = chunk
+                pos += size
+            location: str = shm.name
+            with self._lock:
+                self._segments[location] = shm
+        else:
+            file: Path = path / run_id / f"{artifact_id}.bin"
+            file.parent.mkdir(parents=True, exist_ok=True)
+            with file.open(mode="wb") as f:
+                f.write(data)
+                for raw in raws:
+                    f.write(raw)
+            location: str = str(file)
+
+        handle: DictData = {
+            ARTIFACT_KEY: artifact_id,
+            "kind": "shm" if shared else "file",
+            "location": location,
+            "type": f"{type(value).__module__}.{type(value).__qualname__}",
+            "size": sum(sizes),
+            "sizes": sizes,
+        }
+        with self._lock:
+            self._refs[artifact_id] = 1
+            self._handles[artifact_id] = handle
+            self._owners.setdefault(run_id, set()).add(artifact_id)
+        return handle
+
+    def get(self, handle: DictData) -> Any:
+        """Load a value of the artifact handle. The out-of-band buffers of
+        this value do not copy from the memory-mapped file or the shared memory
+        segment.
+
+        Args:
+            handle (DictData): An artifact handle.
+
+        Raises:
+            FileNotFoundError: If the artifact was released.
+
+        Returns:
+            Any: A value of this artifact.
+        """
+        if handle["kind"] == "shm":
+            buf: memoryview = self._attach(handle["location"]).buf
+        else:
+            with open(handle["location"], mode="rb") as f:
+                buf: memoryview = memoryview(
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+                )
+
+        views: list[memoryview] = []
+        pos: int = 0
+        for size in handle["sizes"]:
+            views.append(buf[pos : pos + size])
+            pos += size
+        return pickle.loads(views[0], buffers=views[1:])
+
+    def _attach(self, name: str) -> SharedMemory:
+        """Attach the shared memory segment by its name. It does not track
+        this segment with the resource tracker because it does not own it.
+
+        Args:
+            name (str): A shared memory segment name.
+
+        Raises:
+            FileNotFoundError: If the segment does not exist.
+
+        Returns:
+            SharedMemory: A shared memory segment.
+        """
+        with self._lock:
+            if name in self._segments:
+                return self._segments[name]
+
+        if sys.version_info >= (3, 13):  # pragma: no cov
+            shm = SharedMemory(name=name, track=False)
+        else:
+            shm = SharedMemory(name=name)
+            resource_tracker.unregister(shm._name, "shared_memory")
+
+        with self._lock:
+            return self._segments.setdefault(name, shm)
+
+    def retain(self, handle: DictData) -> None:
+        """Increase the reference count of the artifact, so it does not remove
+        when its owner releases.
+
+        Args:
+            handle (DictData): An artifact handle.
+        """
+        with self._lock:
+            self._refs[handle[ARTIFACT_KEY]] += 1
+
+    def release(self, handle: DictData) -> None:
+        """Decrease the reference count of the artifact and remove it when its
+        reference count reaches zero.
+
+        Args:
+            handle (DictData): An artifact handle.
+        """
+        artifact_id: str = handle[ARTIFACT_KEY]
+        with self._lock:
+            if artifact_id not in self._refs:
+                return
+            self._refs[artifact_id] -= 1
+            if self._refs[artifact_id] > 0:
+                return
+            self._refs.pop(artifact_id)
+            handle: DictData = self._handles.pop(artifact_id, handle)
+        self._remove(handle)
+
+    def release_run(
+        self,
+        run_id: str,
+        parent_run_id: Optional[str] = None,
+        *,
+        path: Optional[Path] = None,
+    ) -> None:
+        """Release all artifacts that own by the running ID. If it passes the
+        different parent running ID, it moves these artifacts to the parent
+        owner instead, so the parent workflow can use the outputs of its
+        triggered workflow.
+
+        Args:
+            run_id (str): An owner running ID.
+            parent_run_id (str, default None): A parent running ID.
+            path (Path, default None): A base path of the file artifacts that
+                want to clean up the running ID directory.
+        """
+        with self._lock:
+            ids: set[str] = self._owners.pop(run_id, set())
+            if parent_run_id and parent_run_id != run_id:
+                self._owners.setdefault(parent_run_id, set()).update(ids)
+                return
+            handles: list[DictData] = [self._handles[i] for i in ids]
+
+        for handle in handles:
+            self.release(handle)
+
+        # NOTE: Remove the file artifacts that put from the child process and
+        #   do not track on this store.
+        if path is None or not (path / run_id).exists():
+            return
+        for file in (path / run_id).glob("*.bin"):
+            with self._lock:
+                if file.stem in self._refs:
+                    continue
+            file.unlink(missing_ok=True)
+        try:
+            (path / run_id).rmdir()
+        except OSError:
+            pass
+
+    def _remove(self, handle: DictData) -> None:
+        """Remove the artifact value from the filesystem or the shared memory.
+
+        Args:
+            handle (DictData): An artifact handle.
+        """
+        if handle["kind"] == "file":
+            file: Path = Path(handle["location"])
+            file.unlink(missing_ok=True)
+            try:
+                file.parent.rmdir()
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            shm: Optional[SharedMemory] = self._segments.pop(
+                handle["location"], None
+            )
+        if shm is None:
+            return
+        try:
+            shm.unlink()
+        except FileNotFoundError:  # pragma: no cov
+            pass
+        try:
+            shm.close()
+        except BufferError:
+            # NOTE: The loaded value still uses this segment, so it closes
+            #   when the value was garbage collected.
+            pass
+
+    def detach(self) -> dict[str, list[DictData]]:
+        """Detach all artifacts from this store without removing them, so the
+        other process can adopt them with the `adopt` method.
+
+        Returns:
+            dict[str, list[DictData]]: A mapping of owner running ID and its
+                artifact handles.
+        """
+        with self._lock:
+            owned: dict[str, list[DictData]] = {
+                run_id: [self._handles[i] for i in ids if i in self._handles]
+                for run_id, ids in self._owners.items()
+            }
+            segments: list[SharedMemory] = list(self._segments.values())
+            self._refs.clear()
+            self._handles.clear()
+            self._owners.clear()
+            self._segments.clear()
+
+        for shm in segments:
+            try:
+                shm.close()
+            except BufferError:  # pragma: no cov
+                pass
+        return owned
+
+    def adopt(self, owned: dict[str, list[DictData]]) -> None:
+        """Adopt the artifacts that detach from the other process's store, so
+        they will remove when their owners release on this store.
+
+        Args:
+            owned (dict[str, list[DictData]]): A mapping of owner running ID
+                and its artifact handles.
+        """
+        for run_id, handles in owned.items():
+            for handle in handles:
+                artifact_id: str = handle[ARTIFACT_KEY]
+                shm: Optional[SharedMemory] = None
+                if handle["kind"] == "shm":
+                    try:
+                        shm = SharedMemory(name=handle["location"])
+                    except FileNotFoundError:  # pragma: no cov
+                        continue
+
+                with self._lock:
+                    if shm is not None:
+                        self._segments[handle["location"]] = shm
+                    self._refs[artifact_id] = 1
+                    self._handles[artifact_id] = handle
+                    self._owners.setdefault(run_id, set()).add(artifact_id)
+
+    def close(self) -> None:
+        """Remove all artifacts that this store tracks."""
+        with self._lock:
+            handles: list[DictData] = list(self._handles.values())
+            self._refs.clear()
+            self._handles.clear()
+            self._owners.clear()
+        for handle in handles:
+            self._remove(handle)
+
+
+def store_artifacts(
+    value: Any, run_id: str, *, extras: Optional[DictData] = None
+) -> Any:
+    """Replace all pending artifact values in the nested mapping or list with
+    the artifact handles that put to the process-wide artifact store.
+
+    Args:
+        value (Any): A returned value from the call stage function.
+        run_id (str): An owner running ID.
+        extras (DictData, default None): An extra parameter that want to
+            override the `artifact_path` config value.
+
+    Returns:
+        Any: A value that replace all pending artifact values.
+    """
+    if isinstance(value, ArtifactValue):
+        return get_artifact_store().put(
+            value.value,
+            run_id,
+            path=dynamic("artifact_path", extras=extras),
+            shared=value.shared,
+        )
+    elif isinstance(value, dict):
+        return {
+            k: store_artifacts(v, run_id, extras=extras)
+            for k, v in value.items()
+        }
+    elif isinstance(value, (list, tuple)):
+        return type(value)(
+            store_artifacts(v, run_id, extras=extras) for v in value
+        )
+    return value
+
+
+_STORE: Optional[ArtifactStore] = None
+_STORE_LOCK: Lock = Lock()
+
+
+def get_artifact_store() -> ArtifactStore:
+    """Get the process-wide artifact store. All artifacts that it tracks will
+    remove at the interpreter exit of the main process. The store of the
+    child process does not remove them because it passes them to its parent
+    process.
+
+    Returns:
+        ArtifactStore: The process-wide artifact store.
+    """
+    global _STORE
+
+    with _STORE_LOCK:
+        if _STORE is None:
+            _STORE = ArtifactStore()
+            if parent_process() is None:
+                atexit.register(_STORE.close)
+        return _STORE
+
+
+def _reset_store() -> None:  # pragma: no cov
+    """Drop the artifact store that copy from the parent process after fork
+    because its artifacts belong to the parent process.
+    """
+    global _STORE, _STORE_LOCK
+
+    _STORE = None
+    _STORE_LOCK = Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_store)
@@ -41,6 +41,8 @@ Note:
 """
 from __future__ import annotations
 
+import atexit
+import gzip
 import json
 import logging
 import os
@@ -48,10 +50,14 @@ import sqlite3
 import zlib
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from enum import Enum
+from itertools import islice
+from multiprocessing.util import Finalize
 from pathlib import Path
-from typing import Annotated, Any, ClassVar, Literal, Optional, Union
+from threading import Lock
+from typing import IO, Annotated, Any, ClassVar, Literal, Optional, Union
 from urllib.parse import ParseResult, urlparse
 
 from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
@@ -59,8 +65,9 @@ from pydantic.functional_validators import field_validator, model_validator
 from typing_extensions import Self
 
 from .__types import DictData
-from .conf import dynamic
+from .conf import config, dynamic
 from .traces import Trace, get_trace
+from .utils import UTC, BatchWriter
 
 logger = logging.getLogger("ddeutil.workflow")
 
@@ -181,12 +188,16 @@ class BaseAudit(BaseModel, ABC):
         self,
         name: str,
         *,
+        offset: int = 0,
+        limit: Optional[int] = None,
         extras: Optional[DictData] = None,
     ) -> Iterator[Self]:
         """Find all audit data for a given workflow name.
 
         Args:
             name: The workflow name to search for.
+            offset: A number of audit data that want to skip.
+            limit: A maximum number of audit data that want to generate.
             extras: Optional extra parameters to override core config.
 
         Returns:
@@ -224,6 +235,32 @@ class BaseAudit(BaseModel, ABC):
             "Audit should implement `find_audit_with_release` class-method"
         )
 
+    @abstractmethod
+    def find_releases(
+        self,
+        name: str,
+        *,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> set[datetime]:
+        """Find all release datetimes that already audit for a given workflow
+        name with one query.
+
+        Args:
+            name: The workflow name to search for.
+            start: An optional inclusive lower bound of the release.
+            end: An optional inclusive upper bound of the release.
+
+        Returns:
+            set[datetime]: A set of release datetimes without timezone.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by subclass.
+        """
+        raise NotImplementedError(
+            "Audit should implement `find_releases` method"
+        )
+
     def do_before(self) -> None:
         """Perform actions before the end of initial log model setup.
 
@@ -249,6 +286,23 @@ class BaseAudit(BaseModel, ABC):
         """
         raise NotImplementedError("Audit should implement `save` method.")
 
+    def save_many(
+        self, data: list[Any], excluded: Optional[list[str]] = None
+    ) -> Self:
+        """Save a batch of logging data. It saves them one by one by default
+        and the subclass should override it with the batch writing.
+
+        Args:
+            data: A list of audit data.
+            excluded: Optional list of field names to exclude from saving.
+
+        Returns:
+            Self: The audit instance after saving.
+        """
+        for obj in data:
+            self.save(obj, excluded=excluded)
+        return self
+
 
 class LocalFileAudit(BaseAudit):
     """File Audit Pydantic Model for saving log data from workflow execution.
@@ -257,20 +311,58 @@ class LocalFileAudit(BaseAudit):
     for audit logs. It saves workflow execution results to JSON files
     in a structured directory hierarchy.
 
+        It also keeps the sidecar SQLite catalog, `catalog.db`, at the base
+    audit path that index the workflow name, release, and log file of each
+    saved audit log. The find methods use this catalog for the newest-first
+    pagination and the release range query instead of globbing and loading
+    all log files. If the catalog does not exist, they fall back to scan the
+    log files. The first connection to a new catalog indexes the log files
+    that were written before it, and you can build it again with the
+    `rebuild_catalog` method.
+
     Attributes:
         file_fmt: Class variable defining the filename format for audit log.
         file_release_fmt: Class variable defining the filename format for audit
             release log.
+        catalog_name: Class variable defining the catalog filename.
+        compress_suffix: Class variable mapping the compression to the log
+            filename suffix.
+        catalog_ddl: Class variable defining the catalog schema.
     """
 
     file_fmt: ClassVar[str] = "workflow={name}"
     file_release_fmt: ClassVar[str] = "release={release:%Y%m%d%H%M%S}"
+    catalog_name: ClassVar[str] = "catalog.db"
+    compress_suffix: ClassVar[dict[str, str]] = {"gzip": ".gz", "zstd": ".zst"}
+    catalog_ddl: ClassVar[tuple[str, ...]] = (
+        """
+        CREATE TABLE IF NOT EXISTS catalog (
+            workflow        TEXT NOT NULL
+            , release       TEXT NOT NULL
+            , run_id        TEXT NOT NULL
+            , file          TEXT NOT NULL
+            , updated_at    REAL NOT NULL
+            , PRIMARY KEY ( workflow, release, run_id )
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS catalog_workflow_release
+        ON catalog ( workflow, release DESC, updated_at DESC )
+        """,
+    )
 
     type: Literal["file"] = "file"
     path: Path = Field(
         default=Path("./audits"),
         description="A file path that use to manage audit logs.",
     )
+    compress: Optional[Literal["gzip", "zstd"]] = Field(
+        default=None,
+        description=(
+            "A compression of the audit log file. The `zstd` compression "
+            "needs the `zstandard` package on Python before 3.14."
+        ),
+    )
 
     @field_validator("path", mode="before", json_schema_input_type=str)
     def __prepare_path(cls, data: Any) -> Any:
@@ -285,16 +377,112 @@ class LocalFileAudit(BaseAudit):
         """
         Path(self.path).mkdir(parents=True, exist_ok=True)
 
+    @property
+    def catalog(self) -> Path:
+        """Return the sidecar catalog file path of this audit path.
+
+        Returns:
+            Path: The catalog file path.
+        """
+        return self.path / self.catalog_name
+
+    @contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        """Open the connection to the catalog and create its table if it does
+        not exist. It commits the changes when the block exits without error.
+
+        Yields:
+            sqlite3.Connection: The catalog connection.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.catalog, timeout=30)
+        try:
+            with conn:
+                for ddl in self.catalog_ddl:
+                    conn.execute(ddl)
+
+                # NOTE: Index the log files that were written before this
+                #   catalog was created, and mark it with the user version.
+                if conn.execute("PRAGMA user_version").fetchone()[0] == 0:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO catalog VALUES (?, ?, ?, ?, ?)",
+                        self._scan_catalog(),
+                    )
+                    conn.execute("PRAGMA user_version = 1")
+                yield conn
+        finally:
+            conn.close()
+
+    def _scan_catalog(self) -> list[tuple[str, str, str, str, float]]:
+        """Scan all log files at the audit path to the catalog rows.
+
+        Returns:
+            list[tuple[str, str, str, str, float]]: A list of catalog rows.
+        """
+        return [
+            (
+                workflow_dir.name.removeprefix("workflow="),
+                release_dir.name.removeprefix("release="),
+                file.name.split(".", 1)[0],
+                file.relative_to(self.path).as_posix(),
+                file.stat().st_mtime,
+            )
+            for workflow_dir in self.path.glob("workflow=*")
+            for release_dir in workflow_dir.glob("release=*")
+            for file in release_dir.glob("*.log*")
+        ]
+
+    @staticmethod
+    def _open(file: Path, mode: str, compress: Optional[str] = None) -> IO:
+        """Open the audit log file with text mode. It detects the compression
+        from the file suffix if it does not pass.
+
+        Args:
+            file: An audit log file path.
+            mode: A text mode, `rt` or `wt`.
+            compress: An optional compression, `gzip` or `zstd`.
+
+        Returns:
+            IO: A text file object.
+        """
+        if compress is None:
+            compress = {".gz": "gzip", ".zst": "zstd"}.get(file.suffix)
+
+        if compress == "gzip":
+            return gzip.open(file, mode=mode, encoding="utf-8")
+        elif compress == "zstd":
+            try:
+                from compression import zstd
+            except ImportError:
+                try:
+                    import zstandard as zstd
+                except ImportError as e:
+                    raise ImportError(
+                        "Zstd compression need to install `zstandard` package "
+                        "first"
+                    ) from e
+            return zstd.open(file, mode=mode, encoding="utf-8")
+        return file.open(mode=mode, encoding="utf-8")
+
     def find_audits(
         self,
         name: str,
         *,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
         extras: Optional[DictData] = None,
     ) -> Iterator[AuditData]:
-        """Generate audit data found from logs path for a specific workflow name.
+        """Generate audit data found from logs path for a specific workflow
+        name. It orders these audit data from the newest release.
 
         Args:
             name: The workflow name to search for release logging data.
+            offset: A number of audit data that want to skip.
+            limit: A maximum number of audit data that want to generate.
+            start: An optional inclusive lower bound of the release.
+            end: An optional inclusive upper bound of the release.
             extras: Optional extra parameters to override core config.
 
         Returns:
@@ -307,9 +495,94 @@ class LocalFileAudit(BaseAudit):
         if not pointer.exists():
             raise FileNotFoundError(f"Pointer: {pointer.absolute()}.")
 
-        for file in pointer.glob("./release=*/*.log"):
-            with file.open(mode="r", encoding="utf-8") as f:
-                yield AuditData.model_validate(obj=json.load(f))
+        if self.catalog.exists():
+            files: Iterator[Path] = (
+                self.path / file
+                for file in self._query_catalog(
+                    name, offset=offset, limit=limit, start=start, end=end
+                )
+            )
+        else:
+            files: Iterator[Path] = islice(
+                (
+                    file
+                    for release_pointer in sorted(
+                        pointer.glob("./release=*"), reverse=True
+                    )
+                    if self._in_range(release_pointer.name, start, end)
+                    for file in sorted(
+                        release_pointer.glob("./*.log*"),
+                        key=os.path.getmtime,
+                        reverse=True,
+                    )
+                ),
+                offset,
+                None if limit is None else offset + limit,
+            )
+
+        for file in files:
+            try:
+                with self._open(file, mode="rt") as f:
+                    yield AuditData.model_validate(obj=json.load(f))
+            except FileNotFoundError:
+                # NOTE: Skip the catalog row that its log file was removed.
+                continue
+
+    def _query_catalog(
+        self,
+        name: str,
+        *,
+        release: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> list[str]:
+        """Return the relative log file paths of the workflow name from the
+        catalog that order from the newest release.
+
+        Args:
+            name: The workflow name to search for.
+            release: An optional exact release.
+            offset: A number of rows that want to skip.
+            limit: A maximum number of rows.
+            start: An optional inclusive lower bound of the release.
+            end: An optional inclusive upper bound of the release.
+
+        Returns:
+            list[str]: A list of log file paths relative to the audit path.
+        """
+        query: str = "SELECT file FROM catalog WHERE workflow = ?"
+        values: list[Any] = [name]
+        for op, dt in (("=", release), (">=", start), ("<=", end)):
+            if dt is not None:
+                query += f" AND release {op} ?"
+                values.append(f"{dt:%Y%m%d%H%M%S}")
+        query += " ORDER BY release DESC, updated_at DESC LIMIT ? OFFSET ?"
+        values.extend([-1 if limit is None else limit, offset])
+        with self.connect() as conn:
+            return [row[0] for row in conn.execute(query, values)]
+
+    @staticmethod
+    def _in_range(
+        release_name: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+    ) -> bool:
+        """Check the release directory name is in the release range.
+
+        Args:
+            release_name: A release directory name like `release=20240101...`.
+            start: An optional inclusive lower bound of the release.
+            end: An optional inclusive upper bound of the release.
+
+        Returns:
+            bool: True if this release is in the range.
+        """
+        release: str = release_name.removeprefix("release=")
+        if start is not None and release < f"{start:%Y%m%d%H%M%S}":
+            return False
+        return end is None or release <= f"{end:%Y%m%d%H%M%S}"
 
     def find_audit_with_release(
         self,
@@ -335,6 +608,17 @@ class LocalFileAudit(BaseAudit):
             FileNotFoundError: If the specified workflow/release directory does not exist.
             ValueError: If no releases found when release is None.
         """
+        if self.catalog.exists():
+            files: list[str] = self._query_catalog(
+                name, release=release, limit=1
+            )
+            if not files:
+                raise FileNotFoundError(
+                    f"Audit not found for workflow: {name}, release: {release}"
+                )
+            with self._open(self.path / files[0], mode="rt") as f:
+                return AuditData.model_validate(obj=json.load(f))
+
         if release is None:
             pointer: Path = self.path / self.file_fmt.format(name=name)
             if not pointer.exists():
@@ -345,31 +629,68 @@ class LocalFileAudit(BaseAudit):
                     f"No releases found for workflow: {name}"
                 )
 
-            # NOTE: Get the latest release directory
-            release_pointer = max(
-                pointer.glob("./release=*"), key=os.path.getctime
-            )
+            # NOTE: Get the latest release directory from its name that sort
+            #   with the release datetime.
+            release_pointer = max(pointer.glob("./release=*"))
         else:
-            release_pointer: Path = (
-                Path(self.path)
-                / f"workflow={name}/release={release:%Y%m%d%H%M%S}"
-            )
+            release_pointer: Path = self._pointer(name, release)
             if not release_pointer.exists():
                 raise FileNotFoundError(
                     f"Pointer: {release_pointer} does not found."
                 )
 
-        if not any(release_pointer.glob("./*.log")):
+        if not any(release_pointer.glob("./*.log*")):
             raise FileNotFoundError(
                 f"Pointer: {release_pointer} does not contain any log."
             )
 
         latest_file: Path = max(
-            release_pointer.glob("./*.log"), key=os.path.getctime
+            release_pointer.glob("./*.log*"), key=os.path.getmtime
         )
-        with latest_file.open(mode="r", encoding="utf-8") as f:
+        with self._open(latest_file, mode="rt") as f:
             return AuditData.model_validate(obj=json.load(f))
 
+    def find_releases(
+        self,
+        name: str,
+        *,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> set[datetime]:
+        """Find all release datetimes that already audit for a given workflow
+        name from the catalog, or from the release directory names if the
+        catalog does not exist.
+
+        Args:
+            name: The workflow name to search for.
+            start: An optional inclusive lower bound of the release.
+            end: An optional inclusive upper bound of the release.
+
+        Returns:
+            set[datetime]: A set of release datetimes without timezone.
+        """
+        if self.catalog.exists():
+            query: str = (
+                "SELECT DISTINCT release FROM catalog WHERE workflow = ?"
+            )
+            values: list[Any] = [name]
+            for op, dt in ((">=", start), ("<=", end)):
+                if dt is not None:
+                    query += f" AND release {op} ?"
+                    values.append(f"{dt:%Y%m%d%H%M%S}")
+            with self.connect() as conn:
+                releases: list[str] = [
+                    r[0] for r in conn.execute(query, values)
+                ]
+        else:
+            pointer: Path = self.path / self.file_fmt.format(name=name)
+            releases: list[str] = [
+                p.name.removeprefix("release=")
+                for p in pointer.glob("./release=*")
+                if self._in_range(p.name, start, end)
+            ]
+        return {datetime.strptime(r, "%Y%m%d%H%M%S") for r in releases}
+
     def is_pointed(
         self,
         data: Any,
@@ -377,30 +698,52 @@ class LocalFileAudit(BaseAudit):
         extras: Optional[DictData] = None,
     ) -> bool:
         """Check if the release log already exists at the destination log path.
+        It only stats the release directory without validating the full audit
+        data.
 
         Args:
-            data (str):
+            data (Any): An audit data or a mapping that has the workflow name
+                and release keys.
             extras: Optional extra parameters to override core config.
 
         Returns:
             bool: True if the release log exists, False otherwise.
         """
-        return self.pointer(AuditData.model_validate(data)).exists()
+        if isinstance(data, AuditData):
+            name, release = data.name, data.release
+        else:
+            name, release = data["name"], data["release"]
+            if not isinstance(release, datetime):
+                release = TypeAdapter(datetime).validate_python(release)
+        return self._pointer(name, release).exists()
 
-    def pointer(self, data: AuditData) -> Path:
-        """Return release directory path generated from model data.
+    def _pointer(self, name: str, release: datetime) -> Path:
+        """Return release directory path of the workflow name and release.
+
+        Args:
+            name: The workflow name.
+            release: The release datetime.
 
         Returns:
-            Path: The directory path for the current workflow and release.
+            Path: The directory path for the workflow and release.
         """
         return (
             self.path
-            / self.file_fmt.format(**data.model_dump(by_alias=True))
-            / self.file_release_fmt.format(**data.model_dump(by_alias=True))
+            / self.file_fmt.format(name=name)
+            / self.file_release_fmt.format(release=release)
         )
 
+    def pointer(self, data: AuditData) -> Path:
+        """Return release directory path generated from model data.
+
+        Returns:
+            Path: The directory path for the current workflow and release.
+        """
+        return self._pointer(data.name, data.release)
+
     def save(self, data: Any, excluded: Optional[list[str]] = None) -> Self:
-        """Save logging data received from workflow execution result.
+        """Save logging data received from workflow execution result and
+        index its log file to the catalog.
 
         Args:
             data:
@@ -409,40 +752,98 @@ class LocalFileAudit(BaseAudit):
         Returns:
             Self: The audit instance after saving.
         """
-        audit = AuditData.model_validate(data)
-        trace: Trace = get_trace(
-            audit.run_id,
-            parent_run_id=audit.parent_run_id,
-            extras=self.extras,
-        )
+        return self.save_many([data], excluded=excluded)
 
-        # NOTE: Check environ variable was set for real writing.
-        if not dynamic("enable_write_audit", extras=self.extras):
-            trace.debug("[AUDIT]: Skip writing audit log cause config was set.")
-            return self
+    def save_many(
+        self, data: list[Any], excluded: Optional[list[str]] = None
+    ) -> Self:
+        """Save a batch of logging data and index all their log files to the
+        catalog in one transaction.
 
-        pointer: Path = self.pointer(data=audit)
-        if not pointer.exists():
-            pointer.mkdir(parents=True)
+            Each log file encodes with the streaming JSON encoder to the
+        temporary file with the `compress` compression and replaces to the
+        target log file, so the reader does not see the partial log file.
+
+        Args:
+            data: A list of audit data.
+            excluded: Optional list of field names to exclude from saving.
 
-        log_file: Path = pointer / f"{audit.parent_run_id or audit.run_id}.log"
+        Returns:
+            Self: The audit instance after saving.
+        """
+        enable: bool = dynamic("enable_write_audit", extras=self.extras)
 
         # NOTE: Convert excluded list to set for pydantic compatibility
         exclude_set = set(excluded) if excluded else None
-        trace.info(
-            f"[AUDIT]: Start writing audit log with "
-            f"release: {audit.release:%Y%m%d%H%M%S}"
-        )
-        log_file.write_text(
-            json.dumps(
-                audit.model_dump(exclude=exclude_set),
-                default=str,
-                indent=2,
-            ),
-            encoding="utf-8",
-        )
+        suffix: str = self.compress_suffix.get(self.compress, "")
+        rows: list[tuple[str, str, str, str, float]] = []
+        for obj in data:
+            audit = AuditData.model_validate(obj)
+            trace: Trace = get_trace(
+                audit.run_id,
+                parent_run_id=audit.parent_run_id,
+                extras=self.extras,
+            )
+
+            # NOTE: Check environ variable was set for real writing.
+            if not enable:
+                trace.debug(
+                    "[AUDIT]: Skip writing audit log cause config was set."
+                )
+                continue
+
+            pointer: Path = self.pointer(data=audit)
+            pointer.mkdir(parents=True, exist_ok=True)
+
+            run_id: str = audit.parent_run_id or audit.run_id
+            log_file: Path = pointer / f"{run_id}.log{suffix}"
+            trace.info(
+                f"[AUDIT]: Start writing audit log with "
+                f"release: {audit.release:%Y%m%d%H%M%S}"
+            )
+            tmp_file: Path = pointer / f".{run_id}.tmp"
+            with self._open(tmp_file, mode="wt", compress=self.compress) as f:
+                json.dump(
+                    audit.model_dump(exclude=exclude_set),
+                    f,
+                    default=str,
+                    indent=None if self.compress else 2,
+                )
+            os.replace(tmp_file, log_file)
+            rows.append(
+                (
+                    audit.name,
+                    f"{audit.release:%Y%m%d%H%M%S}",
+                    run_id,
+                    log_file.relative_to(self.path).as_posix(),
+                    log_file.stat().st_mtime,
+                )
+            )
+
+        if rows:
+            with self.connect() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO catalog VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
         return self
 
+    def rebuild_catalog(self) -> int:
+        """Rebuild the catalog from all log files at the audit path. It uses
+        with the audit path that was written before the catalog or was changed
+        outside this audit model.
+
+        Returns:
+            int: A number of log files that index to the catalog.
+        """
+        rows: list[tuple[str, str, str, str, float]] = self._scan_catalog()
+        with self.connect() as conn:
+            conn.execute("DELETE FROM catalog")
+            conn.executemany(
+                "INSERT OR REPLACE INTO catalog VALUES (?, ?, ?, ?, ?)", rows
+            )
+        return len(rows)
+
     def cleanup(self, max_age_days: int = 180) -> int:  # pragma: no cov
         """Clean up old audit files based on its age.
 
@@ -459,7 +860,7 @@ class LocalFileAudit(BaseAudit):
         audit_url_parse: ParseResult = urlparse(audit_url)
         base_path = Path(audit_url_parse.path)
         cutoff_time = datetime.now().timestamp() - (max_age_days * 24 * 3600)
-        cleaned_count: int = 0
+        cleaned: list[tuple[str, str]] = []
 
         for workflow_dir in base_path.glob("workflow=*"):
             for release_dir in workflow_dir.glob("release=*"):
@@ -467,9 +868,69 @@ class LocalFileAudit(BaseAudit):
                     import shutil
 
                     shutil.rmtree(release_dir)
-                    cleaned_count += 1
+                    cleaned.append(
+                        (
+                            workflow_dir.name.removeprefix("workflow="),
+                            release_dir.name.removeprefix("release="),
+                        )
+                    )
+
+        if cleaned and base_path == self.path and self.catalog.exists():
+            with self.connect() as conn:
+                conn.executemany(
+                    "DELETE FROM catalog WHERE workflow = ? AND release = ?",
+                    cleaned,
+                )
+        return len(cleaned)
+
+
+_SQLITE_CONNS: dict[Path, tuple[sqlite3.Connection, Lock]] = {}
+_SQLITE_LOCK: Lock = Lock()
+
+
+def get_sqlite_conn(path: Path, ddl: str) -> tuple[sqlite3.Connection, Lock]:
+    """Get the process-wide long-lived connection of the SQLite audit database
+    that use the WAL journal mode, and its lock that guard each transaction.
+    All connections will checkpoint and close at the interpreter exit.
+
+    Args:
+        path (Path): A SQLite database file path.
+        ddl (str): A DDL statement that create the audit table.
+
+    Returns:
+        tuple[sqlite3.Connection, Lock]: A connection and its lock.
+    """
+    with _SQLITE_LOCK:
+        if path not in _SQLITE_CONNS:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                conn.execute(ddl)
+            _SQLITE_CONNS[path] = (conn, Lock())
+        return _SQLITE_CONNS[path]
+
+
+def close_sqlite_conns() -> None:
+    """Checkpoint the WAL file to the database file and close all SQLite audit
+    connections.
+    """
+    with _SQLITE_LOCK:
+        conns = list(_SQLITE_CONNS.values())
+        _SQLITE_CONNS.clear()
+    for conn, lock in conns:
+        with lock:
+            try:
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error as e:  # pragma: no cov
+                logger.warning(f"[AUDIT]: SQLite checkpoint failed: {e}")
+            conn.close()
+
 
-        return cleaned_count
+# NOTE: Register before any audit writer, so the writer flushes its pending
+#   records before these connections close at the interpreter exit.
+atexit.register(close_sqlite_conns)
 
 
 class LocalSQLiteAudit(BaseAudit):  # pragma: no cov
@@ -558,12 +1019,16 @@ class LocalSQLiteAudit(BaseAudit):  # pragma: no cov
         cls,
         name: str,
         *,
+        offset: int = 0,
+        limit: Optional[int] = None,
         extras: Optional[DictData] = None,
     ) -> Iterator[Self]:
         """Find all audit data for a given workflow name.
 
         Args:
             name: The workflow name to search for.
+            offset: A number of audit data that want to skip.
+            limit: A maximum number of audit data that want to generate.
             extras: Optional extra parameters to override core config.
 
         Returns:
@@ -580,8 +1045,11 @@ class LocalSQLiteAudit(BaseAudit):  # pragma: no cov
 
         with sqlite3.connect(db_path) as conn:
             cursor = conn.execute(
-                "SELECT * FROM audits WHERE workflow = ? ORDER BY release DESC",
-                (name,),
+                (
+                    "SELECT * FROM audits WHERE workflow = ? "
+                    "ORDER BY release DESC LIMIT ? OFFSET ?"
+                ),
+                (name, -1 if limit is None else limit, offset),
             )
             for row in cursor.fetchall():
                 # Decompress context and metadata
@@ -661,6 +1129,42 @@ class LocalSQLiteAudit(BaseAudit):  # pragma: no cov
                 runs_metadata=metadata,
             )
 
+    def find_releases(
+        self,
+        name: str,
+        *,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> set[datetime]:
+        """Find all release datetimes that already audit for a given workflow
+        name from the audit database.
+
+        Args:
+            name: The workflow name to search for.
+            start: An optional inclusive lower bound of the release.
+            end: An optional inclusive upper bound of the release.
+
+        Returns:
+            set[datetime]: A set of release datetimes without timezone.
+        """
+        if not self.path.exists():
+            return set()
+
+        conn, lock = get_sqlite_conn(self.path, self.ddl)
+        with lock:
+            rows = conn.execute(
+                "SELECT release FROM audits WHERE workflow = ?", (name,)
+            ).fetchall()
+
+        releases: set[datetime] = set()
+        for (value,) in rows:
+            dt: datetime = datetime.fromisoformat(value)
+            if dt.tzinfo:
+                dt = dt.astimezone(UTC).replace(tzinfo=None)
+            if (start is None or dt >= start) and (end is None or dt <= end):
+                releases.add(dt)
+        return releases
+
     @staticmethod
     def _compress_data(data: str) -> bytes:
         """Compress audit data for storage efficiency.
@@ -698,58 +1202,74 @@ class LocalSQLiteAudit(BaseAudit):  # pragma: no cov
         Raises:
             ValueError: If SQLite database is not properly configured.
         """
-        audit = AuditData.model_validate(data)
-        trace: Trace = get_trace(
-            audit.run_id,
-            parent_run_id=audit.parent_run_id,
-            extras=self.extras,
-        )
+        return self.save_many([data], excluded=excluded)
+
+    def save_many(
+        self, data: list[Any], excluded: Optional[list[str]] = None
+    ) -> Self:
+        """Save a batch of logging data with one `executemany` transaction on
+        the long-lived WAL connection of the audit database.
+
+        Args:
+            data: A list of audit data.
+            excluded: Optional list of field names to exclude from saving.
+
+        Returns:
+            Self: The audit instance after saving.
+
+        Raises:
+            ValueError: If SQLite database is not properly configured.
+        """
+        audits: list[AuditData] = [AuditData.model_validate(d) for d in data]
 
         # NOTE: Check environ variable was set for real writing.
         if not dynamic("enable_write_audit", extras=self.extras):
-            trace.debug("[AUDIT]: Skip writing audit log cause config was set.")
+            for audit in audits:
+                get_trace(
+                    audit.run_id,
+                    parent_run_id=audit.parent_run_id,
+                    extras=self.extras,
+                ).debug("[AUDIT]: Skip writing audit log cause config was set.")
             return self
 
-        audit_url = dynamic("audit_url", extras=self.extras)
-        if audit_url is None or not audit_url.path:
+        if self.path.is_dir():
             raise ValueError(
-                "SQLite audit_url must specify a database file path"
+                "SQLite path must specify a database file path not dir."
             )
 
-        audit_url_parse: ParseResult = urlparse(audit_url)
-        db_path = Path(audit_url_parse.path)
-        db_path.parent.mkdir(parents=True, exist_ok=True)
-
         # Prepare data for storage
         exclude_set = set(excluded) if excluded else None
-        model_data = audit.model_dump(exclude=exclude_set)
-
-        # Compress context and metadata
-        context_blob = self._compress_data(
-            json.dumps(model_data.get("context", {}))
-        )
-        metadata_blob = self._compress_data(
-            json.dumps(model_data.get("runs_metadata", {}))
-        )
+        rows: list[tuple[Any, ...]] = []
+        for audit in audits:
+            model_data = audit.model_dump(exclude=exclude_set)
 
-        with sqlite3.connect(db_path) as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO audits
-                (workflow, release, type, context, parent_run_id, run_id, metadata, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """,
+            # Compress context and metadata
+            rows.append(
                 (
                     audit.name,
                     audit.release.isoformat(),
                     audit.type,
-                    context_blob,
+                    self._compress_data(
+                        json.dumps(model_data.get("context", {}))
+                    ),
                     audit.parent_run_id,
                     audit.run_id,
-                    metadata_blob,
-                ),
+                    self._compress_data(
+                        json.dumps(model_data.get("runs_metadata", {}))
+                    ),
+                )
+            )
+
+        conn, lock = get_sqlite_conn(self.path, self.ddl)
+        with lock, conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO audits
+                (workflow, release, type, context, parent_run_id, run_id, metadata, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """,
+                rows,
             )
-            conn.commit()
 
         return self
 
@@ -817,3 +1337,135 @@ def get_audit(
     audit_conf = dynamic("audit_conf", f=audit_conf, extras=extras)
     model = TypeAdapter(Audit).validate_python(audit_conf | {"extras": extras})
     return model
+
+
+class AuditWriter(BatchWriter):
+    """Background Audit Writer object that save the audit records in batches
+    with the shared batch writer loop.
+
+        The pending records will group by the audit model config and the
+    excluded fields, so the file audit indexes its catalog and the SQLite
+    audit inserts its rows with one transaction per batch. The batch will save
+    when the number of pending records reaches `flush_size` or the oldest
+    record waits longer than `flush_interval` seconds.
+
+        The caller waits for a free slot if the queue is full because the audit
+    record should not drop. All pending records will save at the interpreter
+    exit.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        flush_interval: float = 1.0,
+        flush_size: int = 500,
+    ) -> None:
+        super().__init__(
+            self._write,
+            maxsize=maxsize,
+            flush_interval=flush_interval,
+            flush_size=flush_size,
+            name="wf_audit_writer",
+        )
+
+    def put(
+        self,
+        audit: BaseAudit,
+        data: Any,
+        excluded: Optional[list[str]] = None,
+    ) -> bool:
+        """Put an audit record to the queue for saving with the audit model.
+
+        Args:
+            audit (BaseAudit): An audit model that want to save this record.
+            data (Any): An audit data.
+            excluded (list[str], default None): Optional list of field names
+                to exclude from saving.
+
+        Returns:
+            bool: True because the audit record does not drop.
+        """
+        key: tuple[str, tuple[str, ...]] = (
+            json.dumps(audit.model_dump(), default=str, sort_keys=True),
+            tuple(excluded or ()),
+        )
+        return super().put((key, audit, data, excluded))
+
+    @staticmethod
+    def _write(records: list[tuple[tuple, BaseAudit, Any, Any]]) -> None:
+        """Save a batch of audit records with their audit models."""
+        pending: dict[tuple, tuple[BaseAudit, Any, list]] = {}
+        for key, audit, data, excluded in records:
+            if key not in pending:
+                pending[key] = (audit, excluded, [])
+            pending[key][2].append(data)
+
+        for audit, excluded, datas in pending.values():
+            try:
+                audit.save_many(datas, excluded=excluded)
+            except Exception as e:  # pragma: no cov
+                logger.warning(
+                    f"[AUDIT]: Audit {audit.type!r} save {len(datas)} "
+                    f"records failed: {e.__class__.__name__}: {e}"
+                )
+
+
+_WRITER: Optional[AuditWriter] = None
+_WRITER_LOCK: Lock = Lock()
+
+
+def get_audit_writer() -> AuditWriter:
+    """Get the process-wide background audit writer that create with the
+    `audit_*` config values at the first call. The writer will save all
+    pending records at the interpreter exit, or at the exit of the child
+    process that start from the multiprocessing module.
+
+    Returns:
+        AuditWriter: The shared audit writer.
+    """
+    global _WRITER
+
+    with _WRITER_LOCK:
+        if _WRITER is None:
+            _WRITER = AuditWriter(
+                maxsize=config.audit_queue_size,
+                flush_interval=config.audit_flush_interval,
+                flush_size=config.audit_flush_size,
+            )
+            atexit.register(_WRITER.close)
+
+            # NOTE: The forked child process of the multiprocessing module
+            #   exits without calling the atexit functions.
+            Finalize(None, _WRITER.close, exitpriority=10)
+        return _WRITER
+
+
+def flush_audit(timeout: Optional[float] = None) -> bool:
+    """Save all pending records of the background audit writer if it was
+    created on this process.
+
+    Args:
+        timeout (float, default None): A maximum waiting second.
+
+    Returns:
+        bool: True if all records were saved.
+    """
+    if _WRITER is None:
+        return True
+    return _WRITER.flush(timeout)
+
+
+def _reset_audit_writer() -> None:  # pragma: no cov
+    """Drop the audit writer and the SQLite connections that copy from the
+    parent process after fork because they do not use on the child process.
+    """
+    global _WRITER, _WRITER_LOCK, _SQLITE_LOCK
+
+    _WRITER = None
+    _WRITER_LOCK = Lock()
+    _SQLITE_CONNS.clear()
+    _SQLITE_LOCK = Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_audit_writer)
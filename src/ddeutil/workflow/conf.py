@@ -15,6 +15,7 @@ deployment across different environments.
 
 Classes:
     Config: Main configuration class with validation
+    ConfIndex: Incremental name and type index of a config path
     YamlParser: YAML configuration file parser and loader
 
 Functions:
@@ -30,14 +31,18 @@ import copy
 import json
 import os
 from collections.abc import Iterator
-from functools import cached_property
+from functools import cached_property, lru_cache
+from hashlib import md5
 from pathlib import Path
+from tempfile import gettempdir
+from threading import Lock, get_ident
 from typing import Any, Final, Optional, TypeVar, Union
 from zoneinfo import ZoneInfo
 
 from ddeutil.core import str2bool
 from ddeutil.io import YamlFlResolve, search_env_replace
-from ddeutil.io.paths import glob_files, is_ignored, read_ignore
+from ddeutil.io.files import LOCK as YAML_LOCK
+from ddeutil.io.paths import is_ignored, read_ignore
 from pydantic import SecretStr
 
 from .__types import DictData
@@ -76,6 +81,18 @@ class Config:  # pragma: no cov
         """
         return Path(env("CORE_CONF_PATH", "./conf"))
 
+    @property
+    def conf_cache_path(self) -> Optional[Path]:
+        """Config cache path that keep the persisted manifest files of the
+        config index. It will not persist any manifest if this value does not
+        set.
+
+        Returns:
+            Optional[Path]: The cache path for config index manifests.
+        """
+        cache_path: Optional[str] = env("CORE_CONF_CACHE_PATH")
+        return Path(cache_path) if cache_path else None
+
     @property
     def generate_id_simple_mode(self) -> bool:
         """Flag for generate running ID with simple mode. That does not use
@@ -111,7 +128,68 @@ class Config:  # pragma: no cov
 
     @property
     def trace_handlers(self) -> list[dict[str, Any]]:
-        return json.loads(env("LOG_TRACE_HANDLERS", '[{"type": "console"}]'))
+        return json.loads(self.trace_handlers_conf)
+
+    @property
+    def trace_handlers_conf(self) -> str:
+        """The raw Json string of the trace handler config data. It uses as the
+        cache key of the shared trace handlers.
+
+        Returns:
+            str: A Json string of list of trace handler config data.
+        """
+        return env("LOG_TRACE_HANDLERS", '[{"type": "console"}]')
+
+    @property
+    def trace_async(self) -> bool:
+        """A flag that emit trace log through the background writer thread
+        instead of calling all handlers on the caller thread.
+
+        Returns:
+            bool: True if it enables the async trace pipeline.
+        """
+        return str2bool(env("LOG_TRACE_ASYNC", "false"))
+
+    @property
+    def trace_flush_interval(self) -> float:
+        """The maximum second that the background trace writer keep the trace
+        records before flush them to the handlers.
+
+        Returns:
+            float: A flush interval in second unit.
+        """
+        return float(env("LOG_TRACE_FLUSH_INTERVAL", "1"))
+
+    @property
+    def trace_flush_size(self) -> int:
+        """The number of trace records that trigger the background trace writer
+        to flush before reach the flush interval.
+
+        Returns:
+            int: A flush size.
+        """
+        return int(env("LOG_TRACE_FLUSH_SIZE", "100"))
+
+    @property
+    def trace_queue_size(self) -> int:
+        """The maximum trace records on the queue of the background trace
+        writer.
+
+        Returns:
+            int: A queue size.
+        """
+        return int(env("LOG_TRACE_QUEUE_SIZE", "10000"))
+
+    @property
+    def trace_queue_policy(self) -> str:
+        """The policy when the queue of the background trace writer is full. It
+        should be `block` for waiting a free slot or `drop` for dropping the
+        trace record.
+
+        Returns:
+            str: A queue policy name.
+        """
+        return env("LOG_TRACE_QUEUE_POLICY", "block")
 
     @property
     def debug(self) -> bool:
@@ -131,6 +209,15 @@ class Config:  # pragma: no cov
         """
         return ZoneInfo(env("LOG_TIMEZONE", "UTC"))
 
+    @property
+    def log_datetime_format(self) -> str:
+        """Datetime format of the trace log.
+
+        Returns:
+            str: A datetime format string.
+        """
+        return env("LOG_DATETIME_FORMAT", "%Y-%m-%d %H:%M:%S")
+
     @property
     def audit_conf(self) -> dict[str, Any]:
         return json.loads(
@@ -141,10 +228,234 @@ class Config:  # pragma: no cov
     def enable_write_audit(self) -> bool:
         return str2bool(env("LOG_AUDIT_ENABLE_WRITE", "false"))
 
+    @property
+    def audit_async(self) -> bool:
+        """A flag that save the audit log of the workflow release through the
+        background audit writer instead of saving it on the caller thread.
+
+        Returns:
+            bool: True if it enables the async audit writer.
+        """
+        return str2bool(env("LOG_AUDIT_ASYNC", "false"))
+
+    @property
+    def audit_flush_interval(self) -> float:
+        """The maximum second that the background audit writer keep the audit
+        records before save them in batch.
+
+        Returns:
+            float: A flush interval in second unit.
+        """
+        return float(env("LOG_AUDIT_FLUSH_INTERVAL", "1"))
+
+    @property
+    def audit_flush_size(self) -> int:
+        """The number of audit records that trigger the background audit
+        writer to save before reach the flush interval.
+
+        Returns:
+            int: A flush size.
+        """
+        return int(env("LOG_AUDIT_FLUSH_SIZE", "500"))
+
+    @property
+    def audit_queue_size(self) -> int:
+        """The maximum audit records on the queue of the background audit
+        writer. The caller will wait for a free slot if the queue is full.
+
+        Returns:
+            int: A queue size.
+        """
+        return int(env("LOG_AUDIT_QUEUE_SIZE", "10000"))
+
     @property
     def stage_default_id(self) -> bool:
         return str2bool(env("CORE_STAGE_DEFAULT_ID", "false"))
 
+    @property
+    def stage_bash_stream(self) -> bool:
+        """Streaming mode of the bash stage that read the stdout and stderr
+        pipes incrementally instead of capture all output in memory.
+
+        Returns:
+            bool: True if the bash stage should stream its output.
+        """
+        return str2bool(env("CORE_STAGE_BASH_STREAM", "false"))
+
+    @property
+    def stage_bash_buffer_lines(self) -> int:
+        """The number of head and tail lines of the bash stage output that keep
+        in the stage context on the streaming mode.
+
+        Returns:
+            int: A number of lines for each of the head and tail buffers.
+        """
+        return int(env("CORE_STAGE_BASH_BUFFER_LINES", "100"))
+
+    @property
+    def stage_bash_batch_lines(self) -> int:
+        """The number of bash stage output lines that forward to the trace in
+        one batch on the streaming mode.
+
+        Returns:
+            int: A number of lines for each trace batch.
+        """
+        return int(env("CORE_STAGE_BASH_BATCH_LINES", "100"))
+
+    @property
+    def stage_bash_pool(self) -> bool:
+        """Pool mode of the bash stage that run its statement on the shared
+        long-lived shell workers instead of a new shell process.
+
+        Returns:
+            bool: True if the bash stage should use the shell worker pool.
+        """
+        return str2bool(env("CORE_STAGE_BASH_POOL", "false"))
+
+    @property
+    def stage_bash_pool_size(self) -> int:
+        """The maximum shell workers of the shared shell worker pool.
+
+        Returns:
+            int: A maximum number of shell workers.
+        """
+        return int(env("CORE_STAGE_BASH_POOL_SIZE", "4"))
+
+    @property
+    def stage_bash_pool_recycle(self) -> int:
+        """The number of commands that a shell worker runs before it recycles.
+
+        Returns:
+            int: A number of commands before recycle.
+        """
+        return int(env("CORE_STAGE_BASH_POOL_RECYCLE", "100"))
+
+    @property
+    def stage_venv_cache_path(self) -> Path:
+        """The cache path of the Python virtual environments that the virtual
+        Python stage builds and reuses across runs.
+
+        Returns:
+            Path: A cache path of the virtual environments.
+        """
+        return Path(
+            env(
+                "CORE_STAGE_VENV_CACHE_PATH",
+                str(Path.home() / ".cache" / "ddeutil-workflow" / "venvs"),
+            )
+        )
+
+    @property
+    def stage_venv_cache_size(self) -> int:
+        """The maximum number of cached virtual environments. It will evict
+        the least recently used environment when the cache exceeds this size,
+        and it disables the cache when this value is 0.
+
+        Returns:
+            int: A maximum number of cached virtual environments.
+        """
+        return int(env("CORE_STAGE_VENV_CACHE_SIZE", "8"))
+
+    @property
+    def stage_spill_path(self) -> Path:
+        """The path of the on-disk store that keeps the spilled nested context
+        of foreach items, parallel branches, and matrix strategies when its
+        output policy is `spill`.
+
+        Returns:
+            Path: A path of the spilled context store.
+        """
+        return Path(
+            env(
+                "CORE_STAGE_SPILL_PATH",
+                str(Path(gettempdir()) / "ddeutil-workflow" / "spills"),
+            )
+        )
+
+    @property
+    def artifact_path(self) -> Path:
+        """The path of the local artifact store that keeps the file artifacts
+        that the call stage returns by reference.
+
+        Returns:
+            Path: A path of the local artifact store.
+        """
+        return Path(
+            env(
+                "CORE_ARTIFACT_PATH",
+                str(Path(gettempdir()) / "ddeutil-workflow" / "artifacts"),
+            )
+        )
+
+    @property
+    def workflow_scheduler(self) -> str:
+        """Scheduler mode that use to dispatch jobs on the workflow execution.
+        It should be `queue` for the polling job queue or `event` for the
+        event-driven dependency graph scheduler.
+
+        Returns:
+            str: A scheduler mode name.
+        """
+        return env("CORE_WORKFLOW_SCHEDULER", "queue")
+
+    @property
+    def pool_max_workers(self) -> int:
+        """The maximum thread workers of the shared worker pool that the matrix
+        strategies and the nested stages borrow from.
+
+        Returns:
+            int: The maximum workers of the shared worker pool.
+        """
+        return int(env("CORE_POOL_MAX_WORKERS", "64"))
+
+    @property
+    def pool_quotas(self) -> dict[str, int]:
+        """The maximum borrowed workers of each execution level on the shared
+        worker pool, like `{"strategy": 32, "stage": 32}`.
+
+        Returns:
+            dict[str, int]: A mapping of execution level and its quota.
+        """
+        return json.loads(env("CORE_POOL_QUOTAS", "{}"))
+
+    @property
+    def scheduler_max_workers(self) -> int:
+        """The maximum workflow releases that the scheduler runs in parallel.
+
+        Returns:
+            int: The maximum workers of the scheduler.
+        """
+        return int(env("CORE_SCHEDULER_MAX_WORKERS", "4"))
+
+    @property
+    def scheduler_catchup(self) -> str:
+        """Catch-up policy of the missed releases on the scheduler. It should
+        be `skip`, `latest`, or `all`.
+
+        Returns:
+            str: A catch-up policy name.
+        """
+        return env("CORE_SCHEDULER_CATCHUP", "skip")
+
+    @property
+    def scheduler_misfire_grace(self) -> float:
+        """The maximum second that a due release can delay on the scheduler
+        before it is a missed release.
+
+        Returns:
+            float: A misfire grace period in second unit.
+        """
+        return float(env("CORE_SCHEDULER_MISFIRE_GRACE", "60"))
+
+    @property
+    def scheduler_reload_interval(self) -> float:
+        """The second between two config reloads of the scheduler.
+
+        Returns:
+            float: A reload interval in second unit.
+        """
+        return float(env("CORE_SCHEDULER_RELOAD_PERIOD", "30"))
+
 
 class APIConfig:
     """API Config object."""
@@ -158,6 +469,315 @@ class APIConfig:
         return env("API_PREFIX_PATH", f"/api/v{self.version}")
 
 
+YAML_SUFFIXES: Final[tuple[str, ...]] = (".yml", ".yaml")
+
+
+@lru_cache(maxsize=512)
+def read_yaml(file: str, signature: tuple[int, int, int]) -> Any:
+    """Read and parse a YAML file with LRU caching. The signature of file stat
+    is a part of the cache key, so the cache will miss when this file changed.
+
+    Notes:
+        The returning data is shared between callers. Do not mutate it
+    without copying first.
+
+    Args:
+        file (str): A YAML file path.
+        signature (tuple[int, int, int]): A modified time in nanoseconds, a
+            changed time in nanoseconds, and a size of this file.
+
+    Returns:
+        Any: A parsed data of this YAML file.
+    """
+    from yaml.resolver import Resolver
+
+    with YAML_LOCK:
+        resolvers = Resolver.yaml_implicit_resolvers.copy()
+
+    try:
+        return YamlFlResolve(file).read()
+    except Exception:
+        # NOTE: The YAML reader does not revert its implicit resolvers when
+        #   it fails to parse, so it will break all next reading.
+        with YAML_LOCK:
+            Resolver.yaml_implicit_resolvers = resolvers
+        raise
+
+
+def file_signature(stat: os.stat_result) -> tuple[int, int, int]:
+    """Return a signature of file stat that use to detect a file changing.
+
+    Args:
+        stat (os.stat_result): A file stat result.
+
+    Returns:
+        tuple[int, int, int]: A signature of this file stat.
+    """
+    return stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size
+
+
+class ConfIndex:
+    """Config Index object that keep the mapping of config name and its `type`
+    to the YAML file on a config path.
+
+        The index builds only once per config path and refreshes incrementally
+    by parsing only the new or changed files that detect from their stat
+    signature. A file that was ignored by the default `.confignore` file or
+    can not parse will mark with the `lazy` flag and always be a candidate.
+    It can persist to the manifest file on the cache path, so the new process
+    does not need to parse all YAML files again.
+
+        A file can not add to or remove from a directory without changing the
+    signature of this directory, so the index walks the config path again only
+    when any directory signature changes. Otherwise, it stats only the indexed
+    YAML files to detect the in-place editing. The `.confignore` file reads
+    once per refresh and reads again only when its signature changes.
+
+        ... {
+        ...     "<relative-file>": {
+        ...         "sig": [<mtime-ns>, <ctime-ns>, <size>],
+        ...         "mtime": <mtime>,
+        ...         "ctime": <ctime>,
+        ...         "names": [<name-key>, ...],
+        ...         "types": [<type>, ...],
+        ...     },
+        ... }
+    """
+
+    indexes: dict[str, "ConfIndex"] = {}
+    lock: Lock = Lock()
+
+    def __init__(self, path: Path) -> None:
+        self.path: Path = Path(path)
+        self.files: dict[str, DictData] = {}
+        self.loaded: bool = False
+        self.dirs: dict[str, tuple[int, int, int]] = {}
+        self.ignores: list[str] = []
+        self.ignore_sig: Optional[tuple[int, int, int]] = None
+        self._lock: Lock = Lock()
+
+    @classmethod
+    def get(cls, path: Path) -> "ConfIndex":
+        """Get the shared config index of a config path.
+
+        Args:
+            path (Path): A config path.
+
+        Returns:
+            ConfIndex: The config index of this config path.
+        """
+        with cls.lock:
+            if (key := str(path)) not in cls.indexes:
+                cls.indexes[key] = cls(path)
+            return cls.indexes[key]
+
+    @classmethod
+    def clear(cls) -> None:
+        """Clear all shared config indexes and the parsed YAML data cache."""
+        with cls.lock:
+            cls.indexes.clear()
+        read_yaml.cache_clear()
+
+    def manifest(self, cache_path: Optional[Path]) -> Optional[Path]:
+        """Return the manifest file of this config index on a cache path.
+
+        Args:
+            cache_path (Path | None): A cache path.
+
+        Returns:
+            Optional[Path]: A manifest file path.
+        """
+        if not cache_path:
+            return None
+        key: str = md5(str(self.path.absolute()).encode()).hexdigest()
+        return Path(cache_path) / f"conf-index-{key}.json"
+
+    @staticmethod
+    def extract(values: Any) -> tuple[list[str], list[Optional[str]]]:
+        """Extract the name keys and the types from a parsed YAML data that
+        use with the `YamlParser.find` and `YamlParser.finds` methods.
+
+        Args:
+            values (Any): A parsed YAML data.
+
+        Returns:
+            tuple[list[str], list[str | None]]: A pair of name keys list and
+                types list.
+        """
+        if not isinstance(values, dict):
+            return [], []
+        names: list[str] = list(values)
+        if "name" in values:
+            names.append(values["name"])
+            return names, [values.get("type")]
+        return names, [
+            v.get("type") for v in values.values() if isinstance(v, dict)
+        ]
+
+    def walk(self) -> Iterator[Path]:
+        """Walk all files on the config path and keep the signature of all
+        directories that use to skip the next walking.
+
+        Yields:
+            Path: A file path on the config path.
+        """
+        dirs: dict[str, tuple[int, int, int]] = {}
+        stack: list[Path] = [self.path]
+        while stack:
+            folder: Path = stack.pop()
+
+            # NOTE: Stat the directory before listing it, so a file that adds
+            #   after this listing will change its signature and walk again.
+            try:
+                dirs[folder.relative_to(self.path).as_posix()] = file_signature(
+                    folder.stat()
+                )
+                entries: list[os.DirEntry] = list(os.scandir(folder))
+            except FileNotFoundError:  # pragma: no cov
+                continue
+
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.is_file():
+                    yield Path(entry.path)
+        self.dirs = dirs
+
+    def is_walked(self) -> bool:
+        """Check all directories on the config path do not change since the
+        latest walking.
+
+        Returns:
+            bool: True if the config path does not need to walk again.
+        """
+        if not self.dirs:
+            return False
+        try:
+            return all(
+                file_signature((self.path / rel).stat()) == sig
+                for rel, sig in self.dirs.items()
+            )
+        except FileNotFoundError:
+            return False
+
+    def refresh(self, cache_path: Optional[Path] = None) -> dict[str, DictData]:
+        """Refresh this config index by parsing only the new or changed YAML
+        files on the config path.
+
+        Args:
+            cache_path (Path | None): A cache path that keep the manifest.
+
+        Returns:
+            dict[str, DictData]: A mapping of relative file and its entry.
+        """
+        manifest: Optional[Path] = self.manifest(cache_path)
+        with self._lock:
+            if not self.loaded:
+                if manifest and manifest.exists():
+                    try:
+                        self.files = json.loads(manifest.read_text())
+                    except ValueError:  # pragma: no cov
+                        self.files = {}
+                self.loaded = True
+
+            ignore_file: Path = self.path / ".confignore"
+            try:
+                ignore_sig = file_signature(ignore_file.lstat())
+            except FileNotFoundError:
+                ignore_sig = None
+            if not self.ignores or ignore_sig != self.ignore_sig:
+                self.ignores = read_ignore(ignore_file)
+                self.ignore_sig = ignore_sig
+
+            changed: bool = False
+            files: dict[str, DictData] = {}
+            for file in (
+                (self.path / rel for rel in self.files)
+                if self.is_walked()
+                else self.walk()
+            ):
+                if not file.suffix.endswith(YAML_SUFFIXES):
+                    continue
+
+                try:
+                    sig: tuple[int, int, int] = file_signature(file.lstat())
+                except FileNotFoundError:  # pragma: no cov
+                    continue
+
+                rel: str = file.relative_to(self.path).as_posix()
+                entry: Optional[DictData] = self.files.get(rel)
+                if entry is None or tuple(entry["sig"]) != sig:
+                    changed = True
+                    entry = {
+                        "sig": list(sig),
+                        "mtime": sig[0] / 1e9,
+                        "ctime": sig[1] / 1e9,
+                    }
+
+                    # NOTE: Keep the lazy flag instead of parsing or raising
+                    #   because this file can be ignored by the caller.
+                    if is_ignored(file, self.ignores):
+                        entry.update({"names": [], "types": [], "lazy": True})
+                        files[rel] = entry
+                        continue
+
+                    try:
+                        names, types = self.extract(read_yaml(str(file), sig))
+                        entry.update({"names": names, "types": types})
+                    except Exception:
+                        entry.update({"names": [], "types": [], "lazy": True})
+                files[rel] = entry
+
+            if changed or len(files) != len(self.files):
+                self.files = files
+                if manifest:
+                    # NOTE: Write to the temp file and replace the manifest,
+                    #   so other processes that share this cache path never
+                    #   read a half-written manifest.
+                    manifest.parent.mkdir(parents=True, exist_ok=True)
+                    tmp: Path = manifest.with_name(
+                        f"{manifest.name}.{os.getpid()}.{get_ident()}.tmp"
+                    )
+                    tmp.write_text(json.dumps(self.files))
+                    os.replace(tmp, manifest)
+            return self.files
+
+    def search(
+        self,
+        *,
+        name: Optional[str] = None,
+        obj_type: Optional[str] = None,
+        cache_path: Optional[Path] = None,
+        ignore_filename: Optional[str] = None,
+    ) -> Iterator[tuple[Path, DictData]]:
+        """Search the candidate YAML files that keep a config name or a config
+        type from this config index and do not ignore by the ignore file.
+
+        Args:
+            name (str): A config name that want to search.
+            obj_type (str): A config type that want to search.
+            cache_path (Path | None): A cache path that keep the manifest.
+            ignore_filename (str): An ignore filename. Default is
+                ``.confignore`` filename that already read by the refresh.
+
+        Yields:
+            tuple[Path, DictData]: A pair of file path and its index entry.
+        """
+        files: dict[str, DictData] = self.refresh(cache_path)
+        ignores: list[str] = (
+            self.ignores
+            if ignore_filename in (None, ".confignore")
+            else read_ignore(self.path / ignore_filename)
+        )
+        for rel, entry in files.items():
+            if (
+                entry.get("lazy")
+                or (name is None or name in entry["names"])
+                and (obj_type is None or obj_type in entry["types"])
+            ) and not is_ignored(file := self.path / rel, ignores):
+                yield file, entry
+
+
 class YamlParser:
     """Base Load object that use to search config data by given some identity
     value like name of `Workflow` or `Crontab` templates.
@@ -261,24 +881,26 @@ class YamlParser:
 
         all_data: list[tuple[float, DictData]] = []
         obj_type: Optional[str] = obj_name(obj)
+        cache_path: Optional[Path] = (extras or {}).get(
+            "conf_cache_path", config.conf_cache_path
+        )
 
         for path in paths:
-            for file in glob_files(path):
-
-                if cls.is_ignore(file, path, ignore_filename=ignore_filename):
-                    continue
-
+            for file, entry in ConfIndex.get(path).search(
+                name=name,
+                cache_path=cache_path,
+                ignore_filename=ignore_filename,
+            ):
                 if data := cls.filter_yaml(file, name=name):
 
                     # NOTE: Start adding file metadata.
-                    file_stat: os.stat_result = file.lstat()
-                    data["created_at"] = file_stat.st_ctime
-                    data["updated_at"] = file_stat.st_mtime
+                    data["created_at"] = entry["ctime"]
+                    data["updated_at"] = entry["mtime"]
 
                     if not obj_type:
-                        all_data.append((file_stat.st_mtime, data))
+                        all_data.append((entry["mtime"], data))
                     elif (t := data.get("type")) and t == obj_type:
-                        all_data.append((file_stat.st_mtime, data))
+                        all_data.append((entry["mtime"], data))
 
         return {} if not all_data else max(all_data, key=lambda x: x[0])[1]
 
@@ -330,13 +952,16 @@ class YamlParser:
 
         all_data: dict[str, list[tuple[float, DictData]]] = {}
         obj_type: str = obj_name(obj)
+        cache_path: Optional[Path] = (extras or {}).get(
+            "conf_cache_path", config.conf_cache_path
+        )
 
         for path in paths:
-            for file in glob_files(path):
-
-                if cls.is_ignore(file, path, ignore_filename=ignore_filename):
-                    continue
-
+            for file, entry in ConfIndex.get(path).search(
+                obj_type=obj_type,
+                cache_path=cache_path,
+                ignore_filename=ignore_filename,
+            ):
                 for key, data in cls.filter_yaml(file).items():
 
                     if key in excluded:
@@ -355,11 +980,10 @@ class YamlParser:
                         and t == obj_type
                     ):
                         # NOTE: Start adding file metadata.
-                        file_stat: os.stat_result = file.lstat()
-                        data["created_at"] = file_stat.st_ctime
-                        data["updated_at"] = file_stat.st_mtime
+                        data["created_at"] = entry["ctime"]
+                        data["updated_at"] = entry["mtime"]
                         marking: tuple[float, DictData] = (
-                            file.lstat().st_mtime,
+                            entry["mtime"],
                             data,
                         )
 
@@ -403,6 +1027,9 @@ class YamlParser:
                 input: {"name": "foo", "type": "Some"}
                 output: {"foo": {"name": "foo", "type": "Some"}}
 
+            The parsed YAML data was cached with the file stat signature, so
+        the same file does not parse again until it changes.
+
         Args:
             file (Path): A file path that want to extract YAML context.
             name (str): A key name that search on a YAML context.
@@ -410,8 +1037,10 @@ class YamlParser:
         Returns:
             DictData: A data that read from this file if it is YAML format.
         """
-        if any(file.suffix.endswith(s) for s in (".yml", ".yaml")):
-            values: DictData = YamlFlResolve(file).read()
+        if file.suffix.endswith(YAML_SUFFIXES):
+            values: DictData = copy.deepcopy(
+                read_yaml(str(file), file_signature(file.lstat()))
+            )
             if values is not None:
                 if name:
                     if "name" in values and values.get("name") == name:
@@ -35,6 +35,8 @@ Example:
 """
 from __future__ import annotations
 
+import heapq
+from collections.abc import Iterator
 from dataclasses import fields
 from datetime import datetime
 from typing import Annotated, Any, Literal, Optional, Union
@@ -457,3 +459,60 @@ class Event(BaseModel):
             f"This datetime, {datetime}, does not support for this event "
             f"schedule."
         )
+
+    @staticmethod
+    def runner(on: Cron, start: datetime) -> CronRunner:
+        """Make the cron runner of an event schedule from a start datetime. All
+        release datetimes of this event, like the backfill and the scheduler
+        releases, generate from this runner, so each of them already passes
+        the `validate_dt` method.
+
+        Args:
+            on (Cron): An event schedule.
+            start (datetime): A start datetime.
+
+        Returns:
+            CronRunner: A cron runner that generates the release datetimes
+                with the UTC timezone.
+        """
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=UTC)
+        return on.cronjob.schedule(start.astimezone(UTC), tz=UTC)
+
+    def generate(self, start: datetime, end: datetime) -> Iterator[datetime]:
+        """Generate the release datetimes of all schedules between the start
+        and end datetimes with the inclusive bound. It merges the release
+        datetimes of each schedule in order and drops the duplicate value, so
+        each of them already passes the `validate_dt` method.
+
+        Args:
+            start (datetime): A start datetime.
+            end (datetime): An end datetime.
+
+        Raises:
+            EventError: If this event does not set any schedule.
+
+        Yields:
+            datetime: A release datetime with the UTC timezone.
+        """
+        if not self.schedule:
+            raise EventError(
+                "This event does not set any schedule for generating release."
+            )
+
+        start, end = (
+            (dt if dt.tzinfo else dt.replace(tzinfo=UTC)).astimezone(UTC)
+            for dt in (start, end)
+        )
+
+        def gen(runner: CronRunner) -> Iterator[datetime]:
+            while (dt := runner.next) <= end:
+                yield dt
+
+        previous: Optional[datetime] = None
+        for dt in heapq.merge(
+            *(gen(self.runner(on, start)) for on in self.schedule)
+        ):
+            if dt != previous:
+                previous = dt
+                yield dt
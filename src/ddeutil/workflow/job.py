@@ -19,6 +19,7 @@ Key Features:
     - Dependency management via job needs
     - Conditional execution support
     - Parallel execution capabilities
+    - Async execution with asyncio tasks via `Job.aexecute`
 
 Classes:
     Job: Main job execution container
@@ -33,33 +34,46 @@ Note:
 """
 from __future__ import annotations
 
+import asyncio
 import copy
 import time
 from collections.abc import Iterator
 from concurrent.futures import (
+    FIRST_COMPLETED,
     FIRST_EXCEPTION,
     CancelledError,
+    Executor,
     Future,
-    ThreadPoolExecutor,
+    ProcessPoolExecutor,
     as_completed,
     wait,
 )
 from enum import Enum
-from functools import lru_cache
+from functools import lru_cache, partial
+from multiprocessing import get_context
 from textwrap import dedent
-from threading import Event
-from typing import Annotated, Any, Literal, Optional, Union
+from threading import Event, Thread
+from typing import Annotated, Any, Final, Literal, Optional, Union
 
 from ddeutil.core import freeze_args
-from pydantic import BaseModel, Discriminator, Field, SecretStr, Tag
+from pydantic import (
+    BaseModel,
+    Discriminator,
+    Field,
+    PrivateAttr,
+    SecretStr,
+    Tag,
+)
 from pydantic.functional_serializers import field_serializer
 from pydantic.functional_validators import field_validator, model_validator
 from typing_extensions import Self
 
 from . import JobSkipError
 from .__types import DictData, DictStr, Matrix, StrOrNone
+from .artifacts import get_artifact_store
 from .conf import pass_env
 from .errors import JobCancelError, JobError, mark_errors, to_dict
+from .pool import get_pool
 from .result import (
     CANCEL,
     FAILED,
@@ -72,75 +86,149 @@ from .result import (
     get_status_from_error,
     validate_statuses,
 )
-from .reusables import has_template, param2template
-from .stages import Stage
-from .traces import Trace, get_trace
-from .utils import cross_product, extract_id, filter_func, gen_id, get_dt_now
+from .reusables import (
+    CompiledTemplate,
+    compile_template,
+    eval_condition,
+    has_template,
+    param2template,
+)
+from .stages import OutputPolicy, Stage
+from .traces import Trace, flush_trace, get_trace
+from .utils import (
+    cross_product,
+    extract_id,
+    filter_func,
+    gen_id,
+    get_dt_now,
+    layer_context,
+)
 
 MatrixFilter = list[dict[str, Union[str, int]]]
 
+# NOTE: The number of strategy futures per worker that the local process keeps
+#   in flight while it generates the next strategies.
+STRATEGY_WINDOW: Final[int] = 2
 
-@freeze_args
-@lru_cache
-def make(
+
+def freeze(value: Any) -> Any:
+    """Convert the matrix value to the hashable value that keep the same
+    equality, like the list to the tuple and the dict to the frozenset.
+
+    Args:
+        value (Any): A matrix value.
+
+    Returns:
+        Any: A hashable value.
+    """
+    if isinstance(value, dict):
+        return frozenset((k, freeze(v)) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    elif isinstance(value, set):
+        return frozenset(freeze(v) for v in value)
+    return value
+
+
+def make_iter(
     matrix: Matrix,
     include: MatrixFilter,
     exclude: MatrixFilter,
-) -> list[DictStr]:
-    """Make a list of product of matrix values that already filter with
-    exclude matrix and add specific matrix with include.
+) -> Iterator[DictStr]:
+    """Generate the product of matrix values that already filter with exclude
+    matrix and add specific matrix with include lazily.
 
-        This function use the `lru_cache` decorator function increase
-    performance for duplicate matrix value scenario.
+        The exclude matrix groups by its keys to the set of frozen values, so
+    each product only costs one hash lookup per distinct exclude keys instead
+    of scanning all exclude matrix.
 
     :param matrix: (Matrix) A matrix values that want to cross product to
         possible parallelism values.
     :param include: A list of additional matrix that want to adds-in.
     :param exclude: A list of exclude matrix that want to filter-out.
 
-    :rtype: list[DictStr]
+    :rtype: Iterator[DictStr]
     """
     # NOTE: If it does not set matrix, it will return list of an empty dict.
     if len(matrix) == 0:
-        return [{}]
+        yield {}
+        return
+
+    # VALIDATE:
+    #   Validate any key in include list should be a subset of the matrix keys.
+    keys: set[str] = set(matrix)
+    if any(not (set(inc.keys()) <= keys) for inc in include):
+        raise ValueError(
+            "Include should have the keys that equal to all final matrix."
+        )
+
+    excludes: dict[tuple[str, ...], set[tuple[Any, ...]]] = {}
+    for exc in exclude:
+        ks: tuple[str, ...] = tuple(sorted(exc))
+        excludes.setdefault(ks, set()).add(tuple(freeze(exc[k]) for k in ks))
+
+    def is_excluded(r: DictStr) -> bool:
+        return any(
+            all(k in r for k in ks)
+            and tuple(freeze(r[k]) for k in ks) in values
+            for ks, values in excludes.items()
+        )
 
     # NOTE: Remove matrix that exists on the excluded.
-    final: list[DictStr] = []
+    count: int = 0
     for r in cross_product(matrix=matrix):
-        if any(
-            all(r[k] == v for k, v in exclude.items()) for exclude in exclude
-        ):
+        if is_excluded(r):
             continue
-        final.append(r)
+        count += 1
+        yield r
 
     # NOTE: If it is empty matrix and include, it will return list of an
     #   empty dict.
-    if len(final) == 0 and not include:
-        return [{}]
-
-    # NOTE: Add include to generated matrix with exclude list.
-    add: list[DictStr] = []
-    for inc in include:
-        # VALIDATE:
-        #   Validate any key in include list should be a subset of someone
-        #   in matrix.
-        if all(not (set(inc.keys()) <= set(m.keys())) for m in final):
+    if count == 0:
+        if include:
             raise ValueError(
                 "Include should have the keys that equal to all final matrix."
             )
+        yield {}
+        return
 
+    # NOTE: Add include to generated matrix with exclude list.
+    add: list[DictStr] = []
+    for inc in include:
         # VALIDATE:
         #   Validate value of include should not duplicate with generated
         #   matrix. So, it will skip if this value already exists.
-        if any(
-            all(inc.get(k) == v for k, v in m.items()) for m in [*final, *add]
-        ):
+        row: DictStr = {k: inc.get(k) for k in matrix}
+        if (
+            all(row[k] in matrix[k] for k in matrix) and not is_excluded(row)
+        ) or any(all(inc.get(k) == v for k, v in m.items()) for m in add):
             continue
 
         add.append(inc)
+        yield inc
+
 
-    final.extend(add)
-    return final
+@freeze_args
+@lru_cache
+def make(
+    matrix: Matrix,
+    include: MatrixFilter,
+    exclude: MatrixFilter,
+) -> list[DictStr]:
+    """Make a list of product of matrix values that already filter with
+    exclude matrix and add specific matrix with include.
+
+        This function use the `lru_cache` decorator function increase
+    performance for duplicate matrix value scenario.
+
+    :param matrix: (Matrix) A matrix values that want to cross product to
+        possible parallelism values.
+    :param include: A list of additional matrix that want to adds-in.
+    :param exclude: A list of exclude matrix that want to filter-out.
+
+    :rtype: list[DictStr]
+    """
+    return list(make_iter(matrix, include, exclude))
 
 
 class Strategy(BaseModel):
@@ -159,7 +247,8 @@ class Strategy(BaseModel):
 
     Attributes:
         fail_fast (bool): Cancel remaining executions on first failure
-        max_parallel (int): Maximum concurrent executions (1-9)
+        max_parallel (int): Maximum concurrent executions
+        executor (str): Executor type of strategy execution, thread or process
         matrix (dict): Base matrix values for cross-product generation
         include (list): Additional specific combinations to include
         exclude (list): Specific combinations to exclude from results
@@ -192,11 +281,20 @@ class Strategy(BaseModel):
     max_parallel: Union[int, str] = Field(
         default=1,
         description=(
-            "The maximum number of executor thread pool that want to run "
-            "parallel. This value should gather than 0 and less than 10."
+            "The maximum number of strategies that want to run parallel. It "
+            "borrows workers from the shared worker pool, and this value "
+            "should gather than 0."
         ),
         alias="max-parallel",
     )
+    executor: Literal["thread", "process"] = Field(
+        default="thread",
+        description=(
+            "An executor type that use to run strategies. The `process` type "
+            "will run each strategy on the process pool that fit for the "
+            "CPU-bound stages."
+        ),
+    )
     matrix: Matrix = Field(
         default_factory=dict,
         description=(
@@ -211,6 +309,13 @@ class Strategy(BaseModel):
         default_factory=list,
         description="A list of exclude matrix that want to filter-out.",
     )
+    output: OutputPolicy = Field(
+        default_factory=OutputPolicy,
+        description=(
+            "An output policy of the nested context of each strategy that "
+            "keep in the job context."
+        ),
+    )
 
     def is_set(self) -> bool:
         """Return True if this strategy was set from yaml template.
@@ -229,6 +334,16 @@ class Strategy(BaseModel):
         """
         return make(self.matrix, self.include, self.exclude)
 
+    def make_iter(self) -> Iterator[DictStr]:
+        """Generate the product of matrix values lazily, so the huge matrix
+        does not allocate all its strategies before any execution starts.
+
+        Returns:
+            Iterator[DictStr]: An iterator of parameter combinations from
+                matrix strategy.
+        """
+        return make_iter(self.matrix, self.include, self.exclude)
+
 
 class Rule(str, Enum):
     """Rule enum object for assign trigger option."""
@@ -528,6 +643,12 @@ class Job(BaseModel):
         description="An extra override config values.",
     )
 
+    # NOTE: Private attrs for keeping the compiled template of field values
+    #   with its field name.
+    _tpl: dict[str, tuple[Any, CompiledTemplate]] = PrivateAttr(
+        default_factory=dict
+    )
+
     @field_validator(
         "runs_on",
         mode="before",
@@ -739,13 +860,11 @@ class Job(BaseModel):
             return False
 
         try:
-            # WARNING: The eval build-in function is very dangerous. So, it
-            #   should use the `re` module to validate eval-string before
-            #   running.
-            rs: bool = eval(
-                self.pass_template(self.condition, params),
-                globals() | params,
-                {},
+            # NOTE: The condition compiles with the restricted AST and caches
+            #   its code object, so it does not use the module globals.
+            rs: bool = eval_condition(
+                self.pass_template(self.condition, params, key="condition"),
+                params,
             )
             if not isinstance(rs, bool):
                 raise TypeError("Return type of condition does not be boolean")
@@ -790,9 +909,9 @@ class Job(BaseModel):
                     }
 
             The keys that will set to the received context is `strategies`,
-        `errors`, and `skipped` keys. The `errors` and `skipped` keys will
-        extract from the result context if it exists. If it does not found, it
-        will not set on the received context.
+        `reduced`, `errors`, and `skipped` keys. The `reduced`, `errors`, and
+        `skipped` keys will extract from the result context if it exists. If it
+        does not found, it will not set on the received context.
 
         Raises:
             JobError: If the job's ID does not set and the setting default job
@@ -827,10 +946,18 @@ class Job(BaseModel):
         info: DictData = (
             {"info": output.pop("info")} if "info" in output else {}
         )
+        reduced: DictData = (
+            {"reduced": output.pop("reduced")} if "reduced" in output else {}
+        )
         kwargs: DictData = kwargs or {}
         if self.strategy.is_set():
             to["jobs"][_id] = (
-                {"strategies": output} | errors | status | info | kwargs
+                {"strategies": output}
+                | reduced
+                | errors
+                | status
+                | info
+                | kwargs
             )
         elif len(k := output.keys()) > 1:  # pragma: no cov
             raise JobError(
@@ -865,18 +992,33 @@ class Job(BaseModel):
         else:
             return output.get("jobs", {}).get(_id, {})
 
-    def pass_template(self, value: Any, params: DictData) -> Any:
+    def pass_template(
+        self,
+        value: Any,
+        params: DictData,
+        *,
+        key: Optional[str] = None,
+    ) -> Any:
         """Pass template and environment variable to any value that can
-        templating.
+        templating. If the key was passed, it will compile this value only once
+        and keep it on this job with this key.
 
         Args:
             value (Any): An any value.
             params (DictData): A parameter data that want to use in this
                 execution.
+            key (str, default None): A compiled template key, like the field
+                name.
 
         Returns:
             Any: A templated value.
         """
+        if key is not None:
+            compiled = self._tpl.get(key)
+            if compiled is None or compiled[0] is not value:
+                compiled = (value, compile_template(value))
+                self._tpl[key] = compiled
+            value: CompiledTemplate = compiled[1]
         return pass_env(param2template(value, params, extras=self.extras))
 
     def process(
@@ -1135,6 +1277,200 @@ class Job(BaseModel):
             )
             trace.debug("[JOB]: End Handler job execution.")
 
+    async def aprocess(
+        self,
+        params: DictData,
+        run_id: str,
+        context: DictData,
+        *,
+        parent_run_id: Optional[str] = None,
+        event: Optional[Event] = None,
+        executor: Optional[Executor] = None,
+    ) -> Result:
+        """Async process routing method that will route the provider function
+        depend on runs-on value. Only the local runs-on has the async native
+        process, other runs-on types will offload the `process` method to the
+        executor.
+
+        Args:
+            params (DictData): A parameter data that want to use in this
+                execution.
+            run_id (str): A running stage ID.
+            context (DictData): A context data that was passed from handler
+                method.
+            parent_run_id (str, default None): A parent running ID.
+            event (Event, default None): An event manager that use to track
+                parent process was not force stopped.
+            executor (Executor, default None): A bounded executor that use to
+                offload the blocking execution.
+
+        Returns:
+            Result: The execution result with status and context data.
+        """
+        if self.runs_on.type != LOCAL:  # pragma: no cov
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                executor,
+                partial(
+                    self.process,
+                    params,
+                    run_id=run_id,
+                    context=context,
+                    parent_run_id=parent_run_id,
+                    event=event,
+                ),
+            )
+
+        trace: Trace = get_trace(
+            run_id, parent_run_id=parent_run_id, extras=self.extras
+        )
+        await trace.ainfo(f"[JOB]: Routing Async Local: {self.id!r}")
+        rs: Result = await local_aprocess(
+            self,
+            params,
+            context=context,
+            run_id=parent_run_id,
+            event=event,
+            executor=executor,
+        )
+        if rs.status == SKIP:
+            raise JobSkipError("Job got skipped status.")
+        elif rs.status == CANCEL:
+            raise JobCancelError("Job got canceled status.")
+        elif rs.status == FAILED:
+            raise JobError("Job process error")
+        return rs
+
+    async def _aexecute(
+        self,
+        params: DictData,
+        context: DictData,
+        trace: Trace,
+        event: Optional[Event] = None,
+        executor: Optional[Executor] = None,
+    ) -> Result:
+        """Wrapped the async route execute method with retry strategy before
+        returning to handler async execution.
+
+        Args:
+            params (DictData): A parameter data that want to use in this
+                execution.
+            context (DictData): A context data.
+            trace (Trace): A trace object.
+            event (Event, default None): An event manager.
+            executor (Executor, default None): A bounded executor that use to
+                offload the blocking execution.
+
+        Returns:
+            Result: The wrapped execution result.
+        """
+        current_retry: int = 0
+        maximum_retry: int = self.retry + 1
+        exception: Exception
+        catch(context, status=WAIT)
+        while True:
+            try:
+                return await self.aprocess(
+                    params,
+                    run_id=trace.run_id,
+                    context=context,
+                    parent_run_id=trace.parent_run_id,
+                    event=event,
+                    executor=executor,
+                )
+            except (JobCancelError, JobSkipError):
+                await trace.adebug("[JOB]: process raise skip or cancel error.")
+                raise
+            except Exception as e:
+                if self.retry == 0:
+                    raise
+
+                current_retry += 1
+                exception = e
+                await trace.awarning(
+                    f"[JOB]: Retry count: {current_retry}/{maximum_retry} ... "
+                    f"( {e.__class__.__name__} )"
+                )
+
+            if current_retry >= maximum_retry:
+                break
+
+            catch(context, status=WAIT, updated={"retry": current_retry})
+            await asyncio.sleep(1.2**current_retry)
+
+        await trace.aerror(
+            f"[JOB]: Reach the maximum of retry number: {self.retry}."
+        )
+        raise exception
+
+    async def aexecute(
+        self,
+        params: DictData,
+        *,
+        run_id: StrOrNone = None,
+        event: Optional[Event] = None,
+        executor: Optional[Executor] = None,
+    ) -> Result:
+        """Async job execution that run its matrix strategies and stages as the
+        asyncio tasks instead of the thread workers. The `max-parallel` value
+        of strategy will be a limit of the semaphore.
+
+            The async native stage will await with its `axecute` method, but
+        the blocking stage will offload its `execute` method to the executor.
+
+        Args
+            params: (DictData) A parameter context that also pass from the
+                workflow execute method.
+            run_id: (str) An execution running ID.
+            event: (Event) An Event manager instance that use to cancel this
+                execution if it forces stopped by parent execution.
+            executor: (Executor) A bounded executor that use to offload the
+                blocking stage execution. It will use the default executor of
+                the running loop if it does not pass.
+
+        Returns
+            Result: Return Result object that create from execution context.
+        """
+        ts: float = time.monotonic()
+        parent_run_id, run_id = extract_id(
+            (self.id or "EMPTY"), run_id=run_id, extras=self.extras
+        )
+        context: DictData = {
+            "status": WAIT,
+            "info": {"exec_start": get_dt_now()},
+        }
+        trace: Trace = get_trace(
+            run_id, parent_run_id=parent_run_id, extras=self.extras
+        )
+        try:
+            await trace.ainfo(
+                f"[JOB]: Async Handler {self.runs_on.type.name}: "
+                f"{(self.id or 'EMPTY')!r}."
+            )
+            return await self._aexecute(
+                params,
+                context=context,
+                trace=trace,
+                event=event,
+                executor=executor,
+            )
+        except JobError as e:  # pragma: no cov
+            if isinstance(e, JobSkipError):
+                await trace.aerror(f"[JOB]: ⏭️ Skip: {e}")
+
+            st: Status = get_status_from_error(e)
+            return Result.from_trace(trace).catch(
+                status=st, context=catch(context, status=st)
+            )
+        finally:
+            context["info"].update(
+                {
+                    "exec_end": get_dt_now(),
+                    "exec_latency": round(time.monotonic() - ts, 6),
+                }
+            )
+            await trace.adebug("[JOB]: End Async Handler job execution.")
+
 
 def pop_stages(context: DictData) -> DictData:
     """Pop a stages key from the context data. It will return empty dict if it
@@ -1189,8 +1525,9 @@ def local_process_strategy(
     else:
         strategy_id: str = "EMPTY"
 
-    current_context: DictData = copy.deepcopy(params)
-    current_context.update({"matrix": strategy, "stages": {}})
+    current_context: DictData = layer_context(
+        params, matrix=strategy, stages={}
+    )
     total_stage: int = len(job.stages)
     skips: list[bool] = [False] * total_stage
     for i, stage in enumerate(job.stages, start=0):
@@ -1207,12 +1544,16 @@ def local_process_strategy(
                 context=context,
                 status=CANCEL,
                 updated={
-                    strategy_id: {
-                        "status": CANCEL,
-                        "matrix": strategy,
-                        "stages": pop_stages(current_context),
-                        "errors": JobCancelError(error_msg).to_dict(),
-                    },
+                    strategy_id: job.strategy.output.apply(
+                        strategy_id,
+                        {
+                            "status": CANCEL,
+                            "matrix": strategy,
+                            "stages": pop_stages(current_context),
+                            "errors": JobCancelError(error_msg).to_dict(),
+                        },
+                        trace,
+                    ),
                 },
             )
             raise JobCancelError(error_msg, refs=strategy_id)
@@ -1238,12 +1579,16 @@ def local_process_strategy(
                 context=context,
                 status=FAILED,
                 updated={
-                    strategy_id: {
-                        "status": FAILED,
-                        "matrix": strategy,
-                        "stages": pop_stages(current_context),
-                        "errors": JobError(error_msg).to_dict(),
-                    },
+                    strategy_id: job.strategy.output.apply(
+                        strategy_id,
+                        {
+                            "status": FAILED,
+                            "matrix": strategy,
+                            "stages": pop_stages(current_context),
+                            "errors": JobError(error_msg).to_dict(),
+                        },
+                        trace,
+                    ),
                 },
             )
             raise JobError(error_msg, refs=strategy_id)
@@ -1257,12 +1602,16 @@ def local_process_strategy(
                 context=context,
                 status=CANCEL,
                 updated={
-                    strategy_id: {
-                        "status": CANCEL,
-                        "matrix": strategy,
-                        "stages": pop_stages(current_context),
-                        "errors": JobCancelError(error_msg).to_dict(),
-                    },
+                    strategy_id: job.strategy.output.apply(
+                        strategy_id,
+                        {
+                            "status": CANCEL,
+                            "matrix": strategy,
+                            "stages": pop_stages(current_context),
+                            "errors": JobCancelError(error_msg).to_dict(),
+                        },
+                        trace,
+                    ),
                 },
             )
             raise JobCancelError(error_msg, refs=strategy_id)
@@ -1272,11 +1621,251 @@ def local_process_strategy(
         context=context,
         status=status,
         updated={
-            strategy_id: {
-                "status": status,
-                "matrix": strategy,
-                "stages": pop_stages(current_context),
-            },
+            strategy_id: job.strategy.output.apply(
+                strategy_id,
+                {
+                    "status": status,
+                    "matrix": strategy,
+                    "stages": pop_stages(current_context),
+                },
+                trace,
+            ),
+        },
+    )
+    return status, context
+
+
+def local_process_strategy_worker(
+    job: Job,
+    strategy: DictData,
+    params: DictData,
+    run_id: str,
+    parent_run_id: Optional[str] = None,
+    *,
+    event: Optional[Event] = None,
+) -> tuple[Status, DictData]:
+    """Local strategy execution on the child process of the process pool. It
+    will create its trace object and context data on the child process and
+    return this context data back to the parent process for merging.
+
+        If the strategy execution raise `JobError`, the strategy context data
+    will pass to the `context` attribute of this error because the context data
+    on the child process does not share with the parent process.
+
+    Args:
+        job (Job): A job model that want to execute.
+        strategy (DictData): A strategy metrix value.
+        params (DictData): A parameter data.
+        run_id (str): A job running ID.
+        parent_run_id (str, default None): A parent running ID.
+        event (Event, default None): A shareable Event manager proxy that use
+            to cancel this execution from the parent process.
+
+    Raises:
+        JobError: If the strategy execution raise any `JobError`.
+
+    Returns:
+        tuple[Status, DictData]: A pair of Status and strategy context data.
+    """
+    trace: Trace = get_trace(
+        run_id, parent_run_id=parent_run_id, extras=job.extras
+    )
+    context: DictData = {}
+    try:
+        return local_process_strategy(
+            job, strategy, params, trace, context, event=event
+        )
+    except JobError as e:
+        e.context = context
+        raise
+    finally:
+        # NOTE: Pass the artifacts that put on this child process to the parent
+        #   process, so they still exist for the downstream jobs.
+        if owned := get_artifact_store().detach():
+            context["artifacts"] = owned
+
+        # NOTE: The child process of the pool does not run the `atexit`
+        #   callbacks, so it should flush its trace writer before return.
+        flush_trace()
+
+
+def bridge_event(event: Event, target: Any, stop: Event) -> None:
+    """Propagate the set signal from the threading Event object to a target
+    event, like the Event proxy of the multiprocessing manager, until the stop
+    event was set.
+
+    Args:
+        event (Event): A source threading Event object.
+        target (Any): A target event object that has the `set` method.
+        stop (Event): A stop event that use to end this propagation.
+    """
+    while not stop.is_set():
+        if event.wait(0.01):
+            target.set()
+            return
+
+
+async def local_aprocess_strategy(
+    job: Job,
+    strategy: DictData,
+    params: DictData,
+    trace: Trace,
+    context: DictData,
+    *,
+    event: Optional[Event] = None,
+    executor: Optional[Executor] = None,
+) -> tuple[Status, DictData]:
+    """Async local strategy execution that is the async version of the
+    `local_process_strategy` function.
+
+        The stage that is async native will await with its `axecute` method
+    directly, but the blocking stage will offload its `execute` method to the
+    executor, so it does not block the other strategies and jobs on the same
+    event loop.
+
+    Args:
+        job (Job): A job model that want to execute.
+        strategy (DictData): A strategy metrix value.
+        params (DictData): A parameter data.
+        trace (Trace): A trace object.
+        context (DictData): A context data.
+        event (Event): An Event manager instance that use to cancel this
+            execution if it forces stopped by parent execution.
+        executor (Executor): A bounded executor that use to offload the
+            blocking stage execution.
+
+    Raises:
+        JobError: If event was set.
+        JobError: If stage execution raise any error as `StageError`.
+        JobError: If the result from execution has `FAILED` status.
+
+    Returns:
+        tuple[Status, DictData]: A pair of Status and DictData objects.
+    """
+    if strategy:
+        strategy_id: str = gen_id(strategy)
+        await trace.ainfo(f"[JOB]: Execute Strategy: {strategy_id!r}")
+        await trace.ainfo(f"[JOB]: ... matrix: {strategy!r}")
+    else:
+        strategy_id: str = "EMPTY"
+
+    loop = asyncio.get_running_loop()
+    current_context: DictData = layer_context(
+        params, matrix=strategy, stages={}
+    )
+    total_stage: int = len(job.stages)
+    skips: list[bool] = [False] * total_stage
+    for i, stage in enumerate(job.stages, start=0):
+
+        if job.extras:
+            stage.extras = job.extras
+
+        if event and event.is_set():
+            error_msg: str = (
+                "Strategy execution was canceled from the event before "
+                "start stage execution."
+            )
+            catch(
+                context=context,
+                status=CANCEL,
+                updated={
+                    strategy_id: job.strategy.output.apply(
+                        strategy_id,
+                        {
+                            "status": CANCEL,
+                            "matrix": strategy,
+                            "stages": pop_stages(current_context),
+                            "errors": JobCancelError(error_msg).to_dict(),
+                        },
+                        trace,
+                    ),
+                },
+            )
+            raise JobCancelError(error_msg, refs=strategy_id)
+
+        await trace.ainfo(f"[JOB]: Execute Stage: {stage.iden!r}")
+        if stage.async_native:
+            rs: Result = await stage.axecute(
+                params=current_context,
+                run_id=trace.parent_run_id,
+                event=event,
+            )
+        else:
+            rs: Result = await loop.run_in_executor(
+                executor,
+                partial(
+                    stage.execute,
+                    params=current_context,
+                    run_id=trace.parent_run_id,
+                    event=event,
+                ),
+            )
+        stage.set_outputs(rs.context, to=current_context)
+
+        if rs.status == SKIP:
+            skips[i] = True
+            continue
+
+        if rs.status == FAILED:
+            error_msg: str = (
+                f"Strategy execution was break because its nested-stage, "
+                f"{stage.iden!r}, failed."
+            )
+            catch(
+                context=context,
+                status=FAILED,
+                updated={
+                    strategy_id: job.strategy.output.apply(
+                        strategy_id,
+                        {
+                            "status": FAILED,
+                            "matrix": strategy,
+                            "stages": pop_stages(current_context),
+                            "errors": JobError(error_msg).to_dict(),
+                        },
+                        trace,
+                    ),
+                },
+            )
+            raise JobError(error_msg, refs=strategy_id)
+
+        elif rs.status == CANCEL:
+            error_msg: str = (
+                "Strategy execution was canceled from the event after "
+                "end stage execution."
+            )
+            catch(
+                context=context,
+                status=CANCEL,
+                updated={
+                    strategy_id: job.strategy.output.apply(
+                        strategy_id,
+                        {
+                            "status": CANCEL,
+                            "matrix": strategy,
+                            "stages": pop_stages(current_context),
+                            "errors": JobCancelError(error_msg).to_dict(),
+                        },
+                        trace,
+                    ),
+                },
+            )
+            raise JobCancelError(error_msg, refs=strategy_id)
+
+    status: Status = SKIP if sum(skips) == total_stage else SUCCESS
+    catch(
+        context=context,
+        status=status,
+        updated={
+            strategy_id: job.strategy.output.apply(
+                strategy_id,
+                {
+                    "status": status,
+                    "matrix": strategy,
+                    "stages": pop_stages(current_context),
+                },
+                trace,
+            ),
         },
     )
     return status, context
@@ -1361,9 +1950,9 @@ def local_process(
                 ),
                 extras=job.extras,
             )
-    if workers >= 10:
+    if workers < 1:
         err_msg: str = (
-            f"The max-parallel value should not more than 10, the current value "
+            f"The max-parallel value should gather than 0, the current value "
             f"was set: {workers}."
         )
         trace.error(f"[JOB]: {err_msg}")
@@ -1379,8 +1968,6 @@ def local_process(
             extras=job.extras,
         )
 
-    strategies: list[DictStr] = job.strategy.make()
-    len_strategy: int = len(strategies)
     trace.info(
         f"[JOB]: Mode {ls}: {job.id!r} with {workers} "
         f"worker{'s' if workers > 1 else ''}."
@@ -1404,60 +1991,359 @@ def local_process(
             extras=job.extras,
         )
 
-    with ThreadPoolExecutor(workers, "jb_stg") as executor:
-        futures: list[Future] = [
-            executor.submit(
-                local_process_strategy,
+    if job.strategy.executor == "process":
+        return local_process_pool(
+            job,
+            job.strategy.make(),
+            params,
+            trace=trace,
+            context=context,
+            event=event,
+            workers=workers,
+        )
+
+    # NOTE: Borrow the workers from the shared worker pool instead of creating
+    #   a new thread pool. The caller thread will run strategies together.
+    #   The strategies generate lazily and only keep the window of futures in
+    #   flight, so the huge matrix does not allocate everything up front.
+    strategies: Iterator[DictStr] = job.strategy.make_iter()
+    window: int = workers * STRATEGY_WINDOW
+    errors: DictData = {}
+    statuses: list[Status] = []
+    pending: set[Future] = set()
+    stop: bool = False
+    with get_pool().group(
+        workers,
+        level="strategy",
+        fail_fast=job.strategy.fail_fast,
+        on_error=event.set,
+    ) as group:
+        while True:
+            while not stop and len(pending) < window:
+                if (strategy := next(strategies, None)) is None:
+                    stop = True
+                    break
+                pending.add(
+                    group.submit(
+                        local_process_strategy,
+                        job=job,
+                        strategy=strategy,
+                        params=params,
+                        trace=trace,
+                        context=context,
+                        event=event,
+                    )
+                )
+            group.run()
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    status, _ = future.result()
+                    statuses.append(status)
+                except JobError as e:
+                    statuses.append(get_status_from_error(e))
+                    trace.error(
+                        f"[JOB]: {ls} Handler:||{e.__class__.__name__}: {e}"
+                    )
+                    mark_errors(errors, e)
+                    if job.strategy.fail_fast and not event.is_set():
+                        # NOTE: Stop generating the next strategies instead
+                        #   of cancel them, and cancel the pending strategies
+                        #   that do not start yet on this window.
+                        trace.warning(
+                            "[JOB]: Set the event for stop pending "
+                            "job-execution."
+                        )
+                        event.set()
+                        group.cancel()
+                        trace.debug(
+                            "[JOB]: ... Job was set Fail-Fast, it stops "
+                            "generating the next strategies."
+                        )
+                except CancelledError:
+                    statuses.append(WAIT)
+            stop = stop or event.is_set()
+
+    status: Status = validate_statuses(statuses)
+    errors.update(job.strategy.output.reduce(context, job.extras))
+    return Result.from_trace(trace).catch(
+        status=status,
+        context=catch(context, status=status, updated=errors),
+    )
+
+
+def local_process_pool(
+    job: Job,
+    strategies: list[DictStr],
+    params: DictData,
+    trace: Trace,
+    context: DictData,
+    *,
+    event: Event,
+    workers: int,
+) -> Result:
+    """Local strategies execution on the process pool for the CPU-bound stages
+    that do not release the GIL. It uses the `spawn` start method for avoid
+    inheriting any lock from the running threads of the parent process.
+
+        The cancellation from the shared Event object will propagate to the
+    child processes via the Event proxy of the multiprocessing manager, and the
+    strategy context data that return from the child processes will merge to
+    the parent context data.
+
+    Args:
+        job (Job): A job model.
+        strategies (list[DictStr]): A list of strategy metrix values.
+        params (DictData): A parameter data.
+        trace (Trace): A trace object of this job execution.
+        context (DictData): A context data.
+        event (Event): An Event manager instance that use to cancel this
+            execution if it forces stopped by parent execution.
+        workers (int): The maximum workers of the process pool.
+
+    Returns:
+        Result: A job process result.
+    """
+    ls: str = "Fail-Fast" if job.strategy.fail_fast else "All-Completed"
+    mp_context = get_context("spawn")
+    errors: DictData = {}
+    statuses: list[Status] = [WAIT] * len(strategies)
+    stop: Event = Event()
+    try:
+        with mp_context.Manager() as manager:
+            with ProcessPoolExecutor(
+                workers, mp_context=mp_context
+            ) as executor:
+                shared: Any = manager.Event()
+                if event.is_set():  # pragma: no cov
+                    shared.set()
+
+                Thread(
+                    target=bridge_event, args=(event, shared, stop), daemon=True
+                ).start()
+                futures: list[Future] = [
+                    executor.submit(
+                        local_process_strategy_worker,
+                        job,
+                        strategy,
+                        params,
+                        run_id=trace.run_id,
+                        parent_run_id=trace.parent_run_id,
+                        event=shared,
+                    )
+                    for strategy in strategies
+                ]
+
+                if not job.strategy.fail_fast:
+                    done: Iterator[Future] = as_completed(futures)
+                else:
+                    done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+                    if len(list(done)) != len(futures):
+                        trace.warning(
+                            "[JOB]: Set the event for stop pending job-execution."
+                        )
+                        event.set()
+                        for future in not_done:
+                            future.cancel()
+                    done: Iterator[Future] = as_completed(futures)
+
+                for i, future in enumerate(done, start=0):
+                    try:
+                        statuses[i], updated = future.result()
+                    except JobError as e:
+                        statuses[i] = get_status_from_error(e)
+                        updated = e.context
+                        trace.error(
+                            f"[JOB]: {ls} Handler:||{e.__class__.__name__}: {e}"
+                        )
+                        mark_errors(errors, e)
+                    except CancelledError:
+                        continue
+
+                    # NOTE: Merge the strategy context from the child process.
+                    updated.pop("status", None)
+                    get_artifact_store().adopt(updated.pop("artifacts", {}))
+                    context.update(updated)
+
+    finally:
+        stop.set()
+
+    status: Status = validate_statuses(statuses)
+    errors.update(job.strategy.output.reduce(context, job.extras))
+    return Result.from_trace(trace).catch(
+        status=status,
+        context=catch(context, status=status, updated=errors),
+    )
+
+
+async def local_aprocess(
+    job: Job,
+    params: DictData,
+    run_id: str,
+    context: DictData,
+    *,
+    event: Optional[Event] = None,
+    executor: Optional[Executor] = None,
+) -> Result:
+    """Async local job execution that is the async version of the
+    `local_process` function. It runs all strategies of this job as the
+    asyncio tasks that limit the concurrency with the semaphore of the
+    `max-parallel` value instead of the thread workers.
+
+    Args:
+        job (Job): A job model.
+        params (DictData): A parameter data.
+        run_id (str): A job running ID.
+        context (DictData): A context data.
+        event (Event, default None): An Event manager instance that use to
+            cancel this execution if it forces stopped by parent execution.
+        executor (Executor, default None): A bounded executor that use to
+            offload the blocking stage execution.
+
+    Returns:
+        Result: A job process result.
+    """
+    parent_run_id, run_id = extract_id(
+        (job.id or "EMPTY"), run_id=run_id, extras=job.extras
+    )
+    trace: Trace = get_trace(
+        run_id, parent_run_id=parent_run_id, extras=job.extras
+    )
+    await trace.ainfo("[JOB]: Start Async Local executor.")
+
+    if job.desc:
+        await trace.adebug(f"[JOB]: Description:||{job.desc}||")
+
+    if job.is_skipped(params=params):
+        await trace.ainfo("[JOB]: Skip because job condition was valid.")
+        return Result(
+            run_id=run_id,
+            parent_run_id=parent_run_id,
+            status=SKIP,
+            context=catch(context, status=SKIP),
+            extras=job.extras,
+        )
+
+    event: Event = event or Event()
+    ls: str = "Fail-Fast" if job.strategy.fail_fast else "All-Completed"
+    workers: Union[int, str] = job.strategy.max_parallel
+    if isinstance(workers, str):
+        try:
+            workers: int = int(
+                param2template(workers, params=params, extras=job.extras)
+            )
+        except Exception as err:
+            await trace.aexception(
+                "[JOB]: Got the error on call param2template to "
+                f"max-parallel value: {workers}"
+            )
+            return Result(
+                run_id=run_id,
+                parent_run_id=parent_run_id,
+                status=FAILED,
+                context=catch(
+                    context,
+                    status=FAILED,
+                    updated={"errors": to_dict(err)},
+                ),
+                extras=job.extras,
+            )
+    if workers < 1:
+        err_msg: str = (
+            f"The max-parallel value should gather than 0, the current value "
+            f"was set: {workers}."
+        )
+        await trace.aerror(f"[JOB]: {err_msg}")
+        return Result(
+            run_id=run_id,
+            parent_run_id=parent_run_id,
+            status=FAILED,
+            context=catch(
+                context,
+                status=FAILED,
+                updated={"errors": JobError(err_msg).to_dict()},
+            ),
+            extras=job.extras,
+        )
+
+    strategies: list[DictStr] = job.strategy.make()
+    await trace.ainfo(
+        f"[JOB]: Mode {ls}: {job.id!r} with {workers} "
+        f"task{'s' if workers > 1 else ''}."
+    )
+
+    if event and event.is_set():
+        return Result(
+            run_id=run_id,
+            parent_run_id=parent_run_id,
+            status=CANCEL,
+            context=catch(
+                context,
+                status=CANCEL,
+                updated={
+                    "errors": JobCancelError(
+                        "Execution was canceled from the event before start "
+                        "local job execution."
+                    ).to_dict()
+                },
+            ),
+            extras=job.extras,
+        )
+
+    semaphore = asyncio.Semaphore(workers)
+
+    async def limit(strategy: DictData) -> tuple[Status, DictData]:
+        """Run the strategy execution with the semaphore limit."""
+        async with semaphore:
+            return await local_aprocess_strategy(
                 job=job,
                 strategy=strategy,
                 params=params,
                 trace=trace,
                 context=context,
                 event=event,
+                executor=executor,
             )
-            for strategy in strategies
-        ]
-
-        errors: DictData = {}
-        statuses: list[Status] = [WAIT] * len_strategy
 
-        if not job.strategy.fail_fast:
-            done: Iterator[Future] = as_completed(futures)
-        else:
-            done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
-            if len(list(done)) != len(futures):
-                trace.warning(
-                    "[JOB]: Set the event for stop pending job-execution."
-                )
-                event.set()
-                for future in not_done:
-                    future.cancel()
+    tasks: list[asyncio.Task] = [
+        asyncio.create_task(limit(strategy)) for strategy in strategies
+    ]
+    errors: DictData = {}
+    statuses: list[Status] = []
 
-                time.sleep(0.01)
-                nd: str = (
-                    (
-                        f", {len(not_done)} strateg"
-                        f"{'ies' if len(not_done) > 1 else 'y'} not run!!!"
-                    )
-                    if not_done
-                    else ""
-                )
-                trace.debug(f"[JOB]: ... Job was set Fail-Fast{nd}")
-                done: Iterator[Future] = as_completed(futures)
+    if job.strategy.fail_fast:
+        _, not_done = await asyncio.wait(
+            tasks, return_when=asyncio.FIRST_EXCEPTION
+        )
+        if not_done:
+            await trace.awarning(
+                "[JOB]: Set the event for stop pending job-execution."
+            )
+            event.set()
+            await trace.adebug(
+                f"[JOB]: ... Job was set Fail-Fast, {len(not_done)} strateg"
+                f"{'ies' if len(not_done) > 1 else 'y'} not run!!!"
+            )
 
-        for i, future in enumerate(done, start=0):
-            try:
-                statuses[i], _ = future.result()
-            except JobError as e:
-                statuses[i] = get_status_from_error(e)
-                trace.error(
-                    f"[JOB]: {ls} Handler:||{e.__class__.__name__}: {e}"
-                )
-                mark_errors(errors, e)
-            except CancelledError:
-                pass
+    for rs in await asyncio.gather(*tasks, return_exceptions=True):
+        if isinstance(rs, JobError):
+            statuses.append(get_status_from_error(rs))
+            await trace.aerror(
+                f"[JOB]: {ls} Handler:||{rs.__class__.__name__}: {rs}"
+            )
+            mark_errors(errors, rs)
+        elif isinstance(rs, asyncio.CancelledError):
+            statuses.append(CANCEL)
+        elif isinstance(rs, BaseException):
+            raise rs
+        else:
+            statuses.append(rs[0])
 
     status: Status = validate_statuses(statuses)
+    errors.update(job.strategy.output.reduce(context, job.extras))
     return Result.from_trace(trace).catch(
         status=status,
         context=catch(context, status=status, updated=errors),
@@ -0,0 +1,611 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Shared Worker Pool Module.
+
+This module provides the process-wide bounded worker pool that the matrix
+strategies and the nested stages borrow their workers from instead of creating
+a new `ThreadPoolExecutor` object on every execution.
+
+    The pool does not block any thread for waiting a free worker. Each task
+group borrows workers from the pool when it has a free slot and the quota of
+its level does not reach the limit, and it runs its tasks on the caller thread
+when it cannot borrow any worker. So, the nested execution, like the foreach
+stage inside the parallel stage inside the matrix job, always makes progress
+and does not deadlock.
+
+    This module also provides the process-wide pool of long-lived shell
+coprocesses that the bash stage can run its short commands on instead of
+writing a `.sh` file and spawning a new shell process on every execution.
+
+Classes:
+    WorkerPool: A process-wide bounded worker pool with per-level quotas
+    TaskGroup: A group of tasks that borrow workers from the pool
+    ShellWorker: A long-lived shell coprocess that run framed commands
+    ShellPool: A bounded pool of the shell workers with recycling
+
+Functions:
+    get_pool: Get the process-wide worker pool
+    get_shell_pool: Get the process-wide shell worker pool
+"""
+from __future__ import annotations
+
+import atexit
+import os
+import selectors
+import shlex
+import signal
+import uuid
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from subprocess import PIPE, Popen
+from threading import Condition, Event, Lock
+from typing import Any, Optional
+
+from .__types import DictData
+from .conf import config
+
+__all__: tuple[str, ...] = (
+    "ShellPool",
+    "ShellWorker",
+    "TaskGroup",
+    "WorkerPool",
+    "get_pool",
+    "get_shell_pool",
+)
+
+
+class TaskGroup:
+    """Task Group object that keep the pending tasks of one execution level
+    and run them with the borrowed workers from the pool.
+
+        If the pool does not have any free worker for this group, the caller
+    thread will run the pending tasks by itself instead of waiting. So, the
+    nested group always makes progress even if the pool is exhausted.
+
+    Examples:
+        >>> with get_pool().group(4, level="stage") as group:
+        ...     futures = [group.submit(func, item) for item in items]
+        ...     group.run()
+    """
+
+    def __init__(
+        self,
+        pool: WorkerPool,
+        workers: int,
+        level: str,
+        *,
+        fail_fast: bool = False,
+        on_error: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        """Main initialize.
+
+        Args:
+            pool (WorkerPool): A worker pool that this group borrow from.
+            workers (int): The maximum borrowed workers of this group.
+            level (str): An execution level name that use to apply the quota.
+            fail_fast (bool, default False): A flag that cancel all pending
+                tasks when any task that run on the caller thread raise an
+                error. The borrowed workers leave this cancellation to the
+                caller that wait on their futures.
+            on_error (Callable, default None): A callback function that call
+                before cancel the pending tasks on the fail-fast mode.
+        """
+        self.pool: WorkerPool = pool
+        self.workers: int = max(workers, 1)
+        self.level: str = level
+        self.fail_fast: bool = fail_fast
+        self.on_error: Optional[Callable[[], Any]] = on_error
+        self.futures: set[Future] = set()
+        self._queue: deque[tuple[Future, Callable, tuple, DictData]] = deque()
+        self._lock: Lock = Lock()
+        self._runners: int = 0
+
+    def __enter__(self) -> TaskGroup:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.run()
+        wait_futures(list(self.futures))
+
+    def submit(self, fn: Callable, /, *args: Any, **kwargs: Any) -> Future:
+        """Submit a task to the pending queue of this group. The task does not
+        start until the `run` method was called.
+
+        Args:
+            fn (Callable): A function that want to run.
+
+        Returns:
+            Future: A future object of this task.
+        """
+        future: Future = Future()
+        with self._lock:
+            self._queue.append((future, fn, args, kwargs))
+            self.futures.add(future)
+
+        # NOTE: Only keep the pending futures, so a long-running group that
+        #   submits its tasks by window does not keep all done futures.
+        future.add_done_callback(self.futures.discard)
+        return future
+
+    def cancel(self) -> None:
+        """Cancel all pending tasks that do not start yet."""
+        with self._lock:
+            pending = list(self._queue)
+            self._queue.clear()
+
+        # NOTE: The cancelled future should notify its waiters because the
+        #   `wait` function does not count the un-notified cancelled future
+        #   as done.
+        for future, *_ in pending:
+            if future.cancel():
+                future.set_running_or_notify_cancel()
+
+    @staticmethod
+    def _execute(task: tuple[Future, Callable, tuple, DictData]) -> bool:
+        """Execute a task and set its result to the future object.
+
+        Returns:
+            bool: False if this task raise an error.
+        """
+        future, fn, args, kwargs = task
+        if not future.set_running_or_notify_cancel():
+            return True
+        try:
+            result: Any = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            return False
+        future.set_result(result)
+        return True
+
+    def _runner(self) -> None:
+        """Borrowed worker loop that run the pending tasks until the queue is
+        empty and give its slot back to the pool.
+        """
+        try:
+            while True:
+                # NOTE: Pop the task and leave the loop on the same lock, so
+                #   the caller can trust the running runners to drain the
+                #   queue.
+                with self._lock:
+                    if not self._queue:
+                        self._runners -= 1
+                        break
+                    task = self._queue.popleft()
+                self._execute(task)
+                self._borrow()
+        finally:
+            self.pool.release(self.level)
+
+    def _borrow(self) -> None:
+        """Borrow the free workers from the pool for the pending tasks."""
+        while True:
+            with self._lock:
+                if self._runners >= min(self.workers, len(self._queue)):
+                    return
+                if not self.pool.acquire(self.level):
+                    return
+                self._runners += 1
+            try:
+                self.pool.executor.submit(self._runner)
+            except RuntimeError:
+                # NOTE: Give the slot back if the pool executor was shutdown.
+                with self._lock:
+                    self._runners -= 1
+                self.pool.release(self.level)
+                return
+
+    def run(self) -> None:
+        """Start all pending tasks with the borrowed workers. It will run the
+        pending tasks on the caller thread only when this group does not have
+        any running borrowed worker, and try to borrow again after each task.
+        """
+        self._borrow()
+        while True:
+            with self._lock:
+                if self._runners > 0 or not self._queue:
+                    return
+                task = self._queue.popleft()
+            self.pool.count_inline(self.level)
+            if not self._execute(task) and self.fail_fast:
+                if self.on_error:
+                    self.on_error()
+                self.cancel()
+                return
+            self._borrow()
+
+
+class WorkerPool:
+    """Process-wide bounded worker pool that use to share the thread workers
+    between the matrix strategies and the nested stages.
+
+        The `quotas` value is a mapping of the execution level and the maximum
+    borrowed workers of this level. A level that does not set its quota can
+    borrow all workers in the pool.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        quotas: Optional[dict[str, int]] = None,
+    ) -> None:
+        self.max_workers: int = max_workers
+        self.quotas: dict[str, int] = quotas or {}
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers, "wf_pool"
+        )
+        self._lock: Lock = Lock()
+        self._used: int = 0
+        self._peak: int = 0
+        self._levels: dict[str, DictData] = {}
+
+    def _level(self, level: str) -> DictData:
+        if level not in self._levels:
+            self._levels[level] = {"used": 0, "borrowed": 0, "inline": 0}
+        return self._levels[level]
+
+    def acquire(self, level: str) -> bool:
+        """Acquire a free slot of this pool without blocking.
+
+        Args:
+            level (str): An execution level name.
+
+        Returns:
+            bool: True if it can acquire a slot.
+        """
+        with self._lock:
+            data: DictData = self._level(level)
+            if self._used >= self.max_workers or data[
+                "used"
+            ] >= self.quotas.get(level, self.max_workers):
+                return False
+            self._used += 1
+            self._peak = max(self._peak, self._used)
+            data["used"] += 1
+            data["borrowed"] += 1
+            return True
+
+    def release(self, level: str) -> None:
+        """Release a slot of this pool back.
+
+        Args:
+            level (str): An execution level name.
+        """
+        with self._lock:
+            self._used -= 1
+            self._level(level)["used"] -= 1
+
+    def count_inline(self, level: str) -> None:
+        """Count a task that run on the caller thread of this level."""
+        with self._lock:
+            self._level(level)["inline"] += 1
+
+    def group(
+        self,
+        workers: int,
+        level: str,
+        *,
+        fail_fast: bool = False,
+        on_error: Optional[Callable[[], Any]] = None,
+    ) -> TaskGroup:
+        """Create a task group that borrow workers from this pool.
+
+        Args:
+            workers (int): The maximum workers of this group.
+            level (str): An execution level name, like `strategy` or `stage`.
+            fail_fast (bool, default False): A fail-fast flag.
+            on_error (Callable, default None): A callback function on the
+                fail-fast mode.
+
+        Returns:
+            TaskGroup: A task group object.
+        """
+        return TaskGroup(
+            self, workers, level, fail_fast=fail_fast, on_error=on_error
+        )
+
+    def metrics(self) -> DictData:
+        """Return the utilization metrics of this pool.
+
+        Returns:
+            DictData: A metrics data that include the maximum workers, the used
+                workers, the peak used workers, and the metrics of each level.
+        """
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "used": self._used,
+                "peak": self._peak,
+                "utilization": round(self._used / self.max_workers, 4),
+                "levels": {k: v.copy() for k, v in self._levels.items()},
+            }
+
+
+_POOL: Optional[WorkerPool] = None
+_POOL_LOCK: Lock = Lock()
+
+
+def get_pool() -> WorkerPool:
+    """Get the process-wide worker pool that create with the `pool_max_workers`
+    and `pool_quotas` config values at the first call.
+
+    Returns:
+        WorkerPool: The shared worker pool.
+    """
+    global _POOL
+
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = WorkerPool(config.pool_max_workers, config.pool_quotas)
+        return _POOL
+
+
+class ShellWorker:
+    """Shell Worker object that keep a long-lived shell coprocess and run the
+    framed commands on it.
+
+        Each command goes to the stdin of the coprocess and ends with a random
+    sentinel line. The driver loop runs it on a subshell with the current
+    working directory, so any change of the environment variables, the shell
+    variables, and the working directory does not leak to the next command.
+    After that, it writes the sentinel with the return code to stdout and the
+    sentinel to stderr that this object uses to split the command outputs.
+
+    Examples:
+        >>> worker = ShellWorker()
+        >>> worker.run("echo 'Hello'")
+        (0, 'Hello\\n', '')
+        >>> worker.close()
+    """
+
+    DRIVER: str = (
+        '__wf_end="$1"; set --; __wf_cmd=""\n'
+        "while IFS= read -r __wf_line; do\n"
+        '  if [ "$__wf_line" = "$__wf_end" ]; then\n'
+        '    (eval "$__wf_cmd") </dev/null\n'
+        "    __wf_rc=$?\n"
+        '    printf \'\\n%s %d\\n\' "$__wf_end" "$__wf_rc"\n'
+        "    printf '\\n%s\\n' \"$__wf_end\" >&2\n"
+        '    __wf_cmd=""\n'
+        "  else\n"
+        '    __wf_cmd="$__wf_cmd$__wf_line\n"\n'
+        "  fi\n"
+        "done\n"
+    )
+
+    def __init__(self, shell: str = "sh") -> None:
+        self.sentinel: bytes = f"__wf_end_{uuid.uuid4().hex}__".encode()
+        self.proc: Popen = Popen(
+            [shell, "-c", self.DRIVER, shell, self.sentinel.decode()],
+            stdin=PIPE,
+            stdout=PIPE,
+            stderr=PIPE,
+            start_new_session=True,
+        )
+        self.count: int = 0
+        self.broken: bool = False
+
+    def run(
+        self, script: str, *, event: Optional[Event] = None
+    ) -> tuple[int, str, str]:
+        """Run a shell script on this worker and wait until its sentinels come
+        back on both stdout and stderr.
+
+        Args:
+            script (str): A shell script.
+            event (Event, default None): An event that kill this worker when it
+                was set while the command running.
+
+        Raises:
+            InterruptedError: If the event was set while the command running.
+            BrokenPipeError: If the coprocess was stopped before it returns
+                the sentinel.
+
+        Returns:
+            tuple[int, str, str]: A return code, stdout, and stderr.
+        """
+        self.count += 1
+        script: str = script.replace("\r\n", "\n").rstrip("\n")
+        payload: bytes = (
+            f"cd {shlex.quote(os.getcwd())} || exit 1\n{script}\n".encode()
+            + self.sentinel
+            + b"\n"
+        )
+        ends: dict[int, bytes] = {
+            self.proc.stdout.fileno(): b"\n" + self.sentinel + b" ",
+            self.proc.stderr.fileno(): b"\n" + self.sentinel + b"\n",
+        }
+        buffers: dict[int, bytearray] = {fd: bytearray() for fd in ends}
+        try:
+            self.proc.stdin.write(payload)
+            self.proc.stdin.flush()
+        except OSError as e:
+            self.broken = True
+            raise BrokenPipeError("Shell worker was stopped.") from e
+
+        with selectors.DefaultSelector() as selector:
+            for fd in ends:
+                selector.register(fd, selectors.EVENT_READ)
+            while selector.get_map():
+                if event and event.is_set():
+                    self.broken = True
+                    self.close()
+                    raise InterruptedError("Shell command was cancelled.")
+                for key, _ in selector.select(timeout=0.1):
+                    chunk: bytes = os.read(key.fd, 65536)
+                    if not chunk:
+                        self.broken = True
+                        raise BrokenPipeError(
+                            "Shell worker was stopped before the command end."
+                        )
+                    buf: bytearray = buffers[key.fd]
+                    buf.extend(chunk)
+                    if self._is_end(buf, ends[key.fd]):
+                        selector.unregister(key.fd)
+
+        out: bytearray = buffers[self.proc.stdout.fileno()]
+        idx: int = out.rfind(ends[self.proc.stdout.fileno()])
+        code: int = int(out[idx + len(self.sentinel) + 2 :].strip())
+        err: bytearray = buffers[self.proc.stderr.fileno()]
+        return (
+            code,
+            out[:idx].decode("utf-8", errors="replace"),
+            err[: -len(ends[self.proc.stderr.fileno()])].decode(
+                "utf-8", errors="replace"
+            ),
+        )
+
+    @staticmethod
+    def _is_end(buf: bytearray, end: bytes) -> bool:
+        """Check the buffer ends with the sentinel line."""
+        if end.endswith(b"\n") or not buf.endswith(b"\n"):
+            return buf.endswith(end)
+        idx: int = buf.rfind(end)
+        return idx != -1 and buf.find(b"\n", idx + len(end)) == len(buf) - 1
+
+    def close(self) -> None:
+        """Kill the process group of this shell worker."""
+        if self.proc.poll() is None:
+            try:
+                os.killpg(self.proc.pid, signal.SIGKILL)
+            except ProcessLookupError:  # pragma: no cov
+                pass
+        self.proc.wait()
+        for pipe in (self.proc.stdin, self.proc.stdout, self.proc.stderr):
+            pipe.close()
+
+
+class ShellPool:
+    """Shell Pool object that keep the bounded number of the shell workers.
+    The worker will recycle after it runs the `recycle` number of commands or
+    it breaks on any failure.
+
+    Examples:
+        >>> pool = ShellPool(max_workers=2, recycle=100)
+        >>> pool.run("echo 'Hello'")
+        (0, 'Hello\\n', '')
+        >>> pool.close()
+    """
+
+    def __init__(
+        self, max_workers: int, recycle: int, shell: str = "sh"
+    ) -> None:
+        self.max_workers: int = max_workers
+        self.recycle: int = recycle
+        self.shell: str = shell
+        self._idle: deque[ShellWorker] = deque()
+        self._size: int = 0
+        self._cond: Condition = Condition()
+
+    def acquire(self) -> ShellWorker:
+        """Acquire an idle worker or create a new one if the pool does not
+        reach its maximum workers. It will wait if all workers are busy.
+
+        Returns:
+            ShellWorker: A shell worker.
+        """
+        with self._cond:
+            while not self._idle and self._size >= self.max_workers:
+                self._cond.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._size += 1
+        try:
+            return ShellWorker(self.shell)
+        except BaseException:
+            self._discard()
+            raise
+
+    def release(self, worker: ShellWorker) -> None:
+        """Release the worker back to the pool or close it if it should
+        recycle.
+
+        Args:
+            worker (ShellWorker): A shell worker that acquire from this pool.
+        """
+        if (
+            worker.broken
+            or worker.count >= self.recycle
+            or worker.proc.poll() is not None
+        ):
+            worker.close()
+            self._discard()
+            return
+        with self._cond:
+            self._idle.append(worker)
+            self._cond.notify()
+
+    def _discard(self) -> None:
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    def run(
+        self, script: str, *, event: Optional[Event] = None
+    ) -> tuple[int, str, str]:
+        """Run a shell script on a worker of this pool.
+
+        Args:
+            script (str): A shell script.
+            event (Event, default None): An event that cancel the command.
+
+        Returns:
+            tuple[int, str, str]: A return code, stdout, and stderr.
+        """
+        worker: ShellWorker = self.acquire()
+        try:
+            return worker.run(script, event=event)
+        except BaseException:
+            worker.broken = True
+            raise
+        finally:
+            self.release(worker)
+
+    def close(self) -> None:
+        """Close all idle workers of this pool."""
+        with self._cond:
+            while self._idle:
+                self._idle.pop().close()
+                self._size -= 1
+
+
+_SHELL_POOL: Optional[ShellPool] = None
+_SHELL_POOL_LOCK: Lock = Lock()
+
+
+def get_shell_pool() -> ShellPool:
+    """Get the process-wide shell worker pool that create with the
+    `stage_bash_pool_size` and `stage_bash_pool_recycle` config values at the
+    first call. All idle workers will close at the interpreter exit.
+
+    Returns:
+        ShellPool: The shared shell worker pool.
+    """
+    global _SHELL_POOL
+
+    with _SHELL_POOL_LOCK:
+        if _SHELL_POOL is None:
+            _SHELL_POOL = ShellPool(
+                config.stage_bash_pool_size, config.stage_bash_pool_recycle
+            )
+            atexit.register(_SHELL_POOL.close)
+        return _SHELL_POOL
+
+
+def _reset_shell_pool() -> None:  # pragma: no cov
+    """Drop the shell pool that copy from the parent process after fork
+    because its workers belong to the parent process.
+    """
+    global _SHELL_POOL, _SHELL_POOL_LOCK
+
+    _SHELL_POOL = None
+    _SHELL_POOL_LOCK = Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_shell_pool)
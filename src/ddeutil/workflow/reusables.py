@@ -22,6 +22,8 @@ Functions:
     has_template: Check if string contains template variables
     not_in_template: Validate template restrictions
     extract_call: Extract callable information from registry
+    compile_condition: Compile a condition expression with restricted AST
+    eval_condition: Evaluate a condition expression with parameters
     create_model_from_caller: Generate Pydantic models from function signatures
 
 Example:
@@ -46,17 +48,21 @@ Note:
 """
 from __future__ import annotations
 
+import ast
 import copy
 import inspect
 import logging
 from ast import Call, Constant, Expr, Module, Name, parse
 from datetime import datetime
-from functools import wraps
+from functools import lru_cache, wraps
 from importlib import import_module
+from threading import Lock
+from types import CodeType, MappingProxyType
 from typing import (
     Annotated,
     Any,
     Callable,
+    Final,
     Literal,
     Optional,
     Protocol,
@@ -71,15 +77,17 @@ try:
 except ImportError:
     from typing_extensions import ParamSpec
 
-from ddeutil.core import getdot, import_string, lazy
+from ddeutil.core import can_int, import_string, lazy
 from ddeutil.io import search_env_replace
 from pydantic import BaseModel, ConfigDict, Field, create_model
 from pydantic.alias_generators import to_pascal
 from pydantic.dataclasses import dataclass
 
-from .__types import DictData, Re
+from .__types import CallerRe, DictData, Re
+from .artifacts import get_artifact_store, is_artifact
 from .conf import dynamic
 from .errors import UtilError
+from .utils import LayerContext, load_spill
 
 T = TypeVar("T")
 P = ParamSpec("P")
@@ -143,19 +151,120 @@ def custom_filter(name: str) -> Callable[P, FilterFunc]:
     return func_internal
 
 
+class RegistryCache:
+    """Process-wide Registry Cache object that keep the registry mapping that
+    was made from importing modules, so the filter and caller registries do not
+    run the import machinery and `inspect.getmembers` on every calling.
+
+        A cache entry does not check its source modules, so it keeps until the
+    `clear` method was called. The application that changes the source code
+    should reload its modules and call the `clear` method by itself.
+
+    Examples:
+        >>> registry_cache.info()
+        {'hits': 0, 'misses': 0, 'size': 0}
+    """
+
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.misses: int = 0
+        self._lock: Lock = Lock()
+        self._locks: dict[tuple, Lock] = {}
+        self._data: dict[tuple, Any] = {}
+
+    def get(self, key: tuple, maker: Callable[[], T]) -> T:
+        """Get the registry from cache or make it with the maker function if
+        it does not exist.
+
+            The making step runs under the lock of this key, so the concurrent
+        threads that do not found the same entry will make this registry only
+        once.
+
+        Args:
+            key: A cache key that should be the tuple of registry modules.
+            maker: A function that return the registry.
+
+        Returns:
+            T: A registry data.
+        """
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                return self._data[key]
+            lock: Lock = self._locks.setdefault(key, Lock())
+
+        with lock:
+            # NOTE: Check again because other thread may make it already.
+            with self._lock:
+                if key in self._data:
+                    self.hits += 1
+                    return self._data[key]
+
+            registry: T = maker()
+            with self._lock:
+                self.misses += 1
+                self._data[key] = registry
+            return registry
+
+    def clear(self) -> None:
+        """Clear all registry cache data and reset the hit and miss counters."""
+        with self._lock:
+            self._data.clear()
+            self._locks.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> dict[str, int]:
+        """Return the cache information that include hit, miss counters, and
+        the number of cached registries.
+
+        Returns:
+            dict[str, int]: A cache information.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._data),
+            }
+
+
+registry_cache: RegistryCache = RegistryCache()
+
+
 def make_filter_registry(
     registers: Optional[list[str]] = None,
 ) -> dict[str, FilterRegistry]:
-    """Return registries of all functions that can be called with tasks.
+    """Return registries of all functions that can be called with tasks. This
+    result will cache with the list of registers on the `registry_cache`
+    object.
 
     Args:
         registers: Optional override list of registers.
 
+    Returns:
+        dict[str, FilterRegistry]: Dictionary mapping filter names to functions.
+    """
+    modules: list[str] = dynamic("registry_filter", f=registers)
+    return registry_cache.get(
+        ("filter", *modules),
+        lambda: _make_filter_registry(modules),
+    )
+
+
+def _make_filter_registry(
+    modules: list[str],
+) -> dict[str, FilterRegistry]:
+    """Make registries of all filter functions from importing modules.
+
+    Args:
+        modules: A list of module import string.
+
     Returns:
         dict[str, FilterRegistry]: Dictionary mapping filter names to functions.
     """
     rs: dict[str, FilterRegistry] = {}
-    for module in dynamic("registry_filter", f=registers):
+    for module in modules:
         # NOTE: try to sequential import task functions
         try:
             importer = import_module(module)
@@ -227,6 +336,27 @@ def get_args_const(
     return name.id, args, keywords
 
 
+@lru_cache(maxsize=1024)
+def compile_filter(ft: str) -> tuple[str, tuple[Any, ...], tuple[tuple]]:
+    """Compile a post-filter calling string to its function name and constant
+    arguments. This result will cache with the filter string, so the same
+    post-filter does not parse with the `ast` module again.
+
+    Args:
+        ft: Filter function calling string.
+
+    Returns:
+        tuple[str, tuple[Any, ...], tuple[tuple]]: Function name, args, and
+            pairs of keyword-arguments.
+    """
+    func_name, _args, _kwargs = get_args_const(ft)
+    return (
+        func_name,
+        tuple(arg.value for arg in _args),
+        tuple((k, v.value) for k, v in _kwargs.items()),
+    )
+
+
 def get_args_from_filter(
     ft: str,
     filters: dict[str, FilterRegistry],
@@ -245,9 +375,9 @@ def get_args_from_filter(
     Raises:
         UtilError: If the filter function is not supported or has invalid arguments.
     """
-    func_name, _args, _kwargs = get_args_const(ft)
-    args: list[Any] = [arg.value for arg in _args]
-    kwargs: dict[Any, Any] = {k: v.value for k, v in _kwargs.items()}
+    func_name, _args, _kwargs = compile_filter(ft)
+    args: list[Any] = list(_args)
+    kwargs: dict[Any, Any] = dict(_kwargs)
 
     if func_name not in filters:
         raise UtilError(f"The post-filter: {func_name!r} does not support yet.")
@@ -337,6 +467,385 @@ def has_template(value: Any) -> bool:
     return bool(Re.RE_CALLER.findall(value.strip()))
 
 
+_MISSING = object()
+
+
+def compile_caller(caller: str) -> tuple[tuple[str, bool, Any], ...]:
+    """Compile a caller string to the dot path that use to get value from the
+    parameters without splitting the caller string again on the render step.
+    Each part of the path keeps the key, the optional flag from the `?` suffix,
+    and the integer key that use when the string key does not exist.
+
+    Args:
+        caller: A caller string like `params.source?.table`.
+
+    Returns:
+        tuple[tuple[str, bool, Any], ...]: A compiled dot path.
+    """
+    parts: list[str] = caller.split(".")
+
+    # NOTE: The last empty part does not use on the getting by dot.
+    if len(parts) > 1 and parts[-1] == "":
+        parts.pop()
+
+    path: list[tuple[str, bool, Any]] = []
+    for part in parts:
+        key: str = part.rstrip("?")
+        int_key: Any = _MISSING
+        if can_int(key):
+            try:
+                int_key = int(key)
+            except ValueError:
+                int_key = None
+        path.append((key, part.endswith("?"), int_key))
+    return tuple(path)
+
+
+def getdot_path(
+    path: tuple[tuple[str, bool, Any], ...], content: DictData
+) -> Any:
+    """Get value from content with the compiled dot path. This function has the
+    same result as the `getdot` function from the `ddeutil.core` package.
+
+    Args:
+        path: A compiled dot path from the `compile_caller` function.
+        content: A mapping content.
+
+    Raises:
+        ValueError: If the key of the path does not exist in the content.
+
+    Returns:
+        Any: A value that get from the content.
+    """
+    for key, is_optional, int_key in path:
+        if isinstance(content, dict):
+            # NOTE: Load the nested context lazily if the output policy of the
+            #   nested stage or job spilled it to disk.
+            if key not in content and isinstance(content.get("spill"), str):
+                content = content | load_spill(content["spill"])
+
+            if key in content:
+                content = content[key]
+                continue
+            elif int_key is None:
+                raise ValueError(f"{key!r} can not convert to integer key.")
+            elif int_key is not _MISSING and int_key in content:
+                content = content[int_key]
+                continue
+            elif is_optional:
+                return None
+        raise ValueError(f"{key!r} does not exists in {content}")
+
+    # NOTE: Load the value of the artifact handle lazily from the store.
+    if is_artifact(content):
+        return get_artifact_store().get(content)
+    return content
+
+
+class CompiledCaller:
+    """Compiled caller object that keep the pre-resolved dot path and parsed
+    post-filters of one `${{ <caller> | <filter> }}` template.
+    """
+
+    __slots__ = ("full", "caller", "path", "post_filters", "filters")
+
+    def __init__(self, full: str, caller: str, post_filters: str) -> None:
+        self.full: str = full
+        self.caller: str = caller
+        self.path: tuple[tuple[str, bool, Any], ...] = compile_caller(caller)
+        self.post_filters: list[str] = [
+            i.strip()
+            for i in (post_filters.strip().removeprefix("|").split("|"))
+            if i != ""
+        ]
+
+        # NOTE: Parse post-filters only once. If it raises any error, it will
+        #   keep None and raise again on the render step.
+        self.filters: Optional[list[tuple[str, tuple, tuple]]] = []
+        try:
+            for ft in self.post_filters:
+                self.filters.append(compile_filter(ft))
+        except Exception:
+            self.filters = None
+
+    def render(
+        self,
+        params: DictData,
+        filters: dict[str, FilterRegistry],
+    ) -> Any:
+        """Get value of this caller from parameters and map its post-filters.
+
+        Args:
+            params: A parameter values that already merge with context.
+            filters: A mapping of filter registry.
+
+        Raises:
+            UtilError: If parameters cannot be retrieved or the post-filter
+                function fails.
+
+        Returns:
+            Any: A value that passed all post-filters.
+        """
+        # NOTE: from validate step, it guarantees that caller exists in params.
+        #   I recommend to avoid logging params context on this case because it
+        #   can include secret value.
+        try:
+            value: Any = getdot_path(self.path, params)
+        except ValueError:
+            raise UtilError(
+                f"Parameters does not get dot with caller: {self.caller!r}."
+            ) from None
+
+        # NOTE: Isolate the mutable value that shares with the parent context,
+        #   so the nested execution does not mutate it.
+        if isinstance(params, LayerContext):
+            value = params.isolate(self.path, value)
+
+        if self.filters is None:
+            return map_post_filter(value, self.post_filters, filters=filters)
+
+        for func_name, args, kwargs in self.filters:
+            if func_name not in filters:
+                raise UtilError(
+                    f"The post-filter: {func_name!r} does not support yet."
+                )
+
+            f_func: FilterRegistry = filters[func_name]
+            if isinstance(f_func, list) and (args or kwargs):
+                raise UtilError(
+                    "Chain filter function does not support for passing "
+                    "arguments."
+                )
+
+            try:
+                if isinstance(f_func, list):
+                    for func in f_func:
+                        value: Any = func(value)
+                else:
+                    value: Any = f_func(value, *args, **dict(kwargs))
+            except UtilError:
+                raise
+            except Exception:
+                raise UtilError(
+                    f"The post-filter: {func_name!r} does not fit with "
+                    f"{value!r} (type: {type(value).__name__})."
+                ) from None
+        return value
+
+
+class CompiledStr:
+    """Compiled template string object that pre-split a string value to the
+    literal segments and the compiled callers. The render step of this object
+    only does lookups and does not search the caller regular expression again.
+
+    Examples:
+        >>> compile_str("${{ params.name }}-${{ params.dt | fmt('%Y') }}")
+    """
+
+    __slots__ = ("value", "segments", "has_filter")
+
+    def __init__(self, value: str) -> None:
+        # NOTE: remove space before and after this string value.
+        self.value: str = value.strip()
+        self.segments: list[Union[str, CompiledCaller]] = []
+        pos: int = 0
+        for match in Re.RE_CALLER.finditer(self.value):
+            found: CallerRe = CallerRe.from_regex(match)
+            start, end = match.span()
+            if start > pos:
+                self.segments.append(self.value[pos:start])
+            self.segments.append(
+                CompiledCaller(found.full, found.caller, found.post_filters)
+            )
+            pos = end
+
+        if pos < len(self.value):
+            self.segments.append(self.value[pos:])
+
+        self.has_filter: bool = any(
+            isinstance(s, CompiledCaller) and s.post_filters
+            for s in self.segments
+        )
+
+    def render(
+        self,
+        params: DictData,
+        *,
+        context: Optional[DictData] = None,
+        filters: Optional[dict[str, FilterRegistry]] = None,
+        registers: Optional[list[str]] = None,
+    ) -> Any:
+        """Render this template string with parameters.
+
+            If this template string has only one caller without any literal
+        string, it will return the origin value from the caller instead of the
+        string value.
+
+        Args:
+            params: Parameter values to get with compiled callers.
+            context: Optional context data.
+            filters: Optional mapping of filter registry.
+            registers: Optional override list of registers.
+
+        Returns:
+            Any: The rendered value.
+        """
+        if self.has_filter and not filters:
+            filters = make_filter_registry(registers=registers)
+
+        content: DictData = params | context if context else params
+        rendered: list[str] = []
+        last: int = len(self.segments) - 1
+        for i, segment in enumerate(self.segments):
+            if isinstance(segment, str):
+                rendered.append(segment)
+                continue
+
+            getter: Any = segment.render(content, filters)
+
+            # NOTE:
+            #   If type of getter caller is not string type, and it does not
+            #   use to concat other string value, it will return origin value.
+            if i == last and not any(rendered):
+                return getter
+
+            if not isinstance(getter, str):
+                getter: str = str(getter)
+            rendered.append(getter)
+
+        value: str = "".join(rendered)
+        if value == "None":
+            return None
+
+        # NOTE: Skip searching environment variable if it does not have `$`.
+        if "$" in value:
+            return search_env_replace(value)
+        return value
+
+
+@lru_cache(maxsize=2048)
+def compile_str(value: str) -> CompiledStr:
+    """Compile a template string with LRU caching by the string value. It uses
+    for any ad-hoc templating call that does not keep the compiled object.
+
+    Args:
+        value: A string value that want to compile.
+
+    Returns:
+        CompiledStr: A compiled template string.
+    """
+    return CompiledStr(value)
+
+
+class CompiledTemplate:
+    """Compiled template object of any templated value like dict, list, or str
+    value. It keeps the nested compiled strings, so rendering does not walk the
+    raw value and search the caller regular expression again.
+
+    Examples:
+        >>> tpl = compile_template({"name": "${{ params.name }}"})
+        >>> tpl.render({"params": {"name": "foo"}})
+        {'name': 'foo'}
+    """
+
+    __slots__ = ("value", "node", "has_filter", "static")
+
+    def __init__(self, value: Any) -> None:
+        self.value: Any = value
+        self.has_filter: bool = False
+        self.static: bool = True
+        self.node: tuple = self.compile(value)
+
+    def compile(self, value: Any) -> tuple:
+        """Compile a value to the node tuple that has kind at the first index.
+
+        Args:
+            value: A value that want to compile.
+
+        Returns:
+            tuple: A compiled node.
+        """
+        if isinstance(value, dict):
+            return "dict", tuple((k, self.compile(value[k])) for k in value)
+        elif isinstance(value, (list, tuple, set)):
+            return "seq", value, tuple(self.compile(i) for i in value)
+        elif not isinstance(value, str):
+            return "const", value
+
+        # NOTE: A value that does not have any `$` string will render to the
+        #   same result with any parameters and environment variables.
+        self.static &= "$" not in value
+        compiled: CompiledStr = compile_str(value)
+        self.has_filter |= compiled.has_filter
+        return "str", compiled
+
+    def render(
+        self,
+        params: DictData,
+        context: Optional[DictData] = None,
+        filters: Optional[dict[str, FilterRegistry]] = None,
+        *,
+        extras: Optional[DictData] = None,
+    ) -> Any:
+        """Render this compiled template with parameters.
+
+        Args:
+            params: Parameter values to get with compiled callers.
+            context: Optional context data.
+            filters: Optional mapping of filter registry.
+            extras: Optional override extras.
+
+        Returns:
+            Any: The rendered value.
+        """
+        registers: Optional[list[str]] = (
+            extras.get("registry_filter") if extras else None
+        )
+        if self.has_filter and not filters:
+            filters = make_filter_registry(registers=registers)
+        return self._render(self.node, params, context, filters, registers)
+
+    def _render(
+        self,
+        node: tuple,
+        params: DictData,
+        context: Optional[DictData],
+        filters: Optional[dict[str, FilterRegistry]],
+        registers: Optional[list[str]],
+    ) -> Any:
+        kind: str = node[0]
+        if kind == "str":
+            return node[1].render(
+                params, context=context, filters=filters, registers=registers
+            )
+        elif kind == "dict":
+            return {
+                k: self._render(n, params, context, filters, registers)
+                for k, n in node[1]
+            }
+        elif kind == "seq":
+            try:
+                return type(node[1])(
+                    self._render(n, params, context, filters, registers)
+                    for n in node[2]
+                )
+            except TypeError:
+                return node[1]
+        return node[1]
+
+
+def compile_template(value: Any) -> CompiledTemplate:
+    """Compile any templated value to the reusable compiled template object.
+
+    Args:
+        value: A value that want to compile.
+
+    Returns:
+        CompiledTemplate: A compiled template.
+    """
+    return CompiledTemplate(value)
+
+
 def str2template(
     value: str,
     params: DictData,
@@ -364,54 +873,10 @@ def str2template(
     Raises:
         UtilError: If parameters cannot be retrieved or template processing fails.
     """
-    filters: dict[str, FilterRegistry] = filters or make_filter_registry(
-        registers=registers
+    return compile_str(value).render(
+        params, context=context, filters=filters, registers=registers
     )
 
-    # NOTE: remove space before and after this string value.
-    value: str = value.strip()
-    for found in Re.finditer_caller(value):
-        # NOTE:
-        #   Get caller and filter values that setting inside;
-        #
-        #   ... ``${{ <caller-value> [ | <filter-value>] ... }}``
-        #
-        caller: str = found.caller
-        pfilter: list[str] = [
-            i.strip()
-            for i in (found.post_filters.strip().removeprefix("|").split("|"))
-            if i != ""
-        ]
-
-        # NOTE: from validate step, it guarantees that caller exists in params.
-        #   I recommend to avoid logging params context on this case because it
-        #   can include secret value.
-        try:
-            getter: Any = getdot(caller, params | (context or {}))
-        except ValueError:
-            raise UtilError(
-                f"Parameters does not get dot with caller: {caller!r}."
-            ) from None
-
-        # NOTE:
-        #   If type of getter caller is not string type, and it does not use to
-        #   concat other string value, it will return origin value from the
-        #   ``getdot`` function.
-        if value.replace(found.full, "", 1) == "":
-            return map_post_filter(getter, pfilter, filters=filters)
-
-        # NOTE: map post-filter function.
-        getter: Any = map_post_filter(getter, pfilter, filters=filters)
-        if not isinstance(getter, str):
-            getter: str = str(getter)
-
-        value: str = value.replace(found.full, getter, 1)
-
-    if value == "None":
-        return None
-
-    return search_env_replace(value)
-
 
 def param2template(
     value: T,
@@ -433,12 +898,12 @@ def param2template(
     Returns:
         Any: The processed value with template variables replaced.
     """
+    if isinstance(value, CompiledTemplate):
+        return value.render(params, context, filters, extras=extras)
+
     registers: Optional[list[str]] = (
         extras.get("registry_filter") if extras else None
     )
-    filters: dict[str, FilterRegistry] = filters or make_filter_registry(
-        registers=registers
-    )
     if isinstance(value, dict):
         return {
             k: param2template(value[k], params, context, filters, extras=extras)
@@ -459,6 +924,148 @@ def param2template(
     )
 
 
+CONDITION_FUNCS: Final[dict[str, Callable]] = {
+    "abs": abs,
+    "all": all,
+    "any": any,
+    "bool": bool,
+    "float": float,
+    "int": int,
+    "len": len,
+    "max": max,
+    "min": min,
+    "round": round,
+    "str": str,
+    "sum": sum,
+}
+CONDITION_METHODS: Final[frozenset[str]] = frozenset(
+    (
+        "count",
+        "endswith",
+        "get",
+        "index",
+        "isdigit",
+        "items",
+        "keys",
+        "lower",
+        "split",
+        "startswith",
+        "strip",
+        "upper",
+        "values",
+    )
+)
+CONDITION_NODES: Final[tuple[type[ast.AST], ...]] = (
+    ast.Expression,
+    ast.BoolOp,
+    ast.And,
+    ast.Or,
+    ast.UnaryOp,
+    ast.Not,
+    ast.UAdd,
+    ast.USub,
+    ast.BinOp,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Compare,
+    ast.Eq,
+    ast.NotEq,
+    ast.Lt,
+    ast.LtE,
+    ast.Gt,
+    ast.GtE,
+    ast.In,
+    ast.NotIn,
+    ast.Is,
+    ast.IsNot,
+    ast.IfExp,
+    ast.Constant,
+    ast.Name,
+    ast.Load,
+    ast.List,
+    ast.Tuple,
+    ast.Set,
+    ast.Dict,
+    ast.Subscript,
+    ast.Slice,
+    ast.Attribute,
+    ast.Call,
+    ast.keyword,
+)
+_CONDITION_GLOBALS: Final[DictData] = {"__builtins__": CONDITION_FUNCS}
+
+
+@lru_cache(maxsize=4096)
+def compile_condition(expr: str) -> CodeType:
+    """Compile a condition expression to the code object once. It only allows
+    the whitelist AST nodes, the non-private attributes, and the function call
+    to the `CONDITION_FUNCS` functions or the read-only `CONDITION_METHODS`
+    methods.
+
+    Args:
+        expr (str): A condition expression that already passed the template.
+
+    Raises:
+        SyntaxError: If the expression is not a valid Python expression.
+        ValueError: If the expression use any node that does not allow.
+
+    Returns:
+        CodeType: A code object that use to evaluate with the `eval` function.
+    """
+    tree: ast.Expression = ast.parse(expr.strip(), mode="eval")
+    for node in ast.walk(tree):
+        if not isinstance(node, CONDITION_NODES):
+            raise ValueError(
+                f"Condition does not allow {node.__class__.__name__!r} "
+                f"syntax: {expr!r}"
+            )
+        elif isinstance(node, ast.Name) and node.id.startswith("_"):
+            raise ValueError(
+                f"Condition does not allow private name: {node.id!r}"
+            )
+        elif isinstance(node, ast.Attribute) and (
+            node.attr.startswith("_") or node.attr in ("format", "format_map")
+        ):
+            raise ValueError(
+                f"Condition does not allow attribute: {node.attr!r}"
+            )
+        elif isinstance(node, ast.Call) and not (
+            (
+                isinstance(node.func, ast.Attribute)
+                and node.func.attr in CONDITION_METHODS
+            )
+            or (
+                isinstance(node.func, ast.Name)
+                and node.func.id in CONDITION_FUNCS
+            )
+        ):
+            raise ValueError(
+                f"Condition does not allow calling: {ast.unparse(node.func)!r}"
+            )
+    return compile(tree, "<condition>", "eval")
+
+
+def eval_condition(expr: str, params: DictData) -> Any:
+    """Evaluate a condition expression with the cached code object. The names
+    on this expression will resolve from a read-only view of parameters first
+    and the `CONDITION_FUNCS` functions, so it does not merge any dict.
+
+    Args:
+        expr (str): A condition expression that already passed the template.
+        params (DictData): A parameter data that use to resolve the names.
+
+    Returns:
+        Any: A result of this expression.
+    """
+    return eval(
+        compile_condition(expr), _CONDITION_GLOBALS, MappingProxyType(params)
+    )
+
+
 @custom_filter("fmt")  # pragma: no cov
 def datetime_format(value: datetime, fmt: str = "%Y-%m-%d %H:%M:%S") -> str:
     """Format datetime object to string with the specified format.
@@ -621,7 +1228,9 @@ def make_registry(
     *,
     registries: Optional[list[str]] = None,
 ) -> dict[str, Registry]:
-    """Return registries of all functions that can be called with tasks.
+    """Return registries of all functions that can be called with tasks. This
+    result will cache with the submodule and the list of registries on the
+    `registry_cache` object.
 
     Args:
         submodule: A module prefix to import registry from.
@@ -633,12 +1242,34 @@ def make_registry(
     Raises:
         ValueError: If a tag already exists for a function name.
     """
-    rs: dict[str, Registry] = {}
     regis_calls: list[str] = copy.deepcopy(
         dynamic("registry_caller", f=registries)
     )
     regis_calls.extend(["ddeutil.vendors"])
-    for module in regis_calls:
+    return registry_cache.get(
+        ("caller", submodule, *regis_calls),
+        lambda: _make_registry(submodule, regis_calls),
+    )
+
+
+def _make_registry(
+    submodule: str,
+    modules: list[str],
+) -> dict[str, Registry]:
+    """Make registries of all tagged functions from importing modules.
+
+    Args:
+        submodule: A module prefix to import registry from.
+        modules: A list of module import string.
+
+    Returns:
+        dict[str, Registry]: Dictionary mapping function names to their registries.
+
+    Raises:
+        ValueError: If a tag already exists for a function name.
+    """
+    rs: dict[str, Registry] = {}
+    for module in modules:
         # NOTE: try to sequential import task functions
         try:
             importer = import_module(f"{module}.{submodule}")
@@ -0,0 +1,465 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Scheduler Module.
+
+This module provides the long-running scheduler that releases all workflows on
+the config path when their event schedules are due.
+
+    The scheduler loads all workflow templates with the `YamlParser.finds`
+method and keeps one cron runner per event schedule on a min-heap that orders
+by the next release datetime. It sleeps until the earliest release datetime,
+or until the next config reload, and dispatches the due releases to a bounded
+thread executor, so one slow release does not delay the others.
+
+    A release that was due before the misfire grace period, because the
+scheduler was stopped or all its workers were busy, is a missed release. The
+catch-up policy decides to skip all missed releases, to release only the
+latest one, or to release all of them. The release uses the `normal` release
+type, so the release datetime that already audit will skip.
+
+Classes:
+    CatchUp: A catch-up policy of the missed releases
+    Scheduler: A scheduler of all workflows on the config path
+
+Example:
+    ```python
+    from ddeutil.workflow.scheduler import Scheduler
+
+    scheduler = Scheduler(max_workers=8, catchup="latest")
+    scheduler.run()
+    ```
+"""
+from __future__ import annotations
+
+import copy
+import heapq
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from enum import Enum
+from itertools import count
+from pathlib import Path
+from threading import Event, Lock
+from typing import Any, Optional, Union
+
+from pydantic import ValidationError
+
+from .__cron import CronRunner
+from .__types import DictData
+from .audits import NORMAL, Audit, get_audit
+from .conf import YamlParser, dynamic
+from .event import Cron
+from .result import Result
+from .traces import Trace, get_trace
+from .utils import UTC, extract_id
+from .workflow import Workflow
+
+
+class CatchUp(str, Enum):
+    """Catch-up policy of the missed releases.
+
+    Attributes:
+        SKIP: Skip all missed releases and wait for the next release
+        LATEST: Release only the latest missed release
+        ALL: Release all missed releases in order
+    """
+
+    SKIP = "skip"
+    LATEST = "latest"
+    ALL = "all"
+
+
+class Scheduler:
+    """Scheduler object that releases all workflows on the config path with
+    their event schedules.
+
+        The heap entry keeps the version of its workflow. When the config of a
+    workflow changes or removes, the scheduler bumps or drops this version
+    instead of searching the heap, so the stale entries drop when they reach
+    the top of the heap.
+
+    Examples:
+        >>> scheduler = Scheduler(path=Path("./conf"), catchup="all")
+        >>> scheduler.load()
+        >>> scheduler.tick()
+        datetime.datetime(2024, 1, 1, 0, 5, tzinfo=...)
+        >>> scheduler.close()
+    """
+
+    def __init__(
+        self,
+        *,
+        path: Optional[Path] = None,
+        tags: Optional[list[Union[str, int]]] = None,
+        max_workers: Optional[int] = None,
+        catchup: Optional[Union[CatchUp, str]] = None,
+        misfire_grace: Optional[float] = None,
+        reload_interval: Optional[float] = None,
+        audit: Optional[Audit] = None,
+        extras: Optional[DictData] = None,
+    ) -> None:
+        """Main initialize.
+
+        Args:
+            path (Path, default None): A config path of the workflow templates.
+            tags (list[str | int], default None): A list of tag that want to
+                filter the workflow templates.
+            max_workers (int, default None): The maximum releases that run in
+                parallel. It uses the `scheduler_max_workers` config value if
+                it does not pass.
+            catchup (CatchUp | str, default None): A catch-up policy of the
+                missed releases. It uses the `scheduler_catchup` config value
+                if it does not pass.
+            misfire_grace (float, default None): The maximum second that a due
+                release can delay before it is a missed release.
+            reload_interval (float, default None): The second between two
+                config reloads.
+            audit (Audit, default None): An audit model that all releases use.
+            extras (DictData, default None): An extra parameter that pass to
+                all workflows.
+        """
+        self.path: Optional[Path] = path
+        self.tags: Optional[list[Union[str, int]]] = tags
+        self.extras: DictData = extras or {}
+        self.max_workers: int = max_workers or dynamic(
+            "scheduler_max_workers", extras=self.extras
+        )
+        self.catchup: CatchUp = CatchUp(
+            catchup or dynamic("scheduler_catchup", extras=self.extras)
+        )
+        self.misfire_grace: timedelta = timedelta(
+            seconds=(
+                dynamic("scheduler_misfire_grace", extras=self.extras)
+                if misfire_grace is None
+                else misfire_grace
+            )
+        )
+        self.reload_interval: float = (
+            dynamic("scheduler_reload_interval", extras=self.extras)
+            if reload_interval is None
+            else reload_interval
+        )
+        self.audit: Audit = audit or get_audit(extras=self.extras)
+        self.workflows: dict[str, Workflow] = {}
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            self.max_workers, thread_name_prefix="wf_scheduler"
+        )
+
+        parent_run_id, run_id = extract_id("scheduler", extras=self.extras)
+        self.trace: Trace = get_trace(
+            run_id,
+            parent_run_id=parent_run_id,
+            extras=self.extras,
+            pre_process=True,
+        )
+
+        self._sources: dict[str, DictData] = {}
+        self._versions: dict[str, int] = {}
+        self._last: dict[str, datetime] = {}
+        self._heap: list[tuple[datetime, int, str, int, Cron, CronRunner]] = []
+        self._seq = count()
+        self._running: dict[Future, tuple[str, datetime]] = {}
+        self._lock: Lock = Lock()
+        self._wakeup: Event = Event()
+        self._reload: bool = False
+        self._stopped: bool = False
+
+    def __enter__(self) -> Scheduler:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @staticmethod
+    def now() -> datetime:
+        """Return the current datetime with the UTC timezone."""
+        return datetime.now(tz=UTC)
+
+    @property
+    def running(self) -> list[tuple[str, datetime]]:
+        """Return the workflow names and release datetimes that are running."""
+        with self._lock:
+            return list(self._running.values())
+
+    def load(self, now: Optional[datetime] = None) -> DictData:
+        """Load all workflow templates from the config path and schedule the
+        added or changed workflows. A workflow template that can not validate
+        keeps its previous version on the schedule.
+
+        Args:
+            now (datetime, default None): A current datetime.
+
+        Returns:
+            DictData: A mapping of `added`, `changed`, and `removed` lists of
+                the workflow names.
+        """
+        now: datetime = now or self.now()
+        changes: DictData = {"added": [], "changed": [], "removed": []}
+        found: set[str] = set()
+        for name, data in YamlParser.finds(
+            Workflow, path=self.path, extras=self.extras, tags=self.tags
+        ):
+            found.add(name)
+            source: DictData = {
+                k: v
+                for k, v in data.items()
+                if k not in ("created_at", "updated_at")
+            }
+            if self._sources.get(name) == source:
+                continue
+
+            try:
+                workflow: Workflow = Workflow.model_validate(
+                    obj=copy.deepcopy(source)
+                    | {"name": name, "extras": self.extras}
+                )
+            except ValidationError as e:
+                self.trace.error(
+                    f"[SCHEDULE]: Keep the previous version of {name!r} "
+                    f"because its config does not valid:||{e}"
+                )
+                continue
+
+            changes["changed" if name in self._sources else "added"].append(
+                name
+            )
+            self._sources[name] = source
+            self._schedule(name, workflow, now)
+
+        for name in sorted(set(self._sources) - found):
+            changes["removed"].append(name)
+            self._sources.pop(name)
+            self._versions.pop(name, None)
+            self._last.pop(name, None)
+            self.workflows.pop(name, None)
+
+        if any(changes.values()):
+            self.trace.info(f"[SCHEDULE]: Load workflows with {changes}.")
+        return changes
+
+    def _schedule(self, name: str, workflow: Workflow, now: datetime) -> None:
+        """Push the cron runners of all event schedules of the workflow to the
+        heap with its new version.
+
+            The changed workflow starts from its last release datetime, so it
+        does not release the same datetime again. The new workflow starts from
+        its latest audited release datetime if the catch-up policy does not
+        skip the missed releases.
+
+        Args:
+            name (str): A workflow name.
+            workflow (Workflow): A workflow model.
+            now (datetime): A current datetime.
+        """
+        version: int = self._versions.get(name, 0) + 1
+        self._versions[name] = version
+        self.workflows[name] = workflow
+
+        start: datetime = now
+        if name in self._last:
+            start = self._last[name] + timedelta(minutes=1)
+        elif self.catchup != CatchUp.SKIP and (
+            releases := self.audit.find_releases(name)
+        ):
+            # NOTE: The audit keeps the release datetime without timezone.
+            start = max(releases).replace(tzinfo=UTC) + timedelta(minutes=1)
+            self._last[name] = start - timedelta(minutes=1)
+
+        for on in workflow.on.schedule:
+            self._push(name, version, on, workflow.on.runner(on, start))
+
+    def _push(
+        self,
+        name: str,
+        version: int,
+        on: Cron,
+        runner: CronRunner,
+        dt: Optional[datetime] = None,
+    ) -> None:
+        """Push the next release datetime of the cron runner to the heap.
+
+        Args:
+            name (str): A workflow name.
+            version (int): A workflow version.
+            on (Cron): An event schedule of the cron runner.
+            runner (CronRunner): A cron runner.
+            dt (datetime, default None): A next release datetime that already
+                generate from this runner.
+        """
+        try:
+            dt: datetime = dt or runner.next
+        except Exception as e:
+            self.trace.warning(
+                f"[SCHEDULE]: Drop the schedule {str(on.cronjob)!r} of "
+                f"{name!r} because it can not generate the next release: {e}"
+            )
+            return
+        heapq.heappush(
+            self._heap, (dt, next(self._seq), name, version, on, runner)
+        )
+
+    def tick(self, now: Optional[datetime] = None) -> Optional[datetime]:
+        """Dispatch all due releases on the heap with the catch-up policy.
+
+        Args:
+            now (datetime, default None): A current datetime.
+
+        Returns:
+            Optional[datetime]: The next release datetime on the heap. It
+                returns None if the heap is empty, or if all workers are busy,
+                so the caller should wait for a completed release.
+        """
+        now: datetime = now or self.now()
+        missed: datetime = now - self.misfire_grace
+        while self._heap:
+            dt, _, name, version, on, runner = self._heap[0]
+            if self._versions.get(name) != version:
+                heapq.heappop(self._heap)
+                continue
+            if dt > now:
+                return dt
+            with self._lock:
+                if len(self._running) >= self.max_workers:
+                    return None
+
+            heapq.heappop(self._heap)
+            if dt >= missed or self.catchup == CatchUp.ALL:
+                self._dispatch(name, dt)
+                self._push(name, version, on, runner)
+            elif self.catchup == CatchUp.LATEST:
+                while (nxt := runner.next) < missed:
+                    dt = nxt
+                self._dispatch(name, dt)
+                self._push(name, version, on, runner, dt=nxt)
+            else:
+                self.trace.warning(
+                    f"[SCHEDULE]: Skip the missed releases of {name!r} from "
+                    f"{dt:%Y-%m-%d %H:%M:%S}."
+                )
+                self._push(
+                    name, version, on, self.workflows[name].on.runner(on, now)
+                )
+        return None
+
+    def _dispatch(self, name: str, dt: datetime) -> None:
+        """Submit the release of the workflow to the executor. It drops the
+        release datetime that already dispatch from the other event schedule
+        of the same workflow.
+
+        Args:
+            name (str): A workflow name.
+            dt (datetime): A release datetime.
+        """
+        if (last := self._last.get(name)) is not None and dt <= last:
+            return
+        self._last[name] = dt
+
+        release: datetime = dt.astimezone(UTC)
+        workflow: Workflow = self.workflows[name]
+        self.trace.debug(
+            f"[SCHEDULE]: Dispatch {name!r} : {release:%Y-%m-%d %H:%M:%S}"
+        )
+        with self._lock:
+            future: Future = self.executor.submit(
+                self._release, workflow, release
+            )
+            self._running[future] = (name, release)
+        future.add_done_callback(self._done)
+
+    def _release(self, workflow: Workflow, release: datetime) -> Result:
+        """Release the workflow on the copied workflow because the release
+        method changes its extras.
+
+        Args:
+            workflow (Workflow): A workflow model.
+            release (datetime): A release datetime.
+
+        Returns:
+            Result: A release result.
+        """
+        return workflow.model_copy(
+            update={"extras": workflow.extras.copy()}
+        ).release(
+            release,
+            params={},
+            release_type=NORMAL,
+            audit=self.audit,
+            validate=False,
+        )
+
+    def _done(self, future: Future) -> None:
+        """Remove the completed release from the running releases and wake up
+        the scheduler loop for the next due release.
+        """
+        with self._lock:
+            name, release = self._running.pop(future)
+        if future.cancelled():
+            self.trace.warning(
+                f"[SCHEDULE]: Release {name!r} : "
+                f"{release:%Y-%m-%d %H:%M:%S} was cancelled."
+            )
+        elif (e := future.exception()) is not None:
+            self.trace.error(
+                f"[SCHEDULE]: Release {name!r} : "
+                f"{release:%Y-%m-%d %H:%M:%S} failed with "
+                f"{e.__class__.__name__}: {e}"
+            )
+        else:
+            self.trace.info(
+                f"[SCHEDULE]: Release {name!r} : "
+                f"{release:%Y-%m-%d %H:%M:%S} end with "
+                f"{future.result().status.name}."
+            )
+        self._wakeup.set()
+
+    def reload(self) -> None:
+        """Request the scheduler loop to reload the config on its next wake
+        up. It is safe to call from the signal handler.
+        """
+        self._reload = True
+        self._wakeup.set()
+
+    def stop(self) -> None:
+        """Request the scheduler loop to stop. It is safe to call from the
+        signal handler.
+        """
+        self._stopped = True
+        self._wakeup.set()
+
+    def run(self) -> None:
+        """Run the scheduler loop until the `stop` method was called. It
+        sleeps until the next release datetime, the next config reload, or a
+        completed release, and waits for all running releases before return.
+        """
+        self.load()
+        self.trace.info(
+            f"[SCHEDULE]: Start scheduler with {len(self.workflows)} "
+            f"workflows, {self.max_workers} workers, and "
+            f"{self.catchup.value!r} catch-up policy."
+        )
+        reload_at: float = time.monotonic() + self.reload_interval
+        try:
+            while not self._stopped:
+                due: Optional[datetime] = self.tick()
+                timeout: float = reload_at - time.monotonic()
+                if due is not None:
+                    timeout = min(timeout, (due - self.now()).total_seconds())
+                if self._wakeup.wait(max(timeout, 0)):
+                    self._wakeup.clear()
+                if self._reload or time.monotonic() >= reload_at:
+                    self._reload = False
+                    self.load()
+                    reload_at = time.monotonic() + self.reload_interval
+        finally:
+            self.trace.info(
+                f"[SCHEDULE]: Stop scheduler and wait for "
+                f"{len(self.running)} running releases."
+            )
+            self.close()
+
+    def close(self) -> None:
+        """Wait for all running releases and shut down the executor."""
+        self.executor.shutdown(wait=True)
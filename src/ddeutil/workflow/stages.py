@@ -42,36 +42,47 @@ that use to handle retry execution when it got any error with `retry` field.
 from __future__ import annotations
 
 import asyncio
+import builtins
 import contextlib
 import copy
+import hashlib
 import inspect
 import json
+import os
+import re
+import shutil
+import signal
 import subprocess
 import sys
+import tempfile
 import time
 import traceback
 import uuid
 from abc import ABC, abstractmethod
+from collections import ChainMap, deque
 from collections.abc import AsyncIterator, Iterator
 from concurrent.futures import (
-    FIRST_EXCEPTION,
+    FIRST_COMPLETED,
     CancelledError,
     Future,
-    ThreadPoolExecutor,
     as_completed,
     wait,
 )
 from datetime import datetime
+from functools import lru_cache, partial
 from inspect import Parameter, isclass, isfunction, ismodule
+from itertools import islice
 from pathlib import Path
-from subprocess import CompletedProcess
+from subprocess import PIPE, CompletedProcess, Popen, TimeoutExpired
 from textwrap import dedent
-from threading import Event
+from threading import Event, Lock, Thread
+from types import CodeType
 from typing import (
     Annotated,
     Any,
     Callable,
     ClassVar,
+    Literal,
     Optional,
     TypedDict,
     TypeVar,
@@ -80,12 +91,13 @@ from typing import (
 )
 
 from ddeutil.core import str2list
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, PrivateAttr, ValidationError
 from pydantic.functional_validators import field_validator, model_validator
 from typing_extensions import NotRequired, Self
 
 from .__about__ import __python_version__
 from .__types import DictData, DictStr, StrOrInt, StrOrNone, TupleStr, cast_dict
+from .artifacts import store_artifacts
 from .conf import dynamic, pass_env
 from .errors import (
     StageCancelError,
@@ -96,6 +108,7 @@ from .errors import (
     StageSkipError,
     to_dict,
 )
+from .pool import get_pool, get_shell_pool
 from .result import (
     CANCEL,
     FAILED,
@@ -109,9 +122,14 @@ from .result import (
     validate_statuses,
 )
 from .reusables import (
+    CompiledTemplate,
     TagFunc,
+    compile_caller,
+    compile_template,
     create_model_from_caller,
+    eval_condition,
     extract_call,
+    getdot_path,
     not_in_template,
     param2template,
 )
@@ -119,10 +137,13 @@ from .traces import Trace, get_trace
 from .utils import (
     delay,
     dump_all,
+    dump_spill,
     extract_id,
+    file_lock,
     filter_func,
     gen_id,
     get_dt_now,
+    layer_context,
     make_exec,
     to_train,
 )
@@ -166,6 +187,7 @@ class BaseStage(BaseModel, ABC):
     """
 
     action_stage: ClassVar[bool] = False
+    async_native: ClassVar[bool] = False
     extras: DictData = Field(
         default_factory=dict,
         description="An extra parameter that override core config values.",
@@ -195,6 +217,12 @@ class BaseStage(BaseModel, ABC):
         alias="if",
     )
 
+    # NOTE: Private attrs for keeping the compiled template of field values
+    #   with its key, like the field name.
+    _tpl: dict[str, tuple[Any, CompiledTemplate, Any]] = PrivateAttr(
+        default_factory=dict
+    )
+
     @property
     def iden(self) -> str:
         """Return this stage identity that return the `id` field first and if
@@ -234,19 +262,67 @@ class BaseStage(BaseModel, ABC):
             )
         return self
 
-    def pass_template(self, value: Any, params: DictData) -> Any:
+    def pass_template(
+        self,
+        value: Any,
+        params: DictData,
+        *,
+        key: Optional[str] = None,
+        prepare: Optional[Callable[[Any], Any]] = None,
+        env: bool = True,
+    ) -> Any:
         """Pass template and environment variable to any value that can
         templating.
 
+            If the key was passed, it will compile the prepared value only once
+        and keep it on this stage with this key, so the next calls do not walk
+        the raw value and parse its template again. A value that does not have
+        any template or environment variable will return its rendered value
+        from the first call, or a copy of it if it is a mutable value.
+
         Args:
             value (Any): An any value.
             params (DictData): A parameter data that want to use in this
                 execution.
+            key (str, default None): A compiled template key, like the field
+                name. It should use with the same prepare and env arguments.
+            prepare (Callable, default None): A function that prepare the raw
+                value before compile, like the `dedent` function.
+            env (bool, default True): A flag that pass environment variable
+                after templating.
 
         Returns:
             Any: A templated value.
         """
-        return pass_env(param2template(value, params, extras=self.extras))
+        if key is None:
+            value: Any = param2template(
+                value if prepare is None else prepare(value),
+                params,
+                extras=self.extras,
+            )
+            return pass_env(value) if env else value
+
+        # NOTE: Compile again if this field was replaced with a new value.
+        compiled = self._tpl.get(key)
+        if compiled is None or compiled[0] is not value:
+            tpl: CompiledTemplate = compile_template(
+                value if prepare is None else prepare(value)
+            )
+            rendered: Any = None
+            if tpl.static:
+                rendered = tpl.render({}, extras=self.extras)
+                rendered = pass_env(rendered) if env else rendered
+            compiled = (value, tpl, rendered)
+            self._tpl[key] = compiled
+
+        if compiled[1].static:
+            # NOTE: Return a copy of the mutable value, like list or dict, so
+            #   the caller can change it without leaking to the next calls.
+            if isinstance(compiled[2], (str, int, float, bool, type(None))):
+                return compiled[2]
+            return copy.deepcopy(compiled[2])
+        rendered: Any = compiled[1].render(params, extras=self.extras)
+        return pass_env(rendered) if env else rendered
 
     @abstractmethod
     def process(
@@ -338,7 +414,7 @@ class BaseStage(BaseModel, ABC):
         )
         try:
             _id: str = (
-                f" with ID: {self.pass_template(self.id, params=params)!r}"
+                f" with ID: {self.pass_template(self.id, params, key='id')!r}"
                 if self.id
                 else ""
             )
@@ -560,13 +636,11 @@ class BaseStage(BaseModel, ABC):
             return self.condition
 
         try:
-            # WARNING: The eval build-in function is very dangerous. So, it
-            #   should use the `re` module to validate eval-string before
-            #   running.
-            rs: bool = eval(
-                self.pass_template(self.condition, params),
-                globals() | params,
-                {},
+            # NOTE: The condition compiles with the restricted AST and caches
+            #   its code object, so it does not use the module globals.
+            rs: bool = eval_condition(
+                self.pass_template(self.condition, params, key="condition"),
+                params,
             )
             if not isinstance(rs, bool):
                 raise TypeError("Return type of condition does not be boolean")
@@ -585,11 +659,11 @@ class BaseStage(BaseModel, ABC):
             str: An ID that already generated from id or name fields.
         """
         return (
-            param2template(self.id, params=params, extras=self.extras)
+            self.pass_template(self.id, params, key="id", env=False)
             if self.id
             else gen_id(
                 # NOTE: The name should be non-sensitive case for uniqueness.
-                param2template(self.name, params=params, extras=self.extras)
+                self.pass_template(self.name, params, key="name", env=False)
             )
         )
 
@@ -739,8 +813,14 @@ class BaseAsyncStage(BaseStage, ABC):
 
         This class is the abstraction class for any inherit asyncable stage
     model.
+
+        The `async_native` class attribute marks that the `axecute` method does
+    not block the event loop, so the async job execution can await it directly
+    instead of offloading the `execute` method to the thread executor.
     """
 
+    async_native: ClassVar[bool] = True
+
     @abstractmethod
     async def async_process(
         self,
@@ -802,7 +882,7 @@ class BaseAsyncStage(BaseStage, ABC):
         )
         try:
             _id: str = (
-                f" with ID: {self.pass_template(self.id, params=params)!r}"
+                f" with ID: {self.pass_template(self.id, params, key='id')!r}"
                 if self.id
                 else ""
             )
@@ -1225,7 +1305,12 @@ class EmptyStage(BaseAsyncStage):
             run_id, parent_run_id=parent_run_id, extras=self.extras
         )
         message: str = (
-            self.pass_template(dedent(self.echo.strip("\n")), params=params)
+            self.pass_template(
+                self.echo,
+                params,
+                key="echo",
+                prepare=lambda x: dedent(x.strip("\n")),
+            )
             if self.echo
             else "..."
         )
@@ -1274,7 +1359,12 @@ class EmptyStage(BaseAsyncStage):
             run_id, parent_run_id=parent_run_id, extras=self.extras
         )
         message: str = (
-            self.pass_template(dedent(self.echo.strip("\n")), params=params)
+            self.pass_template(
+                self.echo,
+                params,
+                key="echo",
+                prepare=lambda x: dedent(x.strip("\n")),
+            )
             if self.echo
             else "..."
         )
@@ -1292,6 +1382,41 @@ class EmptyStage(BaseAsyncStage):
         )
 
 
+class StreamBuffer:
+    """Bounded line buffer that keeps only the head and the tail lines of a
+    stream output and counts the lines that was dropped in the middle.
+
+    Examples:
+        >>> buffer = StreamBuffer(size=1)
+        >>> for line in ("a\\n", "b\\n", "c\\n"):
+        ...     buffer.append(line)
+        >>> buffer.getvalue()
+        'a\\n... (1 lines truncated) ...\\nc\\n'
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size: int = size
+        self.head: list[str] = []
+        self.tail: deque[str] = deque(maxlen=size)
+        self.count: int = 0
+
+    def append(self, line: str) -> None:
+        """Append a line to the head buffer until it full, then the tail."""
+        self.count += 1
+        if len(self.head) < self.size:
+            self.head.append(line)
+        else:
+            self.tail.append(line)
+
+    def getvalue(self) -> str:
+        """Return the buffered output with a truncated marker line."""
+        lines: list[str] = list(self.head)
+        if (skip := self.count - len(self.head) - len(self.tail)) > 0:
+            lines.append(f"... ({skip} lines truncated) ...\n")
+        lines.extend(self.tail)
+        return "".join(lines)
+
+
 class BashStage(BaseRetryStage):
     """Bash stage executor that execute bash script on the current OS.
     If your current OS is Windows, it will run on the bash from the current WSL.
@@ -1302,6 +1427,15 @@ class BashStage(BaseRetryStage):
     statement. Thus, it will write the `.sh` file before start running bash
     command for fix this issue.
 
+        On the streaming mode, `stage_bash_stream`, it reads the stdout and
+    stderr pipes incrementally, forwards its lines to the trace in batches,
+    and keeps only the head and tail lines in the stage context. The full
+    output will spill to the trace directory if it has the file handler.
+
+        On the pool mode, `stage_bash_pool`, it runs the same script content on
+    the long-lived shell worker from the shared shell pool instead of writing
+    the `.sh` file and spawning a new shell process.
+
     Examples:
         >>> stage = BaseStage.model_validate({
         ...     "id": "bash-stage",
@@ -1326,6 +1460,24 @@ class BashStage(BaseRetryStage):
         ),
     )
 
+    @staticmethod
+    def prepare_sh(bash: str, env: DictStr) -> str:
+        """Prepare the shell script content that set the environment variables
+        before the bash statement.
+
+        Args:
+            bash (str): A bash statement.
+            env (DictStr): An environment variable that set before run bash.
+
+        Returns:
+            str: A shell script content without the shebang line.
+        """
+        # NOTE: add setting environment variable before bash skip statement.
+        script: str = "".join(pass_env([f"{k}='{env[k]}';\n" for k in env]))
+
+        # NOTE: make sure that shell script file does not have `\r` char.
+        return script + "\n" + pass_env(bash.replace("\r\n", "\n"))
+
     @contextlib.asynccontextmanager
     async def async_make_sh_file(
         self, bash: str, env: DictStr, run_id: StrOrNone = None
@@ -1350,12 +1502,7 @@ class BashStage(BaseRetryStage):
         async with aiofiles.open(f"./{f_name}", mode="w", newline="\n") as f:
             # NOTE: write header of `.sh` file
             await f.write(f"#!/bin/{f_shebang}\n\n")
-
-            # NOTE: add setting environment variable before bash skip statement.
-            await f.writelines(pass_env([f"{k}='{env[k]}';\n" for k in env]))
-
-            # NOTE: make sure that shell script file does not have `\r` char.
-            await f.write("\n" + pass_env(bash.replace("\r\n", "\n")))
+            await f.write(self.prepare_sh(bash, env))
 
         # NOTE: Make this .sh file able to executable.
         make_exec(f"./{f_name}")
@@ -1389,12 +1536,7 @@ class BashStage(BaseRetryStage):
         with open(f"./{f_name}", mode="w", newline="\n") as f:
             # NOTE: write header of `.sh` file
             f.write(f"#!/bin/{f_shebang}\n\n")
-
-            # NOTE: add setting environment variable before bash skip statement.
-            f.writelines(pass_env([f"{k}='{env[k]}';\n" for k in env]))
-
-            # NOTE: make sure that shell script file does not have `\r` char.
-            f.write("\n" + pass_env(bash.replace("\r\n", "\n")))
+            f.write(self.prepare_sh(bash, env))
 
         # NOTE: Make this .sh file able to executable.
         make_exec(f"./{f_name}")
@@ -1410,6 +1552,214 @@ class BashStage(BaseRetryStage):
         """Prepare returned standard string from subprocess."""
         return None if (out := value.strip("\n")) == "" else out
 
+    def make_spill(self, trace: Trace, run_id: str) -> Optional[Path]:
+        """Get the spill file prefix of the streaming output from the first
+        trace handler that has the trace directory.
+
+        Args:
+            trace (Trace): A trace object of this stage.
+            run_id (str): A running stage ID.
+
+        Returns:
+            Optional[Path]: A spill file prefix path or None if the trace does
+                not have any file handler.
+        """
+        for handler in trace.handlers:
+            if hasattr(handler, "pointer"):
+                pointer: Path = handler.pointer(trace.parent_run_id or run_id)
+                return pointer / f"bash-{run_id}"
+        return None
+
+    def stream(
+        self,
+        sh: TupleStr,
+        trace: Trace,
+        run_id: str,
+        *,
+        event: Optional[Event] = None,
+    ) -> tuple[int, str, str]:
+        """Run the bash file with the streaming mode. It reads each pipe on its
+        own thread and kills the child process group when the event was set.
+
+        Args:
+            sh (TupleStr): A shebang and the bash file name.
+            trace (Trace): A trace object of this stage.
+            run_id (str): A running stage ID.
+            event (Event, default None): An event manager that use to track
+                parent process was not force stopped.
+
+        Raises:
+            StageCancelError: If event was set while the process running.
+
+        Returns:
+            tuple[int, str, str]: A return code, stdout, and stderr that keep
+                only its head and tail lines.
+        """
+        size: int = dynamic("stage_bash_buffer_lines", extras=self.extras)
+        batch: int = dynamic("stage_bash_batch_lines", extras=self.extras)
+        spill: Optional[Path] = self.make_spill(trace, run_id)
+        buffers: dict[str, StreamBuffer] = {
+            "stdout": StreamBuffer(size),
+            "stderr": StreamBuffer(size),
+        }
+        lock: Lock = Lock()
+
+        def reader(name: str, pipe) -> None:
+            prefix: str = f"[STAGE]: Bash {name}:\n"
+            lines: list[str] = []
+            f = spill.parent / f"{spill.name}.{name}.txt" if spill else None
+            f = f.open(mode="w", encoding="utf-8") if f else None
+            try:
+                for line in pipe:
+                    buffers[name].append(line)
+                    lines.append(line)
+                    if f:
+                        f.write(line)
+                    if len(lines) >= batch:
+                        with lock:
+                            trace.info(prefix + "".join(lines))
+                        lines = []
+                if lines:
+                    with lock:
+                        trace.info(prefix + "".join(lines))
+            finally:
+                if f:
+                    f.close()
+                pipe.close()
+
+        proc: Popen = Popen(
+            sh,
+            stdout=PIPE,
+            stderr=PIPE,
+            text=True,
+            encoding="utf-8",
+            start_new_session=not sys.platform.startswith("win"),
+        )
+        threads: list[Thread] = [
+            Thread(target=reader, args=(name, pipe), daemon=True)
+            for name, pipe in (("stdout", proc.stdout), ("stderr", proc.stderr))
+        ]
+        for thread in threads:
+            thread.start()
+
+        while True:
+            try:
+                proc.wait(timeout=0.1)
+                break
+            except TimeoutExpired:
+                if event and event.is_set():
+                    self.kill(proc)
+                    for thread in threads:
+                        thread.join(timeout=1)
+                    raise StageCancelError(
+                        "Cancel bash process while it running."
+                    ) from None
+
+        for thread in threads:
+            thread.join()
+        if spill:
+            trace.debug(f"[STAGE]: Spill bash output to `{spill}.*`.")
+        return (
+            proc.returncode,
+            buffers["stdout"].getvalue(),
+            buffers["stderr"].getvalue(),
+        )
+
+    async def async_stream(
+        self,
+        sh: TupleStr,
+        trace: Trace,
+        run_id: str,
+        *,
+        event: Optional[Event] = None,
+    ) -> tuple[int, str, str]:
+        """Async run the bash file with the streaming mode.
+
+        Args:
+            sh (TupleStr): A shebang and the bash file name.
+            trace (Trace): A trace object of this stage.
+            run_id (str): A running stage ID.
+            event (Event, default None): An event manager that use to track
+                parent process was not force stopped.
+
+        Raises:
+            StageCancelError: If event was set while the process running.
+
+        Returns:
+            tuple[int, str, str]: A return code, stdout, and stderr that keep
+                only its head and tail lines.
+        """
+        size: int = dynamic("stage_bash_buffer_lines", extras=self.extras)
+        batch: int = dynamic("stage_bash_batch_lines", extras=self.extras)
+        spill: Optional[Path] = self.make_spill(trace, run_id)
+        buffers: dict[str, StreamBuffer] = {
+            "stdout": StreamBuffer(size),
+            "stderr": StreamBuffer(size),
+        }
+
+        async def reader(name: str, pipe: asyncio.StreamReader) -> None:
+            prefix: str = f"[STAGE]: Bash {name}:\n"
+            lines: list[str] = []
+            f = spill.parent / f"{spill.name}.{name}.txt" if spill else None
+            f = f.open(mode="w", encoding="utf-8") if f else None
+            try:
+                while raw := await pipe.readline():
+                    line: str = raw.decode("utf-8", errors="replace")
+                    buffers[name].append(line)
+                    lines.append(line)
+                    if f:
+                        f.write(line)
+                    if len(lines) >= batch:
+                        await trace.ainfo(prefix + "".join(lines))
+                        lines = []
+                if lines:
+                    await trace.ainfo(prefix + "".join(lines))
+            finally:
+                if f:
+                    f.close()
+
+        proc = await asyncio.create_subprocess_exec(
+            *sh,
+            stdout=PIPE,
+            stderr=PIPE,
+            start_new_session=not sys.platform.startswith("win"),
+        )
+        readers = asyncio.gather(
+            reader("stdout", proc.stdout), reader("stderr", proc.stderr)
+        )
+        while True:
+            done, _ = await asyncio.wait({readers}, timeout=0.1)
+            if done:
+                break
+            if event and event.is_set():
+                self.kill(proc)
+                readers.cancel()
+                await proc.wait()
+                raise StageCancelError("Cancel bash process while it running.")
+
+        await readers
+        await proc.wait()
+        if spill:
+            await trace.adebug(f"[STAGE]: Spill bash output to `{spill}.*`.")
+        return (
+            proc.returncode,
+            buffers["stdout"].getvalue(),
+            buffers["stderr"].getvalue(),
+        )
+
+    @staticmethod
+    def kill(proc) -> None:
+        """Kill the process group of the bash process, so its child processes
+        that keep the pipes open will stop together.
+        """
+        try:
+            if sys.platform.startswith("win"):  # pragma: no cov
+                proc.kill()
+            else:
+                os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:  # pragma: no cov
+            pass
+
     def process(
         self,
         params: DictData,
@@ -1444,26 +1794,25 @@ class BashStage(BaseRetryStage):
         trace: Trace = get_trace(
             run_id, parent_run_id=parent_run_id, extras=self.extras
         )
-        bash: str = param2template(
-            dedent(self.bash.strip("\n")), params, extras=self.extras
+        bash: str = self.pass_template(
+            self.bash,
+            params,
+            key="bash",
+            prepare=lambda x: dedent(x.strip("\n")),
+            env=False,
         )
-        with self.make_sh_file(
-            bash=bash,
-            env=param2template(self.env, params, extras=self.extras),
-            run_id=run_id,
-        ) as sh:
-
+        env: DictStr = self.pass_template(
+            self.env, params, key="env", env=False
+        )
+        if self.is_pool():
             if event and event.is_set():
                 raise StageCancelError("Cancel before start bash process.")
 
-            trace.debug(f"[STAGE]: Create `{sh[1]}` file.", module="stage")
-            rs: CompletedProcess = subprocess.run(
-                sh,
-                shell=False,
-                check=False,
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
+            trace.debug("[STAGE]: Run bash on the shell worker pool.")
+            rs: CompletedProcess = self.pool_process(bash, env, event=event)
+        else:
+            rs: CompletedProcess = self.file_process(
+                bash, env, trace, run_id, event=event
             )
         if rs.returncode > 0:
             e: str = rs.stderr.removesuffix("\n")
@@ -1485,6 +1834,94 @@ class BashStage(BaseRetryStage):
             extras=self.extras,
         )
 
+    def file_process(
+        self,
+        bash: str,
+        env: DictStr,
+        trace: Trace,
+        run_id: str,
+        *,
+        event: Optional[Event] = None,
+    ) -> CompletedProcess:
+        """Run the bash statement from the `.sh` file on a new shell process.
+
+        Args:
+            bash (str): A bash statement.
+            env (DictStr): An environment variable that set before run bash.
+            trace (Trace): A trace object of this stage.
+            run_id (str): A running stage ID.
+            event (Event, default None): An event manager that use to track
+                parent process was not force stopped.
+
+        Raises:
+            StageCancelError: If event was set before start process.
+
+        Returns:
+            CompletedProcess: A completed process object.
+        """
+        with self.make_sh_file(bash=bash, env=env, run_id=run_id) as sh:
+
+            if event and event.is_set():
+                raise StageCancelError("Cancel before start bash process.")
+
+            trace.debug(f"[STAGE]: Create `{sh[1]}` file.", module="stage")
+            if dynamic("stage_bash_stream", extras=self.extras):
+                rs: CompletedProcess = CompletedProcess(
+                    sh, *self.stream(sh, trace, run_id, event=event)
+                )
+            else:
+                rs: CompletedProcess = subprocess.run(
+                    sh,
+                    shell=False,
+                    check=False,
+                    capture_output=True,
+                    text=True,
+                    encoding="utf-8",
+                )
+        return rs
+
+    def is_pool(self) -> bool:
+        """Check this stage should run on the shell worker pool. The streaming
+        mode takes priority over the pool mode and the pool mode does not
+        support on the Windows OS.
+
+        Returns:
+            bool: True if it should run on the shell worker pool.
+        """
+        return (
+            dynamic("stage_bash_pool", extras=self.extras)
+            and not dynamic("stage_bash_stream", extras=self.extras)
+            and not sys.platform.startswith("win")
+        )
+
+    def pool_process(
+        self, bash: str, env: DictStr, *, event: Optional[Event] = None
+    ) -> CompletedProcess:
+        """Run the bash statement on the shared shell worker pool with the
+        same script content as the `.sh` file.
+
+        Args:
+            bash (str): A bash statement.
+            env (DictStr): An environment variable that set before run bash.
+            event (Event, default None): An event manager that use to track
+                parent process was not force stopped.
+
+        Raises:
+            StageCancelError: If event was set while the process running.
+
+        Returns:
+            CompletedProcess: A completed process object.
+        """
+        try:
+            code, stdout, stderr = get_shell_pool().run(
+                self.prepare_sh(bash, env), event=event
+            )
+        except InterruptedError:
+            raise StageCancelError(
+                "Cancel bash process while it running."
+            ) from None
+        return CompletedProcess("sh", code, stdout, stderr)
+
     async def async_process(
         self,
         params: DictData,
@@ -1518,26 +1955,27 @@ class BashStage(BaseRetryStage):
         trace: Trace = get_trace(
             run_id, parent_run_id=parent_run_id, extras=self.extras
         )
-        bash: str = param2template(
-            dedent(self.bash.strip("\n")), params, extras=self.extras
+        bash: str = self.pass_template(
+            self.bash,
+            params,
+            key="bash",
+            prepare=lambda x: dedent(x.strip("\n")),
+            env=False,
         )
-        async with self.async_make_sh_file(
-            bash=bash,
-            env=param2template(self.env, params, extras=self.extras),
-            run_id=run_id,
-        ) as sh:
-
+        env: DictStr = self.pass_template(
+            self.env, params, key="env", env=False
+        )
+        if self.is_pool():
             if event and event.is_set():
                 raise StageCancelError("Cancel before start bash process.")
 
-            await trace.adebug(f"[STAGE]: Create `{sh[1]}` file.")
-            rs: CompletedProcess = subprocess.run(
-                sh,
-                shell=False,
-                check=False,
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
+            await trace.adebug("[STAGE]: Run bash on the shell worker pool.")
+            rs: CompletedProcess = await asyncio.to_thread(
+                self.pool_process, bash, env, event=event
+            )
+        else:
+            rs: CompletedProcess = await self.async_file_process(
+                bash, env, trace, run_id, event=event
             )
         if rs.returncode > 0:
             e: str = rs.stderr.removesuffix("\n")
@@ -1559,13 +1997,80 @@ class BashStage(BaseRetryStage):
             extras=self.extras,
         )
 
+    async def async_file_process(
+        self,
+        bash: str,
+        env: DictStr,
+        trace: Trace,
+        run_id: str,
+        *,
+        event: Optional[Event] = None,
+    ) -> CompletedProcess:
+        """Async run the bash statement from the `.sh` file on a new shell
+        process.
+
+        Args:
+            bash (str): A bash statement.
+            env (DictStr): An environment variable that set before run bash.
+            trace (Trace): A trace object of this stage.
+            run_id (str): A running stage ID.
+            event (Event, default None): An event manager that use to track
+                parent process was not force stopped.
+
+        Raises:
+            StageCancelError: If event was set before start process.
+
+        Returns:
+            CompletedProcess: A completed process object.
+        """
+        async with self.async_make_sh_file(
+            bash=bash, env=env, run_id=run_id
+        ) as sh:
+
+            if event and event.is_set():
+                raise StageCancelError("Cancel before start bash process.")
+
+            await trace.adebug(f"[STAGE]: Create `{sh[1]}` file.")
+            if dynamic("stage_bash_stream", extras=self.extras):
+                rs: CompletedProcess = CompletedProcess(
+                    sh,
+                    *(await self.async_stream(sh, trace, run_id, event=event)),
+                )
+            else:
+                rs: CompletedProcess = subprocess.run(
+                    sh,
+                    shell=False,
+                    check=False,
+                    capture_output=True,
+                    text=True,
+                    encoding="utf-8",
+                )
+        return rs
+
+
+@lru_cache(maxsize=1024)
+def compile_py(source: str) -> CodeType:
+    """Compile a Python statement of the Python stage to the code object. It
+    caches with the rendered source, so the same statement does not compile
+    again on the next run or retry.
+
+    Args:
+        source (str): A rendered Python statement.
+
+    Returns:
+        CodeType: A code object that use to run with the `exec` function.
+    """
+    return compile(source, "<string>", "exec")
+
 
 class PyStage(BaseRetryStage):
     """Python stage that running the Python statement with the current globals
     and passing an input additional variables via `exec` built-in function.
 
-        This stage allow you to use any Python object that exists on the globals
-    such as import your installed package.
+        This stage runs with a minimal globals that only has the built-in
+    functions, the `vars` values, and the `result` object, so you should import
+    your installed package inside the statement. The compiled code object will
+    cache with the rendered statement.
 
     Warning:
 
@@ -1584,6 +2089,7 @@ class PyStage(BaseRetryStage):
         ... })
     """
 
+    async_native: ClassVar[bool] = False
     run: str = Field(
         description="A Python string statement that want to run with `exec`.",
     )
@@ -1619,6 +2125,41 @@ class PyStage(BaseRetryStage):
 
             yield value
 
+    def make_globals(
+        self,
+        params: DictData,
+        run_id: str,
+        context: DictData,
+        *,
+        parent_run_id: Optional[str] = None,
+    ) -> DictData:
+        """Make a minimal globals mapping for the `exec` function. It only
+        includes the built-in functions, the templated `vars` values, and the
+        `result` object instead of the whole namespace of this module.
+
+        Args:
+            params (DictData): A parameter data that use to template `vars`.
+            run_id (str): A running stage ID.
+            context (DictData): A context data of the result object.
+            parent_run_id (str | None, default None): A parent running ID.
+
+        Returns:
+            DictData: A globals mapping.
+        """
+        return (
+            {"__builtins__": builtins, "__name__": __name__}
+            | self.pass_template(self.vars, params, key="vars", env=False)
+            | {
+                "result": Result(
+                    run_id=run_id,
+                    parent_run_id=parent_run_id,
+                    status=WAIT,
+                    context=context,
+                    extras=self.extras,
+                )
+            }
+        )
+
     def set_outputs(
         self, output: DictData, to: DictData, info: Optional[DictData] = None
     ) -> DictData:
@@ -1670,18 +2211,8 @@ class PyStage(BaseRetryStage):
         )
         trace.debug("[STAGE]: Prepare `globals` and `locals` variables.")
         lc: DictData = {}
-        gb: DictData = (
-            globals()
-            | param2template(self.vars, params, extras=self.extras)
-            | {
-                "result": Result(
-                    run_id=run_id,
-                    parent_run_id=parent_run_id,
-                    status=WAIT,
-                    context=context,
-                    extras=self.extras,
-                )
-            }
+        gb: DictData = self.make_globals(
+            params, run_id, context, parent_run_id=parent_run_id
         )
 
         if event and event.is_set():
@@ -1689,7 +2220,13 @@ class PyStage(BaseRetryStage):
 
         # WARNING: The exec build-in function is very dangerous. So, it
         #   should use the re module to validate exec-string before running.
-        exec(self.pass_template(dedent(self.run), params), gb, lc)
+        exec(
+            compile_py(
+                self.pass_template(self.run, params, key="run", prepare=dedent)
+            ),
+            gb,
+            lc,
+        )
         return Result.from_trace(trace).catch(
             status=SUCCESS,
             context=catch(
@@ -1701,12 +2238,11 @@ class PyStage(BaseRetryStage):
                         k: gb[k]
                         for k in gb
                         if (
-                            not k.startswith("__")
-                            and k != "annotations"
+                            k in params
+                            and not k.startswith("__")
                             and not ismodule(gb[k])
                             and not isclass(gb[k])
                             and not isfunction(gb[k])
-                            and k in params
                         )
                     },
                 },
@@ -1749,18 +2285,8 @@ class PyStage(BaseRetryStage):
         )
         await trace.ainfo("[STAGE]: Prepare `globals` and `locals` variables.")
         lc: DictData = {}
-        gb: DictData = (
-            globals()
-            | param2template(self.vars, params, extras=self.extras)
-            | {
-                "result": Result(
-                    run_id=run_id,
-                    parent_run_id=parent_run_id,
-                    status=WAIT,
-                    context=context,
-                    extras=self.extras,
-                )
-            }
+        gb: DictData = self.make_globals(
+            params, run_id, context, parent_run_id=parent_run_id
         )
 
         if event and event.is_set():
@@ -1768,7 +2294,13 @@ class PyStage(BaseRetryStage):
 
         # WARNING: The exec build-in function is very dangerous. So, it
         #   should use the re module to validate exec-string before running.
-        exec(self.pass_template(dedent(self.run), params), gb, lc)
+        exec(
+            compile_py(
+                self.pass_template(self.run, params, key="run", prepare=dedent)
+            ),
+            gb,
+            lc,
+        )
         return Result.from_trace(trace).catch(
             status=SUCCESS,
             context=catch(
@@ -1780,12 +2312,11 @@ class PyStage(BaseRetryStage):
                         k: gb[k]
                         for k in gb
                         if (
-                            not k.startswith("__")
-                            and k != "annotations"
+                            k in params
+                            and not k.startswith("__")
                             and not ismodule(gb[k])
                             and not isclass(gb[k])
                             and not isfunction(gb[k])
-                            and k in params
                         )
                     },
                 },
@@ -1870,7 +2401,7 @@ class CallStage(BaseRetryStage):
                 TagFunc object.
         """
         return extract_call(
-            param2template(self.uses, params, extras=self.extras),
+            self.pass_template(self.uses, params, key="uses", env=False),
             registries=self.extras.get("registry_caller"),
         )
 
@@ -1920,7 +2451,7 @@ class CallStage(BaseRetryStage):
                 extras=self.extras,
             ),
             "extras": self.extras,
-        } | self.pass_template(self.args, params)
+        } | self.pass_template(self.args, params, key="args")
 
         # NOTE: Catch the necessary parameters.
         sig: inspect.Signature = inspect.signature(call_func)
@@ -1965,13 +2496,9 @@ class CallStage(BaseRetryStage):
 
         if inspect.iscoroutinefunction(call_func):
             loop = asyncio.get_event_loop()
-            rs: DictData = loop.run_until_complete(
-                call_func(**param2template(args, params, extras=self.extras))
-            )
+            rs: DictData = loop.run_until_complete(call_func(**args))
         else:
-            rs: DictData = call_func(
-                **param2template(args, params, extras=self.extras)
-            )
+            rs: DictData = call_func(**args)
 
         # VALIDATE:
         #   Check the result type from call function, it should be dict.
@@ -1990,7 +2517,11 @@ class CallStage(BaseRetryStage):
             context=catch(
                 context=context,
                 status=SUCCESS,
-                updated=dump_all(rs, by_alias=True),
+                updated=store_artifacts(
+                    dump_all(rs, by_alias=True),
+                    parent_run_id or run_id,
+                    extras=self.extras,
+                ),
             ),
             extras=self.extras,
         )
@@ -2043,7 +2574,7 @@ class CallStage(BaseRetryStage):
                 extras=self.extras,
             ),
             "extras": self.extras,
-        } | self.pass_template(self.args, params)
+        } | self.pass_template(self.args, params, key="args")
 
         # NOTE: Catch the necessary parameters.
         sig: inspect.Signature = inspect.signature(call_func)
@@ -2086,12 +2617,14 @@ class CallStage(BaseRetryStage):
             raise StageCancelError("Cancel before start call process.")
 
         if inspect.iscoroutinefunction(call_func):
-            rs: DictOrModel = await call_func(
-                **param2template(args, params, extras=self.extras)
-            )
+            rs: DictOrModel = await call_func(**args)
         else:
-            rs: DictOrModel = call_func(
-                **param2template(args, params, extras=self.extras)
+            # NOTE: Offload the blocking caller function to the executor of
+            #   the shared bounded pool for not blocking other tasks.
+            loop = asyncio.get_running_loop()
+            rs: DictOrModel = await loop.run_in_executor(
+                get_pool().executor,
+                partial(call_func, **args),
             )
 
         # VALIDATE:
@@ -2111,7 +2644,11 @@ class CallStage(BaseRetryStage):
             context=catch(
                 context=context,
                 status=SUCCESS,
-                updated=dump_all(rs, by_alias=True),
+                updated=store_artifacts(
+                    dump_all(rs, by_alias=True),
+                    parent_run_id or run_id,
+                    extras=self.extras,
+                ),
             ),
             extras=self.extras,
         )
@@ -2193,7 +2730,7 @@ class CallStage(BaseRetryStage):
                 extras=self.extras,
             ),
             "extras": self.extras,
-        } | self.pass_template(self.args, params)
+        } | self.pass_template(self.args, params, key="args")
 
         # NOTE: Catch the necessary parameters.
         sig: inspect.Signature = inspect.signature(call_func)
@@ -2260,6 +2797,7 @@ class TriggerStage(BaseRetryStage):
         ... })
     """
 
+    async_native: ClassVar[bool] = False
     trigger: str = Field(
         description=(
             "A trigger workflow name. This workflow name should exist on the "
@@ -2301,7 +2839,9 @@ class TriggerStage(BaseRetryStage):
         trace: Trace = get_trace(
             run_id, parent_run_id=parent_run_id, extras=self.extras
         )
-        _trigger: str = param2template(self.trigger, params, extras=self.extras)
+        _trigger: str = self.pass_template(
+            self.trigger, params, key="trigger", env=False
+        )
         if _trigger == self.extras.get("__sys_exec_break_circle", "NOTSET"):
             raise StageError("Circle execute via trigger itself workflow name.")
 
@@ -2317,7 +2857,9 @@ class TriggerStage(BaseRetryStage):
         # IMPORTANT: Should not use the `pass_env` function on this `params`
         #   parameter.
         result: Result = workflow.execute(
-            params=param2template(self.params, params, extras=self.extras),
+            params=self.pass_template(
+                self.params, params, key="params", env=False
+            ),
             run_id=parent_run_id,
             event=event,
         )
@@ -2366,11 +2908,155 @@ class TriggerStage(BaseRetryStage):
         )
 
 
+REDUCERS: dict[str, Callable[[list[Any]], Any]] = {
+    "sum": sum,
+    "collect": list,
+    "last": lambda values: values[-1] if values else None,
+    "count": len,
+}
+
+
+class OutputPolicy(BaseModel):
+    """Output policy model that controls how much of the nested context of
+    each foreach item, parallel branch, or matrix strategy it keeps in the
+    parent context. The parent context will deep-copy to the downstream and
+    serialize to the audit, so the large fan-out should not keep all nested
+    outputs.
+
+        The mode of this policy can be;
+
+        - `all`: Keep all nested context. (Default)
+        - `status`: Keep only the status and errors without the stages output.
+        - `reduce`: Keep only the status and errors, and reduce the value at
+          the `path` of all nested context with the `reducer` function to the
+          `reduced` key.
+        - `spill`: Write the stages output to the on-disk store and keep the
+          reference with the `spill` key. The template will load the spilled
+          value lazily.
+
+    Examples:
+        >>> OutputPolicy.model_validate("spill")
+        >>> OutputPolicy.model_validate(
+        ...     {
+        ...         "mode": "reduce",
+        ...         "reducer": "sum",
+        ...         "path": "stages.count.outputs.rows",
+        ...     }
+        ... )
+    """
+
+    mode: Literal["all", "status", "reduce", "spill"] = Field(
+        default="all",
+        description="An output mode of the nested context.",
+    )
+    reducer: str = Field(
+        default="collect",
+        description=(
+            "A reducer name, `sum`, `collect`, `last`, or `count`, or the "
+            "caller path, `<path>/<func>@<tag>`, that receive a list of values."
+        ),
+    )
+    path: Optional[str] = Field(
+        default=None,
+        description=(
+            "A dot path of the value that want to reduce from the nested "
+            "context. It uses the `stages` value if it does not set."
+        ),
+    )
+
+    @model_validator(mode="before")
+    def __prepare_mode(cls, data: Any) -> Any:
+        """Prepare the mode only string value to the mapping value."""
+        if isinstance(data, str):
+            return {"mode": data}
+        return data
+
+    @field_validator("reducer", mode="after")
+    def __validate_reducer(cls, value: str) -> str:
+        """Validate the reducer should be the builtin name or caller path."""
+        if value not in REDUCERS and not ("/" in value and "@" in value):
+            raise ValueError(
+                f"Reducer: {value!r} should be one of {list(REDUCERS)} or the "
+                f"caller path, `<path>/<func>@<tag>`."
+            )
+        return value
+
+    def apply(self, key: StrOrInt, value: DictData, trace: Trace) -> DictData:
+        """Apply this output policy to the nested context before setting it
+        to the parent context.
+
+        Args:
+            key (str | int): A key of the nested context in the parent context.
+            value (DictData): A nested context that has the `stages` key.
+            trace (Trace): A Trace model that use its running IDs to make the
+                spill file path.
+
+        Returns:
+            DictData: A nested context that want to set to the parent context.
+        """
+        if self.mode == "all":
+            return value
+
+        output: DictData = {k: v for k, v in value.items() if k != "stages"}
+        if self.mode == "reduce":
+            try:
+                output["output"] = (
+                    getdot_path(compile_caller(self.path), value)
+                    if self.path
+                    else value.get("stages", {})
+                )
+            except ValueError:
+                pass
+        elif self.mode == "spill":
+            path: Path = (
+                dynamic("stage_spill_path", extras=trace.extras)
+                / (trace.parent_run_id or trace.run_id)
+                / trace.run_id
+                / f"{gen_id(key)}.json"
+            )
+            dump_spill(path, {"stages": value.get("stages", {})})
+            output["spill"] = str(path)
+        return output
+
+    def reduce(
+        self, context: DictData, extras: Optional[DictData] = None
+    ) -> DictData:
+        """Reduce the values that the `apply` method keeps with the `output`
+        key of all nested context. It pops this key from the nested context.
+
+        Args:
+            context (DictData): A mapping of the nested context.
+            extras (DictData, default None): An extra parameter that use to
+                get the caller registries.
+
+        Returns:
+            DictData: A mapping with the `reduced` key, or empty mapping if the
+                mode is not `reduce`.
+        """
+        if self.mode != "reduce":
+            return {}
+
+        values: list[Any] = [
+            v.pop("output")
+            for v in context.values()
+            if isinstance(v, dict) and "output" in v
+        ]
+        if self.reducer in REDUCERS:
+            return {"reduced": REDUCERS[self.reducer](values)}
+
+        func: TagFunc = extract_call(
+            self.reducer, registries=(extras or {}).get("registry_caller")
+        )()
+        return {"reduced": func(values)}
+
+
 class BaseNestedStage(BaseAsyncStage, ABC):
     """Base Nested Stage model. This model is use for checking the child stage
     is the nested stage or not.
     """
 
+    async_native: ClassVar[bool] = False
+
     def set_outputs(
         self, output: DictData, to: DictData, info: Optional[DictData] = None
     ) -> DictData:
@@ -2479,17 +3165,24 @@ class ParallelStage(BaseNestedStage):
     max_workers: Union[int, str] = Field(
         default=2,
         description=(
-            "The maximum multi-thread pool worker size for execution parallel. "
-            "This value should be gather or equal than 1, and less than 20."
+            "The maximum workers for execution parallel that borrow from the "
+            "shared worker pool. This value should be gather or equal than 1."
         ),
         alias="max-workers",
     )
+    output: OutputPolicy = Field(
+        default_factory=OutputPolicy,
+        description=(
+            "An output policy of the nested context of each branch that keep "
+            "in the parallel context."
+        ),
+    )
 
     @field_validator("max_workers")
     def __validate_max_workers(cls, value: Union[int, str]) -> Union[int, str]:
-        """Validate `max_workers` field that should has value between 1 and 19."""
-        if isinstance(value, int) and (value < 1 or value >= 20):
-            raise ValueError("A max-workers value should between 1 and 19.")
+        """Validate `max_workers` field that should has value gather than 0."""
+        if isinstance(value, int) and value < 1:
+            raise ValueError("A max-workers value should gather than 0.")
         return value
 
     def _process_nested(
@@ -2523,8 +3216,7 @@ class ParallelStage(BaseNestedStage):
             tuple[Status, DictData]: A pair of status and result context data.
         """
         trace.info(f"[NESTED]: Execute Branch: {branch!r}")
-        current_context: DictData = copy.deepcopy(params)
-        current_context.update({"branch": branch})
+        current_context: DictData = layer_context(params, branch=branch)
         nestet_context: ParallelContext = {"branch": branch, "stages": {}}
 
         total_stage: int = len(self.parallel[branch])
@@ -2542,14 +3234,18 @@ class ParallelStage(BaseNestedStage):
                     context=context,
                     status=CANCEL,
                     parallel={
-                        branch: {
-                            "status": CANCEL,
-                            "branch": branch,
-                            "stages": filter_func(
-                                nestet_context.pop("stages", {})
-                            ),
-                            "errors": StageCancelError(error_msg).to_dict(),
-                        }
+                        branch: self.output.apply(
+                            branch,
+                            {
+                                "status": CANCEL,
+                                "branch": branch,
+                                "stages": filter_func(
+                                    nestet_context.pop("stages", {})
+                                ),
+                                "errors": StageCancelError(error_msg).to_dict(),
+                            },
+                            trace,
+                        )
                     },
                 )
                 raise StageCancelError(error_msg, refs=branch)
@@ -2577,14 +3273,18 @@ class ParallelStage(BaseNestedStage):
                     context=context,
                     status=FAILED,
                     parallel={
-                        branch: {
-                            "status": FAILED,
-                            "branch": branch,
-                            "stages": filter_func(
-                                nestet_context.pop("stages", {})
-                            ),
-                            "errors": StageError(error_msg).to_dict(),
-                        },
+                        branch: self.output.apply(
+                            branch,
+                            {
+                                "status": FAILED,
+                                "branch": branch,
+                                "stages": filter_func(
+                                    nestet_context.pop("stages", {})
+                                ),
+                                "errors": StageError(error_msg).to_dict(),
+                            },
+                            trace,
+                        ),
                     },
                 )
                 raise StageError(error_msg, refs=branch)
@@ -2597,14 +3297,18 @@ class ParallelStage(BaseNestedStage):
                     context=context,
                     status=CANCEL,
                     parallel={
-                        branch: {
-                            "status": CANCEL,
-                            "branch": branch,
-                            "stages": filter_func(
-                                nestet_context.pop("stages", {})
-                            ),
-                            "errors": StageCancelError(error_msg).to_dict(),
-                        }
+                        branch: self.output.apply(
+                            branch,
+                            {
+                                "status": CANCEL,
+                                "branch": branch,
+                                "stages": filter_func(
+                                    nestet_context.pop("stages", {})
+                                ),
+                                "errors": StageCancelError(error_msg).to_dict(),
+                            },
+                            trace,
+                        )
                     },
                 )
                 raise StageCancelError(error_msg, refs=branch)
@@ -2614,11 +3318,15 @@ class ParallelStage(BaseNestedStage):
             context=context,
             status=status,
             parallel={
-                branch: {
-                    "status": status,
-                    "branch": branch,
-                    "stages": filter_func(nestet_context.pop("stages", {})),
-                },
+                branch: self.output.apply(
+                    branch,
+                    {
+                        "status": status,
+                        "branch": branch,
+                        "stages": filter_func(nestet_context.pop("stages", {})),
+                    },
+                    trace,
+                ),
             },
         )
 
@@ -2658,11 +3366,7 @@ class ParallelStage(BaseNestedStage):
         # NOTE: Start prepare max_workers field if it is string type.
         if isinstance(self.max_workers, str):
             max_workers: int = self.__validate_max_workers(
-                pass_env(
-                    param2template(
-                        self.max_workers, params=params, extras=self.extras
-                    )
-                )
+                self.pass_template(self.max_workers, params, key="max_workers")
             )
         else:
             max_workers: int = self.max_workers
@@ -2676,9 +3380,9 @@ class ParallelStage(BaseNestedStage):
         if event and event.is_set():
             raise StageCancelError("Cancel before start parallel process.")
 
-        with ThreadPoolExecutor(max_workers, "stp") as executor:
+        with get_pool().group(max_workers, level="stage") as group:
             futures: list[Future] = [
-                executor.submit(
+                group.submit(
                     self._process_nested,
                     branch=branch,
                     params=params,
@@ -2688,6 +3392,7 @@ class ParallelStage(BaseNestedStage):
                 )
                 for branch in self.parallel
             ]
+            group.run()
             errors: DictData = {}
             statuses: list[Status] = [WAIT] * len_parallel
             for i, future in enumerate(as_completed(futures), start=0):
@@ -2698,6 +3403,7 @@ class ParallelStage(BaseNestedStage):
                     self.mark_errors(errors, e)
 
         st: Status = validate_statuses(statuses)
+        errors.update(self.output.reduce(context["parallel"], self.extras))
         return Result.from_trace(trace).catch(
             status=st,
             context=catch(context, status=st, updated=errors),
@@ -2713,6 +3419,39 @@ EachType = Union[
 ]
 
 
+def iter_lines(path: Union[str, Path]) -> Iterator[str]:
+    """Generate the non-empty lines of the line-delimited file lazily.
+
+    Args:
+        path (str | Path): A line-delimited file path.
+
+    Returns:
+        Iterator[str]: An iterator of lines without the newline char.
+    """
+    with Path(path).open(encoding="utf-8") as f:
+        for line in f:
+            if line := line.rstrip("\r\n"):
+                yield line
+
+
+def make_chunks(items: Iterator[Any], size: int) -> Iterator[list[Any]]:
+    """Group items to the chunks with the chunk size lazily.
+
+    Examples:
+        >>> list(make_chunks(iter([1, 2, 3]), 2))
+        [[1, 2], [3]]
+
+    Args:
+        items (Iterator[Any]): An iterator of items.
+        size (int): A chunk size.
+
+    Returns:
+        Iterator[list[Any]]: An iterator of the chunks.
+    """
+    while chunk := list(islice(items, size)):
+        yield chunk
+
+
 class ForEachStage(BaseNestedStage):
     """For-Each stage executor that execute all stages with each item in the
     foreach list.
@@ -2732,6 +3471,17 @@ class ForEachStage(BaseNestedStage):
         ...         },
         ...     ],
         ... })
+
+        The `foreach` field can be a lazy source that does not materialize all
+    items, like `{"uses": "tasks/get-items@demo", "with": {...}}` for the
+    caller function that return an iterable or `{"file": "./items.txt"}` for
+    the line-delimited file. The lazy source always uses the loop index as
+    its key.
+
+        If it sets the `chunk-size` field, it groups items to the chunks and
+    passes each chunk to stages via ${{ items }} template parameter instead.
+    The chunk uses its index as the key and the `concurrent` field runs over
+    chunks.
     """
 
     foreach: EachType = Field(
@@ -2749,7 +3499,6 @@ class ForEachStage(BaseNestedStage):
     concurrent: int = Field(
         default=1,
         ge=1,
-        lt=10,
         description=(
             "A concurrent value allow to run each item at the same time. It "
             "will be sequential mode if this value equal 1."
@@ -2762,6 +3511,22 @@ class ForEachStage(BaseNestedStage):
             "This flag allow to skip checking duplicate item step."
         ),
     )
+    chunk_size: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description=(
+            "A chunk size that groups items to the chunk and passes it to "
+            "stages via ${{ items }} template parameter."
+        ),
+        alias="chunk-size",
+    )
+    output: OutputPolicy = Field(
+        default_factory=OutputPolicy,
+        description=(
+            "An output policy of the nested context of each item that keep in "
+            "the foreach context."
+        ),
+    )
 
     def _process_nested(
         self,
@@ -2772,6 +3537,8 @@ class ForEachStage(BaseNestedStage):
         context: DictData,
         *,
         event: Optional[Event] = None,
+        chunk: bool = False,
+        use_index: bool = False,
     ) -> tuple[Status, DictData]:
         """Execute item that will execute all nested-stage that was set in this
         stage with specific foreach item.
@@ -2788,6 +3555,10 @@ class ForEachStage(BaseNestedStage):
             event: (Event) An Event manager instance that use to cancel this
                 execution if it forces stopped by parent execution.
                 (Default is None)
+            chunk: (bool) A flag that the item is a chunk of items that pass
+                via the `items` key. (Default is False)
+            use_index: (bool) A flag for using the loop index as a key.
+                (Default is False)
 
             This method should raise error when it wants to stop the foreach
         loop such as cancel event or getting the failed status.
@@ -2800,11 +3571,13 @@ class ForEachStage(BaseNestedStage):
         Returns:
             tuple[Status, DictData]
         """
-        trace.info(f"[NESTED]: Execute Item: {item!r}")
-        key: StrOrInt = index if self.use_index_as_key else item
-        current_context: DictData = copy.deepcopy(params)
-        current_context.update({"item": item, "loop": index})
-        nestet_context: DictData = {"item": item, "stages": {}}
+        name: str = "items" if chunk else "item"
+        trace.info(f"[NESTED]: Execute {name.title()}: {item!r}")
+        key: StrOrInt = index if (self.use_index_as_key or use_index) else item
+        current_context: DictData = layer_context(
+            params, **{name: item}, loop=index
+        )
+        nestet_context: DictData = {name: item, "stages": {}}
 
         total_stage: int = len(self.stages)
         skips: list[bool] = [False] * total_stage
@@ -2821,14 +3594,18 @@ class ForEachStage(BaseNestedStage):
                     context=context,
                     status=CANCEL,
                     foreach={
-                        key: {
-                            "status": CANCEL,
-                            "item": item,
-                            "stages": filter_func(
-                                nestet_context.pop("stages", {})
-                            ),
-                            "errors": StageCancelError(error_msg).to_dict(),
-                        }
+                        key: self.output.apply(
+                            key,
+                            {
+                                "status": CANCEL,
+                                name: item,
+                                "stages": filter_func(
+                                    nestet_context.pop("stages", {})
+                                ),
+                                "errors": StageCancelError(error_msg).to_dict(),
+                            },
+                            trace,
+                        )
                     },
                 )
                 raise StageCancelError(error_msg, refs=key)
@@ -2857,14 +3634,18 @@ class ForEachStage(BaseNestedStage):
                     context=context,
                     status=FAILED,
                     foreach={
-                        key: {
-                            "status": FAILED,
-                            "item": item,
-                            "stages": filter_func(
-                                nestet_context.pop("stages", {})
-                            ),
-                            "errors": StageError(error_msg).to_dict(),
-                        },
+                        key: self.output.apply(
+                            key,
+                            {
+                                "status": FAILED,
+                                name: item,
+                                "stages": filter_func(
+                                    nestet_context.pop("stages", {})
+                                ),
+                                "errors": StageError(error_msg).to_dict(),
+                            },
+                            trace,
+                        ),
                     },
                 )
                 raise StageError(error_msg, refs=key)
@@ -2877,14 +3658,18 @@ class ForEachStage(BaseNestedStage):
                     context=context,
                     status=CANCEL,
                     foreach={
-                        key: {
-                            "status": CANCEL,
-                            "item": item,
-                            "stages": filter_func(
-                                nestet_context.pop("stages", {})
-                            ),
-                            "errors": StageCancelError(error_msg).to_dict(),
-                        }
+                        key: self.output.apply(
+                            key,
+                            {
+                                "status": CANCEL,
+                                name: item,
+                                "stages": filter_func(
+                                    nestet_context.pop("stages", {})
+                                ),
+                                "errors": StageCancelError(error_msg).to_dict(),
+                            },
+                            trace,
+                        )
                     },
                 )
                 raise StageCancelError(error_msg, refs=key)
@@ -2894,11 +3679,15 @@ class ForEachStage(BaseNestedStage):
             context=context,
             status=status,
             foreach={
-                key: {
-                    "status": status,
-                    "item": item,
-                    "stages": filter_func(nestet_context.pop("stages", {})),
-                },
+                key: self.output.apply(
+                    key,
+                    {
+                        "status": status,
+                        name: item,
+                        "stages": filter_func(nestet_context.pop("stages", {})),
+                    },
+                    trace,
+                ),
             },
         )
 
@@ -2942,6 +3731,41 @@ class ForEachStage(BaseNestedStage):
             )
         return value
 
+    def make_source(self, value: Any) -> Optional[Iterator[Any]]:
+        """Make the lazy item source from the dict foreach value that has the
+        `uses` key for the caller function or the `file` key for the
+        line-delimited file.
+
+        Args:
+            value (Any): A templated foreach value.
+
+        Raises:
+            TypeError: If the dict foreach value is not the lazy source, or
+                the caller function does not return an iterable.
+
+        Returns:
+            Optional[Iterator[Any]]: An iterator of items or None if the
+                foreach value is not the dict type.
+        """
+        if not isinstance(value, dict):
+            return None
+        elif "file" in value:
+            return iter_lines(value["file"])
+        elif "uses" in value:
+            func: TagFunc = extract_call(
+                value["uses"], registries=self.extras.get("registry_caller")
+            )()
+            rs: Any = func(**value.get("with", {}))
+            if isinstance(rs, (str, dict)) or not hasattr(rs, "__iter__"):
+                raise TypeError(
+                    f"Foreach caller: {value['uses']!r} should return an "
+                    f"iterable of items, but it returns {type(rs)}."
+                )
+            return iter(rs)
+        raise TypeError(
+            f"Does not support dict foreach: {value!r} ({type(value)}) yet."
+        )
+
     def process(
         self,
         params: DictData,
@@ -2957,6 +3781,11 @@ class ForEachStage(BaseNestedStage):
         value more than 1. It will cancel all nested-stage execution when it has
         any item loop raise failed or canceled error.
 
+            The items, or the chunks of items, generate lazily and only keep
+        the window of futures in flight, so the lazy source never has to be
+        fully materialized. It stops generating the next items when it has
+        any error.
+
         Args:
             params: A parameter data that want to use in this
                 execution.
@@ -2973,68 +3802,93 @@ class ForEachStage(BaseNestedStage):
             run_id, parent_run_id=parent_run_id, extras=self.extras
         )
         event: Event = event or Event()
-        foreach: EachType = self.pass_template(self.foreach, params=params)
-        foreach: list[Any] = self.validate_foreach(foreach)
-        trace.info(f"[NESTED]: Foreach: {foreach!r}.")
-        catch(
-            context=context,
-            status=WAIT,
-            updated={"items": foreach, "foreach": {}},
+        foreach: EachType = self.pass_template(
+            self.foreach, params, key="foreach"
         )
-        len_foreach: int = len(foreach)
+        source: Optional[Iterator[Any]] = self.make_source(foreach)
+        if source is None:
+            foreach: list[Any] = self.validate_foreach(foreach)
+            trace.info(f"[NESTED]: Foreach: {foreach!r}.")
+            catch(
+                context=context,
+                status=WAIT,
+                updated={"items": foreach, "foreach": {}},
+            )
+        else:
+            trace.info(f"[NESTED]: Foreach from lazy source: {foreach!r}.")
+            catch(context=context, status=WAIT, updated={"foreach": {}})
+
         if event and event.is_set():
             raise StageCancelError("Cancel before start foreach process.")
 
-        with ThreadPoolExecutor(self.concurrent, "stf") as executor:
-            futures: list[Future] = [
-                executor.submit(
-                    self._process_nested,
-                    index=index,
-                    item=item,
-                    params=params,
-                    trace=trace,
-                    context=context,
-                    event=event,
-                )
-                for index, item in enumerate(foreach, start=0)
-            ]
-
-            errors: DictData = {}
-            statuses: list[Status] = [WAIT] * len_foreach
-
-            done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
-            if len(list(done)) != len(futures):
-                trace.warning(
-                    "[NESTED]: Set the event for stop pending for-each stage."
-                )
-                event.set()
-                for future in not_done:
-                    future.cancel()
-
-                time.sleep(0.025)
-                nd: str = (
-                    (
-                        f", {len(not_done)} item"
-                        f"{'s' if len(not_done) > 1 else ''} not run!!!"
-                    )
-                    if not_done
-                    else ""
-                )
-                trace.debug(f"[NESTED]: ... Foreach-Stage set failed event{nd}")
-                done: Iterator[Future] = as_completed(futures)
-
-            for i, future in enumerate(done, start=0):
-                try:
-                    # NOTE: Ignore returned context because it already updated.
-                    statuses[i], _ = future.result()
-                except StageError as e:
-                    statuses[i] = get_status_from_error(e)
-                    self.mark_errors(errors, e)
-                except CancelledError:
-                    statuses[i] = CANCEL
-                    pass
+        chunk: bool = self.chunk_size is not None
+        items: Iterator[Any] = iter(foreach if source is None else source)
+        units: Iterator[tuple[int, Any]] = enumerate(
+            make_chunks(items, self.chunk_size) if chunk else items, start=0
+        )
+        window: int = self.concurrent * 2
+        errors: DictData = {}
+        statuses: list[Status] = []
+        pending: set[Future] = set()
+        stop: bool = False
+        try:
+            with get_pool().group(
+                self.concurrent,
+                level="stage",
+                fail_fast=True,
+                on_error=event.set,
+            ) as group:
+                while True:
+                    while not stop and len(pending) < window:
+                        if (unit := next(units, None)) is None:
+                            stop = True
+                            break
+                        pending.add(
+                            group.submit(
+                                self._process_nested,
+                                index=unit[0],
+                                item=unit[1],
+                                params=params,
+                                trace=trace,
+                                context=context,
+                                event=event,
+                                chunk=chunk,
+                                use_index=chunk or source is not None,
+                            )
+                        )
+                    group.run()
+                    if not pending:
+                        break
+
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        try:
+                            # NOTE: Ignore returned context because it already
+                            #   updated.
+                            status, _ = future.result()
+                            statuses.append(status)
+                        except StageError as e:
+                            statuses.append(get_status_from_error(e))
+                            self.mark_errors(errors, e)
+                            if not event.is_set():
+                                trace.warning(
+                                    "[NESTED]: Set the event for stop pending "
+                                    "for-each stage."
+                                )
+                                event.set()
+                                group.cancel()
+                        except CancelledError:
+                            statuses.append(CANCEL)
+
+                    # NOTE: Stop generating the next items instead of cancel
+                    #   them when it has any error or the parent cancels.
+                    stop = stop or event.is_set()
+        finally:
+            if hasattr(items, "close"):
+                items.close()
 
         status: Status = validate_statuses(statuses)
+        errors.update(self.output.reduce(context["foreach"], self.extras))
         return Result.from_trace(trace).catch(
             status=status,
             context=catch(context, status=status, updated=errors),
@@ -3117,8 +3971,7 @@ class UntilStage(BaseNestedStage):
                 item.
         """
         trace.debug(f"[NESTED]: Execute Loop: {loop} (Item {item!r})")
-        current_context: DictData = copy.deepcopy(params)
-        current_context.update({"item": item, "loop": loop})
+        current_context: DictData = layer_context(params, item=item, loop=loop)
         nestet_context: DictData = {"loop": loop, "item": item, "stages": {}}
 
         next_item: Optional[T] = None
@@ -3256,7 +4109,9 @@ class UntilStage(BaseNestedStage):
         )
         event: Event = event or Event()
         trace.info(f"[NESTED]: Until: {self.until!r}")
-        item: Union[str, int, bool] = self.pass_template(self.item, params)
+        item: Union[str, int, bool] = self.pass_template(
+            self.item, params, key="item"
+        )
         loop: int = 1
         until_rs: bool = True
         exceed_loop: bool = False
@@ -3287,16 +4142,13 @@ class UntilStage(BaseNestedStage):
                     f"{loop} by default."
                 )
 
-            next_track: bool = eval(
-                pass_env(
-                    param2template(
-                        self.until,
-                        params | {"item": item, "loop": loop},
-                        extras=self.extras,
-                    ),
+            next_track: bool = eval_condition(
+                self.pass_template(
+                    self.until,
+                    params | {"item": item, "loop": loop},
+                    key="until",
                 ),
-                globals() | params | {"item": item},
-                {},
+                ChainMap({"item": item}, params),
             )
             if not isinstance(next_track, bool):
                 raise TypeError(
@@ -3459,7 +4311,7 @@ class CaseStage(BaseNestedStage):
         stages: Optional[list[Stage]] = None
 
         # NOTE: Start check the condition of each stage match with this case.
-        for match in self.match:
+        for i, match in enumerate(self.match):
 
             if isinstance(match, Else):
                 _else_stages: list[Stage] = match.other
@@ -3470,8 +4322,8 @@ class CaseStage(BaseNestedStage):
                 _else_stages: list[Stage] = match.stages
                 continue
 
-            _condition: str = param2template(c, params, extras=self.extras)
-            if pass_env(case) == pass_env(_condition):
+            _condition: str = self.pass_template(c, params, key=f"match.{i}")
+            if pass_env(case) == _condition:
                 stages: list[Stage] = match.stages
                 break
 
@@ -3517,8 +4369,7 @@ class CaseStage(BaseNestedStage):
             DictData
         """
         trace.info(f"[NESTED]: Case: {case!r}")
-        current_context: DictData = copy.deepcopy(params)
-        current_context.update({"case": case})
+        current_context: DictData = layer_context(params, case=case)
         output: DictData = {"case": case, "stages": {}}
         total_stage: int = len(stages)
         skips: list[bool] = [False] * total_stage
@@ -3619,7 +4470,9 @@ class CaseStage(BaseNestedStage):
             run_id, parent_run_id=parent_run_id, extras=self.extras
         )
 
-        case: StrOrNone = param2template(self.case, params, extras=self.extras)
+        case: StrOrNone = self.pass_template(
+            self.case, params, key="case", env=False
+        )
         trace.info(f"[NESTED]: Get Case: {case!r}.")
         case, stages = self.extract_stages_from_case(case, params=params)
 
@@ -3689,7 +4542,9 @@ class RaiseStage(BaseAsyncStage):
         trace: Trace = get_trace(
             run_id, parent_run_id=parent_run_id, extras=self.extras
         )
-        message: str = param2template(self.message, params, extras=self.extras)
+        message: str = self.pass_template(
+            self.message, params, key="message", env=False
+        )
         trace.info(f"[STAGE]: Message: ( {message} )")
         raise StageError(message)
 
@@ -3720,7 +4575,9 @@ class RaiseStage(BaseAsyncStage):
         trace: Trace = get_trace(
             run_id, parent_run_id=parent_run_id, extras=self.extras
         )
-        message: str = param2template(self.message, params, extras=self.extras)
+        message: str = self.pass_template(
+            self.message, params, key="message", env=False
+        )
         await trace.ainfo(f"[STAGE]: Execute Raise-Stage: ( {message} )")
         raise StageError(message)
 
@@ -3749,6 +4606,7 @@ class DockerStage(BaseRetryStage):  # pragma: no cov
     """
 
     action_stage: ClassVar[bool] = True
+    async_native: ClassVar[bool] = False
     image: str = Field(
         description="A Docker image url with tag that want to run.",
     )
@@ -3809,9 +4667,7 @@ class DockerStage(BaseRetryStage):  # pragma: no cov
         resp = client.api.pull(
             repository=pass_env(self.image),
             tag=pass_env(self.tag),
-            auth_config=pass_env(
-                param2template(self.auth, params, extras=self.extras)
-            ),
+            auth_config=self.pass_template(self.auth, params, key="auth"),
             stream=True,
             decode=True,
         )
@@ -3933,9 +4789,161 @@ class DockerStage(BaseRetryStage):  # pragma: no cov
         )
 
 
+def build_venv(path: Path, version: str, deps: list[str]) -> None:
+    """Build the Python virtual environment with its dependencies via the `uv`
+    package.
+
+    Args:
+        path (Path): A target path of the virtual environment.
+        version (str): A Python version of the virtual environment.
+        deps (list[str]): A list of Python dependencies.
+
+    Raises:
+        CalledProcessError: If the `uv` command return non-zero code.
+    """
+    subprocess.run(
+        [sys.executable, "-m", "uv", "venv", "--python", version, str(path)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    if deps:
+        subprocess.run(
+            [
+                sys.executable,
+                *("-m", "uv", "pip", "install"),
+                *("--python", str(VenvCache.python(path))),
+                *deps,
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+
+
+class VenvCache:
+    """Content-addressed cache of the Python virtual environments that keys
+    with the normalized dependencies and the Python version.
+
+        The environment builds once under the exclusive file lock of its key
+    and reuses across runs and processes with the shared file lock. The least
+    recently used environments that nobody holds its lock will evict when the
+    cache has more than `max_size` environments.
+
+    Examples:
+        >>> cache = VenvCache(Path("./.venvs"), max_size=8)
+        >>> with cache.get(["numpy"], "3.11") as venv:
+        ...     subprocess.run([VenvCache.python(venv), "main.py"])
+    """
+
+    MARKER: ClassVar[str] = ".complete"
+
+    def __init__(
+        self,
+        path: Path,
+        max_size: int,
+        builder: Callable[[Path, str, list[str]], None] = build_venv,
+    ) -> None:
+        self.path: Path = Path(path)
+        self.max_size: int = max_size
+        self.builder: Callable[[Path, str, list[str]], None] = builder
+
+    @staticmethod
+    def normalize(deps: list[str]) -> list[str]:
+        """Normalize the dependency list with the PEP 503 project name and
+        remove the whitespace and the duplicate items.
+
+        Args:
+            deps (list[str]): A list of Python dependencies.
+
+        Returns:
+            list[str]: A sorted list of normalized dependencies.
+        """
+        rs: set[str] = set()
+        for dep in deps:
+            dep: str = re.sub(r"\s+", "", dep)
+            name, spec = re.match(r"^([A-Za-z0-9._-]*)(.*)$", dep).groups()
+            rs.add(re.sub(r"[-_.]+", "-", name).lower() + spec)
+        return sorted(rs)
+
+    @classmethod
+    def key(cls, deps: list[str], version: str) -> str:
+        """Make the cache key of the dependencies and the Python version."""
+        data: DictData = {"python": version, "deps": cls.normalize(deps)}
+        return hashlib.sha256(json.dumps(data).encode()).hexdigest()[:32]
+
+    @staticmethod
+    def python(path: Path) -> Path:
+        """Get the Python interpreter path of the virtual environment."""
+        if sys.platform.startswith("win"):  # pragma: no cov
+            return path / "Scripts" / "python.exe"
+        return path / "bin" / "python"
+
+    @contextlib.contextmanager
+    def get(self, deps: list[str], version: str) -> Iterator[Path]:
+        """Get the virtual environment of the dependencies and the Python
+        version. It builds this environment if it does not exist in the cache
+        and holds the shared lock until the context exits.
+
+        Args:
+            deps (list[str]): A list of Python dependencies.
+            version (str): A Python version.
+
+        Returns:
+            Iterator[Path]: A path of the virtual environment.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        key: str = self.key(deps, version)
+        env: Path = self.path / key
+        lock: Path = self.path / f"{key}.lock"
+        while True:
+            with file_lock(lock, shared=True):
+                if (marker := env / self.MARKER).exists():
+                    marker.touch()
+                    yield env
+                    break
+            with file_lock(lock):
+                if not (env / self.MARKER).exists():
+                    self.build(env, version, self.normalize(deps))
+        self.evict()
+
+    def build(self, env: Path, version: str, deps: list[str]) -> None:
+        """Build the environment on the temporary path and move it to the
+        target path after it completes.
+        """
+        tmp: Path = env.with_name(f"{env.name}.tmp-{uuid.uuid4().hex}")
+        try:
+            self.builder(tmp, version, deps)
+            (tmp / self.MARKER).touch()
+            shutil.rmtree(env, ignore_errors=True)
+            os.replace(tmp, env)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def evict(self) -> None:
+        """Evict the least recently used environments that nobody holds its
+        lock until the cache does not have more than `max_size` environments.
+        """
+        envs: list[Path] = sorted(
+            (p for p in self.path.iterdir() if (p / self.MARKER).exists()),
+            key=lambda p: (p / self.MARKER).stat().st_mtime,
+        )
+        for env in envs[: max(len(envs) - self.max_size, 0)]:
+            try:
+                with file_lock(self.path / f"{env.name}.lock", blocking=False):
+                    shutil.rmtree(env, ignore_errors=True)
+            except BlockingIOError:
+                continue
+
+
 class VirtualPyStage(PyStage):  # pragma: no cov
     """Virtual Python stage executor that run Python statement on the dependent
     Python virtual environment via the `uv` package.
+
+        The virtual environment caches with its dependencies and Python version
+    by the `VenvCache` object, so it builds only once and reuses across runs.
+    Set the `stage_venv_cache_size` config to 0 for running with `uv run`
+    without the cache instead.
     """
 
     version: str = Field(
@@ -3960,8 +4968,9 @@ class VirtualPyStage(PyStage):  # pragma: no cov
         deps: list[str],
         run_id: StrOrNone = None,
     ) -> Iterator[str]:
-        """Create the `.py` file and write an input Python statement and its
-        Python dependency on the header of this file.
+        """Create the `.py` file on the per-run temporary directory and write
+        an input Python statement and its Python dependency on the header of
+        this file.
 
             The format of Python dependency was followed by the `uv`
         recommended.
@@ -3974,8 +4983,9 @@ class VirtualPyStage(PyStage):  # pragma: no cov
             run_id: (StrOrNone) A running ID of this stage execution.
         """
         run_id: str = run_id or uuid.uuid4()
-        f_name: str = f"{run_id}.py"
-        with open(f"./{f_name}", mode="w", newline="\n") as f:
+        tmp: str = tempfile.mkdtemp(prefix=f"{run_id}-")
+        f_name: str = os.path.join(tmp, f"{run_id}.py")
+        with open(f_name, mode="w", newline="\n") as f:
             # NOTE: Create variable mapping that write before running statement.
             vars_str: str = pass_env(
                 "\n ".join(
@@ -4001,12 +5011,13 @@ class VirtualPyStage(PyStage):  # pragma: no cov
             f.write("\n" + pass_env(py.replace("\r\n", "\n")))
 
         # NOTE: Make this .py file able to executable.
-        make_exec(f"./{f_name}")
+        make_exec(f_name)
 
-        yield f_name
-
-        # Note: Remove .py file that use to run Python.
-        Path(f"./{f_name}").unlink()
+        try:
+            yield f_name
+        finally:
+            # Note: Remove the per-run directory that use to run Python.
+            shutil.rmtree(tmp, ignore_errors=True)
 
     @staticmethod
     def prepare_std(value: str) -> Optional[str]:
@@ -4044,11 +5055,16 @@ class VirtualPyStage(PyStage):  # pragma: no cov
         trace: Trace = get_trace(
             run_id, parent_run_id=parent_run_id, extras=self.extras
         )
-        run: str = param2template(dedent(self.run), params, extras=self.extras)
+        run: str = self.pass_template(
+            self.run, params, key="run", prepare=dedent, env=False
+        )
+        deps: list[str] = self.pass_template(
+            self.deps, params, key="deps", env=False
+        )
         with self.make_py_file(
             py=run,
-            values=param2template(self.vars, params, extras=self.extras),
-            deps=param2template(self.deps, params, extras=self.extras),
+            values=self.pass_template(self.vars, params, key="vars", env=False),
+            deps=deps,
             run_id=run_id,
         ) as py:
 
@@ -4058,13 +5074,31 @@ class VirtualPyStage(PyStage):  # pragma: no cov
                 )
 
             trace.debug(f"[STAGE]: Create `{py}` file.")
-            rs: CompletedProcess = subprocess.run(
-                ["python", "-m", "uv", "run", py, "--no-cache"],
-                # ["uv", "run", "--python", "3.9", py],
-                shell=False,
-                capture_output=True,
-                text=True,
-            )
+            size: int = dynamic("stage_venv_cache_size", extras=self.extras)
+            if size > 0:
+                cache = VenvCache(
+                    dynamic("stage_venv_cache_path", extras=self.extras), size
+                )
+                try:
+                    with cache.get(deps, self.version) as venv:
+                        trace.debug(f"[STAGE]: Use virtual env: `{venv}`.")
+                        rs: CompletedProcess = subprocess.run(
+                            [str(VenvCache.python(venv)), py],
+                            shell=False,
+                            capture_output=True,
+                            text=True,
+                        )
+                except subprocess.CalledProcessError as e:
+                    raise StageError(
+                        f"Build virtual env failed: {e.stderr}"
+                    ) from None
+            else:
+                rs: CompletedProcess = subprocess.run(
+                    ["python", "-m", "uv", "run", py, "--no-cache"],
+                    shell=False,
+                    capture_output=True,
+                    text=True,
+                )
 
         if rs.returncode > 0:
             # NOTE: Prepare stderr message that returning from subprocess.
@@ -16,20 +16,24 @@ monitoring workflow executions.
 Functions:
     set_logging: Configure logger with custom formatting.
     get_trace: Factory function for trace instances.
+    get_handler: Get the shared handler instance of a handler config data.
+    get_trace_writer: Get the process-wide background trace writer.
+    flush_trace: Flush all pending records of the background trace writer.
 """
+import atexit
 import contextlib
 import json
 import logging
 import os
 import re
+import socket
+import sys
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from datetime import datetime
-from functools import lru_cache
-from inspect import Traceback, currentframe, getframeinfo
+from functools import cached_property, lru_cache
 from pathlib import Path
 from threading import Lock, get_ident
-from types import FrameType
 from typing import (
     Annotated,
     Any,
@@ -41,15 +45,20 @@ from typing import (
     Union,
     cast,
 )
-from zoneinfo import ZoneInfo
 
-from pydantic import BaseModel, Field, PrivateAttr
-from pydantic.functional_validators import field_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    computed_field,
+)
+from pydantic.functional_validators import field_validator, model_validator
 from typing_extensions import Self
 
 from .__types import DictData
 from .conf import config, dynamic
-from .utils import cut_id, get_dt_now, prepare_newline
+from .utils import BatchWriter, cut_id, get_dt_now, prepare_newline
 
 logger = logging.getLogger("ddeutil.workflow")
 Level = Literal["debug", "info", "warning", "error", "exception"]
@@ -101,6 +110,35 @@ def set_logging(
     return _logger
 
 
+@lru_cache(maxsize=1)
+def get_system_info() -> DictData:
+    """Get the system context of this process that will attach to all trace
+    metadata. It caches the result because the DNS lookup of the IP address can
+    take milliseconds or hang.
+
+    Returns:
+        DictData: A mapping of hostname, IP address, Python and package
+            versions.
+    """
+    from .__about__ import __version__
+
+    hostname: str = socket.gethostname()
+    try:
+        ip_address: Optional[str] = socket.gethostbyname(hostname)
+    except OSError:  # pragma: no cov
+        ip_address = None
+    return {
+        "hostname": hostname,
+        "ip_address": ip_address,
+        "python_version": (
+            f"{sys.version_info.major}"
+            f".{sys.version_info.minor}"
+            f".{sys.version_info.micro}"
+        ),
+        "package_version": __version__,
+    }
+
+
 PrefixType = Literal[
     "caller",
     "nested",
@@ -161,10 +199,10 @@ class Message(BaseModel):
         Returns:
             Message: The validated model from a string message.
         """
-        msg = cls.model_validate(PREFIX_LOGS_REGEX.search(msg).groupdict())
-        if msg.module is None and module:
-            msg.module = module
-        return msg
+        data: DictData = PREFIX_LOGS_REGEX.search(msg).groupdict()
+        if data["module"] is None and module:
+            data["module"] = module
+        return cls.model_validate(data)
 
     def prepare(self, extras: Optional[DictData] = None) -> str:
         """Prepare message with force add prefix before writing trace log.
@@ -204,9 +242,6 @@ class Metadata(BaseModel):  # pragma: no cov
 
     error_flag: bool = Field(default=False, description="A meta error flag.")
     level: Level = Field(description="A log level.")
-    datetime: str = Field(
-        description="A datetime string with the specific config format."
-    )
     process: int = Field(description="A process ID.")
     thread: int = Field(description="A thread ID.")
     module: Optional[PrefixType] = Field(
@@ -254,31 +289,68 @@ class Metadata(BaseModel):  # pragma: no cov
         default_factory=dict, description="Additional custom metadata."
     )
 
+    # NOTE: Private attrs for the lazy datetime formatting.
+    _dt: Any = PrivateAttr(default=None)
+    _extras: Optional[DictData] = PrivateAttr(default=None)
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def __prepare_datetime(cls, data: Any, handler: Any) -> Self:
+        """Keep the datetime string that pass to this model, like the trace
+        that reads back from the handler storage, instead of formatting it.
+        """
+        if not isinstance(data, dict):
+            return handler(data)
+        if not isinstance(dt := data.get("datetime"), str):
+            raise ValueError("Metadata should pass the datetime string.")
+        metadata: Self = handler(data)
+        metadata.__dict__["datetime"] = dt
+        return metadata
+
+    @computed_field(
+        description="A datetime string with the specific config format."
+    )
+    @cached_property
+    def datetime(self) -> str:
+        """Return the datetime string of this metadata. The metadata that was
+        made with the `make` method formats it with the `log_tz` and
+        `log_datetime_format` config values at the first read or dump.
+
+        Returns:
+            str: A datetime string.
+        """
+        extras: DictData = self._extras or {}
+        return self._dt.astimezone(dynamic("log_tz", extras=extras)).strftime(
+            dynamic("log_datetime_format", extras=extras)
+        )
+
     @classmethod
     def dynamic_frame(
-        cls, frame: FrameType, *, extras: Optional[DictData] = None
-    ) -> Traceback:
+        cls, *, extras: Optional[DictData] = None
+    ) -> tuple[str, int]:
         """Dynamic Frame information base on the `logs_trace_frame_layer` config.
+        It reads the filename and line number from the frame object directly
+        instead of the `getframeinfo` function that reads the source file.
 
         Args:
-            frame: The current frame that want to dynamic.
             extras: An extra parameter that want to get the
                 `logs_trace_frame_layer` config value.
 
+        Raises:
+            ValueError: If the layer value is deeper than the call stack.
+
         Returns:
-            Traceback: The frame information at the specified layer.
+            tuple[str, int]: A pair of filename and line number at the specified
+                layer from the caller of this method.
         """
-        extras_data: DictData = extras or {}
-        layer: int = extras_data.get("logs_trace_frame_layer", 4)
-        current_frame: FrameType = frame
-        for _ in range(layer):
-            _frame: Optional[FrameType] = current_frame.f_back
-            if _frame is None:
-                raise ValueError(
-                    f"Layer value does not valid, the maximum frame is: {_ + 1}"
-                )
-            current_frame = _frame
-        return getframeinfo(current_frame)
+        layer: int = (extras or {}).get("logs_trace_frame_layer", 4)
+        try:
+            frame = sys._getframe(layer + 1)
+        except ValueError:
+            raise ValueError(
+                f"Layer value does not valid, the maximum frame is: {layer}"
+            ) from None
+        return frame.f_code.co_filename, frame.f_lineno
 
     @classmethod
     def make(
@@ -297,7 +369,9 @@ class Metadata(BaseModel):  # pragma: no cov
         """Make the current metric for contract this Metadata model instance.
 
         This method captures local states like PID, thread identity, and system
-        information to create a comprehensive trace metadata instance.
+        information to create a comprehensive trace metadata instance. It skips
+        the model validation because all values come from the trace object, and
+        it defers the datetime formatting until a handler needs it.
 
         Args:
             error_flag: A metadata mode.
@@ -314,42 +388,11 @@ class Metadata(BaseModel):  # pragma: no cov
         Returns:
             Self: The constructed Metadata instance.
         """
-        import socket
-        import sys
-
-        from .__about__ import __version__
-
-        frame: Optional[FrameType] = currentframe()
-        if frame is None:
-            raise ValueError("Cannot get current frame")
-
-        frame_info: Traceback = cls.dynamic_frame(frame, extras=extras)
+        filename, lineno = cls.dynamic_frame(extras=extras)
         extras_data: DictData = extras or {}
-
-        # NOTE: Get system information
-        hostname = socket.gethostname()
-        ip_address = socket.gethostbyname(hostname)
-        python_version: str = (
-            f"{sys.version_info.major}"
-            f".{sys.version_info.minor}"
-            f".{sys.version_info.micro}"
-        )
-
-        # Get datetime format with fallback
-        datetime_format = (
-            dynamic("log_datetime_format", extras=extras_data)
-            or "%Y-%m-%d %H:%M:%S"
-        )
-        timezone = dynamic("log_tz", extras=extras_data)
-        if timezone is None:
-            timezone = ZoneInfo("UTC")
-
-        return cls(
+        metadata: Self = cls.model_construct(
             error_flag=error_flag,
             level=level,
-            datetime=(
-                get_dt_now().astimezone(timezone).strftime(datetime_format)
-            ),
             process=os.getpid(),
             thread=get_ident(),
             module=module,
@@ -357,21 +400,21 @@ class Metadata(BaseModel):  # pragma: no cov
             cut_id=cutting_id,
             run_id=run_id,
             parent_run_id=parent_run_id,
-            filename=frame_info.filename.split(os.path.sep)[-1],
-            lineno=frame_info.lineno,
+            filename=os.path.basename(filename),
+            lineno=lineno,
             # NOTE: Performance metrics
             duration_ms=extras_data.get("duration_ms"),
             memory_usage_mb=extras_data.get("memory_usage_mb"),
             cpu_usage_percent=extras_data.get("cpu_usage_percent"),
-            # NOTE: System context
-            hostname=hostname,
-            ip_address=ip_address,
-            python_version=python_version,
-            package_version=__version__,
             # NOTE: Custom metadata
             tags=extras_data.get("tags", []),
-            metric=metric,
+            metric=metric if metric is not None else {},
+            # NOTE: System context
+            **get_system_info(),
         )
+        metadata._dt = get_dt_now()
+        metadata._extras = extras
+        return metadata
 
     @property
     def pointer_id(self) -> str:
@@ -1691,6 +1734,172 @@ TraceHandler = Annotated[
 ]
 
 
+HANDLER_ADAPTER: Final[TypeAdapter] = TypeAdapter(TraceHandler)
+_HANDLERS: dict[str, BaseHandler] = {}
+_HANDLERS_LOCK: Lock = Lock()
+
+
+def get_handler(data: Union[DictData, BaseHandler]) -> BaseHandler:
+    """Get the shared handler instance of a handler config data from the
+    handler registry. The same config data will always return the same handler
+    instance, so all traces share its lock and its opened resources.
+
+    Args:
+        data (DictData | BaseHandler): A handler config data or a handler
+            instance that will return as is.
+
+    Returns:
+        BaseHandler: The shared handler instance.
+    """
+    if isinstance(data, BaseHandler):
+        return data
+
+    key: str = json.dumps(data, sort_keys=True, default=str)
+    with _HANDLERS_LOCK:
+        if key not in _HANDLERS:
+            _HANDLERS[key] = HANDLER_ADAPTER.validate_python(data)
+        return _HANDLERS[key]
+
+
+@lru_cache(maxsize=32)
+def load_handlers(value: str) -> tuple[BaseHandler, ...]:
+    """Load the shared handler instances from the raw Json string config. It
+    caches with the raw string, so it parses the Json string again only when
+    the environment variable was changed.
+
+    Args:
+        value (str): A Json string of list of trace handler config data.
+
+    Returns:
+        tuple[BaseHandler, ...]: A tuple of shared handler instances.
+    """
+    return tuple(get_handler(data) for data in json.loads(value))
+
+
+class TraceWriter(BatchWriter):
+    """Background Trace Writer object that flush the trace records to the
+    handlers in batches with the shared batch writer loop.
+
+        The pending records will group by the handler and the pointer ID, so
+    the file handler opens its files only once per batch. The batch will flush
+    when the number of pending records reaches `flush_size` or the oldest
+    record waits longer than `flush_interval` seconds.
+
+        If the queue is full, the `block` policy will wait for a free slot, and
+    the `drop` policy will drop the record and count it on the `dropped`
+    attribute.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        flush_interval: float = 1.0,
+        flush_size: int = 100,
+        policy: Literal["block", "drop"] = "block",
+    ) -> None:
+        super().__init__(
+            self._write,
+            maxsize=maxsize,
+            flush_interval=flush_interval,
+            flush_size=flush_size,
+            policy=policy,
+            name="wf_trace_writer",
+        )
+
+    def put(
+        self,
+        handlers: list[TraceHandler],
+        metadata: Metadata,
+        extra: Optional[DictData] = None,
+    ) -> bool:
+        """Put a trace record to the queue for flushing to all handlers.
+
+        Args:
+            handlers (list[TraceHandler]): A list of handler that want to emit.
+            metadata (Metadata): A trace metadata.
+            extra (DictData, default None): An extra parameter.
+
+        Returns:
+            bool: False if this record was dropped.
+        """
+        return super().put((handlers, metadata, extra))
+
+    @staticmethod
+    def _write(records: list[tuple[list[TraceHandler], Metadata, Any]]) -> None:
+        """Flush a batch of trace records to their handlers."""
+        pending: dict[tuple[int, str], tuple[Any, Any, list]] = {}
+        for handlers, metadata, extra in records:
+            for handler in handlers:
+                key = (id(handler), metadata.pointer_id)
+                if key not in pending:
+                    pending[key] = (handler, extra, [])
+                pending[key][2].append(metadata)
+
+        for handler, extra, metas in pending.values():
+            try:
+                handler.flush(metas, extra=extra)
+            except Exception as e:  # pragma: no cov
+                logger.warning(
+                    f"[TRACE]: Handler {handler.type!r} flush failed: "
+                    f"{e.__class__.__name__}: {e}"
+                )
+
+
+_WRITER: Optional[TraceWriter] = None
+_WRITER_LOCK: Lock = Lock()
+
+
+def get_trace_writer() -> TraceWriter:
+    """Get the process-wide background trace writer that create with the
+    `trace_*` config values at the first call. The writer will flush all
+    pending records at the interpreter exit.
+
+    Returns:
+        TraceWriter: The shared trace writer.
+    """
+    global _WRITER
+
+    with _WRITER_LOCK:
+        if _WRITER is None:
+            _WRITER = TraceWriter(
+                maxsize=config.trace_queue_size,
+                flush_interval=config.trace_flush_interval,
+                flush_size=config.trace_flush_size,
+                policy=config.trace_queue_policy,
+            )
+            atexit.register(_WRITER.close)
+        return _WRITER
+
+
+def flush_trace(timeout: Optional[float] = None) -> bool:
+    """Flush all pending records of the background trace writer if it was
+    created on this process.
+
+    Args:
+        timeout (float, default None): A maximum waiting second.
+
+    Returns:
+        bool: True if all records were flushed.
+    """
+    if _WRITER is None:
+        return True
+    return _WRITER.flush(timeout)
+
+
+def _reset_trace_writer() -> None:  # pragma: no cov
+    """Drop the trace writer that copy from the parent process after fork
+    because its thread does not exist on the child process.
+    """
+    global _WRITER, _WRITER_LOCK
+
+    _WRITER = None
+    _WRITER_LOCK = Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_trace_writer)
+
+
 class BaseEmit(ABC):
 
     @abstractmethod
@@ -1945,6 +2154,12 @@ class Trace(BaseModel, BaseEmit, BaseAsyncEmit):
         # NOTE: Check enable buffer flag was set or not.
         if not self._enable_buffer:
 
+            # NOTE: Pass this metadata to the background writer if it enables
+            #   the async trace pipeline.
+            if dynamic("trace_async", extras=self.extras):
+                get_trace_writer().put(self.handlers, metadata, self.extras)
+                return
+
             # NOTE: Start emit tracing log data to each handler.
             for handler in self.handlers:
                 handler.emit(metadata, extra=self.extras)
@@ -1990,6 +2205,10 @@ class Trace(BaseModel, BaseEmit, BaseAsyncEmit):
             extras=self.extras,
         )
 
+        if dynamic("trace_async", extras=self.extras):
+            get_trace_writer().put(self.handlers, metadata, self.extras)
+            return
+
         # NOTE: Start emit tracing log data to each handler.
         for handler in self.handlers:
             await handler.amit(metadata, extra=self.extras)
@@ -2043,7 +2262,8 @@ def get_trace(
 
         This factory function returns the appropriate trace implementation based
     on configuration. It can be overridden by extras argument and accepts
-    running ID and parent running ID.
+    running ID and parent running ID. All traces share the handler instances
+    from the handler registry, so making a trace is a cheap object creation.
 
     Args:
         run_id (str): A running ID.
@@ -2059,13 +2279,20 @@ def get_trace(
     Returns:
         Trace: The appropriate trace instance.
     """
-    trace: Trace = Trace.model_validate(
-        {
-            "run_id": run_id,
-            "parent_run_id": parent_run_id,
-            "handlers": dynamic("trace_handlers", f=handlers, extras=extras),
-            "extras": extras or {},
-        }
+    if handlers is None:
+        handlers = (extras or {}).get("trace_handlers")
+
+    # NOTE: Pydantic does not re-validate the shared handler instances, so it
+    #   only validates the running IDs and the extras.
+    trace: Trace = Trace(
+        run_id=run_id,
+        parent_run_id=parent_run_id,
+        handlers=(
+            list(load_handlers(config.trace_handlers_conf))
+            if handlers is None
+            else [get_handler(h) for h in handlers]
+        ),
+        extras=extras or {},
     )
     # NOTE: Start pre-process when start create trace.
     if pre_process:
@@ -11,16 +11,23 @@ operations, and other common tasks.
 """
 from __future__ import annotations
 
+import copy
+import json
+import os
 import stat
+import sys
 import time
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta
 from hashlib import md5
 from inspect import isclass, isfunction
 from itertools import product
 from pathlib import Path
+from queue import Empty, Full, Queue
 from random import randrange
-from typing import Any, Final, Optional, TypeVar, Union, overload
+from threading import Event, Lock, Thread
+from typing import Any, Final, Literal, Optional, TypeVar, Union, overload
 from zoneinfo import ZoneInfo
 
 from ddeutil.core import hash_str
@@ -281,6 +288,81 @@ def make_exec(path: Union[Path, str]) -> None:
     f.chmod(f.stat().st_mode | stat.S_IEXEC)
 
 
+@contextmanager
+def file_lock(
+    path: Union[Path, str], *, shared: bool = False, blocking: bool = True
+) -> Iterator[None]:
+    """Hold an advisory lock of the lock file that share across processes.
+
+        On Windows, it always uses the exclusive lock because the `msvcrt`
+    module does not support the shared lock.
+
+    Args:
+        path: A lock file path that will create if it does not exist.
+        shared: A flag that hold the shared lock instead of the exclusive lock.
+        blocking: A flag that wait until it can hold the lock.
+
+    Raises:
+        BlockingIOError: If it cannot hold the lock on the non-blocking mode.
+    """
+    fd: int = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if sys.platform.startswith("win"):  # pragma: no cov
+            import msvcrt
+
+            try:
+                msvcrt.locking(
+                    fd, msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1
+                )
+            except OSError as e:
+                raise BlockingIOError(str(e)) from e
+            try:
+                yield
+            finally:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            flag: int = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+            fcntl.flock(fd, flag if blocking else flag | fcntl.LOCK_NB)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def dump_spill(path: Path, data: DictData) -> None:
+    """Write the spilled context data to the JSON file. It writes to the
+    temporary file first and replaces the target file, so the reader does not
+    see the partial file.
+
+    Args:
+        path (Path): A spill file path.
+        data (DictData): A context data that want to spill.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp: Path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with tmp.open(mode="w", encoding="utf-8") as f:
+        json.dump(data, f, default=str)
+    os.replace(tmp, path)
+
+
+def load_spill(path: Union[str, Path]) -> DictData:
+    """Load the spilled context data from the JSON file.
+
+    Args:
+        path (str | Path): A spill file path.
+
+    Returns:
+        DictData: A spilled context data.
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
 def filter_func(value: T) -> T:
     """Filter out custom functions from mapping context by replacing with function names.
 
@@ -311,6 +393,232 @@ def filter_func(value: T) -> T:
     return value
 
 
+class LayerContext(dict):
+    """Layer Context object that is a thin copy-on-write layer over a parent
+    context for a nested execution such as a strategy, a branch, or a foreach
+    item.
+
+        The nested execution only writes the top-level keys and the stage ID
+    keys under the `stages` key, so only these two levels get copied. All
+    deeper values, like the upstream `jobs` outputs, are shared by reference
+    with the parent. A template that reads a mutable value that still shares
+    with the parent will get a deep copy of this value instead that keeps on
+    the memo of this layer, so every stage on the same layer sees the same
+    copy and the parent and the other layers never see its mutation.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        parent: Optional[DictData] = None,
+        memo: Optional[dict[int, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.parent: DictData = {} if parent is None else parent
+        self.memo: dict[int, Any] = {} if memo is None else memo
+
+    def __or__(self, other: Any) -> Any:
+        if not isinstance(other, dict):
+            return NotImplemented
+        return LayerContext(
+            dict.__or__(self, other), parent=self.parent, memo=self.memo
+        )
+
+    def __reduce__(self) -> tuple[type, tuple[DictData]]:
+        # NOTE: Pickle to the plain dict that already isolates from the parent
+        #   on the other process, so it does not need to pickle the parent.
+        return dict, (dict(self),)
+
+    def isolate(
+        self, path: tuple[tuple[str, bool, Any], ...], value: Any
+    ) -> Any:
+        """Return a deep copy of a value that get from this layer with the
+        compiled dot path if it is a mutable value that shares with the parent.
+
+        Args:
+            path: A compiled dot path from the `compile_caller` function.
+            value: A value that get from this layer with this path.
+
+        Returns:
+            Any: A value that safe to mutate on this layer.
+        """
+        if not isinstance(value, (dict, list, set)):
+            return value
+
+        node: Any = self.parent
+        for key, _, int_key in path:
+            if not isinstance(node, dict):
+                return value
+            elif key in node:
+                node = node[key]
+            elif isinstance(int_key, int) and int_key in node:
+                node = node[int_key]
+            else:
+                return value
+
+        if node is not value:
+            return value
+
+        # NOTE: Copy from the copy of the parent layer if the parent already
+        #   copied it, so the mutation of the parent layer passes through.
+        if isinstance(self.parent, LayerContext):
+            value = self.parent.memo.get(id(value), value)
+        return copy.deepcopy(value, self.memo)
+
+
+def layer_context(parent: DictData, **values: Any) -> LayerContext:
+    """Make a thin copy-on-write layer over a parent context for a nested
+    execution such as a strategy, a branch, or a foreach item.
+
+        This layer costs O(number of top-level keys and stages) instead of the
+    whole context size that the `copy.deepcopy` function will copy, and it only
+    copies the mutable values that the nested stages read with templates.
+
+    Example:
+        >>> parent = {"jobs": {"first": {"outputs": {}}}, "stages": {}}
+        >>> child = layer_context(parent, item=1)
+        >>> child["stages"]["echo"] = {"outputs": {}}
+        >>> parent["stages"], child["jobs"] is parent["jobs"]
+        ({}, True)
+
+    Args:
+        parent (DictData): A parent context data that read through.
+        values: Any top-level values that want to set on the local layer.
+
+    Returns:
+        LayerContext: A new context data that safe to write with stage
+            outputs.
+    """
+    context: LayerContext = LayerContext(parent, parent=parent)
+    if isinstance(context.get("stages"), dict):
+        context["stages"] = dict(context["stages"])
+    context.update(values)
+    return context
+
+
+class BatchWriter:
+    """Batch Writer object that drain the records from the bounded in-memory
+    queue on the daemon thread and pass them to the write callback in batches.
+
+        The batch will write when the number of pending records reaches
+    `flush_size` or the oldest record waits longer than `flush_interval`
+    seconds. The write callback receives the list of pending records in the
+    put order, and it should handle its own error because the writer thread
+    does not retry the batch.
+
+        If the queue is full, the `block` policy will wait for a free slot, and
+    the `drop` policy will drop the record and count it on the `dropped`
+    attribute.
+
+    Example:
+        >>> batches = []
+        >>> writer = BatchWriter(batches.append, flush_size=2)
+        >>> writer.put(1), writer.put(2), writer.put(3)
+        (True, True, True)
+        >>> writer.close()
+        >>> batches
+        [[1, 2], [3]]
+    """
+
+    def __init__(
+        self,
+        write: Callable[[list[Any]], None],
+        maxsize: int = 10_000,
+        flush_interval: float = 1.0,
+        flush_size: int = 100,
+        policy: Literal["block", "drop"] = "block",
+        name: str = "wf_batch_writer",
+    ) -> None:
+        self.write: Callable[[list[Any]], None] = write
+        self.flush_interval: float = flush_interval
+        self.flush_size: int = max(flush_size, 1)
+        self.policy: str = policy
+        self.dropped: int = 0
+        self.queue: Queue = Queue(maxsize=maxsize)
+        self._lock: Lock = Lock()
+        self._thread: Thread = Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def put(self, record: Any) -> bool:
+        """Put a record to the queue for writing with the next batch.
+
+        Args:
+            record (Any): A record that does not be None or the Event object.
+
+        Returns:
+            bool: False if this record was dropped.
+        """
+        if self.policy != "drop":
+            self.queue.put(record)
+            return True
+
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all records that put before this call were written.
+
+        Args:
+            timeout (float, default None): A maximum waiting second.
+
+        Returns:
+            bool: True if all records were written.
+        """
+        if not self._thread.is_alive():
+            return True
+        done: Event = Event()
+        self.queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Write all pending records and stop the writer thread."""
+        if self._thread.is_alive():
+            self.queue.put(None)
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        """Writer loop that drain the queue until it receives the stop signal."""
+        pending: list[Any] = []
+        deadline: float = 0.0
+        while True:
+            try:
+                item = self.queue.get(
+                    timeout=(
+                        max(deadline - time.monotonic(), 0) if pending else None
+                    )
+                )
+            except Empty:
+                item = Empty
+
+            if (
+                item is not None
+                and item is not Empty
+                and not isinstance(item, Event)
+            ):
+                if not pending:
+                    deadline = time.monotonic() + self.flush_interval
+                pending.append(item)
+                if (
+                    len(pending) < self.flush_size
+                    and time.monotonic() < deadline
+                ):
+                    continue
+
+            if pending:
+                self.write(pending)
+                pending = []
+            if isinstance(item, Event):
+                item.set()
+            elif item is None:
+                return
+
+
 def cross_product(matrix: Matrix) -> Iterator[DictData]:
     """Generate iterator of product values from matrix.
 
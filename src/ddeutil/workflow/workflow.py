@@ -22,19 +22,26 @@ Constants:
     DRYRUN: Dryrun execution for testing workflow loop.
     FORCE: Force execution regardless of conditions
 """
+import asyncio
 import copy
 import time
 import traceback
+from collections import deque
+from collections.abc import Callable, Iterator
 from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
     Future,
     ThreadPoolExecutor,
     as_completed,
+    wait,
 )
 from datetime import datetime
 from pathlib import Path
 from queue import Queue
 from textwrap import dedent
 from threading import Event as ThreadEvent
+from threading import Lock
 from typing import Any, Literal, Optional, Union
 
 from pydantic import BaseModel, Field
@@ -44,7 +51,16 @@ from typing_extensions import Self
 
 from . import DRYRUN
 from .__types import DictData
-from .audits import NORMAL, RERUN, Audit, AuditData, ReleaseType, get_audit
+from .artifacts import get_artifact_store
+from .audits import (
+    NORMAL,
+    RERUN,
+    Audit,
+    AuditData,
+    ReleaseType,
+    get_audit,
+    get_audit_writer,
+)
 from .conf import YamlParser, dynamic
 from .errors import (
     WorkflowCancelError,
@@ -56,6 +72,7 @@ from .errors import (
 from .event import Event
 from .job import Job
 from .params import Param
+from .pool import get_pool
 from .result import (
     CANCEL,
     FAILED,
@@ -69,8 +86,9 @@ from .result import (
     validate_statuses,
 )
 from .reusables import has_template, param2template
-from .traces import Trace, get_trace
+from .traces import Trace, flush_trace, get_trace
 from .utils import (
+    UTC,
     extract_id,
     get_dt_now,
     pop_sys_extras,
@@ -394,6 +412,7 @@ class Workflow(BaseModel):
         timeout: int = 600,
         audit_excluded: Optional[list[str]] = None,
         audit: Audit = None,
+        validate: bool = True,
     ) -> Result:
         """Release the workflow which is executes workflow with writing audit
         log tracking. The method is overriding parameter with the release
@@ -422,6 +441,9 @@ class Workflow(BaseModel):
             timeout: (int) A workflow execution time out in second unit.
             audit_excluded: (list[str]) A list of key that want to exclude
                 from the audit data.
+            validate: (bool) A flag that validate the release datetime with
+                the event schedules. The backfill method disables it because
+                its release datetimes generate from these schedules.
 
         Returns:
             Result: return result object that pass context data from the execute
@@ -449,7 +471,8 @@ class Workflow(BaseModel):
             extras=self.extras,
             pre_process=True,
         )
-        release: datetime = self.on.validate_dt(dt=release)
+        if validate:
+            release: datetime = self.on.validate_dt(dt=release)
         trace.info(f"[RELEASE]: Start {name!r} : {release:%Y-%m-%d %H:%M:%S}")
         values: DictData = param2template(
             params,
@@ -497,28 +520,39 @@ class Workflow(BaseModel):
             run_id=parent_run_id,
             timeout=timeout,
         )
+
+        # NOTE: The execution passes its artifacts to this release, so release
+        #   them here if this release does not have the parent execution that
+        #   will release them.
+        if parent_run_id == run_id:
+            get_artifact_store().release_run(
+                run_id, path=dynamic("artifact_path", extras=self.extras)
+            )
         catch(context, status=rs.status, updated=rs.context)
         trace.info(f"[RELEASE]: End {name!r} : {release:%Y-%m-%d %H:%M:%S}")
         trace.debug(f"[RELEASE]: Writing audit: {name!r}.")
         if release_type != DRYRUN:
-            (
-                audit.save(
-                    data=audit_data
+            audit_data: DictData = audit_data | {
+                "context": context,
+                "runs_metadata": (
+                    (runs_metadata or {})
+                    | context.get("info", {})
                     | {
-                        "context": context,
-                        "runs_metadata": (
-                            (runs_metadata or {})
-                            | context.get("info", {})
-                            | {
-                                "timeout": timeout,
-                                "original_name": self.name,
-                                "audit_excluded": audit_excluded,
-                            }
-                        ),
-                    },
-                    excluded=audit_excluded,
+                        "timeout": timeout,
+                        "original_name": self.name,
+                        "audit_excluded": audit_excluded,
+                    }
+                ),
+            }
+
+            # NOTE: Save the audit on the background audit writer, so the
+            #   backfill of many releases does not wait for each audit write.
+            if dynamic("audit_async", extras=self.extras):
+                get_audit_writer().put(
+                    audit, data=audit_data, excluded=audit_excluded
                 )
-            )
+            else:
+                audit.save(data=audit_data, excluded=audit_excluded)
 
         # NOTE: Pop system extra parameters.
         pop_sys_extras(self.extras, scope="release")
@@ -539,6 +573,200 @@ class Workflow(BaseModel):
             ),
         )
 
+    def backfill(
+        self,
+        start: datetime,
+        end: datetime,
+        params: Optional[DictData] = None,
+        *,
+        max_parallel: int = 1,
+        release_type: ReleaseType = NORMAL,
+        timeout: int = 600,
+        ordered: bool = True,
+        callback: Optional[Callable[[datetime, Result], Any]] = None,
+        report_interval: float = 10.0,
+        audit: Optional[Audit] = None,
+        audit_excluded: Optional[list[str]] = None,
+    ) -> Result:
+        """Backfill this workflow with all release datetimes of its event
+        schedules between the start and end datetimes.
+
+            It generates the release datetimes from the event schedules
+        lazily, filters the release datetimes that already audit with one
+        audit query if the release type is `normal`, and releases the rest of
+        them with the bounded task group of the shared worker pool. The release
+        datetimes do not validate again with the event schedules because they
+        generate from these schedules.
+
+        Args:
+            start (datetime): A start datetime with the inclusive bound.
+            end (datetime): An end datetime with the inclusive bound.
+            params (DictData, default None): A workflow parameter that pass
+                to each release.
+            max_parallel (int, default 1): The maximum releases that run in
+                parallel.
+            release_type (ReleaseType, default NORMAL): A release type.
+            timeout (int, default 600): A timeout in second of each release.
+            ordered (bool, default True): A flag that call the callback and
+                report the releases in the release datetime order instead of
+                the completion order.
+            callback (Callable, default None): A callback function that
+                receive the release datetime and its result when it completes.
+            report_interval (float, default 10.0): The minimum second between
+                two progress reports on the trace log.
+            audit (Audit, default None): An audit model that use to manage
+                release log of this backfill.
+            audit_excluded (list[str], default None): A list of key that want
+                to exclude from the audit data.
+
+        Raises:
+            EventError: If this workflow does not set any event schedule.
+
+        Returns:
+            Result: A result that its context has the list of release reports
+                and the backfill metrics.
+        """
+        audit: Audit = audit or get_audit(extras=self.extras)
+        parent_run_id, run_id = extract_id(self.name, extras=self.extras)
+        trace: Trace = get_trace(
+            run_id,
+            parent_run_id=parent_run_id,
+            extras=self.extras,
+            pre_process=True,
+        )
+        trace.info(
+            f"[BACKFILL]: Start {self.name!r} : {start:%Y-%m-%d %H:%M:%S} to "
+            f"{end:%Y-%m-%d %H:%M:%S} with {max_parallel} parallel releases."
+        )
+        releases: Iterator[datetime] = self.on.generate(start, end)
+        audited: set[datetime] = set()
+        if release_type == NORMAL:
+            # NOTE: The audit keeps the release datetime without timezone.
+            lower, upper = (
+                (dt if dt.tzinfo else dt.replace(tzinfo=UTC))
+                .astimezone(UTC)
+                .replace(tzinfo=None)
+                for dt in (start, end)
+            )
+            audited = audit.find_releases(self.name, start=lower, end=upper)
+            releases = (
+                dt for dt in releases if dt.replace(tzinfo=None) not in audited
+            )
+
+        def release(dt: datetime) -> Result:
+            """Release this workflow with the release datetime on the copied
+            workflow because the release method changes its extras.
+            """
+            workflow: Workflow = self.model_copy(
+                update={"extras": self.extras.copy()}
+            )
+            return workflow.release(
+                dt,
+                params=params or {},
+                release_type=release_type,
+                timeout=timeout,
+                audit=audit,
+                audit_excluded=audit_excluded,
+                validate=False,
+            )
+
+        reports: list[DictData] = []
+        counts: dict[str, int] = {}
+        submitted: deque[datetime] = deque()
+        completed: dict[datetime, Result] = {}
+        pending: dict[Future, datetime] = {}
+        begin: float = time.monotonic()
+        reported: float = begin
+        stop: bool = False
+
+        def report(dt: datetime, rs: Result) -> None:
+            """Count the completed release and call the callback function."""
+            key: str = rs.status.name.lower()
+            counts[key] = counts.get(key, 0) + 1
+            reports.append(
+                {"release": dt, "status": rs.status, "run_id": rs.run_id}
+            )
+            if callback:
+                callback(dt, rs)
+
+        with get_pool().group(max_parallel, level="release") as group:
+            while True:
+                # NOTE: The completed releases that wait for the previous
+                #   releases also count in the window, so the ordered mode
+                #   does not keep unbounded results.
+                while (
+                    not stop
+                    and len(pending) + len(completed) < max_parallel * 2
+                ):
+                    if (dt := next(releases, None)) is None:
+                        stop = True
+                        break
+                    if ordered:
+                        submitted.append(dt)
+                    pending[group.submit(release, dt)] = dt
+                group.run()
+                if not pending:
+                    break
+
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for future in done:
+                    dt: datetime = pending.pop(future)
+                    try:
+                        completed[dt] = future.result()
+                    except Exception as e:
+                        trace.error(
+                            f"[BACKFILL]: Release {dt:%Y-%m-%d %H:%M:%S} "
+                            f"failed with {e.__class__.__name__}: {e}"
+                        )
+                        completed[dt] = Result(
+                            status=FAILED,
+                            context=catch(
+                                {},
+                                status=FAILED,
+                                updated={"errors": to_dict(e)},
+                            ),
+                            parent_run_id=run_id,
+                            extras=self.extras,
+                        )
+
+                # NOTE: Report the completed releases in the release datetime
+                #   order only when all previous releases were completed.
+                if ordered:
+                    while submitted and submitted[0] in completed:
+                        dt: datetime = submitted.popleft()
+                        report(dt, completed.pop(dt))
+                else:
+                    for dt, rs in completed.items():
+                        report(dt, rs)
+                    completed.clear()
+
+                if time.monotonic() - reported >= report_interval:
+                    reported = time.monotonic()
+                    trace.info(
+                        f"[BACKFILL]: Progress {len(reports)} releases, "
+                        f"{counts}, "
+                        f"{len(reports) / (reported - begin):.2f} releases/s."
+                    )
+
+        elapsed: float = time.monotonic() - begin
+        metrics: DictData = {
+            "total": len(reports),
+            "audited": len(audited),
+            **counts,
+            "elapsed": round(elapsed, 4),
+            "throughput": round(len(reports) / elapsed, 4) if elapsed else 0.0,
+        }
+        status: Status = validate_statuses([r["status"] for r in reports])
+        trace.info(f"[BACKFILL]: End {self.name!r} with {metrics}.")
+        return Result.from_trace(trace).catch(
+            status=status,
+            context=catch(
+                {},
+                status=status,
+                updated={"releases": reports, "metrics": metrics},
+            ),
+        )
+
     def process_job(
         self,
         job: Job,
@@ -795,6 +1023,479 @@ class Workflow(BaseModel):
             f"{timeout} seconds."
         )
 
+    def process_event(
+        self,
+        job_ids: list[str],
+        run_id: str,
+        context: DictData,
+        *,
+        parent_run_id: Optional[str] = None,
+        event: Optional[ThreadEvent] = None,
+        timeout: float = 3600,
+        max_job_parallel: int = 2,
+    ) -> Result:
+        """Job process method with the event-driven scheduler mode.
+
+            This method builds the `needs` graph of the target jobs only once,
+        an in-degree counter and a reverse adjacency mapping, and submits each
+        job the moment its last upstream job finishes from the future
+        completion callback. It does not poll the job queue or sleep between
+        job dependency checking like the `process` method.
+
+            A need that does not include in the target job IDs, like a job that
+        already success before the rerun mode, does not count on the in-degree
+        because it already has its result on the context.
+
+        Args:
+            job_ids (list[str]): A list of job ID that want to execute.
+            run_id (str): A running ID.
+            context (DictData): A context data.
+            parent_run_id (str, default None): A parent running ID.
+            event (Event, default None): An Event manager instance that use to
+                cancel this execution if it forces stopped by parent execution.
+            timeout (float, default 3600): A workflow execution time out in
+                second unit.
+            max_job_parallel (int, default 2): The maximum workers that use for
+                job execution in `ThreadPoolExecutor` object.
+
+        Raises:
+            WorkflowCancelError: If the event was set before start execution.
+            WorkflowError: If the job trigger rule validation was failed.
+            WorkflowTimeoutError: If the execution use time more than timeout.
+
+        Returns:
+            Result: A result object of this workflow execution.
+        """
+        ts: float = time.monotonic()
+        trace: Trace = get_trace(
+            run_id, parent_run_id=parent_run_id, extras=self.extras
+        )
+        if event and event.is_set():
+            raise WorkflowCancelError(
+                "Execution was canceled from the event was set "
+                "before workflow execution."
+            )
+
+        # NOTE: Build the needs graph with in-degree counter and reverse
+        #   adjacency only once.
+        targets: set[str] = set(job_ids)
+        in_degree: dict[str, int] = dict.fromkeys(job_ids, 0)
+        downstream: dict[str, list[str]] = {job_id: [] for job_id in job_ids}
+        for job_id in job_ids:
+            for need in self.job(name=job_id).needs:
+                if need in targets:
+                    in_degree[job_id] += 1
+                    downstream[need].append(job_id)
+
+        # NOTE: Force update internal extras for handler circle execution.
+        self.extras.update({"__sys_exec_break_circle": self.name})
+
+        lock: Lock = Lock()
+        finished: ThreadEvent = ThreadEvent()
+        statuses: list[Status] = []
+        futures: list[Future] = []
+        errors: list[WorkflowError] = []
+        remaining: list[int] = [len(job_ids)]
+
+        with ThreadPoolExecutor(max_job_parallel, "wf") as executor:
+
+            def release(job_id: str, status: Status) -> None:
+                """Release the finished job and schedule all downstream jobs
+                that do not have any waiting upstream job.
+                """
+                with lock:
+                    statuses.append(status)
+                    remaining[0] -= 1
+                    ready: list[str] = []
+                    if not errors and not finished.is_set():
+                        for child in downstream[job_id]:
+                            in_degree[child] -= 1
+                            if in_degree[child] == 0:
+                                ready.append(child)
+                    if remaining[0] == 0:
+                        finished.set()
+
+                for child in ready:
+                    schedule(child)
+
+            def fail(job_id: str, e: Exception) -> None:
+                """Record the scheduling error and stop waiting, because the
+                error that raise inside the future callback does not reach
+                the caller thread.
+                """
+                with lock:
+                    errors.append(
+                        e
+                        if isinstance(e, WorkflowError)
+                        else WorkflowError(
+                            f"Schedule job: {job_id!r} was failed with "
+                            f"{e.__class__.__name__}: {e}"
+                        )
+                    )
+                finished.set()
+
+            def done(job_id: str, future: Future) -> None:
+                """Completion callback of the job future.
+
+                    It only keeps the status of the failed future like the
+                `process` method does. The job outputs were already set by the
+                `process_job` method.
+                """
+                try:
+                    if future.cancelled():
+                        release(job_id, CANCEL)
+                    elif e := future.exception():
+                        release(job_id, get_status_from_error(e))
+                    else:
+                        st, _ = future.result()
+                        release(job_id, st)
+                except Exception as e:
+                    fail(job_id, e)
+
+            def schedule(job_id: str) -> None:
+                """Check the job trigger rule and submit it to the executor."""
+                try:
+                    submit(job_id)
+                except Exception as e:
+                    fail(job_id, e)
+
+            def submit(job_id: str) -> None:
+                job: Job = self.job(name=job_id)
+                check: Status = job.check_needs(context["jobs"])
+                if check == FAILED:  # pragma: no cov
+                    raise WorkflowError(
+                        f"Validate job trigger rule was failed with "
+                        f"{job.trigger_rule.value!r}."
+                    )
+                elif check == SKIP:  # pragma: no cov
+                    trace.info(
+                        f"[JOB]: ⏭️ Skip job: {job_id!r} from trigger rule."
+                    )
+                    job.set_outputs(output={"status": SKIP}, to=context)
+                    release(job_id, SKIP)
+                    return
+
+                try:
+                    future: Future = executor.submit(
+                        self.process_job,
+                        job=job,
+                        run_id=run_id,
+                        context=context,
+                        parent_run_id=parent_run_id,
+                        event=event,
+                    )
+                except RuntimeError:  # pragma: no cov
+                    # NOTE: The executor was shutdown after timeout.
+                    return
+
+                with lock:
+                    futures.append(future)
+                future.add_done_callback(lambda f: done(job_id, f))
+
+            if not job_ids:
+                finished.set()
+
+            for job_id in [j for j in job_ids if in_degree[j] == 0]:
+                schedule(job_id)
+
+            not_timeout_flag: bool = finished.wait(
+                timeout=max(timeout - (time.monotonic() - ts), 0)
+            )
+            if not_timeout_flag:
+                if errors:
+                    pop_sys_extras(self.extras)
+                    raise errors[0]
+
+                pop_sys_extras(self.extras)
+                st: Status = validate_statuses(statuses)
+                return Result.from_trace(trace).catch(
+                    status=st, context=catch(context, status=st)
+                )
+
+            if event:
+                event.set()
+
+            with lock:
+                finished.set()
+                pending: list[Future] = futures.copy()
+
+            for future in pending:
+                future.cancel()
+
+            trace.error(
+                (
+                    f"{self.name!r} was timeout because it use exec time more "
+                    f"than {timeout} seconds."
+                ),
+                module="workflow",
+            )
+
+            time.sleep(0.0025)
+
+        pop_sys_extras(self.extras)
+        raise WorkflowTimeoutError(
+            f"{self.name!r} was timeout because it use exec time more than "
+            f"{timeout} seconds."
+        )
+
+    async def aprocess_job(
+        self,
+        job: Job,
+        run_id: str,
+        context: DictData,
+        *,
+        parent_run_id: Optional[str] = None,
+        event: Optional[ThreadEvent] = None,
+        executor: Optional[Executor] = None,
+    ) -> tuple[Status, DictData]:
+        """Async job process that is the async version of the `process_job`
+        method. It awaits the `Job.aexecute` method instead of blocking a
+        thread worker.
+
+        Args:
+            job: (Job) A job model that want to execute.
+            run_id: A running stage ID.
+            context: A context data.
+            parent_run_id: A parent running ID. (Default is None)
+            event: (Event) An Event manager instance that use to cancel this
+                execution if it forces stopped by parent execution.
+            executor: (Executor) A bounded executor that use to offload the
+                blocking stage execution.
+
+        Returns:
+            tuple[Status, DictData]: The pair of status and result context data.
+        """
+        trace: Trace = get_trace(
+            run_id, parent_run_id=parent_run_id, extras=self.extras
+        )
+        if event and event.is_set():
+            error_msg: str = (
+                "Job execution was canceled because the event was set "
+                "before start job execution."
+            )
+            return CANCEL, catch(
+                context=context,
+                status=CANCEL,
+                updated={
+                    "errors": WorkflowCancelError(error_msg).to_dict(),
+                },
+            )
+
+        await trace.ainfo(f"[WORKFLOW]: Execute Job: {job.id!r}")
+        result: Result = await job.aexecute(
+            params=context,
+            run_id=parent_run_id,
+            event=event,
+            executor=executor,
+        )
+        job.set_outputs(result.context, to=context)
+
+        if result.status == FAILED:
+            error_msg: str = f"Job execution, {job.id!r}, was failed."
+            return FAILED, catch(
+                context=context,
+                status=FAILED,
+                updated={
+                    "errors": WorkflowError(error_msg).to_dict(),
+                },
+            )
+
+        elif result.status == CANCEL:
+            error_msg: str = (
+                f"Job execution, {job.id!r}, was canceled from the event after "
+                f"end job execution."
+            )
+            return CANCEL, catch(
+                context=context,
+                status=CANCEL,
+                updated={
+                    "errors": WorkflowCancelError(error_msg).to_dict(),
+                },
+            )
+
+        return result.status, catch(context, status=result.status)
+
+    async def aprocess(
+        self,
+        job_ids: list[str],
+        run_id: str,
+        context: DictData,
+        *,
+        parent_run_id: Optional[str] = None,
+        event: Optional[ThreadEvent] = None,
+        timeout: float = 3600,
+        max_job_parallel: int = 2,
+        executor: Optional[Executor] = None,
+    ) -> Result:
+        """Async job process method that schedules each job as an asyncio task
+        the moment its last upstream job finishes, like the `process_event`
+        method. The `max_job_parallel` value will be a limit of the semaphore
+        instead of the thread workers.
+
+        Args:
+            job_ids (list[str]): A list of job ID that want to execute.
+            run_id (str): A running ID.
+            context (DictData): A context data.
+            parent_run_id (str, default None): A parent running ID.
+            event (Event, default None): An Event manager instance that use to
+                cancel this execution if it forces stopped by parent execution.
+            timeout (float, default 3600): A workflow execution time out in
+                second unit.
+            max_job_parallel (int, default 2): The maximum job tasks that run
+                concurrently.
+            executor (Executor, default None): A bounded executor that use to
+                offload the blocking stage execution.
+
+        Raises:
+            WorkflowCancelError: If the event was set before start execution.
+            WorkflowError: If the job trigger rule validation was failed.
+            WorkflowTimeoutError: If the execution use time more than timeout.
+
+        Returns:
+            Result: A result object of this workflow execution.
+        """
+        trace: Trace = get_trace(
+            run_id, parent_run_id=parent_run_id, extras=self.extras
+        )
+        if event and event.is_set():
+            raise WorkflowCancelError(
+                "Execution was canceled from the event was set "
+                "before workflow execution."
+            )
+
+        # NOTE: Build the needs graph with in-degree counter and reverse
+        #   adjacency only once.
+        targets: set[str] = set(job_ids)
+        in_degree: dict[str, int] = dict.fromkeys(job_ids, 0)
+        downstream: dict[str, list[str]] = {job_id: [] for job_id in job_ids}
+        for job_id in job_ids:
+            for need in self.job(name=job_id).needs:
+                if need in targets:
+                    in_degree[job_id] += 1
+                    downstream[need].append(job_id)
+
+        # NOTE: Force update internal extras for handler circle execution.
+        self.extras.update({"__sys_exec_break_circle": self.name})
+
+        semaphore = asyncio.Semaphore(max_job_parallel)
+        finished = asyncio.Event()
+        statuses: list[Status] = []
+        tasks: list[asyncio.Task] = []
+        errors: list[WorkflowError] = []
+        remaining: list[int] = [len(job_ids)]
+
+        def release(job_id: str, status: Status) -> None:
+            """Release the finished job and schedule all downstream jobs that
+            do not have any waiting upstream job.
+            """
+            statuses.append(status)
+            remaining[0] -= 1
+            if not errors and not finished.is_set():
+                for child in downstream[job_id]:
+                    in_degree[child] -= 1
+                    if in_degree[child] == 0:
+                        schedule(child)
+            if remaining[0] == 0:
+                finished.set()
+
+        async def run(job: Job) -> None:
+            """Run the job process with the semaphore limit."""
+            async with semaphore:
+                try:
+                    st, _ = await self.aprocess_job(
+                        job,
+                        run_id=run_id,
+                        context=context,
+                        parent_run_id=parent_run_id,
+                        event=event,
+                        executor=executor,
+                    )
+                except asyncio.CancelledError:
+                    release(job.id, CANCEL)
+                    raise
+                except Exception as e:
+                    st: Status = get_status_from_error(e)
+            release(job.id, st)
+
+        def fail(job_id: str, e: Exception) -> None:
+            """Record the scheduling error and stop waiting, because the error
+            that raise inside the job task does not reach the main loop.
+            """
+            errors.append(
+                e
+                if isinstance(e, WorkflowError)
+                else WorkflowError(
+                    f"Schedule job: {job_id!r} was failed with "
+                    f"{e.__class__.__name__}: {e}"
+                )
+            )
+            finished.set()
+
+        def schedule(job_id: str) -> None:
+            """Check the job trigger rule and create its task."""
+            try:
+                submit(job_id)
+            except Exception as e:
+                fail(job_id, e)
+
+        def submit(job_id: str) -> None:
+            job: Job = self.job(name=job_id)
+            check: Status = job.check_needs(context["jobs"])
+            if check == FAILED:  # pragma: no cov
+                raise WorkflowError(
+                    f"Validate job trigger rule was failed with "
+                    f"{job.trigger_rule.value!r}."
+                )
+            elif check == SKIP:  # pragma: no cov
+                trace.info(f"[JOB]: ⏭️ Skip job: {job_id!r} from trigger rule.")
+                job.set_outputs(output={"status": SKIP}, to=context)
+                release(job_id, SKIP)
+                return
+
+            tasks.append(asyncio.create_task(run(job)))
+
+        if not job_ids:
+            finished.set()
+
+        for job_id in [j for j in job_ids if in_degree[j] == 0]:
+            schedule(job_id)
+
+        try:
+            await asyncio.wait_for(finished.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            if event:
+                event.set()
+
+            finished.set()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+            await trace.aerror(
+                (
+                    f"{self.name!r} was timeout because it use exec time more "
+                    f"than {timeout} seconds."
+                ),
+                module="workflow",
+            )
+            pop_sys_extras(self.extras)
+            raise WorkflowTimeoutError(
+                f"{self.name!r} was timeout because it use exec time more than "
+                f"{timeout} seconds."
+            ) from None
+
+        pop_sys_extras(self.extras)
+        if errors:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise errors[0]
+
+        st: Status = validate_statuses(statuses)
+        return Result.from_trace(trace).catch(
+            status=st, context=catch(context, status=st)
+        )
+
     def _execute(
         self,
         params: DictData,
@@ -821,11 +1522,22 @@ class Workflow(BaseModel):
                 status=SUCCESS, context=catch(context, status=SUCCESS)
             )
 
+        catch(context, status=WAIT)
+        if dynamic("workflow_scheduler", extras=self.extras) == "event":
+            return self.process_event(
+                list(self.jobs),
+                run_id=trace.run_id,
+                context=context,
+                parent_run_id=trace.parent_run_id,
+                event=event,
+                timeout=timeout,
+                max_job_parallel=max_job_parallel,
+            )
+
         job_queue: Queue[str] = Queue()
         for job_id in self.jobs:
             job_queue.put(job_id)
 
-        catch(context, status=WAIT)
         return self.process(
             job_queue,
             run_id=trace.run_id,
@@ -883,23 +1595,29 @@ class Workflow(BaseModel):
             }
         )
 
-        total_job: int = 0
-        job_queue: Queue[str] = Queue()
-        for job_id in self.jobs:
-
-            if job_id in context["jobs"]:
-                continue
-
-            job_queue.put(job_id)
-            total_job += 1
-
-        if total_job == 0:
+        job_ids: list[str] = [j for j in self.jobs if j not in context["jobs"]]
+        if len(job_ids) == 0:
             raise WorkflowSkipError(
                 "It does not have job to rerun. it will change "
                 "status to skip."
             )
 
         catch(context, status=WAIT)
+        if dynamic("workflow_scheduler", extras=self.extras) == "event":
+            return self.process_event(
+                job_ids,
+                run_id=trace.run_id,
+                context=context,
+                parent_run_id=trace.parent_run_id,
+                event=event,
+                timeout=timeout,
+                max_job_parallel=max_job_parallel,
+            )
+
+        job_queue: Queue[str] = Queue()
+        for job_id in job_ids:
+            job_queue.put(job_id)
+
         return self.process(
             job_queue,
             run_id=trace.run_id,
@@ -908,7 +1626,7 @@ class Workflow(BaseModel):
             event=event,
             timeout=timeout,
             max_job_parallel=max_job_parallel,
-            total_job=total_job,
+            total_job=len(job_ids),
         )
 
     def execute(
@@ -1050,6 +1768,137 @@ class Workflow(BaseModel):
                     "exec_latency": round(time.monotonic() - ts, 6),
                 }
             )
+            # NOTE: Release the artifacts that this execution owns, or pass
+            #   them to the parent execution if it was triggered.
+            get_artifact_store().release_run(
+                trace.run_id,
+                trace.parent_run_id,
+                path=dynamic("artifact_path", extras=self.extras),
+            )
+            flush_trace()
+
+    async def aexecute(
+        self,
+        params: DictData,
+        *,
+        run_id: Optional[str] = None,
+        event: Optional[ThreadEvent] = None,
+        timeout: float = 3600,
+        max_job_parallel: int = 2,
+        max_workers: int = 8,
+    ) -> Result:
+        """Async execute workflow with passing a dynamic parameters to all jobs
+        that included in this workflow model with `jobs` field.
+
+            This method is the async version of the `execute` method. It runs
+        the jobs, matrix strategies, and stages as the asyncio tasks, so one
+        process can drive many IO-bound stages concurrently. The blocking
+        stages that are not async native will offload to the bounded thread
+        executor that create with `max_workers` value.
+
+        Args:
+            params (DictData): A parameter data that will parameterize before
+                execution.
+            run_id (str, default None): A workflow running ID.
+            event (Event, default None): An Event manager instance that use to
+                cancel this execution if it forces stopped by parent execution.
+            timeout (float, default 3600): A workflow execution time out in
+                second unit.
+            max_job_parallel (int, default 2) The maximum job tasks that run
+                concurrently.
+            max_workers (int, default 8): The maximum thread workers of the
+                executor that use to offload the blocking stages.
+
+        Returns
+            Result: Return Result object that create from execution context.
+        """
+        ts: float = time.monotonic()
+        parent_run_id, run_id = extract_id(
+            self.name, run_id=run_id, extras=self.extras
+        )
+        trace: Trace = get_trace(
+            run_id,
+            parent_run_id=parent_run_id,
+            extras=self.extras,
+            pre_process=True,
+        )
+        context: DictData = {
+            "jobs": {},
+            "status": WAIT,
+            "info": {"exec_start": get_dt_now()},
+        }
+        event: ThreadEvent = event or ThreadEvent()
+        max_job_parallel: int = dynamic(
+            "max_job_parallel", f=max_job_parallel, extras=self.extras
+        )
+        executor = ThreadPoolExecutor(max_workers, "wf_async")
+        try:
+            context.update(
+                {"jobs": {}, "info": {"exec_start": get_dt_now()}}
+                | self.parameterize(params)
+            )
+            await trace.ainfo(
+                f"[WORKFLOW]: Async Execute: {self.name!r} ("
+                f"{'parallel' if max_job_parallel > 1 else 'sequential'} jobs)"
+            )
+            if not self.jobs:
+                await trace.awarning(
+                    f"[WORKFLOW]: {self.name!r} does not set jobs"
+                )
+                return Result.from_trace(trace).catch(
+                    status=SUCCESS, context=catch(context, status=SUCCESS)
+                )
+
+            catch(context, status=WAIT)
+            return await self.aprocess(
+                list(self.jobs),
+                run_id=trace.run_id,
+                context=context,
+                parent_run_id=trace.parent_run_id,
+                event=event,
+                timeout=timeout,
+                max_job_parallel=max_job_parallel,
+                executor=executor,
+            )
+        except WorkflowError as e:
+            updated = {"errors": e.to_dict()}
+            if isinstance(e, WorkflowSkipError):
+                await trace.aerror(f"⏭️ Skip: {e}", module="workflow")
+                updated = None
+            else:
+                await trace.aerror(
+                    f"📢 Workflow Failed:||{e}", module="workflow"
+                )
+
+            st: Status = get_status_from_error(e)
+            return Result.from_trace(trace).catch(
+                status=st, context=catch(context, status=st, updated=updated)
+            )
+        except Exception as e:
+            await trace.aerror(
+                f"💥 Error Failed:||🚨 {traceback.format_exc()}||",
+                module="workflow",
+            )
+            return Result.from_trace(trace).catch(
+                status=FAILED,
+                context=catch(
+                    context, status=FAILED, updated={"errors": to_dict(e)}
+                ),
+            )
+        finally:
+            executor.shutdown(wait=False)
+            context["info"].update(
+                {
+                    "exec_end": get_dt_now(),
+                    "exec_latency": round(time.monotonic() - ts, 6),
+                }
+            )
+            get_artifact_store().release_run(
+                trace.run_id,
+                trace.parent_run_id,
+                path=dynamic("artifact_path", extras=self.extras),
+            )
+            await asyncio.to_thread(flush_trace)
 
     def rerun(
         self,
@@ -1,5 +1,9 @@
+import shutil
+import time
+from threading import Event, Timer
+
 import pytest
-from ddeutil.workflow import FAILED, SUCCESS, Result
+from ddeutil.workflow import CANCEL, FAILED, SUCCESS, Result
 from ddeutil.workflow.stages import BashStage
 
 from ..utils import exclude_info
@@ -180,3 +184,92 @@ async def test_bash_stage_axec_raise():
             ),
         },
     }
+
+
+def test_bash_stage_exec_stream(test_path):
+    path = test_path / "trace-bash-stream"
+    stage: BashStage = BashStage(
+        name="Bash Stage",
+        bash="for i in $(seq 1 10); do echo \"line $i\"; done; echo 'warn' >&2",
+        extras={
+            "stage_bash_stream": True,
+            "stage_bash_buffer_lines": 2,
+            "stage_bash_batch_lines": 3,
+            "trace_handlers": [{"type": "file", "path": str(path)}],
+        },
+    )
+    try:
+        rs: Result = stage.execute({}, run_id="01")
+        assert rs.status == SUCCESS
+        assert exclude_info(rs.context) == {
+            "status": SUCCESS,
+            "return_code": 0,
+            "stdout": (
+                "line 1\nline 2\n... (6 lines truncated) ...\nline 9\nline 10"
+            ),
+            "stderr": "warn",
+        }
+        spill = path / "run_id=01"
+        stdout = next(spill.glob("bash-*.stdout.txt"))
+        assert stdout.read_text().count("\n") == 10
+        assert next(spill.glob("bash-*.stderr.txt")).read_text() == "warn\n"
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def test_bash_stage_exec_stream_cancel():
+    event = Event()
+    stage: BashStage = BashStage(
+        name="Bash Stage",
+        bash="echo 'start'; sleep 30; echo 'end'",
+        extras={"stage_bash_stream": True},
+    )
+    Timer(0.5, event.set).start()
+    start: float = time.monotonic()
+    rs: Result = stage.execute({}, event=event)
+    assert time.monotonic() - start < 10
+    assert rs.status == CANCEL
+
+
+@pytest.mark.asyncio
+async def test_bash_stage_axec_stream():
+    stage: BashStage = BashStage(
+        name="Bash Stage",
+        bash='echo "Hello World";\necho "Foo" >&2',
+        extras={"stage_bash_stream": True},
+    )
+    rs: Result = await stage.axecute({})
+    assert rs.status == SUCCESS
+    assert exclude_info(rs.context) == {
+        "status": SUCCESS,
+        "return_code": 0,
+        "stdout": "Hello World",
+        "stderr": "Foo",
+    }
+
+
+def test_bash_stage_exec_pool():
+    stage: BashStage = BashStage(
+        name="Bash Stage",
+        bash='echo "ENV $$FOO"; export BAR="bar"; cd /; echo "warn" >&2',
+        env={"FOO": "Bar"},
+        extras={"stage_bash_pool": True},
+    )
+    for _ in range(3):
+        rs: Result = stage.execute({})
+        assert rs.status == SUCCESS
+        assert exclude_info(rs.context) == {
+            "status": SUCCESS,
+            "return_code": 0,
+            "stdout": "ENV Bar",
+            "stderr": "warn",
+        }
+
+    stage: BashStage = BashStage(
+        name="Bash Stage",
+        bash='echo "BAR=$BAR"; pwd; exit 1',
+        extras={"stage_bash_pool": True},
+    )
+    rs: Result = stage.execute({})
+    assert rs.status == FAILED
+    assert rs.context["errors"]["name"] == "StageError"
@@ -1,7 +1,9 @@
 from threading import Event
+from unittest import mock
 
 import pytest
 from ddeutil.workflow import CANCEL, FAILED, SUCCESS, Result
+from ddeutil.workflow.pool import WorkerPool
 from ddeutil.workflow.stages import CallStage, Stage
 from pydantic import ValidationError
 
@@ -108,6 +110,39 @@ def test_call_stage():
     assert empty_stage.sleep == 0.35
 
 
+def test_call_stage_exec_compiled_args():
+    stage: Stage = CallStage.model_validate(
+        obj={
+            "name": "Extract & Load Local System",
+            "id": "second-job",
+            "uses": "tasks/simple-task@demo",
+            "with": {
+                "source": "${{ params.source }}",
+                "sink": "sink",
+                "conversion": {"id": ["int", "${{ params.nullable }}"]},
+            },
+        }
+    )
+    rs: Result = stage.execute({"params": {"source": "src", "nullable": 1}})
+    assert rs.status == SUCCESS
+
+    # NOTE: The next execution should render the compiled args that keep on
+    #   this stage without walking and compiling the raw value again.
+    with mock.patch(
+        "ddeutil.workflow.stages.param2template",
+        side_effect=AssertionError("Walk the raw value."),
+    ):
+        with mock.patch(
+            "ddeutil.workflow.reusables.compile_str",
+            side_effect=AssertionError("Compile the template string."),
+        ):
+            rs: Result = stage.execute(
+                {"params": {"source": "other", "nullable": 2}}
+            )
+    assert rs.status == SUCCESS
+    assert exclude_info(rs.context) == {"records": 1, "status": SUCCESS}
+
+
 def test_call_stage_exec():
     stage: Stage = CallStage.model_validate(
         obj={
@@ -283,7 +318,15 @@ async def test_call_stage_axec():
             "with": {"source": "src", "sink": "sink"},
         }
     )
-    rs: Result = await stage.axecute({})
+    # NOTE: The sync caller function runs on the shared bounded pool.
+    pool = WorkerPool(1)
+    with mock.patch("ddeutil.workflow.stages.get_pool", return_value=pool):
+        with mock.patch.object(
+            pool.executor, "submit", wraps=pool.executor.submit
+        ) as submit:
+            rs: Result = await stage.axecute({})
+    pool.executor.shutdown()
+    assert submit.call_count == 1
     assert rs.status == SUCCESS
     assert exclude_info(rs.context) == {"records": 1, "status": SUCCESS}
 
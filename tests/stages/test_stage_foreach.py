@@ -1,14 +1,18 @@
 from threading import Event
 
+import pytest
 from ddeutil.workflow import (
     CANCEL,
     FAILED,
     SKIP,
     SUCCESS,
+    DictData,
     Result,
     Workflow,
 )
+from ddeutil.workflow.reusables import param2template
 from ddeutil.workflow.stages import ForEachStage, Stage
+from pydantic import ValidationError
 
 from ..utils import MockEvent, dump_yaml_context, exclude_info
 
@@ -1038,3 +1042,226 @@ def test_foreach_stage_exec_concurrent_raise():
             break
         except AssertionError:
             pass
+
+
+def test_foreach_stage_exec_chunk():
+    stage: Stage = ForEachStage.model_validate(
+        {
+            "name": "Start run for-each stage with chunk",
+            "id": "foreach-stage",
+            "foreach": [1, 2, 3, 4, 5],
+            "chunk-size": 2,
+            "concurrent": 2,
+            "stages": [
+                {
+                    "name": "Sum Items",
+                    "id": "sum",
+                    "run": "total = sum(${{ items }})",
+                },
+            ],
+        }
+    )
+    rs: Result = stage.execute({})
+    assert rs.status == SUCCESS
+    assert rs.context["items"] == [1, 2, 3, 4, 5]
+    assert {
+        k: (v["items"], v["stages"]["sum"]["outputs"]["total"])
+        for k, v in rs.context["foreach"].items()
+    } == {0: ([1, 2], 3), 1: ([3, 4], 7), 2: ([5], 5)}
+
+
+def test_foreach_stage_exec_isolate_mutable_params():
+    stage: Stage = ForEachStage.model_validate(
+        {
+            "name": "Start run for-each stage with mutable params",
+            "id": "foreach-stage",
+            "foreach": [1, 2, 3],
+            "concurrent": 3,
+            "stages": [
+                {
+                    "name": "Append Item",
+                    "id": "append",
+                    "vars": {"acc": "${{ params.acc }}", "it": "${{ item }}"},
+                    "run": "acc.append(it); n = len(acc)",
+                },
+                {
+                    "name": "Count Items",
+                    "id": "count",
+                    "vars": {"acc": "${{ params.acc }}"},
+                    "run": "n = len(acc)",
+                },
+            ],
+        }
+    )
+    params: DictData = {"params": {"acc": []}}
+    rs: Result = stage.execute(params)
+    assert rs.status == SUCCESS
+
+    # NOTE: The stages on the same item share the mutation, but the other
+    #   items and the caller params do not see it.
+    assert {
+        k: (
+            v["stages"]["append"]["outputs"]["n"],
+            v["stages"]["count"]["outputs"]["n"],
+        )
+        for k, v in rs.context["foreach"].items()
+    } == {1: (1, 1), 2: (1, 1), 3: (1, 1)}
+    assert params == {"params": {"acc": []}}
+
+
+def test_foreach_stage_exec_lazy_file(test_path):
+    path = test_path / "tmp-foreach-items.txt"
+    path.write_text("a\n\nb\nc\n")
+    try:
+        stage: Stage = ForEachStage.model_validate(
+            {
+                "name": "Start run for-each stage from file",
+                "id": "foreach-stage",
+                "foreach": {"file": str(path)},
+                "chunk-size": 2,
+                "stages": [
+                    {
+                        "name": "Echo Items",
+                        "id": "echo",
+                        "run": "size = len(${{ items }})",
+                    },
+                ],
+            }
+        )
+        rs: Result = stage.execute({})
+    finally:
+        path.unlink()
+
+    assert rs.status == SUCCESS
+    assert "items" not in rs.context
+    assert {
+        k: (v["items"], v["stages"]["echo"]["outputs"]["size"])
+        for k, v in rs.context["foreach"].items()
+    } == {0: (["a", "b"], 2), 1: (["c"], 1)}
+
+
+def test_foreach_stage_exec_lazy_caller():
+    stage: Stage = ForEachStage.model_validate(
+        {
+            "name": "Start run for-each stage from caller",
+            "id": "foreach-stage",
+            "foreach": {
+                "uses": "tasks/gen-items@demo",
+                "with": {"size": "${{ params.size }}"},
+            },
+            "concurrent": 2,
+            "stages": [{"name": "Echo Item", "echo": "${{ item }}"}],
+        }
+    )
+    rs: Result = stage.execute({"params": {"size": 3}})
+    assert rs.status == SUCCESS
+    assert {k: v["item"] for k, v in rs.context["foreach"].items()} == {
+        0: 1,
+        1: 2,
+        2: 3,
+    }
+
+    stage: Stage = ForEachStage.model_validate(
+        {
+            "name": "Start run for-each stage from caller",
+            "foreach": {"uses": "tasks/get-items@demo"},
+            "stages": [{"name": "Echo Item", "echo": "${{ item }}"}],
+        }
+    )
+    rs: Result = stage.execute({})
+    assert rs.status == FAILED
+
+
+def test_foreach_stage_exec_lazy_fail_fast():
+    generated: list[int] = []
+
+    def source():
+        for i in range(1_000):
+            generated.append(i)
+            yield i
+
+    stage: Stage = ForEachStage.model_validate(
+        {
+            "name": "Start run for-each stage with raise",
+            "foreach": {"uses": "tasks/gen-items@demo"},
+            "concurrent": 2,
+            "stages": [
+                {
+                    "name": "Raise",
+                    "if": "${{ item }} == 1",
+                    "raise": "Raise with item ${{ item }}",
+                },
+            ],
+        }
+    )
+    object.__setattr__(stage, "make_source", lambda _: source())
+    rs: Result = stage.execute({})
+    assert rs.status == FAILED
+    assert len(generated) < 1_000
+
+
+def test_foreach_stage_exec_output_policy(tmp_path):
+    data = {
+        "name": "Start run for-each stage with output policy",
+        "id": "foreach-stage",
+        "foreach": [1, 2, 3],
+        "stages": [
+            {
+                "name": "Double",
+                "id": "double",
+                "run": "x = ${{ item }} * 2",
+            },
+        ],
+    }
+    stage: Stage = ForEachStage.model_validate(data | {"output": "status"})
+    rs: Result = stage.execute({})
+    assert rs.status == SUCCESS
+    assert rs.context["foreach"] == {
+        1: {"status": SUCCESS, "item": 1},
+        2: {"status": SUCCESS, "item": 2},
+        3: {"status": SUCCESS, "item": 3},
+    }
+
+    stage: Stage = ForEachStage.model_validate(
+        data
+        | {
+            "output": {
+                "mode": "reduce",
+                "reducer": "sum",
+                "path": "stages.double.outputs.x",
+            },
+        }
+    )
+    rs: Result = stage.execute({})
+    assert rs.status == SUCCESS
+    assert rs.context["reduced"] == 12
+    assert rs.context["foreach"][1] == {"status": SUCCESS, "item": 1}
+
+    stage: Stage = ForEachStage.model_validate(
+        data | {"output": "spill", "extras": {"stage_spill_path": tmp_path}}
+    )
+    rs: Result = stage.execute({})
+    assert rs.status == SUCCESS
+    assert "stages" not in rs.context["foreach"][2]
+    assert rs.context["foreach"][2]["spill"].startswith(str(tmp_path))
+
+    output: DictData = stage.set_outputs(rs.context, to={})
+    assert (
+        param2template(
+            "${{ stages.foreach-stage.outputs.foreach.2.stages.double.outputs.x }}",
+            params=output,
+        )
+        == 4
+    )
+
+
+def test_foreach_stage_output_policy_raise():
+    with pytest.raises(ValidationError):
+        ForEachStage.model_validate(
+            {
+                "name": "Foreach with not valid reducer",
+                "foreach": [1, 2],
+                "output": {"mode": "reduce", "reducer": "not-exists"},
+                "stages": [],
+            }
+        )
@@ -112,13 +112,13 @@ def test_parallel_stage_exec_max_workers():
         },
     }
 
-    rs: Result = stage.execute(params={"max-workers": 100})
+    rs: Result = stage.execute(params={"max-workers": 0})
     assert rs.status == FAILED
     assert exclude_info(rs.context) == {
         "status": FAILED,
         "errors": {
             "name": "ValueError",
-            "message": "A max-workers value should between 1 and 19.",
+            "message": "A max-workers value should gather than 0.",
         },
     }
 
@@ -357,3 +357,69 @@ def test_parallel_stage_exec_raise():
             }
         },
     }
+
+
+def test_parallel_stage_exec_output_policy():
+    stage: Stage = ParallelStage.model_validate(
+        {
+            "id": "parallel-stage",
+            "name": "Start run parallel stage with output policy",
+            "parallel": {
+                "branch01": [
+                    {"name": "Set X", "id": "set-x", "run": "x = 1"},
+                ],
+                "branch02": [
+                    {"name": "Set X", "id": "set-x", "run": "x = 2"},
+                ],
+            },
+            "output": {
+                "mode": "reduce",
+                "reducer": "collect",
+                "path": "stages.set-x.outputs.x",
+            },
+        }
+    )
+    rs: Result = stage.execute({})
+    assert rs.status == SUCCESS
+    assert sorted(rs.context["reduced"]) == [1, 2]
+    assert rs.context["parallel"] == {
+        "branch01": {"status": SUCCESS, "branch": "branch01"},
+        "branch02": {"status": SUCCESS, "branch": "branch02"},
+    }
+
+
+def test_parallel_stage_exec_isolate_mutable_params():
+    stage: Stage = ParallelStage.model_validate(
+        {
+            "id": "parallel-stage",
+            "name": "Start run parallel stage with mutable params",
+            "parallel": {
+                "branch01": [
+                    {
+                        "name": "Append Branch",
+                        "id": "append",
+                        "vars": {"acc": "${{ params.acc }}"},
+                        "run": "acc.append('${{ branch }}'); n = len(acc)",
+                    },
+                ],
+                "branch02": [
+                    {
+                        "name": "Append Branch",
+                        "id": "append",
+                        "vars": {"acc": "${{ params.acc }}"},
+                        "run": "acc.append('${{ branch }}'); n = len(acc)",
+                    },
+                ],
+            },
+            "output": {
+                "mode": "reduce",
+                "reducer": "collect",
+                "path": "stages.append.outputs.n",
+            },
+        }
+    )
+    params = {"params": {"acc": ["start"]}}
+    rs: Result = stage.execute(params)
+    assert rs.status == SUCCESS
+    assert rs.context["reduced"] == [2, 2]
+    assert params == {"params": {"acc": ["start"]}}
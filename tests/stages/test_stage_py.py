@@ -2,7 +2,7 @@ from inspect import isfunction
 
 import pytest
 from ddeutil.workflow import FAILED, SUCCESS, Result, Workflow
-from ddeutil.workflow.stages import PyStage, Stage
+from ddeutil.workflow.stages import PyStage, Stage, compile_py
 
 from ..utils import exclude_info
 
@@ -91,6 +91,42 @@ def test_py_stage_exec_create_func():
     )
 
 
+def test_py_stage_exec_compile_cache():
+    compile_py.cache_clear()
+    stage: PyStage = PyStage(
+        name="Compile Once",
+        id="compile-once",
+        vars={"x": "${{ params.x }}"},
+        run="y: int = x + 1\nhas_os: bool = 'os' in globals()",
+    )
+    for x in range(3):
+        rs: Result = stage.execute(params={"params": {"x": x}})
+        assert rs.status == SUCCESS
+        assert exclude_info(rs.context) == {
+            "status": SUCCESS,
+            "locals": {"y": x + 1, "has_os": False},
+            "globals": {},
+        }
+
+    info = compile_py.cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+
+
+def test_py_stage_exec_static_vars_do_not_leak():
+    stage: PyStage = PyStage(
+        name="Static Vars",
+        id="static-vars",
+        vars={"items": []},
+        run="items.append(1)\nn: int = len(items)",
+    )
+    for _ in range(3):
+        rs: Result = stage.execute(params={})
+        assert rs.status == SUCCESS
+        assert rs.context["locals"]["n"] == 1
+    assert stage.vars == {"items": []}
+
+
 def test_py_stage_exec_create_object():
     workflow: Workflow = Workflow.from_conf(name="wf-run-python-filter")
     stage: Stage = workflow.job("create-job").stage(stage_id="create-stage")
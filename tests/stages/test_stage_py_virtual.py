@@ -1,4 +1,10 @@
+import os
+import shutil
+import sys
+from pathlib import Path
+
 from ddeutil.workflow import SUCCESS, Result, Stage, StageError, Workflow
+from ddeutil.workflow.stages import VenvCache, VirtualPyStage
 
 from ..utils import dump_yaml_context, exclude_info
 
@@ -50,3 +56,69 @@ def test_stage_py_virtual(test_path):
             print(e)
         except Exception as e:
             print(e)
+
+
+def fake_builder(path: Path, version: str, deps: list[str]) -> None:
+    (path / "bin").mkdir(parents=True)
+    os.symlink(sys.executable, path / "bin" / "python")
+    (path / "deps.txt").write_text(",".join(deps))
+
+
+def test_venv_cache_key():
+    assert VenvCache.normalize(["Foo_Bar >= 1.0", "numpy", "foo-bar>=1.0"]) == [
+        "foo-bar>=1.0",
+        "numpy",
+    ]
+    assert VenvCache.key(["numpy", "Pandas"], "3.11") == VenvCache.key(
+        ["pandas", "numpy"], "3.11"
+    )
+    assert VenvCache.key(["numpy"], "3.11") != VenvCache.key(["numpy"], "3.12")
+
+
+def test_venv_cache_reuse_and_evict(test_path):
+    path: Path = test_path / "venv-cache"
+    builds: list[list[str]] = []
+
+    def builder(p: Path, version: str, deps: list[str]) -> None:
+        builds.append(deps)
+        fake_builder(p, version, deps)
+
+    cache = VenvCache(path, max_size=2, builder=builder)
+    try:
+        with cache.get(["numpy"], "3.11") as venv:
+            assert (venv / "deps.txt").read_text() == "numpy"
+        with cache.get(["NumPy "], "3.11") as venv_again:
+            assert venv_again == venv
+        assert builds == [["numpy"]]
+
+        with cache.get(["pandas"], "3.11"):
+            pass
+        with cache.get(["polars"], "3.11"):
+            pass
+        assert len(builds) == 3
+        assert not venv.exists()
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def test_stage_py_virtual_cached_env(test_path):
+    path: Path = test_path / "venv-cache-stage"
+    stage = VirtualPyStage(
+        name="Run on the cached virtual env",
+        deps=[],
+        vars={"x": "${{ params.x }}"},
+        run="print(x * 2)",
+        extras={"stage_venv_cache_path": path},
+    )
+    try:
+        with VenvCache(path, max_size=8, builder=fake_builder).get(
+            [], stage.version
+        ):
+            pass
+
+        rs: Result = stage.execute(params={"params": {"x": 21}})
+        assert rs.status == SUCCESS
+        assert exclude_info(rs.context)["stdout"] == "42"
+        assert not list(Path(".").glob("*.py"))
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
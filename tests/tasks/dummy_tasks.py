@@ -10,6 +10,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+from ddeutil.workflow.artifacts import artifact
 from ddeutil.workflow.result import Result
 from ddeutil.workflow.reusables import tag
 from pydantic import BaseModel
@@ -107,6 +108,19 @@ def get_items_2():
     return {"items": [1, 2, 3, 4]}
 
 
+@tag("demo", alias="make-artifact")
+def make_artifact(size: int = 3, shared: bool = False):
+    return {
+        "values": artifact(bytearray(range(size)), shared=shared),
+        "size": size,
+    }
+
+
+@tag("demo", alias="gen-items")
+def gen_items(size: int = 4):
+    yield from range(1, size + 1)
+
+
 class MockModel(BaseModel):  # pragma: no cov
     name: str
     data: dict[str, Any]
@@ -1,10 +1,14 @@
-from datetime import datetime
+import random
+from datetime import datetime, timedelta, timezone
 from functools import partial
+from typing import Optional, Union
 from zoneinfo import ZoneInfo
 
 import pytest
+from ddeutil.core.dtutils import next_date, replace_date
 from ddeutil.workflow.__cron import (
     CRON_UNITS,
+    WEEKDAYS,
     CronJob,
     CronJobYear,
     CronPart,
@@ -213,3 +217,242 @@ def test_cron_year_next_year_raise():
     )
     with pytest.raises(YearReachLimit):
         _ = sch.next
+
+
+def legacy_find_date(
+    cron: Union[CronJob, CronJobYear], date: datetime, reverse: bool = False
+) -> Optional[datetime]:
+    """The previous implementation of the runner that shifts the date by one
+    unit of each mode until it matches with the cronjob. It returns None if it
+    can not find the matching date.
+    """
+    is_year: bool = isinstance(cron, CronJobYear)
+    switch: dict[str, str] = {
+        "year": "year",
+        "month": "year",
+        "day": "month",
+        "hour": "day",
+        "minute": "hour",
+    }
+
+    def shift(mode: str) -> bool:
+        nonlocal date
+        current_value: int = getattr(date, switch[mode])
+        if not is_year and mode == "year":
+            return False
+        while not cron.check(date, mode) or (
+            mode == "day"
+            and WEEKDAYS.get(date.strftime("%a")) not in cron.dow.values
+        ):
+            if mode == "year" and date.year > max(cron.year.values):
+                raise YearReachLimit(date.year)
+            date = next_date(date, mode, reverse=reverse)
+            date = replace_date(date, mode, reverse=reverse)
+            date = date.replace(second=0, microsecond=0)
+            if current_value != getattr(date, switch[mode]):
+                return mode != "month"
+        return False
+
+    for _ in range(100 if is_year else 25):
+        if all(
+            not shift(mode)
+            for mode in ("year", "month", "day", "hour", "minute")
+        ):
+            return date
+    return None
+
+
+def random_cron(rnd: random.Random, year: bool = False) -> str:
+    def part(lo: int, hi: int) -> str:
+        choice: int = rnd.randrange(6)
+        if choice == 0:
+            return "*"
+        elif choice == 1:
+            return f"*/{rnd.randint(2, max(2, hi - lo))}"
+        elif choice == 2:
+            start: int = rnd.randint(lo, hi)
+            return f"{start}-{rnd.randint(start, hi)}"
+        return ",".join(
+            str(v) for v in rnd.sample(range(lo, hi + 1), rnd.randint(1, 3))
+        )
+
+    value: str = " ".join(
+        part(lo, hi) for lo, hi in ((0, 59), (0, 23), (1, 31), (1, 12), (0, 6))
+    )
+    return f"{value} {part(2020, 2030)}" if year else value
+
+
+def matches(cron: CronJob, dt: datetime) -> bool:
+    modes: list[str] = ["minute", "hour", "day", "month"]
+    if isinstance(cron, CronJobYear):
+        modes.append("year")
+    return all(
+        cron.check(dt, mode) or not getattr(cron, mode).values for mode in modes
+    ) and (
+        WEEKDAYS[dt.strftime("%a")] in cron.dow.values or not cron.dow.values
+    )
+
+
+def exists(dt: datetime) -> bool:
+    return dt.astimezone(timezone.utc).astimezone(dt.tzinfo).replace(
+        tzinfo=None
+    ) == dt.replace(tzinfo=None)
+
+
+def after_gap(dt: datetime) -> datetime:
+    while not exists(dt):
+        dt = dt + timedelta(minutes=1)
+    return dt
+
+
+def is_valid(cron: CronJob, dt: datetime) -> bool:
+    """Return True if the datetime exists and matches with the cronjob, or it
+    is the first time after the DST gap that a matching time moved to.
+    """
+    return exists(dt) and (
+        matches(cron, dt) or not exists(dt - timedelta(minutes=1))
+    )
+
+
+def assert_matches_legacy(
+    cron: CronJob, start: datetime, reverse: bool, steps: int = 5
+) -> None:
+    runner = cron.schedule(start)
+    date: datetime = runner.date
+    for i in range(steps):
+        try:
+            new = runner.prev if reverse else runner.next
+        except (YearReachLimit, RecursionError):
+            new = None
+
+        if new is not None:
+            assert is_valid(cron, new), (str(cron), start, new)
+
+        if reverse:
+            date -= timedelta(minutes=1)
+        elif i > 0:
+            date += timedelta(minutes=1)
+        try:
+            old = legacy_find_date(cron, date, reverse=reverse)
+        except YearReachLimit:
+            old = None
+        if old is None or not matches(cron, old):
+            break
+
+        # NOTE: The legacy result can be the non-exist time on the DST gap,
+        #   it should move to the first time after this gap.
+        if not exists(old):
+            if not reverse:
+                assert new == after_gap(old), (str(cron), start, reverse)
+            break
+
+        # NOTE: The legacy shifting can skip a valid time on the reverse, so
+        #   the new result may be the closer valid time.
+        assert new == old or (
+            new is not None and reverse and date > new > old
+        ), (str(cron), start, reverse)
+        date = new
+
+
+@pytest.mark.parametrize("seed", range(2))
+@pytest.mark.parametrize("tz", ["UTC", "America/New_York", "Europe/London"])
+def test_cron_runner_matches_legacy(seed, tz):
+    rnd = random.Random(f"{seed}-{tz}")
+    zone = ZoneInfo(tz)
+    for _ in range(100):
+        is_year: bool = rnd.random() < 0.2
+        cron = (CronJobYear if is_year else CronJob)(random_cron(rnd, is_year))
+        start = datetime(2020, 1, 1, tzinfo=zone) + timedelta(
+            minutes=rnd.randrange(10 * 366 * 24 * 60)
+        )
+        for reverse in (False, True):
+            assert_matches_legacy(cron, start, reverse)
+
+
+@pytest.mark.parametrize(
+    "tz,gap",
+    [
+        ("America/New_York", datetime(2024, 3, 10)),
+        ("Europe/London", datetime(2024, 3, 31)),
+    ],
+)
+def test_cron_runner_matches_legacy_dst_gap(tz, gap):
+    rnd = random.Random(f"{tz}-gap")
+    zone = ZoneInfo(tz)
+    for _ in range(100):
+        cron = CronJob(
+            f"{rnd.choice(['*', '*/7', '0', '30', '15,45'])} "
+            f"{rnd.choice(['*', '1', '2', '1-3', '*/2'])} * * *"
+        )
+        start = gap.replace(tzinfo=zone) - timedelta(
+            minutes=rnd.randrange(24 * 60)
+        )
+        assert_matches_legacy(cron, start, reverse=False, steps=8)
+
+
+def test_cron_runner_jump_sparse():
+    sch = CronJob("0 0 29 2 *").schedule(date=datetime(2024, 3, 1))
+    assert sch.next == datetime(2028, 2, 29)
+    assert sch.next == datetime(2032, 2, 29)
+    assert sch.prev == datetime(2028, 2, 29)
+    assert sch.prev == datetime(2024, 2, 29)
+
+    # NOTE: The day and weekday parts are both applied.
+    sch = CronJob("0 0 29 2 MON").schedule(date=datetime(2024, 3, 1))
+    assert sch.next == datetime(2044, 2, 29)
+
+    sch = CronJob("0 0 30 2 *").schedule(date=datetime(2024, 3, 1))
+    with pytest.raises(RecursionError):
+        _ = sch.next
+
+
+def test_cron_runner_question_mark():
+    sch = CronJob("0 12 ? * MON").schedule(date=datetime(2024, 1, 1, 13))
+    assert sch.next == datetime(2024, 1, 8, 12)
+    assert sch.next == datetime(2024, 1, 15, 12)
+
+    sch = CronJob("0 12 15 * ?").schedule(date=datetime(2024, 1, 1))
+    assert sch.next == datetime(2024, 1, 15, 12)
+    assert sch.next == datetime(2024, 2, 15, 12)
+
+
+def test_cron_runner_dst():
+    tz = ZoneInfo("America/New_York")
+
+    # NOTE: The 02:30 does not exist on the DST gap day, so it moves to the
+    #   first time after this gap.
+    sch = CronJob("30 2 * * *").schedule(
+        date=datetime(2024, 3, 9, 3, tzinfo=tz)
+    )
+    assert [sch.next for _ in range(2)] == [
+        datetime(2024, 3, 10, 3, 0, tzinfo=tz),
+        datetime(2024, 3, 11, 2, 30, tzinfo=tz),
+    ]
+    assert sch.prev == datetime(2024, 3, 10, 3, 0, tzinfo=tz)
+    assert sch.prev == datetime(2024, 3, 9, 2, 30, tzinfo=tz)
+
+    # NOTE: The matching times that move to the same time release once.
+    sch = CronJob("0,30 2,3 * * *").schedule(
+        date=datetime(2024, 3, 10, 1, tzinfo=tz)
+    )
+    assert [sch.next for _ in range(3)] == [
+        datetime(2024, 3, 10, 3, 0, tzinfo=tz),
+        datetime(2024, 3, 10, 3, 30, tzinfo=tz),
+        datetime(2024, 3, 11, 2, 0, tzinfo=tz),
+    ]
+
+    sch = CronJob("*/20 * * * *").schedule(
+        date=datetime(2024, 3, 10, 1, 40, tzinfo=tz)
+    )
+    assert [sch.next for _ in range(3)] == [
+        datetime(2024, 3, 10, 1, 40, tzinfo=tz),
+        datetime(2024, 3, 10, 3, 0, tzinfo=tz),
+        datetime(2024, 3, 10, 3, 20, tzinfo=tz),
+    ]
+
+    # NOTE: The 01:30 repeats on the DST overlap day, but it releases once.
+    sch = CronJob("30 1 * * *").schedule(date=datetime(2024, 11, 3, tzinfo=tz))
+    first = sch.next
+    assert first == datetime(2024, 11, 3, 1, 30, tzinfo=tz)
+    assert first.fold == 0
+    assert sch.next == datetime(2024, 11, 4, 1, 30, tzinfo=tz)
@@ -0,0 +1,226 @@
+import copy
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from ddeutil.workflow import (
+    SUCCESS,
+    ArtifactStore,
+    Result,
+    Workflow,
+    artifact,
+    get_artifact_store,
+    is_artifact,
+)
+from ddeutil.workflow.artifacts import store_artifacts
+from ddeutil.workflow.reusables import param2template
+from ddeutil.workflow.stages import CallStage
+from ddeutil.workflow.utils import gen_id
+
+
+def test_artifact_store_file(tmp_path):
+    store = ArtifactStore()
+    value = {"rows": list(range(5)), "data": bytearray(b"abc")}
+    handle = store.put(value, "01", path=tmp_path)
+    assert is_artifact(handle)
+    assert handle["kind"] == "file"
+    assert handle["type"] == "builtins.dict"
+    assert Path(handle["location"]).parent == tmp_path / "01"
+
+    # NOTE: The handle is cheap to deep-copy and dump to the audit.
+    assert json.loads(json.dumps(copy.deepcopy(handle))) == handle
+    assert store.get(handle) == value
+
+    # NOTE: The out-of-band buffer loads from the private memory-mapped file,
+    #   so change it does not change the artifact.
+    loaded = store.get(handle)
+    loaded["data"][0] = ord("z")
+    assert store.get(handle)["data"] == bytearray(b"abc")
+
+    store.retain(handle)
+    store.release_run("01", path=tmp_path)
+    assert Path(handle["location"]).exists()
+
+    store.release(handle)
+    assert not Path(handle["location"]).exists()
+    assert not (tmp_path / "01").exists()
+
+
+def test_artifact_store_shared(tmp_path):
+    store = ArtifactStore()
+    handle = store.put(bytearray(b"x" * 1024), "02", path=tmp_path, shared=True)
+    assert handle["kind"] == "shm"
+    assert store.get(handle) == bytearray(b"x" * 1024)
+
+    store.release_run("02", path=tmp_path)
+    with pytest.raises(FileNotFoundError):
+        store.get(handle)
+
+
+def test_artifact_store_release_to_parent(tmp_path):
+    store = ArtifactStore()
+    handle = store.put([1, 2], "child", path=tmp_path)
+
+    # NOTE: The triggered workflow passes its artifacts to its parent.
+    store.release_run("child", "parent", path=tmp_path)
+    assert store.get(handle) == [1, 2]
+
+    store.release_run("parent", path=tmp_path)
+    assert not Path(handle["location"]).exists()
+
+
+def test_store_artifacts(tmp_path):
+    rs = store_artifacts(
+        {"a": artifact([1]), "b": [artifact("x")], "c": 1},
+        "03",
+        extras={"artifact_path": tmp_path},
+    )
+    assert is_artifact(rs["a"]) and is_artifact(rs["b"][0])
+    assert rs["c"] == 1
+    assert param2template("${{ a }}", params=rs) == [1]
+    get_artifact_store().release_run("03", path=tmp_path)
+
+
+def test_call_stage_exec_artifact(tmp_path):
+    stage = CallStage.model_validate(
+        {
+            "name": "Make Artifact",
+            "id": "make",
+            "uses": "tasks/make-artifact@demo",
+            "with": {"size": 4},
+            "extras": {"artifact_path": tmp_path},
+        }
+    )
+    rs: Result = stage.execute({}, run_id="04")
+    assert rs.status == SUCCESS
+    assert is_artifact(rs.context["values"])
+    assert rs.context["size"] == 4
+
+    output = stage.set_outputs(rs.context, to={})
+    assert param2template(
+        "${{ stages.make.outputs.values }}", params=output
+    ) == bytearray(range(4))
+    get_artifact_store().release_run("04", path=tmp_path)
+    assert not Path(rs.context["values"]["location"]).exists()
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_workflow_exec_artifact(tmp_path, shared):
+    workflow = Workflow.model_validate(
+        {
+            "name": "wf-artifact",
+            "jobs": {
+                "first-job": {
+                    "stages": [
+                        {
+                            "name": "Make Artifact",
+                            "id": "make",
+                            "uses": "tasks/make-artifact@demo",
+                            "with": {"size": 5, "shared": shared},
+                        },
+                        {
+                            "name": "Sum Artifact",
+                            "id": "sum",
+                            "run": (
+                                "total = sum(${{ stages.make.outputs.values }})"
+                            ),
+                        },
+                    ],
+                },
+            },
+            "extras": {"artifact_path": tmp_path},
+        }
+    )
+    rs: Result = workflow.execute({})
+    assert rs.status == SUCCESS
+    stages = rs.context["jobs"]["first-job"]["stages"]
+    assert stages["sum"]["outputs"]["total"] == 10
+
+    # NOTE: The workflow releases its artifacts at the end of execution.
+    handle = stages["make"]["outputs"]["values"]
+    assert is_artifact(handle)
+    with pytest.raises(FileNotFoundError):
+        get_artifact_store().get(handle)
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_workflow_exec_artifact_process_executor(tmp_path, shared):
+    workflow = Workflow.model_validate(
+        {
+            "name": "wf-artifact-process",
+            "jobs": {
+                "first": {
+                    "strategy": {"matrix": {"x": [1]}, "executor": "process"},
+                    "stages": [
+                        {
+                            "name": "Make Artifact",
+                            "id": "make",
+                            "uses": "tasks/make-artifact@demo",
+                            "with": {"size": 5, "shared": shared},
+                        },
+                    ],
+                },
+                "second": {
+                    "needs": ["first"],
+                    "stages": [
+                        {
+                            "name": "Sum Artifact",
+                            "id": "sum",
+                            "run": (
+                                "total = sum(${{ jobs.first.strategies."
+                                f"{gen_id({'x': 1})}"
+                                ".stages.make.outputs.values }})"
+                            ),
+                        },
+                    ],
+                },
+            },
+            "extras": {"artifact_path": tmp_path},
+        }
+    )
+    rs: Result = workflow.execute({})
+    assert rs.status == SUCCESS
+    stages = rs.context["jobs"]["second"]["stages"]
+    assert stages["sum"]["outputs"]["total"] == 10
+
+    # NOTE: The parent process owns the artifacts from the child process and
+    #   releases them at the end of execution.
+    strategy = rs.context["jobs"]["first"]["strategies"][gen_id({"x": 1})]
+    handle = strategy["stages"]["make"]["outputs"]["values"]
+    with pytest.raises(FileNotFoundError):
+        get_artifact_store().get(handle)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_workflow_release_artifact(tmp_path):
+    workflow = Workflow.model_validate(
+        {
+            "name": "wf-artifact-release",
+            "jobs": {
+                "first-job": {
+                    "stages": [
+                        {
+                            "name": "Make Artifact",
+                            "id": "make",
+                            "uses": "tasks/make-artifact@demo",
+                            "with": {"size": 3},
+                        },
+                    ],
+                },
+            },
+            "extras": {"artifact_path": tmp_path, "enable_write_audit": False},
+        }
+    )
+    rs: Result = workflow.release(datetime(2024, 1, 1), params={})
+    assert rs.status == SUCCESS
+
+    # NOTE: The release releases the artifacts that its execution passes.
+    handle = rs.context["jobs"]["first-job"]["stages"]["make"]["outputs"][
+        "values"
+    ]
+    assert is_artifact(handle)
+    with pytest.raises(FileNotFoundError):
+        get_artifact_store().get(handle)
+    assert rs.run_id not in get_artifact_store()._owners
+    assert list(tmp_path.iterdir()) == []
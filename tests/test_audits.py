@@ -1,4 +1,5 @@
 import shutil
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 from unittest import mock
@@ -7,6 +8,7 @@ import pytest
 from ddeutil.workflow.audits import (
     NORMAL,
     AuditData,
+    AuditWriter,
     BaseAudit,
     LocalFileAudit,
     LocalSQLiteAudit,
@@ -179,3 +181,167 @@ def test_audit_file_find_with_release():
 
     with pytest.raises(FileNotFoundError):
         log.find_audit_with_release(name="wf-file-not-found")
+
+
+@mock.patch.object(Config, "enable_write_audit", True)
+def test_audit_file_catalog(tmp_path: Path):
+    log = LocalFileAudit(path=tmp_path)
+    for day in range(1, 6):
+        log.save(
+            data={
+                "name": "wf-catalog",
+                "release": datetime(2024, 1, day),
+                "run_id": f"0{day}",
+            },
+            excluded=None,
+        )
+    assert log.catalog.exists()
+
+    # NOTE: It orders from the newest release and supports the pagination.
+    audits = list(log.find_audits(name="wf-catalog", offset=1, limit=2))
+    assert [a.run_id for a in audits] == ["04", "03"]
+
+    audits = list(
+        log.find_audits(
+            name="wf-catalog",
+            start=datetime(2024, 1, 2),
+            end=datetime(2024, 1, 3),
+        )
+    )
+    assert [a.run_id for a in audits] == ["03", "02"]
+
+    assert log.find_audit_with_release(name="wf-catalog").run_id == "05"
+    assert (
+        log.find_audit_with_release(
+            name="wf-catalog", release=datetime(2024, 1, 2)
+        ).run_id
+        == "02"
+    )
+    with pytest.raises(FileNotFoundError):
+        log.find_audit_with_release(
+            name="wf-catalog", release=datetime(2024, 2, 1)
+        )
+
+    # NOTE: It checks the existence without validating the full audit data.
+    assert log.is_pointed({"name": "wf-catalog", "release": "2024-01-01"})
+    assert not log.is_pointed(
+        {"name": "wf-catalog", "release": datetime(2024, 2, 1)}
+    )
+
+    # NOTE: It falls back to scan the log files if the catalog does not exist.
+    log.catalog.unlink()
+    audits = list(log.find_audits(name="wf-catalog", offset=1, limit=2))
+    assert [a.run_id for a in audits] == ["04", "03"]
+    assert log.find_audit_with_release(name="wf-catalog").run_id == "05"
+
+    assert log.rebuild_catalog() == 5
+    audits = list(log.find_audits(name="wf-catalog", limit=1))
+    assert [a.run_id for a in audits] == ["05"]
+
+
+@mock.patch.object(Config, "enable_write_audit", True)
+def test_audit_file_compress(tmp_path: Path):
+    log = LocalFileAudit(path=tmp_path, compress="gzip")
+    log.save_many(
+        [
+            {
+                "name": "wf-compress",
+                "release": datetime(2024, 1, day),
+                "run_id": f"0{day}",
+                "context": {"params": {"day": day}},
+            }
+            for day in (1, 2)
+        ]
+    )
+    pointer = tmp_path / "workflow=wf-compress" / "release=20240102000000"
+    assert (pointer / "02.log.gz").exists()
+    assert not list(pointer.glob(".*.tmp"))
+
+    audit = log.find_audit_with_release(name="wf-compress")
+    assert audit.context == {"params": {"day": 2}}
+
+    log.catalog.unlink()
+    assert log.find_audit_with_release(name="wf-compress").run_id == "02"
+    assert log.rebuild_catalog() == 2
+    audits = list(log.find_audits(name="wf-compress"))
+    assert [a.run_id for a in audits] == ["02", "01"]
+
+
+@mock.patch.object(Config, "enable_write_audit", True)
+def test_audit_writer(tmp_path: Path):
+    writer = AuditWriter(flush_interval=60, flush_size=3)
+    file_log = LocalFileAudit(path=tmp_path / "file")
+    sqlite_log = LocalSQLiteAudit(path=tmp_path / "audit.db")
+    for i in range(5):
+        data = {
+            "name": "wf-writer",
+            "release": datetime(2024, 1, 1, i),
+            "run_id": f"0{i}",
+        }
+        writer.put(file_log, data)
+        writer.put(sqlite_log, data, excluded=["context"])
+
+    # NOTE: The writer saves a batch when its size reaches the flush size.
+    assert writer.flush(timeout=5)
+    assert len(list(file_log.find_audits(name="wf-writer"))) == 5
+    with sqlite3.connect(tmp_path / "audit.db") as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("SELECT COUNT(*) FROM audits").fetchone()[0] == 5
+
+    writer.put(file_log, data | {"release": datetime(2024, 1, 2)})
+    writer.close(timeout=5)
+    assert len(list(file_log.find_audits(name="wf-writer"))) == 6
+
+
+@mock.patch.object(Config, "enable_write_audit", True)
+def test_audit_find_releases(tmp_path: Path):
+    log = LocalFileAudit(path=tmp_path / "file")
+    sqlite_log = LocalSQLiteAudit(path=tmp_path / "audit.db")
+    for day in (1, 2, 3):
+        data = {
+            "name": "wf-releases",
+            "release": datetime(2024, 1, day),
+            "run_id": f"0{day}",
+        }
+        log.save(data)
+        sqlite_log.save(data)
+
+    for audit in (log, sqlite_log):
+        assert audit.find_releases(
+            "wf-releases", start=datetime(2024, 1, 2)
+        ) == {datetime(2024, 1, 2), datetime(2024, 1, 3)}
+
+    log.catalog.unlink()
+    assert log.find_releases("wf-releases", end=datetime(2024, 1, 1)) == {
+        datetime(2024, 1, 1)
+    }
+
+
+@mock.patch.object(Config, "enable_write_audit", True)
+def test_audit_file_catalog_from_existing_logs(tmp_path: Path):
+    log = LocalFileAudit(path=tmp_path)
+    for day in (1, 2):
+        log.save(
+            {"name": "wf", "release": datetime(2024, 1, day), "run_id": "01"}
+        )
+
+    # NOTE: Start with the audit tree that was written before the catalog.
+    log.catalog.unlink()
+    log.save({"name": "wf", "release": datetime(2024, 2, 1), "run_id": "02"})
+    assert log.find_releases("wf") == {
+        datetime(2024, 1, 1),
+        datetime(2024, 1, 2),
+        datetime(2024, 2, 1),
+    }
+    assert len(list(log.find_audits(name="wf"))) == 3
+
+    # NOTE: The catalog without the index marker, like the catalog that was
+    #   created before this marker, indexes the existing logs again.
+    with sqlite3.connect(log.catalog) as conn:
+        conn.execute("DELETE FROM catalog")
+        conn.execute("PRAGMA user_version = 0")
+    conn.close()
+    assert log.find_audit_with_release(
+        name="wf", release=datetime(2024, 1, 1)
+    ).release == datetime(2024, 1, 1)
+    assert len(log.find_releases("wf")) == 3
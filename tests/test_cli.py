@@ -13,3 +13,49 @@ def test_app(runner: CliRunner):
     assert result.exit_code == 0
     assert "ddeutil-workflow==" in result.output
     assert "python-version==" in result.output
+
+
+def test_app_logs_rebuild_catalog(runner: CliRunner, tmp_path):
+    release = tmp_path / "workflow=wf-cli" / "release=20240101000000"
+    release.mkdir(parents=True)
+    (release / "01.log").write_text("{}")
+    result = runner.invoke(
+        app, ["logs", "rebuild-catalog", "--path", str(tmp_path)]
+    )
+    assert result.exit_code == 0
+    assert "index 1 audit logs" in result.output
+    assert (tmp_path / "catalog.db").exists()
+
+
+def test_app_workflows_backfill(runner: CliRunner, tmp_path):
+    (tmp_path / "wf.yml").write_text(
+        "wf-cli-backfill:\n"
+        "  type: Workflow\n"
+        "  on:\n"
+        "    schedule:\n"
+        "      - cronjob: '0 0 * * *'\n"
+        "  jobs:\n"
+        "    first-job:\n"
+        "      stages:\n"
+        "        - name: Echo\n"
+        "          echo: hello\n"
+    )
+    # NOTE: Disable the console trace handler because its log stream shares
+    #   the output buffer of this runner and overwrites the echo messages.
+    result = runner.invoke(
+        app,
+        [
+            "workflows",
+            "backfill",
+            "--name=wf-cli-backfill",
+            "--start=2024-01-01",
+            "--end=2024-01-03",
+            "--release-type=force",
+            "--max-parallel=2",
+            f"--path={tmp_path}",
+        ],
+        env={"WORKFLOW_LOG_TRACE_HANDLERS": "[]"},
+    )
+    assert result.exit_code == 0, result.output
+    assert "... 2024-01-03 00:00:00 : SUCCESS" in result.output
+    assert "'total': 3" in result.output
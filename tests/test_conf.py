@@ -8,9 +8,11 @@ from zoneinfo import ZoneInfo
 import pytest
 import rtoml
 import yaml
+from ddeutil.io.paths import read_ignore
 from ddeutil.workflow import Workflow
 from ddeutil.workflow.conf import (
     Config,
+    ConfIndex,
     YamlParser,
     config,
     dynamic,
@@ -401,6 +403,124 @@ def test_load_ignore_file(test_path: Path):
     assert YamlParser.find("wf-not-exists", path=test_path / "conf") == {}
 
 
+def test_conf_index(test_path: Path):
+    target_p = test_path / "test_conf_index"
+    cache_p = test_path / "test_conf_index_cache"
+    target_p.mkdir(exist_ok=True)
+    (target_p / "wf_index.yml").write_text(
+        "wf-index:\n  type: Workflow\n  value: 1\n"
+    )
+    (target_p / "broken.yml").write_text("foo: [\n")
+    (target_p / ".confignore").write_text("broken.yml\n")
+    extras = {"conf_cache_path": cache_p}
+
+    ConfIndex.clear()
+    index = ConfIndex.get(target_p)
+    assert index is ConfIndex.get(target_p)
+
+    data = YamlParser.find("wf-index", path=target_p, extras=extras)
+    assert exclude_created_and_updated(data) == {
+        "type": "Workflow",
+        "value": 1,
+        "name": "wf-index",
+    }
+    assert index.files["wf_index.yml"]["names"] == ["wf-index"]
+    assert index.files["wf_index.yml"]["types"] == ["Workflow"]
+    assert index.files["broken.yml"]["lazy"]
+    assert index.manifest(cache_p).exists()
+    assert [f.name for f in cache_p.iterdir()] == [index.manifest(cache_p).name]
+
+    # NOTE: The parsed data from cache should not change by the caller.
+    data["value"] = 2
+    assert YamlParser.find("wf-index", path=target_p)["value"] == 1
+
+    # NOTE: The new process will load entries from the manifest file.
+    ConfIndex.clear()
+    index = ConfIndex.get(target_p)
+    with mock.patch("ddeutil.workflow.conf.read_yaml") as mock_read:
+        index.refresh(cache_p)
+        mock_read.assert_not_called()
+
+    # NOTE: Only the changed file should parse again.
+    (target_p / "wf_index.yml").write_text(
+        "wf-index-new:\n  type: Workflow\n  value: 10\n"
+    )
+    os.utime(target_p / "wf_index.yml", (1, 1))
+    files = index.refresh(cache_p)
+    assert files["wf_index.yml"]["names"] == ["wf-index-new"]
+    assert YamlParser.find("wf-index", path=target_p, extras=extras) == {}
+    assert (
+        dict(YamlParser.finds(Workflow, path=target_p, extras=extras))[
+            "wf-index-new"
+        ]["value"]
+        == 10
+    )
+
+    (target_p / "wf_index.yml").unlink()
+    assert "wf_index.yml" not in index.refresh(cache_p)
+
+    # NOTE: The file that can not parse should raise when it does not ignore.
+    (target_p / "broken-raise.yml").write_text("foo: [\n")
+    with pytest.raises(yaml.YAMLError):
+        YamlParser.find("wf-index", path=target_p)
+
+    (target_p / "broken-raise.yml").unlink()
+    assert YamlParser.find("wf-index", path=target_p) == {}
+
+    ConfIndex.clear()
+    shutil.rmtree(target_p)
+    shutil.rmtree(cache_p)
+
+
+def test_conf_index_skip_walk(test_path: Path):
+    target_p = test_path / "test_conf_index_skip_walk"
+    (target_p / "sub").mkdir(parents=True, exist_ok=True)
+    (target_p / "wf_walk.yml").write_text(
+        "wf-walk:\n  type: Workflow\n  value: 1\n"
+    )
+
+    ConfIndex.clear()
+    index = ConfIndex.get(target_p)
+    assert YamlParser.find("wf-walk", path=target_p)["value"] == 1
+    assert set(index.dirs) == {".", "sub"}
+
+    # NOTE: The unchanged config path should not walk and read the ignore
+    #   file again.
+    with mock.patch.object(index, "walk", wraps=index.walk) as mock_walk:
+        with mock.patch(
+            "ddeutil.workflow.conf.read_ignore", wraps=read_ignore
+        ) as mock_ignore:
+            assert YamlParser.find("wf-walk", path=target_p)["value"] == 1
+            assert YamlParser.find("wf-walk-sub", path=target_p) == {}
+            mock_walk.assert_not_called()
+            mock_ignore.assert_not_called()
+
+            # NOTE: The in-place editing should detect without walking.
+            (target_p / "wf_walk.yml").write_text(
+                "wf-walk:\n  type: Workflow\n  value: 2\n"
+            )
+            os.utime(target_p / "wf_walk.yml", (1, 1))
+            assert YamlParser.find("wf-walk", path=target_p)["value"] == 2
+            mock_walk.assert_not_called()
+
+            # NOTE: The new file on the sub-directory should walk again.
+            (target_p / "sub" / "wf_walk_sub.yml").write_text(
+                "wf-walk-sub:\n  type: Workflow\n  value: 3\n"
+            )
+            assert YamlParser.find("wf-walk-sub", path=target_p)["value"] == 3
+            mock_walk.assert_called_once()
+            mock_ignore.assert_not_called()
+
+            # NOTE: The changed ignore file should read only once.
+            (target_p / ".confignore").write_text("sub\n")
+            assert YamlParser.find("wf-walk-sub", path=target_p) == {}
+            assert YamlParser.find("wf-walk-sub", path=target_p) == {}
+            mock_ignore.assert_called_once()
+
+    ConfIndex.clear()
+    shutil.rmtree(target_p)
+
+
 def test_dynamic():
     conf = dynamic("log_datetime_format", f="%Y%m%d", extras={})
     assert conf == "%Y%m%d"
@@ -7,7 +7,7 @@ from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 
 import pytest
-from ddeutil.workflow import Crontab, CrontabYear
+from ddeutil.workflow import UTC, Crontab, CrontabYear, EventError
 from ddeutil.workflow.event import CrontabValue, Event, interval2crontab
 from pydantic import ValidationError
 
@@ -239,3 +239,23 @@ def test_event():
         },
     )
     assert len(event.schedule) == 2
+
+
+def test_event_generate():
+    event = Event.model_validate(
+        {
+            "schedule": [
+                {"cronjob": "0 */6 * * *"},
+                {"cronjob": "0 0 * * *"},
+            ]
+        }
+    )
+    releases = list(event.generate(datetime(2024, 1, 1), datetime(2024, 1, 2)))
+
+    # NOTE: The duplicate release from both schedules should generate once.
+    assert [dt.hour for dt in releases] == [0, 6, 12, 18, 0]
+    assert releases[0] == datetime(2024, 1, 1, tzinfo=UTC)
+    assert all(event.validate_dt(dt) == dt for dt in releases)
+
+    with pytest.raises(EventError):
+        next(Event().generate(datetime(2024, 1, 1), datetime(2024, 1, 2)))
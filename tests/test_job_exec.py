@@ -1,5 +1,7 @@
-from ddeutil.workflow import Job, Workflow
+import pytest
+from ddeutil.workflow import DictData, Job, Workflow
 from ddeutil.workflow.result import CANCEL, FAILED, SKIP, SUCCESS, Result
+from ddeutil.workflow.reusables import param2template
 
 from .utils import MockEvent, exclude_info
 
@@ -748,14 +750,7 @@ def test_job_exec_max_parallel():
         }
     )
     rs = job.execute({})
-    assert rs.status == FAILED
-    assert exclude_info(rs.context) == {
-        "status": FAILED,
-        "errors": {
-            "name": "JobError",
-            "message": "The max-parallel value should not more than 10, the current value was set: 100.",
-        },
-    }
+    assert rs.status == SUCCESS
 
     job: Job = Job.model_validate(
         {
@@ -767,13 +762,13 @@ def test_job_exec_max_parallel():
             "stages": [{"name": "Echo empty", "echo": "Hello World"}],
         }
     )
-    rs = job.execute({"params": {"value": 100}})
+    rs = job.execute({"params": {"value": 0}})
     assert rs.status == FAILED
     assert exclude_info(rs.context) == {
         "status": FAILED,
         "errors": {
             "name": "JobError",
-            "message": "The max-parallel value should not more than 10, the current value was set: 100.",
+            "message": "The max-parallel value should gather than 0, the current value was set: 0.",
         },
     }
 
@@ -796,3 +791,183 @@ def test_job_exec_max_parallel():
             "message": "invalid literal for int() with base 10: '{{ params.value }}'",
         },
     }
+
+
+def test_job_exec_process_executor():
+    job: Job = Workflow.from_conf(name="wf-run-python-raise-for-job").job(
+        "job-complete"
+    )
+    expected: Result = job.execute({})
+    job: Job = job.model_copy(
+        update={
+            "strategy": job.strategy.model_copy(update={"executor": "process"})
+        }
+    )
+    rs: Result = job.execute({})
+    assert rs.status == SUCCESS
+    assert exclude_info(rs.context) == exclude_info(expected.context)
+
+
+def test_job_exec_process_executor_fail_fast():
+    job: Job = Job(
+        strategy={
+            "max-parallel": 3,
+            "fail-fast": True,
+            "executor": "process",
+            "matrix": {"x": [1, 2, 3]},
+        },
+        stages=[
+            {
+                "name": "Raise if x equal 1",
+                "if": "${{ matrix.x }} == 1",
+                "raise": "Raise from x equal 1",
+            },
+            {"name": "Sleep", "echo": "sleep", "sleep": 2},
+            {"name": "Echo Last Stage", "echo": "the last stage"},
+        ],
+    )
+    rs: Result = job.execute(params={})
+    assert rs.status == FAILED
+    statuses = {
+        v["matrix"]["x"]: v["status"]
+        for v in rs.context.values()
+        if isinstance(v, dict) and "matrix" in v
+    }
+    assert statuses == {1: FAILED, 2: CANCEL, 3: CANCEL}
+    assert any(e["name"] == "JobError" for e in rs.context["errors"].values())
+
+
+def test_job_exec_lazy_strategy_fail_fast():
+    job: Job = Job(
+        strategy={
+            "max-parallel": 2,
+            "fail-fast": True,
+            "matrix": {"x": list(range(500)), "y": list(range(100))},
+        },
+        stages=[
+            {
+                "name": "Raise if x equal 1",
+                "if": "${{ matrix.x }} == 1",
+                "raise": "Raise from x equal 1",
+            },
+            {"name": "Echo Last Stage", "echo": "the last stage"},
+        ],
+        extras={"stage_default_id": False},
+    )
+    rs: Result = job.execute(params={})
+    assert rs.status == FAILED
+
+    # NOTE: It stops generating the next strategies after the first failed
+    #   strategy, so it does not run all 50,000 strategies.
+    strategies = [
+        v for v in rs.context.values() if isinstance(v, dict) and "matrix" in v
+    ]
+    assert len(strategies) < 500
+    assert {"x": 1, "y": 0} in [v["matrix"] for v in strategies]
+
+
+def test_job_exec_output_policy(tmp_path):
+    data = {
+        "id": "matrix-job",
+        "stages": [
+            {
+                "name": "Square",
+                "id": "square",
+                "run": "y = ${{ matrix.x }} ** 2",
+            },
+        ],
+        "extras": {"stage_spill_path": tmp_path},
+    }
+    job: Job = Job.model_validate(
+        data | {"strategy": {"matrix": {"x": [1, 2, 3]}, "output": "spill"}}
+    )
+    rs: Result = job.execute(params={})
+    assert rs.status == SUCCESS
+    strategies = {
+        v["matrix"]["x"]: k
+        for k, v in rs.context.items()
+        if isinstance(v, dict) and "matrix" in v
+    }
+    assert len(strategies) == 3
+    assert all("stages" not in rs.context[k] for k in strategies.values())
+
+    # NOTE: The template loads the spilled strategy context lazily.
+    output: DictData = job.set_outputs(rs.context, to={})
+    caller: str = (
+        f"jobs.matrix-job.strategies.{strategies[3]}.stages.square.outputs.y"
+    )
+    assert param2template("${{ " + caller + " }}", params=output) == 9
+
+    job: Job = Job.model_validate(
+        data
+        | {
+            "strategy": {
+                "matrix": {"x": [1, 2, 3]},
+                "output": {
+                    "mode": "reduce",
+                    "reducer": "sum",
+                    "path": "stages.square.outputs.y",
+                },
+            },
+        }
+    )
+    rs: Result = job.execute(params={})
+    assert rs.status == SUCCESS
+    assert rs.context["reduced"] == 14
+    output: DictData = job.set_outputs(rs.context, to={})
+    assert output["jobs"]["matrix-job"]["reduced"] == 14
+
+
+@pytest.mark.asyncio
+async def test_job_aexec_py():
+    job: Job = Workflow.from_conf(name="wf-run-common").job("demo-run")
+    rs: Result = await job.aexecute(params={"params": {"name": "Foo"}})
+    assert rs.status == SUCCESS
+    assert exclude_info(rs.context) == {
+        "status": SUCCESS,
+        "EMPTY": {
+            "status": SUCCESS,
+            "matrix": {},
+            "stages": {
+                "hello-world": {
+                    "outputs": {"x": "New Name"},
+                    "status": SUCCESS,
+                },
+                "run-var": {"outputs": {"x": 1}, "status": SUCCESS},
+            },
+        },
+    }
+
+    event = MockEvent(n=0)
+    rs: Result = await job.aexecute(
+        params={"params": {"name": "Foo"}}, event=event
+    )
+    assert rs.status == CANCEL
+
+
+@pytest.mark.asyncio
+async def test_job_aexec_matrix_fail_fast():
+    job: Job = Job(
+        strategy={
+            "max-parallel": 4,
+            "fail-fast": True,
+            "matrix": {"x": [1, 2, 3]},
+        },
+        stages=[
+            {
+                "name": "Raise if x equal 1",
+                "if": "${{ matrix.x }} == 1",
+                "raise": "Raise from x equal 1",
+            },
+            {"name": "Sleep", "echo": "sleep", "sleep": 1},
+            {"name": "Echo Last Stage", "echo": "the last stage"},
+        ],
+    )
+    rs: Result = await job.aexecute(params={})
+    assert rs.status == FAILED
+    statuses = {
+        v["matrix"]["x"]: v["status"]
+        for v in rs.context.values()
+        if isinstance(v, dict) and "matrix" in v
+    }
+    assert statuses == {1: FAILED, 2: CANCEL, 3: CANCEL}
@@ -0,0 +1,156 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from ddeutil.workflow import Job
+from ddeutil.workflow.pool import WorkerPool
+from ddeutil.workflow.result import FAILED, SUCCESS
+
+from .utils import exclude_info
+
+
+def test_pool_group():
+    pool = WorkerPool(max_workers=4)
+    with pool.group(3, level="stage") as group:
+        futures = [group.submit(lambda x: x * 2, i) for i in range(10)]
+        group.run()
+
+    assert [f.result() for f in futures] == [i * 2 for i in range(10)]
+
+    # NOTE: Wait all borrowed workers give their slot back to the pool.
+    pool.executor.shutdown()
+    metrics = pool.metrics()
+    assert metrics["max_workers"] == 4
+    assert metrics["used"] == 0
+    assert metrics["utilization"] == 0
+    assert metrics["peak"] <= 3
+    assert metrics["levels"]["stage"]["used"] == 0
+    assert (
+        metrics["levels"]["stage"]["borrowed"]
+        + metrics["levels"]["stage"]["inline"]
+        >= 1
+    )
+
+
+def test_pool_group_quota():
+    pool = WorkerPool(max_workers=8, quotas={"stage": 1})
+
+    def task() -> float:
+        time.sleep(0.05)
+        return pool.metrics()["levels"]["stage"]["used"]
+
+    with pool.group(8, level="stage") as group:
+        futures = [group.submit(task) for _ in range(6)]
+        group.run()
+
+    assert max(f.result() for f in futures) <= 1
+    assert pool.metrics()["peak"] == 1
+    pool.executor.shutdown()
+
+
+def test_pool_group_fail_fast():
+    # NOTE: Set the quota to zero for running all tasks on the caller thread.
+    pool = WorkerPool(max_workers=1, quotas={"stage": 0})
+    called: list[int] = []
+
+    def task(x: int) -> int:
+        if x == 1:
+            raise ValueError("Raise at the second task.")
+        return x
+
+    with pool.group(
+        1, level="stage", fail_fast=True, on_error=lambda: called.append(1)
+    ) as group:
+        futures = [group.submit(task, i) for i in range(4)]
+        group.run()
+
+    assert futures[0].result() == 0
+    with pytest.raises(ValueError):
+        futures[1].result()
+    assert all(f.cancelled() for f in futures[2:])
+    assert called == [1]
+    assert pool.metrics()["levels"]["stage"]["inline"] == 2
+    pool.executor.shutdown()
+
+
+def test_pool_nested_do_not_deadlock():
+    """Nested groups that request more workers than the pool has should run
+    on the caller threads instead of waiting forever.
+    """
+    pool = WorkerPool(max_workers=2)
+
+    def inner(x: int) -> int:
+        with pool.group(4, level="stage") as group:
+            fs = [group.submit(lambda y: y + x, y) for y in range(4)]
+            group.run()
+        return sum(f.result() for f in fs)
+
+    def outer(x: int) -> int:
+        with pool.group(4, level="stage") as group:
+            fs = [group.submit(inner, x + i) for i in range(4)]
+            group.run()
+        return sum(f.result() for f in fs)
+
+    with pool.group(4, level="strategy") as group:
+        futures = [group.submit(outer, i) for i in range(4)]
+        group.run()
+
+    assert [f.result(timeout=5) for f in futures] == [
+        sum(sum(y + i + j for y in range(4)) for j in range(4))
+        for i in range(4)
+    ]
+    assert pool.metrics()["peak"] <= 2
+    pool.executor.shutdown()
+
+
+def test_pool_nested_job_exec():
+    job: Job = Job.model_validate(
+        {
+            "id": "nested-job",
+            "strategy": {
+                "max-parallel": 20,
+                "matrix": {"number": list(range(12))},
+            },
+            "stages": [
+                {
+                    "name": "Parallel",
+                    "id": "parallel-stage",
+                    "parallel": {
+                        f"branch{b:02d}": [
+                            {
+                                "name": "Foreach",
+                                "id": "foreach-stage",
+                                "foreach": [1, 2, 3],
+                                "concurrent": 12,
+                                "stages": [
+                                    {
+                                        "name": "Sleep",
+                                        "run": "import time\ntime.sleep(0.01)",
+                                    }
+                                ],
+                            }
+                        ]
+                        for b in range(3)
+                    },
+                    "max-workers": 12,
+                },
+            ],
+        }
+    )
+    with ThreadPoolExecutor(1) as executor:
+        rs = executor.submit(job.execute, {}).result(timeout=60)
+    assert rs.status == SUCCESS
+    assert len([k for k in rs.context if k not in ("status", "info")]) == 12
+
+
+def test_pool_job_exec_max_parallel_zero():
+    job: Job = Job.model_validate(
+        {
+            "id": "first-job",
+            "strategy": {"matrix": {"number": [1, 2]}, "max-parallel": 0},
+            "stages": [{"name": "Echo empty", "echo": "Hello World"}],
+        }
+    )
+    rs = job.execute({})
+    assert rs.status == FAILED
+    assert exclude_info(rs.context)["errors"]["name"] == "JobError"
@@ -0,0 +1,83 @@
+import os
+import time
+from threading import Event, Timer
+
+import pytest
+from ddeutil.workflow.pool import ShellPool, ShellWorker
+
+
+def test_shell_worker():
+    worker = ShellWorker()
+    try:
+        assert worker.run("echo 'Hello'") == (0, "Hello\n", "")
+        assert worker.run(
+            "FOO=1; export BAR=2; cd /; echo $FOO $BAR; echo err >&2; "
+            "printf 'no newline'"
+        ) == (0, "1 2\nno newline", "err\n")
+
+        # NOTE: The previous command does not leak its env and cwd.
+        assert worker.run('echo "$FOO$BAR"; pwd; exit 3') == (
+            3,
+            f"\n{os.getcwd()}\n",
+            "",
+        )
+        assert worker.count == 3
+    finally:
+        worker.close()
+
+
+def test_shell_worker_quote_cwd(tmp_path, monkeypatch):
+    path = tmp_path / "it's; touch injected"
+    path.mkdir()
+    monkeypatch.chdir(path)
+    worker = ShellWorker()
+    try:
+        assert worker.run("pwd") == (0, f"{path}\n", "")
+        assert not (path / "injected").exists()
+    finally:
+        worker.close()
+
+
+def test_shell_worker_large_stderr():
+    worker = ShellWorker()
+    try:
+        code, out, err = worker.run(
+            "for i in $(seq 1 50000); do echo line$i; done >&2; echo ok"
+        )
+        assert code == 0
+        assert out == "ok\n"
+        assert err.count("\n") == 50000
+    finally:
+        worker.close()
+
+
+def test_shell_worker_cancel():
+    event = Event()
+    worker = ShellWorker()
+    Timer(0.3, event.set).start()
+    start: float = time.monotonic()
+    with pytest.raises(InterruptedError):
+        worker.run("sleep 30", event=event)
+    assert time.monotonic() - start < 10
+    assert worker.broken
+
+
+def test_shell_pool_recycle():
+    pool = ShellPool(max_workers=1, recycle=2)
+    try:
+        pids: list[int] = []
+        for _ in range(4):
+            worker = pool.acquire()
+            pids.append(worker.proc.pid)
+            assert worker.run("true")[0] == 0
+            pool.release(worker)
+        assert pids[0] == pids[1]
+        assert pids[1] != pids[2]
+        assert pids[2] == pids[3]
+
+        # NOTE: A worker that stop inside its command will not reuse.
+        with pytest.raises(BrokenPipeError):
+            pool.run("kill -9 $$; sleep 1")
+        assert pool.run("echo 'Recycle'") == (0, "Recycle\n", "")
+    finally:
+        pool.close()
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from importlib import reload
 from pathlib import Path
 from textwrap import dedent
 
@@ -9,6 +12,7 @@ from ddeutil.workflow.reusables import (
     Registry,
     extract_call,
     make_registry,
+    registry_cache,
 )
 
 
@@ -97,11 +101,13 @@ def test_make_registry(call_function):
 def test_make_registry_from_env():
     rs: dict[str, Registry] = make_registry("tasks")
     assert set(rs.keys()) == {
+        "gen-items",
         "gen-type",
         "get-groups-from-priority",
         "get-items",
         "get-processes-from-group",
         "get-stream-info",
+        "make-artifact",
         "private-args-task",
         "private-args-task-not-special",
         "return-type-not-valid",
@@ -144,3 +150,74 @@ def test_extract_caller():
     assert call_func.name == "simple-task"
     assert call_func.tag == "demo"
     assert call_func.mark == "tag"
+
+
+def test_make_registry_cache(test_path: Path):
+    new_tasks_path: Path = test_path / "new_tasks_cache"
+    new_tasks_path.mkdir(exist_ok=True)
+    (new_tasks_path / "__init__.py").write_text("from .dummy import *\n")
+    (new_tasks_path / "dummy.py").write_text(
+        dedent(
+            """
+            from ddeutil.workflow.reusables import tag
+
+            @tag("v1", alias="cache-task")
+            def dummy_task() -> dict[str, int]:
+                return {"records": 1}
+            """.strip(
+                "\n"
+            )
+        )
+    )
+
+    try:
+        registry_cache.clear()
+        rs: dict[str, Registry] = make_registry("new_tasks_cache")
+        assert set(rs["cache-task"]) == {"v1"}
+        assert registry_cache.info() == {"hits": 0, "misses": 1, "size": 1}
+
+        assert make_registry("new_tasks_cache") is rs
+        assert registry_cache.info() == {"hits": 1, "misses": 1, "size": 1}
+
+        # NOTE: Change the source module, the cache keeps the registry until
+        #   the application reloads its modules and clears the cache.
+        (new_tasks_path / "dummy.py").write_text(
+            dedent(
+                """
+                from ddeutil.workflow.reusables import tag
+
+                @tag("v2", alias="cache-task")
+                def dummy_task() -> dict[str, int]:
+                    return {"records": 2}
+                """.strip(
+                    "\n"
+                )
+            )
+        )
+        assert make_registry("new_tasks_cache") is rs
+        assert registry_cache.info() == {"hits": 2, "misses": 1, "size": 1}
+
+        reload(sys.modules["tests.new_tasks_cache.dummy"])
+        reload(sys.modules["tests.new_tasks_cache"])
+        registry_cache.clear()
+
+        rs = make_registry("new_tasks_cache")
+        assert set(rs["cache-task"]) == {"v2"}
+        assert registry_cache.info() == {"hits": 0, "misses": 1, "size": 1}
+
+        # NOTE: The concurrent threads make the missing entry only once.
+        registry_cache.clear()
+        with ThreadPoolExecutor(4) as executor:
+            futures = [
+                executor.submit(make_registry, "new_tasks_cache")
+                for _ in range(8)
+            ]
+            results = [f.result() for f in futures]
+        assert all(r is results[0] for r in results)
+        assert registry_cache.info() == {"hits": 7, "misses": 1, "size": 1}
+
+        # NOTE: Clear cache explicitly.
+        registry_cache.clear()
+        assert registry_cache.info() == {"hits": 0, "misses": 0, "size": 0}
+    finally:
+        shutil.rmtree(new_tasks_path)
@@ -0,0 +1,51 @@
+from collections import ChainMap
+
+import pytest
+from ddeutil.workflow.reusables import compile_condition, eval_condition
+
+
+def test_compile_condition():
+    assert compile_condition("1 == 1") is compile_condition("1 == 1")
+    assert compile_condition("  1 == 1") is not None
+
+    with pytest.raises(SyntaxError):
+        compile_condition("1 ==")
+
+    with pytest.raises(ValueError):
+        compile_condition("__import__('os').system('ls')")
+
+    with pytest.raises(ValueError):
+        compile_condition("().__class__.__bases__")
+
+    with pytest.raises(ValueError):
+        compile_condition("'{0.__class__}'.format(1)")
+
+    with pytest.raises(ValueError):
+        compile_condition("open('file.txt')")
+
+    with pytest.raises(ValueError):
+        compile_condition("[x for x in range(10)]")
+
+    with pytest.raises(ValueError):
+        compile_condition("(lambda: 1)()")
+
+    with pytest.raises(ValueError):
+        compile_condition("2 ** 10")
+
+
+def test_eval_condition():
+    params = {"params": {"name": "foo"}, "item": 3}
+    assert eval_condition("1 == 1", params)
+    assert eval_condition("'foo' != 'bar'", params)
+    assert eval_condition("item > 2 and params['name'] == 'foo'", params)
+    assert eval_condition("params.get('name').startswith('f')", params)
+    assert eval_condition("len([1, 2, 3]) == 3", params)
+    assert eval_condition("1 if item == 3 else 2", params) == 1
+    assert eval_condition("item == 1", ChainMap({"item": 1}, params))
+
+    with pytest.raises(NameError):
+        eval_condition("datetime == 1", params)
+
+    # NOTE: It does not allow to change the parameters.
+    with pytest.raises(ValueError):
+        eval_condition("params.update({'name': 'bar'})", params)
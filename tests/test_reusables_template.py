@@ -4,8 +4,13 @@ from typing import Any
 from urllib.parse import urlparse
 
 import pytest
+from ddeutil.workflow import DictData
 from ddeutil.workflow.errors import UtilError
 from ddeutil.workflow.reusables import (
+    CompiledStr,
+    CompiledTemplate,
+    compile_str,
+    compile_template,
     has_template,
     not_in_template,
     param2template,
@@ -236,3 +241,58 @@ def test_has_template():
     )
 
     assert not has_template(None)
+
+
+def test_compile_template():
+    tpl: CompiledTemplate = compile_template(
+        {
+            "str": "${{ params.src }}",
+            "int": "${{ params.value }}",
+            "concat": "${{ params.src }}-${{ params.value | abs }}",
+            "list": ["${{ params.src }}", "${{ params.items.1 }}", 1],
+            "optional": "${{ params.missing?.key }}",
+            "none": "None",
+            "const": 10,
+        }
+    )
+    assert tpl.has_filter
+    params: DictData = {
+        "params": {"src": "foo", "value": -10, "items": {1: "bar"}},
+    }
+    rendered: dict[str, Any] = tpl.render(params)
+    assert rendered == {
+        "str": "foo",
+        "int": -10,
+        "concat": "foo-10",
+        "list": ["foo", "bar", 1],
+        "optional": None,
+        "none": None,
+        "const": 10,
+    }
+    assert param2template(tpl, params) == rendered
+    assert param2template(tpl.value, params) == rendered
+
+    # NOTE: Render again with other parameters.
+    rendered = tpl.render(
+        {"params": {"src": "baz", "value": 1, "items": {"1": "qux"}}}
+    )
+    assert rendered["concat"] == "baz-1"
+    assert rendered["list"] == ["baz", "qux", 1]
+
+    with pytest.raises(UtilError):
+        tpl.render({"params": {}})
+
+
+def test_compile_str_cache():
+    assert compile_str("${{ params.src }}") is compile_str("${{ params.src }}")
+
+    compiled: CompiledStr = compile_str(" foo-${{ params.src | upper }}-bar ")
+    assert compiled.value == "foo-${{ params.src | upper }}-bar"
+    assert compiled.has_filter
+    assert len(compiled.segments) == 3
+    assert compiled.render({"params": {"src": "baz"}}) == "foo-BAZ-bar"
+
+    with pytest.raises(UtilError):
+        compile_str("${{ params.src | not_exists }}").render(
+            {"params": {"src": "baz"}}
+        )
@@ -0,0 +1,198 @@
+from datetime import datetime
+from threading import Thread
+
+import pytest
+from ddeutil.workflow import UTC, CatchUp, Scheduler, Workflow
+from ddeutil.workflow.audits import LocalFileAudit
+
+WORKFLOW: str = (
+    "wf-scheduler:\n"
+    "  type: Workflow\n"
+    "  on:\n"
+    "    schedule:\n"
+    "      - cronjob: '{cron}'\n"
+    "  jobs:\n"
+    "    first-job:\n"
+    "      stages:\n"
+    "        - name: Echo\n"
+    "          echo: hello\n"
+    "wf-scheduler-manual:\n"
+    "  type: Workflow\n"
+    "  jobs:\n"
+    "    first-job:\n"
+    "      stages:\n"
+    "        - name: Echo\n"
+    "          echo: hello\n"
+)
+
+
+def dt(hour: int, minute: int) -> datetime:
+    return datetime(2024, 1, 1, hour, minute, tzinfo=UTC)
+
+
+def releases(audit: LocalFileAudit) -> list[datetime]:
+    return sorted(
+        r.replace(tzinfo=UTC) for r in audit.find_releases("wf-scheduler")
+    )
+
+
+@pytest.fixture
+def conf(tmp_path):
+    path = tmp_path / "conf"
+    path.mkdir()
+    (path / "wf.yml").write_text(WORKFLOW.format(cron="*/5 * * * *"))
+    return path
+
+
+@pytest.fixture
+def audit(tmp_path):
+    return LocalFileAudit(
+        path=tmp_path / "audits", extras={"enable_write_audit": True}
+    )
+
+
+def test_scheduler_tick(conf, audit):
+    with Scheduler(path=conf, audit=audit, misfire_grace=60) as scheduler:
+        assert scheduler.catchup == CatchUp.SKIP
+        assert scheduler.load(now=dt(0, 0)) == {
+            "added": ["wf-scheduler", "wf-scheduler-manual"],
+            "changed": [],
+            "removed": [],
+        }
+        assert scheduler.tick(now=dt(0, 0)) == dt(0, 5)
+        assert scheduler.tick(now=dt(0, 4)) == dt(0, 5)
+        assert scheduler.tick(now=dt(0, 5)) == dt(0, 10)
+
+        # NOTE: Load again without any change does not reschedule.
+        assert not any(scheduler.load(now=dt(0, 5)).values())
+        assert scheduler.tick(now=dt(0, 5)) == dt(0, 10)
+
+    assert releases(audit) == [dt(0, 0), dt(0, 5)]
+
+
+@pytest.mark.parametrize(
+    "catchup,expected,due",
+    [
+        (CatchUp.SKIP, [dt(0, 0)], dt(1, 5)),
+        (CatchUp.LATEST, [dt(0, 0), dt(1, 0)], dt(1, 5)),
+        (
+            CatchUp.ALL,
+            [dt(0, 0)]
+            + [
+                dt(h, m)
+                for h in (0, 1)
+                for m in (range(5, 60, 5) if h == 0 else [0])
+            ],
+            dt(1, 5),
+        ),
+    ],
+)
+def test_scheduler_tick_catchup(conf, audit, catchup, expected, due):
+    with Scheduler(
+        path=conf,
+        audit=audit,
+        catchup=catchup,
+        misfire_grace=60,
+        max_workers=16,
+    ) as scheduler:
+        scheduler.load(now=dt(0, 0))
+        scheduler.tick(now=dt(0, 0))
+        assert scheduler.tick(now=dt(1, 2)) == due
+    assert releases(audit) == expected
+
+
+def test_scheduler_catchup_from_audit(conf, audit):
+    workflow = Workflow.from_conf("wf-scheduler", path=conf)
+    for release in (dt(0, 0), dt(0, 5)):
+        workflow.release(release, params={}, audit=audit)
+
+    with Scheduler(
+        path=conf, audit=audit, catchup="all", misfire_grace=60
+    ) as scheduler:
+        scheduler.load(now=dt(0, 12))
+        assert scheduler.tick(now=dt(0, 12)) == dt(0, 15)
+    assert releases(audit) == [dt(0, 0), dt(0, 5), dt(0, 10)]
+
+
+def test_scheduler_timezone_matches_backfill(conf, audit):
+    (conf / "wf.yml").write_text(
+        WORKFLOW.format(cron="0 0 * * *").replace(
+            "      - cronjob: '0 0 * * *'\n",
+            "      - cronjob: '0 0 * * *'\n        timezone: Asia/Bangkok\n",
+        )
+    )
+    workflow = Workflow.from_conf("wf-scheduler", path=conf)
+    expected = list(
+        workflow.on.generate(datetime(2024, 1, 1), datetime(2024, 1, 2, 23))
+    )
+    assert expected == [
+        datetime(2024, 1, 1, tzinfo=UTC),
+        datetime(2024, 1, 2, tzinfo=UTC),
+    ]
+
+    # NOTE: The scheduler releases the same datetimes with the backfill and
+    #   all of them pass the release validation.
+    with Scheduler(
+        path=conf, audit=audit, catchup="all", misfire_grace=60
+    ) as scheduler:
+        scheduler.load(now=dt(0, 0))
+        assert scheduler.tick(now=dt(0, 0)) == expected[1]
+        assert scheduler.tick(now=expected[1]) == datetime(
+            2024, 1, 3, tzinfo=UTC
+        )
+    assert releases(audit) == expected
+    assert all(workflow.on.validate_dt(r) == r for r in expected)
+
+
+def test_scheduler_max_workers(conf, audit):
+    with Scheduler(
+        path=conf, audit=audit, catchup="all", max_workers=1
+    ) as scheduler:
+        scheduler.load(now=dt(0, 0))
+        scheduler._running[object()] = ("wf-other", dt(0, 0))
+
+        # NOTE: All workers are busy, so the due release stays on the heap.
+        assert scheduler.tick(now=dt(0, 0)) is None
+        scheduler._running.clear()
+        assert scheduler.tick(now=dt(0, 0)) == dt(0, 5)
+    assert releases(audit) == [dt(0, 0)]
+
+
+def test_scheduler_reload(conf, audit):
+    with Scheduler(path=conf, audit=audit, misfire_grace=60) as scheduler:
+        scheduler.load(now=dt(0, 0))
+        assert scheduler.tick(now=dt(0, 0)) == dt(0, 5)
+
+        (conf / "wf.yml").write_text(WORKFLOW.format(cron="0 * * * *"))
+        assert scheduler.load(now=dt(0, 1)) == {
+            "added": [],
+            "changed": ["wf-scheduler"],
+            "removed": [],
+        }
+        assert scheduler.tick(now=dt(0, 5)) == dt(1, 0)
+
+        # NOTE: The invalid config keeps the previous version.
+        (conf / "wf.yml").write_text(
+            WORKFLOW.format(cron="0 * * * *").replace("jobs:", "jobs: 1\n  x:")
+        )
+        assert not any(scheduler.load(now=dt(0, 6)).values())
+        assert scheduler.tick(now=dt(0, 6)) == dt(1, 0)
+
+        (conf / "wf.yml").unlink()
+        assert scheduler.load(now=dt(0, 7))["removed"] == [
+            "wf-scheduler",
+            "wf-scheduler-manual",
+        ]
+        assert scheduler.tick(now=dt(1, 0)) is None
+    assert releases(audit) == [dt(0, 0)]
+
+
+def test_scheduler_run_stop(conf, audit):
+    scheduler = Scheduler(path=conf, audit=audit, reload_interval=0.01)
+    thread = Thread(target=scheduler.run)
+    thread.start()
+    scheduler.reload()
+    scheduler.stop()
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+    assert set(scheduler.workflows) == {"wf-scheduler", "wf-scheduler-manual"}
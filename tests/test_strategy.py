@@ -1,6 +1,6 @@
 import pytest
 from ddeutil.workflow import Job, Strategy, Workflow
-from ddeutil.workflow.job import make
+from ddeutil.workflow.job import make, make_iter
 
 
 def test_make():
@@ -47,6 +47,21 @@ def test_make():
     ) == [{"table": "customer", "system": "csv", "partition": 1}]
 
 
+def test_make_iter():
+    matrix = {"x": list(range(1000)), "y": list(range(1000))}
+    it = make_iter(matrix, [], [{"x": 0}, {"x": 1, "y": 1}])
+    assert next(it) == {"x": 1, "y": 0}
+    assert next(it) == {"x": 1, "y": 2}
+
+    assert list(
+        make_iter(
+            {"x": [1, 2], "y": [[1], [2]]},
+            include=[{"x": 1, "y": [2]}, {"x": 3}],
+            exclude=[{"y": [1]}],
+        )
+    ) == [{"x": 1, "y": [2]}, {"x": 2, "y": [2]}, {"x": 3}]
+
+
 def test_strategy():
     strategy = Strategy.model_validate(
         {
@@ -1,7 +1,9 @@
+import json
 import os
 import shutil
 import traceback
 from pathlib import Path
+from threading import Event
 from unittest import mock
 
 import pytest
@@ -13,6 +15,10 @@ from ddeutil.workflow.traces import (
     Message,
     Metadata,
     Trace,
+    TraceWriter,
+    flush_trace,
+    get_handler,
+    get_system_info,
     get_trace,
 )
 from pydantic import ValidationError
@@ -123,6 +129,53 @@ def test_trace_meta():
         )
 
 
+def test_trace_meta_lazy_datetime():
+    meta = Metadata.make(
+        run_id="100",
+        parent_run_id="01",
+        error_flag=False,
+        message="Foo",
+        level="info",
+        cutting_id="",
+        extras={
+            "logs_trace_frame_layer": 1,
+            "log_datetime_format": "%Y%m%d",
+        },
+    )
+    assert "datetime" not in meta.__dict__
+    assert meta.lineno > 0
+    assert meta.hostname == get_system_info()["hostname"]
+
+    # NOTE: The datetime string will format at the first read or dump.
+    assert len(meta.datetime) == 8
+    assert meta.__dict__["datetime"] == meta.datetime
+    assert meta.model_dump()["datetime"] == meta.datetime
+
+    dumped = Metadata.make(
+        run_id="100",
+        parent_run_id="01",
+        error_flag=False,
+        message="Foo",
+        level="info",
+        cutting_id="",
+        extras={"logs_trace_frame_layer": 1, "log_datetime_format": "%Y"},
+    ).model_dump()
+    assert len(dumped["datetime"]) == 4
+
+    # NOTE: The datetime string that pass to the model does not format again.
+    assert Metadata.model_validate(dumped | {"datetime": "foo"}).datetime == (
+        "foo"
+    )
+    with pytest.raises(ValidationError):
+        Metadata.model_validate(
+            {k: v for k, v in dumped.items() if k != "datetime"}
+        )
+
+    # NOTE: A missing attribute still raises the AttributeError.
+    with pytest.raises(AttributeError):
+        _ = meta.not_exists
+
+
 def test_result_gen_trace():
     rs: Result = Result(
         parent_run_id="foo_id_for_writing_log",
@@ -342,3 +395,82 @@ def test_trace_get_trace(test_path: Path):
     # assert (test_path / "logs/trace/run_id=1001_test_get_trace").exists()
     # shutil.rmtree(test_path / "logs/trace")
     os.environ["WORKFLOW_LOG_TRACE_HANDLERS"] = rollback
+
+
+def test_trace_async_writer(test_path: Path):
+    trace = Trace(
+        run_id="01",
+        parent_run_id="1001_test_async",
+        handlers=[{"type": "file", "path": str(test_path / "logs")}],
+        extras={"trace_async": True},
+    )
+    for i in range(5):
+        trace.info(f"This is info message: {i}")
+    trace.error("This is error message")
+    assert flush_trace(timeout=5)
+
+    pointer: Path = test_path / "logs/run_id=1001_test_async"
+    assert len((pointer / "stdout.txt").read_text().splitlines()) == 5
+    assert len((pointer / "stderr.txt").read_text().splitlines()) == 1
+    assert len((pointer / "metadata.txt").read_text().splitlines()) == 6
+
+    shutil.rmtree(pointer)
+
+
+def test_trace_writer_drop_policy():
+    release = Event()
+    flushed: list[int] = []
+
+    class BlockHandler:
+        type = "block"
+
+        def flush(self, metadata, *, extra=None):
+            release.wait(5)
+            flushed.append(len(metadata))
+
+    meta = Metadata.make(
+        error_flag=False,
+        message="Drop message",
+        level="info",
+        cutting_id="01",
+        run_id="01",
+        parent_run_id=None,
+        extras={"logs_trace_frame_layer": 1},
+    )
+    writer = TraceWriter(maxsize=1, flush_size=1, policy="drop")
+    handlers = [BlockHandler()]
+
+    # NOTE: The first record will block the writer thread on its flush.
+    assert writer.put(handlers, meta)
+    for _ in range(50):
+        if writer.queue.empty():
+            break
+        release.wait(0.01)
+
+    assert writer.put(handlers, meta)
+    assert not writer.put(handlers, meta)
+    assert writer.dropped == 1
+
+    release.set()
+    writer.close(timeout=5)
+    assert flushed == [1, 1]
+
+
+def test_trace_get_trace_shared_handlers(test_path: Path):
+    trace = get_trace(run_id="01", parent_run_id="1001_test_shared")
+    other = get_trace(run_id="02", parent_run_id="1001_test_shared")
+    assert trace.handlers == other.handlers
+    assert all(h is o for h, o in zip(trace.handlers, other.handlers))
+    assert get_handler({"type": "console"}) is get_handler({"type": "console"})
+
+    handlers = [{"type": "file", "path": str(test_path / "logs")}]
+    trace = get_trace(run_id="01", extras={"trace_handlers": handlers})
+    other = get_trace(run_id="02", handlers=handlers)
+    assert isinstance(trace.handlers[0], FileHandler)
+    assert trace.handlers[0] is other.handlers[0]
+
+    with mock.patch.dict(
+        os.environ, {"WORKFLOW_LOG_TRACE_HANDLERS": json.dumps(handlers)}
+    ):
+        trace = get_trace(run_id="01")
+    assert trace.handlers[0] is other.handlers[0]
@@ -1,12 +1,16 @@
 import os
+import pickle
+import time
 from datetime import date, datetime
 from pathlib import Path
 from urllib.parse import urlparse
 from zoneinfo import ZoneInfo
 
 import pytest
+from ddeutil.workflow.reusables import compile_caller
 from ddeutil.workflow.utils import (
     UTC,
+    BatchWriter,
     cut_id,
     dump_all,
     filter_func,
@@ -14,6 +18,7 @@ from ddeutil.workflow.utils import (
     get_d_now,
     get_diff_sec,
     get_dt_now,
+    layer_context,
     make_exec,
     obj_name,
     prepare_newline,
@@ -195,3 +200,87 @@ def test_obj_name():
     assert obj_name("datetime") == "datetime"
     assert obj_name(datetime) == "datetime"
     assert obj_name(datetime(2025, 1, 1, 1)) == "datetime"
+
+
+def test_layer_context():
+    parent = {
+        "params": {"name": "foo"},
+        "jobs": {"first": {"outputs": {"records": [1, 2, 3]}}},
+        "stages": {"echo": {"outputs": {}}},
+    }
+    rs = layer_context(parent, item=1, loop=0)
+    assert rs == parent | {"item": 1, "loop": 0}
+    assert rs["jobs"] is parent["jobs"]
+    assert rs["stages"] is not parent["stages"]
+
+    rs["stages"]["sleep"] = {"outputs": {}}
+    rs["item"] = 2
+    assert parent == {
+        "params": {"name": "foo"},
+        "jobs": {"first": {"outputs": {"records": [1, 2, 3]}}},
+        "stages": {"echo": {"outputs": {}}},
+    }
+
+    assert layer_context({}, matrix={}, stages={}) == {
+        "matrix": {},
+        "stages": {},
+    }
+
+
+def test_layer_context_isolate():
+    parent = {"params": {"acc": [1], "name": "foo"}, "stages": {}}
+    first = layer_context(parent, item=1)
+    second = layer_context(parent, item=2)
+    path = compile_caller("params.acc")
+
+    # NOTE: The shared mutable value copies once per layer.
+    acc = first.isolate(path, first["params"]["acc"])
+    assert acc == [1] and acc is not parent["params"]["acc"]
+    assert first.isolate(path, first["params"]["acc"]) is acc
+    assert (first | {"retry": 1}).isolate(path, parent["params"]["acc"]) is acc
+    assert second.isolate(path, second["params"]["acc"]) is not acc
+
+    acc.append(2)
+    assert parent["params"]["acc"] == [1]
+    assert second.isolate(path, second["params"]["acc"]) == [1]
+
+    # NOTE: The nested layer copies from the copy of its parent layer.
+    nested = layer_context(first, loop=0)
+    assert nested.isolate(path, nested["params"]["acc"]) == [1, 2]
+    assert nested.isolate(path, nested["params"]["acc"]) is not acc
+
+    # NOTE: The immutable value and the local value do not copy.
+    name = compile_caller("params.name")
+    assert first.isolate(name, "foo") == "foo"
+    first["stages"]["echo"] = {"outputs": {"records": [1]}}
+    records = first["stages"]["echo"]["outputs"]["records"]
+    path = compile_caller("stages.echo.outputs.records")
+    assert first.isolate(path, records) is records
+
+    assert type(pickle.loads(pickle.dumps(first))) is dict
+
+
+def test_batch_writer():
+    batches = []
+    writer = BatchWriter(batches.append, flush_interval=60, flush_size=2)
+    for i in range(5):
+        assert writer.put(i)
+
+    # NOTE: The writer writes a batch when its size reaches the flush size.
+    assert writer.flush(timeout=5)
+    assert batches == [[0, 1], [2, 3], [4]]
+
+    writer.put(5)
+    writer.close(timeout=5)
+    assert batches[-1] == [5]
+    assert writer.flush()
+
+    batches.clear()
+    writer = BatchWriter(batches.append, flush_interval=0.01, flush_size=100)
+    writer.put("a")
+    for _ in range(100):
+        if batches:
+            break
+        time.sleep(0.01)
+    assert batches == [["a"]]
+    writer.close(timeout=5)
@@ -1,8 +1,10 @@
 import shutil
+import time
 from datetime import datetime
 from textwrap import dedent
 from unittest.mock import patch
 
+import pytest
 from ddeutil.core import getdot
 from ddeutil.workflow import (
     CANCEL,
@@ -579,6 +581,261 @@ def test_workflow_exec_needs_parallel():
     }
 
 
+def test_workflow_exec_needs_event_scheduler():
+    workflow = Workflow.from_conf(
+        name="wf-run-depends", extras={"workflow_scheduler": "event"}
+    )
+    rs: Result = workflow.execute(params={"name": "bar"}, max_job_parallel=3)
+    assert rs.status == SUCCESS
+    assert exclude_info(rs.context) == {
+        "status": SUCCESS,
+        "params": {"name": "bar"},
+        "jobs": {
+            "final-job": {
+                "status": SUCCESS,
+                "stages": {"8797330324": {"outputs": {}, "status": SUCCESS}},
+            },
+            "second-job": {
+                "status": SUCCESS,
+                "stages": {"1772094681": {"outputs": {}, "status": SUCCESS}},
+            },
+            "first-job": {
+                "status": SUCCESS,
+                "stages": {"7824513474": {"outputs": {}, "status": SUCCESS}},
+            },
+        },
+    }
+
+    workflow = Workflow.from_conf(
+        name="wf-run-depends-condition",
+        extras={"workflow_scheduler": "event"},
+    )
+    rs: Result = workflow.execute(params={"name": "bar"})
+    assert rs.status == SUCCESS
+    assert exclude_info(rs.context) == {
+        "status": SUCCESS,
+        "params": {"name": "bar"},
+        "jobs": {
+            "second-job": {"status": SKIP},
+            "first-job": {"status": SKIP},
+            "final-job": {
+                "status": SUCCESS,
+                "stages": {"8797330324": {"outputs": {}, "status": SUCCESS}},
+            },
+        },
+    }
+
+
+def test_workflow_exec_event_scheduler_wide():
+    job: Job = Job(stages=[{"name": "Echo", "echo": "hello"}])
+    jobs: dict[str, Job] = {"start": job}
+    for i in range(50):
+        jobs[f"middle-{i:02d}"] = job.model_copy(update={"needs": ["start"]})
+    jobs["end"] = job.model_copy(
+        update={"needs": [f"middle-{i:02d}" for i in range(50)]}
+    )
+    workflow: Workflow = Workflow(
+        name="demo-workflow",
+        jobs=jobs,
+        extras={"workflow_scheduler": "event"},
+    )
+    rs: Result = workflow.execute(params={}, max_job_parallel=4)
+    assert rs.status == SUCCESS
+    assert len(rs.context["jobs"]) == 52
+    assert all(
+        rs.context["jobs"][j]["status"] == SUCCESS for j in rs.context["jobs"]
+    )
+
+
+def test_workflow_exec_event_scheduler_timeout():
+    job: Job = Job(
+        stages=[
+            {"name": "Sleep", "run": "import time\ntime.sleep(2)"},
+            {"name": "Echo Last Stage", "echo": "the last stage"},
+        ],
+    )
+    workflow: Workflow = Workflow(
+        name="demo-workflow",
+        jobs={
+            "sleep-run": job,
+            "sleep-again-run": job.model_copy(update={"needs": ["sleep-run"]}),
+        },
+        extras={"stage_default_id": False, "workflow_scheduler": "event"},
+    )
+    rs: Result = workflow.execute(params={}, timeout=1.25, max_job_parallel=2)
+    assert rs.status == FAILED
+    assert exclude_info(rs.context) == {
+        "status": FAILED,
+        "params": {},
+        "jobs": {
+            "sleep-run": {
+                "status": CANCEL,
+                "stages": {},
+                "errors": {
+                    "name": "JobCancelError",
+                    "message": (
+                        "Strategy execution was canceled from the event before "
+                        "start stage execution."
+                    ),
+                },
+            },
+        },
+        "errors": {
+            "name": "WorkflowTimeoutError",
+            "message": (
+                "'demo-workflow' was timeout because it use exec time more "
+                "than 1.25 seconds."
+            ),
+        },
+    }
+
+
+def test_workflow_exec_event_scheduler_schedule_raise():
+    job: Job = Job(stages=[{"name": "Echo", "echo": "hello"}])
+    workflow: Workflow = Workflow(
+        name="demo-workflow",
+        jobs={
+            "first-job": job,
+            "second-job": job.model_copy(update={"needs": ["first-job"]}),
+        },
+        extras={"workflow_scheduler": "event"},
+    )
+    origin = Job.check_needs
+
+    def check_needs(self, jobs):
+        if self.id == "second-job":
+            raise ValueError("Raise from check needs.")
+        return origin(self, jobs)
+
+    # NOTE: The error from the future callback should stop the execution
+    #   instead of waiting until timeout.
+    start: float = time.monotonic()
+    with patch.object(Job, "check_needs", check_needs):
+        rs: Result = workflow.execute(params={}, timeout=30)
+    assert time.monotonic() - start < 10
+    assert rs.status == FAILED
+    assert rs.context["errors"] == {
+        "name": "WorkflowError",
+        "message": (
+            "Schedule job: 'second-job' was failed with ValueError: Raise "
+            "from check needs."
+        ),
+    }
+
+
+@pytest.mark.asyncio
+async def test_workflow_aexec_needs():
+    workflow = Workflow.from_conf(name="wf-run-depends")
+    rs: Result = await workflow.aexecute(
+        params={"name": "bar"}, max_job_parallel=3
+    )
+    assert rs.status == SUCCESS
+    assert exclude_info(rs.context) == {
+        "status": SUCCESS,
+        "params": {"name": "bar"},
+        "jobs": {
+            "final-job": {
+                "status": SUCCESS,
+                "stages": {"8797330324": {"outputs": {}, "status": SUCCESS}},
+            },
+            "second-job": {
+                "status": SUCCESS,
+                "stages": {"1772094681": {"outputs": {}, "status": SUCCESS}},
+            },
+            "first-job": {
+                "status": SUCCESS,
+                "stages": {"7824513474": {"outputs": {}, "status": SUCCESS}},
+            },
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_workflow_aexec_schedule_raise():
+    job: Job = Job(stages=[{"name": "Echo", "echo": "hello"}])
+    workflow: Workflow = Workflow(
+        name="demo-workflow",
+        jobs={
+            "first-job": job,
+            "second-job": job.model_copy(update={"needs": ["first-job"]}),
+        },
+    )
+    origin = Job.check_needs
+
+    def check_needs(self, jobs):
+        if self.id == "second-job":
+            raise ValueError("Raise from check needs.")
+        return origin(self, jobs)
+
+    # NOTE: The error from the job task should stop the execution instead of
+    #   waiting until timeout.
+    start: float = time.monotonic()
+    with patch.object(Job, "check_needs", check_needs):
+        rs: Result = await workflow.aexecute(params={}, timeout=30)
+    assert time.monotonic() - start < 10
+    assert rs.status == FAILED
+    assert rs.context["errors"] == {
+        "name": "WorkflowError",
+        "message": (
+            "Schedule job: 'second-job' was failed with ValueError: Raise "
+            "from check needs."
+        ),
+    }
+
+
+@pytest.mark.asyncio
+async def test_workflow_aexec_concurrent_io():
+    job: Job = Job(
+        strategy={"max-parallel": 5, "matrix": {"x": [1, 2, 3, 4, 5]}},
+        stages=[
+            {"name": "Sleep", "echo": "sleep", "sleep": 0.5},
+            {"name": "Python", "run": "x = ${{ matrix.x }}"},
+        ],
+    )
+    workflow: Workflow = Workflow(
+        name="demo-workflow",
+        jobs={f"job-{i:02d}": job for i in range(20)},
+    )
+    start: float = time.monotonic()
+    rs: Result = await workflow.aexecute(params={}, max_job_parallel=20)
+    assert rs.status == SUCCESS
+    assert len(rs.context["jobs"]) == 20
+    assert all(
+        len(rs.context["jobs"][j]["strategies"]) == 5
+        for j in rs.context["jobs"]
+    )
+
+    # NOTE: All 100 sleep stages should await concurrently.
+    assert time.monotonic() - start < 10
+
+
+@pytest.mark.asyncio
+async def test_workflow_aexec_timeout():
+    job: Job = Job(
+        stages=[
+            {"name": "Sleep", "run": "import time\ntime.sleep(2)"},
+            {"name": "Echo Last Stage", "echo": "the last stage"},
+        ],
+    )
+    workflow: Workflow = Workflow(
+        name="demo-workflow",
+        jobs={
+            "sleep-run": job,
+            "sleep-again-run": job.model_copy(update={"needs": ["sleep-run"]}),
+        },
+        extras={"stage_default_id": False},
+    )
+    rs: Result = await workflow.aexecute(params={}, timeout=1.25)
+    assert rs.status == FAILED
+    assert rs.context["errors"] == {
+        "name": "WorkflowTimeoutError",
+        "message": (
+            "'demo-workflow' was timeout because it use exec time more "
+            "than 1.25 seconds."
+        ),
+    }
+
+
 def test_workflow_exec_call(test_path):
     with dump_yaml_context(
         test_path / "conf/demo/01_99_wf_test_wf_call_csv_to_parquet.yml",
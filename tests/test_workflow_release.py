@@ -17,6 +17,7 @@ from ddeutil.workflow import (
     Result,
     Workflow,
 )
+from ddeutil.workflow.audits import LocalFileAudit, flush_audit
 
 from .utils import exclude_info
 
@@ -207,6 +208,88 @@ def test_workflow_release_with_datetime(test_path):
     shutil.rmtree(test_audit_skip_path)
 
 
+def test_workflow_release_audit_async(tmp_path):
+    workflow: Workflow = Workflow.model_validate(
+        obj={
+            "name": "wf-scheduling-common",
+            "jobs": {
+                "first-job": {
+                    "stages": [{"name": "First Stage", "id": "first-stage"}]
+                }
+            },
+            "extras": {
+                "enable_write_audit": True,
+                "audit_async": True,
+                "audit_conf": {"type": "file", "path": str(tmp_path)},
+            },
+        }
+    )
+    dt: datetime = datetime(2025, 1, 18, tzinfo=ZoneInfo("Asia/Bangkok"))
+    rs: Result = workflow.release(release=dt, params={})
+    assert rs.status == SUCCESS
+
+    # NOTE: The audit saves on the background audit writer.
+    assert flush_audit(timeout=5)
+    audit = LocalFileAudit(path=tmp_path)
+    assert audit.find_audit_with_release(name="wf-scheduling-common")
+
+    rs: Result = workflow.release(release=dt, params={})
+    assert rs.status == SKIP
+
+
+def test_workflow_backfill(tmp_path):
+    workflow: Workflow = Workflow.model_validate(
+        obj={
+            "name": "wf-backfill",
+            "on": {"schedule": [{"cronjob": "0 * * * *"}]},
+            "jobs": {
+                "first-job": {
+                    "stages": [{"name": "First Stage", "id": "first-stage"}]
+                }
+            },
+            "extras": {
+                "enable_write_audit": True,
+                "audit_conf": {"type": "file", "path": str(tmp_path)},
+            },
+        }
+    )
+    hours: list[int] = []
+    rs: Result = workflow.backfill(
+        datetime(2024, 1, 1),
+        datetime(2024, 1, 1, 5),
+        max_parallel=3,
+        callback=lambda dt, r: hours.append(dt.hour),
+    )
+    assert rs.status == SUCCESS
+    assert hours == [0, 1, 2, 3, 4, 5]
+    assert rs.context["metrics"]["total"] == 6
+    assert rs.context["metrics"]["success"] == 6
+    assert rs.context["releases"][0]["release"] == datetime(
+        2024, 1, 1, tzinfo=UTC
+    )
+
+    # NOTE: The normal release type skips the releases that already audit.
+    rs: Result = workflow.backfill(
+        datetime(2024, 1, 1),
+        datetime(2024, 1, 1, 7),
+        max_parallel=2,
+        ordered=False,
+    )
+    assert rs.context["metrics"]["audited"] == 6
+    assert sorted(r["release"].hour for r in rs.context["releases"]) == [6, 7]
+
+    rs: Result = workflow.backfill(
+        datetime(2024, 1, 1),
+        datetime(2024, 1, 1, 1),
+        release_type=FORCE,
+    )
+    assert rs.context["metrics"] == rs.context["metrics"] | {
+        "total": 2,
+        "audited": 0,
+        "success": 2,
+    }
+
+
 def test_workflow_release_with_auto(test_path):
     workflow: Workflow = Workflow.model_validate(
         obj={